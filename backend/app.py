@@ -12,10 +12,14 @@ from routes.testcases_extended import testcases_extended_bp
 from routes.dashboard_extended import dashboard_extended_bp
 from routes.automation import automation_bp
 from routes.performance import performance_bp
+from routes.load_profiles import load_profiles_bp
+from routes.executions import executions_bp
 from routes.folders import folders_bp
+from routes.schedules import schedules_bp
 from routes.users import users_bp
 from routes.auth import auth_bp
 from utils.cors import setup_cors
+from utils.scheduler import scheduler_enabled, start_scheduler
 from flask_jwt_extended import JWTManager
 from datetime import timedelta
 
@@ -155,10 +159,19 @@ app.register_blueprint(testcases_extended_bp)
 app.register_blueprint(dashboard_extended_bp)
 app.register_blueprint(automation_bp)
 app.register_blueprint(performance_bp)
+app.register_blueprint(load_profiles_bp)
+app.register_blueprint(executions_bp)
 app.register_blueprint(folders_bp)
+app.register_blueprint(schedules_bp)
 app.register_blueprint(users_bp)
 app.register_blueprint(auth_bp, url_prefix='/auth')
 
+# 예약 스케줄러: 웹 프로세스가 요청을 받기 시작하면 한 번 시작 (독립 워커 프로세스도 기본으로 실행)
+if scheduler_enabled():
+    @app.before_request
+    def ensure_scheduler():
+        start_scheduler(app)
+
 # 헬퍼 함수들
 def create_cors_response(data=None, status_code=200):
     """CORS 헤더가 포함된 응답 생성"""
@@ -0,0 +1,24 @@
+from engines.process_runner import excerpt
+
+def output_excerpt(result):
+    """TestResult.notes에 저장할 stdout/stderr 끝부분 (전체 출력은 실행 작업 디렉토리 로그에 보관)"""
+    output = excerpt(result.get('output') or '')
+    error = excerpt(result.get('error') or '')
+    if output and error:
+        return f"{output}\n[stderr]\n{error}"
+    return output or error
+
+def summarize_run(result):
+    """실행 기록(result_summary)에 저장할 요약 (테스트별 결과 목록은 제외)"""
+    summary = {
+        'status': result.get('status'),
+        'engine': result.get('engine'),
+        'exit_code': result.get('exit_code'),
+        'execution_time': result.get('execution_time'),
+        'error': excerpt(result.get('error')) or None,
+        'workspace': result.get('workspace')
+    }
+    for key in ('test_summary', 'shards', 'resources'):
+        if key in result:
+            summary[key] = result[key]
+    return summary
@@ -0,0 +1,207 @@
+import atexit
+import os
+import queue
+import subprocess
+import threading
+import time
+import uuid
+
+# 컨테이너 런타임 CLI (docker 호환 CLI면 podman 등으로 교체 가능)
+CONTAINER_CLI = os.environ.get('CONTAINER_CLI', 'docker')
+
+# 풀 컨테이너의 마운트 위치
+CONTAINER_PROJECT_DIR = '/project'
+CONTAINER_RUNS_DIR = '/runs'
+
+class PooledContainer:
+    def __init__(self, container_id, name):
+        self.container_id = container_id
+        self.name = name
+        self.runs = 0
+        self.created_at = time.time()
+        self.checked_at = time.time()
+
+# 미리 띄워 둔 유휴 컨테이너 풀
+# 실행마다 컨테이너를 생성/삭제(docker run --rm)하는 대신 유휴 컨테이너에 docker exec로 작업을 투입하여
+# 컨테이너 생성과 이미지 확인 비용을 실행 경로에서 제거
+# - 컨테이너는 프로젝트 루트(읽기 전용)와 실행 작업 디렉토리 루트를 마운트하고 대기 명령으로 유지
+# - 일정 시간이 지난 컨테이너는 꺼내기 전에 상태 확인, 비정상이면 폐기 후 교체
+# - max_runs 회 사용한 컨테이너와 시간 초과로 중단된 컨테이너는 백그라운드에서 교체(recycle)
+class ContainerPool:
+    def __init__(self, image, project_root, runs_root, size=2, max_runs=20, health_check_seconds=30, cli=None):
+        self.image = image
+        self.project_root = os.path.abspath(project_root)
+        self.runs_root = os.path.abspath(runs_root)
+        self.size = size
+        self.max_runs = max_runs
+        self.health_check_seconds = health_check_seconds
+        self.cli = cli or CONTAINER_CLI
+        self.pool_id = uuid.uuid4().hex[:8]
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._containers = {}
+        self._started = False
+        self._warmed = threading.Event()
+        self._closed = False
+        self.stats_counters = {'runs': 0, 'started': 0, 'recycled': 0, 'unhealthy': 0}
+
+    def _cli(self, *args, timeout=60):
+        return subprocess.run([self.cli, *args], capture_output=True, text=True, timeout=timeout)
+
+    def _start_container(self):
+        name = f'k6-pool-{self.pool_id}-{uuid.uuid4().hex[:6]}'
+        os.makedirs(self.runs_root, exist_ok=True)
+        result = self._cli(
+            'run', '-d', '--name', name,
+            '--label', f'integrated-test-platform.pool={self.pool_id}',
+            '-v', f'{self.project_root}:{CONTAINER_PROJECT_DIR}:ro',
+            '-v', f'{self.runs_root}:{CONTAINER_RUNS_DIR}',
+            '--entrypoint', 'tail',
+            self.image, '-f', '/dev/null'
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f'풀 컨테이너 시작 실패: {result.stderr.strip()}')
+        container = PooledContainer(result.stdout.strip() or name, name)
+        with self._lock:
+            self._containers[container.name] = container
+            self.stats_counters['started'] += 1
+        return container
+
+    def _remove_container(self, container):
+        with self._lock:
+            self._containers.pop(container.name, None)
+        try:
+            self._cli('rm', '-f', container.name, timeout=30)
+        except Exception as e:
+            print(f"⚠️ 풀 컨테이너 삭제 실패 ({container.name}): {e}")
+
+    def _replace(self, container):
+        """새 컨테이너를 먼저 띄운 뒤 기존 컨테이너 폐기 (시작 실패 시 다음 acquire에서 보충)"""
+        try:
+            if not self._closed:
+                self._add_container()
+        finally:
+            self._remove_container(container)
+
+    def _replace_async(self, container):
+        threading.Thread(target=self._replace, args=(container,), daemon=True).start()
+
+    def is_healthy(self, container):
+        try:
+            result = self._cli('inspect', '-f', '{{.State.Running}}', container.name, timeout=10)
+        except Exception:
+            return False
+        return result.returncode == 0 and result.stdout.strip() == 'true'
+
+    def warm(self):
+        """풀 크기만큼 컨테이너를 병렬로 시작 (최초 1회, 동시 호출은 완료까지 대기)"""
+        with self._lock:
+            started = self._started
+            self._started = True
+        if started:
+            self._warmed.wait()
+            return
+        threads = [threading.Thread(target=self._add_container) for _ in range(self.size)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self._warmed.set()
+
+    def _add_container(self):
+        try:
+            self._idle.put(self._start_container())
+            return True
+        except Exception as e:
+            print(f"⚠️ 풀 컨테이너 시작 실패: {e}")
+            return False
+
+    def acquire(self, timeout=None):
+        """유휴 컨테이너 확보 (모두 사용 중이면 timeout 동안 대기)"""
+        self.warm()
+        deadline = time.time() + timeout if timeout else None
+        while True:
+            with self._lock:
+                count = len(self._containers)
+            if count < self.size and self._idle.empty():
+                # 시작 실패로 풀이 줄어든 경우 보충 (하나도 띄울 수 없으면 런타임 사용 불가)
+                if not self._add_container() and count == 0:
+                    raise RuntimeError('풀 컨테이너를 시작할 수 없습니다')
+            remaining = None if deadline is None else max(0.0, deadline - time.time())
+            try:
+                container = self._idle.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError('사용 가능한 풀 컨테이너가 없습니다')
+            if time.time() - container.checked_at < self.health_check_seconds:
+                return container
+            if self.is_healthy(container):
+                container.checked_at = time.time()
+                return container
+            with self._lock:
+                self.stats_counters['unhealthy'] += 1
+            self._replace_async(container)
+
+    def release(self, container, broken=False):
+        """컨테이너 반납 (사용 횟수 초과나 비정상 종료 시 교체)"""
+        container.runs += 1
+        with self._lock:
+            self.stats_counters['runs'] += 1
+        if self._closed:
+            self._remove_container(container)
+        elif broken or container.runs >= self.max_runs:
+            with self._lock:
+                self.stats_counters['recycled'] += 1
+            self._replace_async(container)
+        else:
+            self._idle.put(container)
+
+    def container_path(self, host_path):
+        """호스트 경로를 컨테이너 내부 경로로 변환 (마운트 밖이면 None)"""
+        host_path = os.path.abspath(host_path)
+        for root, mount in ((self.runs_root, CONTAINER_RUNS_DIR), (self.project_root, CONTAINER_PROJECT_DIR)):
+            if host_path == root or host_path.startswith(root + os.sep):
+                return mount + host_path[len(root):].replace(os.sep, '/')
+        return None
+
+    def exec_command(self, container, args, workdir=None, env_vars=None):
+        """컨테이너에서 명령을 실행하는 docker exec 명령 구성"""
+        cmd = [self.cli, 'exec']
+        if workdir:
+            cmd.extend(['-w', workdir])
+        for key, value in (env_vars or {}).items():
+            cmd.extend(['-e', f'{key}={value}'])
+        cmd.append(container.name)
+        cmd.extend(args)
+        return cmd
+
+    def stats(self):
+        with self._lock:
+            return {
+                'image': self.image,
+                'size': self.size,
+                'max_runs': self.max_runs,
+                'containers': len(self._containers),
+                'idle': self._idle.qsize(),
+                **self.stats_counters
+            }
+
+    def shutdown(self):
+        self._closed = True
+        with self._lock:
+            containers = list(self._containers.values())
+        for container in containers:
+            self._remove_container(container)
+
+_pools = []
+
+def create_container_pool(*args, **kwargs):
+    """컨테이너 풀 생성 (프로세스 종료 시 컨테이너 정리)"""
+    pool = ContainerPool(*args, **kwargs)
+    _pools.append(pool)
+    return pool
+
+@atexit.register
+def _shutdown_pools():
+    for pool in _pools:
+        if pool._started:
+            pool.shutdown()
@@ -0,0 +1,28 @@
+import re
+
+# k6 기간 문자열 (예: 30s, 1m30s, 500ms): 엔진과 부하 프로필이 함께 쓰므로 앱/DB 의존성 없이 유지
+DURATION_PATTERN = re.compile(r'^(?:\d+(?:\.\d+)?(?:ms|s|m|h))+$')
+DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+def parse_duration(value):
+    """k6 기간 문자열(예: 30s, 1m30s, 500ms) 또는 초 단위 숫자를 초로 변환 (형식 오류는 ValueError)"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if value < 0:
+            raise ValueError(f'기간은 0 이상이어야 합니다: {value}')
+        return float(value)
+    text = str(value).strip()
+    if not DURATION_PATTERN.match(text):
+        raise ValueError(f'기간 형식이 올바르지 않습니다: {value} (예: 30s, 1m30s, 2h)')
+    return sum(float(amount) * DURATION_UNITS[unit] for amount, unit in DURATION_PART.findall(text))
+
+def format_duration(seconds):
+    """초를 k6 기간 문자열로 변환"""
+    seconds = float(seconds)
+    if seconds != int(seconds):
+        return f'{int(round(seconds * 1000))}ms'
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    text = (f'{hours}h' if hours else '') + (f'{minutes}m' if minutes else '') + (f'{secs}s' if secs else '')
+    return text or '0s'
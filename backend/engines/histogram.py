@@ -0,0 +1,105 @@
+import math
+
+# 로그 버킷 기반 지연시간 히스토그램
+# - 버킷 폭이 값에 비례하므로 상대 오차가 precision 이내로 유지됨
+# - 버킷 수는 값의 범위(로그 스케일)에만 비례하므로 샘플 수와 무관하게 메모리가 일정
+# - 버킷 카운트를 더하는 것만으로 병합 가능 (샤드/워커 결과 병합 시 사용)
+class LatencyHistogram:
+    def __init__(self, precision=0.01, min_value=0.001):
+        self.precision = precision
+        self.min_value = min_value
+        self._log_base = math.log1p(precision)
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def _bucket_index(self, value):
+        if value <= self.min_value:
+            return 0
+        return int(math.log(value / self.min_value) / self._log_base) + 1
+
+    def _bucket_value(self, index):
+        """버킷 대표값 (버킷 하한과 상한의 기하 평균)"""
+        if index == 0:
+            return self.min_value
+        lower = self.min_value * math.exp((index - 1) * self._log_base)
+        return lower * math.sqrt(1 + self.precision)
+
+    def record(self, value, count=1):
+        index = self._bucket_index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """다른 히스토그램의 카운트를 합산 (동일 precision 필요)"""
+        if other.count == 0:
+            return self
+        if other.precision != self.precision or other.min_value != self.min_value:
+            raise ValueError('precision이 다른 히스토그램은 병합할 수 없습니다')
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if self.min is None or other.min < self.min:
+            self.min = other.min
+        if self.max is None or other.max > self.max:
+            self.max = other.max
+        return self
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent):
+        """백분위수 계산 (percent: 0~100)"""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percent / 100.0))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                value = self._bucket_value(index)
+                # 대표값은 실제 관측 범위를 벗어나지 않도록 보정
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self, percentiles=(50, 90, 95, 99)):
+        data = {
+            'count': self.count,
+            'mean': self.mean,
+            'min': self.min if self.min is not None else 0.0,
+            'max': self.max if self.max is not None else 0.0
+        }
+        for p in percentiles:
+            data[f'p{p}'] = self.percentile(p)
+        return data
+
+    def to_dict(self):
+        """직렬화 (원격 워커 결과 전송용)"""
+        return {
+            'precision': self.precision,
+            'min_value': self.min_value,
+            'count': self.count,
+            'total': self.total,
+            'min': self.min,
+            'max': self.max,
+            'buckets': {str(k): v for k, v in self.buckets.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        hist = cls(precision=data['precision'], min_value=data['min_value'])
+        hist.buckets = {int(k): v for k, v in data.get('buckets', {}).items()}
+        hist.count = data.get('count', 0)
+        hist.total = data.get('total', 0.0)
+        hist.min = data.get('min')
+        hist.max = data.get('max')
+        return hist
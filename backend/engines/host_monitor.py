@@ -0,0 +1,242 @@
+import os
+import threading
+import time
+from engines.resource_monitor import proc_available
+
+# 호스트 지표 샘플링 간격 (초)
+HOST_SAMPLE_INTERVAL = float(os.environ.get('HOST_SAMPLE_INTERVAL', '1.0'))
+HOST_SAMPLING_ENABLED = os.environ.get('HOST_SAMPLING', 'true').lower() == 'true'
+# 메모리에 유지할 최대 샘플 수 (실행 중인 추적이 없으면 비움)
+HOST_MAX_SAMPLES = int(os.environ.get('HOST_MAX_SAMPLES', '21600'))
+
+PROC_ROOT = '/proc'
+
+# 샘플 계열 (ts는 k6 메트릭 타임스탬프와 맞추기 위한 UNIX 시각)
+# cpu/iowait/steal: 전체 CPU 대비 비율(%), cpu_cores: 코어별 사용률(%), load1: 1분 부하 평균,
+# mem_available_kb/swap_used_kb: 메모리, net_rx/net_tx: 간격 동안 송수신 바이트 (loopback 제외),
+# tcp_retrans/tcp_out: 간격 동안 재전송/송신 세그먼트 수, tcp_estab/tcp_tw/tcp_orphan: TCP 소켓 상태별 수
+HOST_SERIES = ('ts', 'cpu', 'iowait', 'steal', 'cpu_cores', 'load1', 'mem_available_kb', 'swap_used_kb',
+               'net_rx', 'net_tx', 'tcp_retrans', 'tcp_out', 'tcp_estab', 'tcp_tw', 'tcp_orphan')
+
+def _read(name):
+    with open(os.path.join(PROC_ROOT, name)) as f:
+        return f.read()
+
+def read_cpu_times():
+    """/proc/stat의 CPU별 (사용, iowait, steal, 전체) 틱 {'cpu': ..., 'cpu0': ...}"""
+    times = {}
+    for line in _read('stat').splitlines():
+        if not line.startswith('cpu'):
+            break
+        name, *values = line.split()
+        values = [int(v) for v in values[:8]] + [0] * max(0, 8 - len(values))
+        user, nice, system, idle, iowait, irq, softirq, steal = values
+        total = sum(values)
+        times[name] = (total - idle - iowait, iowait, steal, total)
+    return times
+
+def read_meminfo():
+    info = {}
+    for line in _read('meminfo').splitlines():
+        key, _, value = line.partition(':')
+        parts = value.split()
+        if parts:
+            info[key] = int(parts[0])
+    return info
+
+def read_net_dev():
+    """loopback을 제외한 전체 인터페이스의 (수신, 송신) 누적 바이트"""
+    rx = tx = 0
+    for line in _read('net/dev').splitlines()[2:]:
+        interface, _, data = line.partition(':')
+        if interface.strip() == 'lo':
+            continue
+        values = data.split()
+        if len(values) >= 9:
+            rx += int(values[0])
+            tx += int(values[8])
+    return rx, tx
+
+def read_tcp_counters():
+    """/proc/net/snmp의 TCP 누적 카운터 (RetransSegs, OutSegs, CurrEstab)"""
+    lines = [line.split() for line in _read('net/snmp').splitlines() if line.startswith('Tcp:')]
+    if len(lines) < 2:
+        return {}
+    return {key: int(value) for key, value in zip(lines[0][1:], lines[1][1:]) if value.lstrip('-').isdigit()}
+
+def read_sockstat():
+    """/proc/net/sockstat의 TCP 소켓 상태 (inuse, orphan, tw, alloc)"""
+    for line in _read('net/sockstat').splitlines():
+        if line.startswith('TCP:'):
+            parts = line.split()[1:]
+            return {parts[i]: int(parts[i + 1]) for i in range(0, len(parts) - 1, 2)}
+    return {}
+
+def _percent(part, total):
+    return round(part * 100.0 / total, 1) if total > 0 else 0.0
+
+# 호스트 전체 지표 샘플러 (프로세스 내 하나만 실행, 성능 실행이 추적하는 동안에만 동작)
+# 동시에 여러 실행이 진행되면 같은 샘플 계열을 공유하고 실행별로 자신의 구간만 잘라 사용
+class HostMetricsSampler:
+    def __init__(self, interval=None, max_samples=None):
+        self.interval = interval or HOST_SAMPLE_INTERVAL
+        self.max_samples = max_samples or HOST_MAX_SAMPLES
+        self.series = {key: [] for key in HOST_SERIES}
+        self.offset = 0  # 앞에서 잘라낸 샘플 수 (추적 시작 위치를 전체 순번으로 유지)
+        self._previous = None
+        self._lock = threading.Lock()
+        self._trackers = 0
+        self._stop = None
+        self._thread = None
+        # 샘플러 스레드가 사용한 CPU 시간 (오버헤드 확인용)
+        self.cpu_seconds = 0.0
+        self.active_seconds = 0.0
+
+    def start_tracking(self):
+        """추적 시작 (샘플러가 멈춰 있으면 시작), 추적 토큰 반환 (샘플링 불가 시 None)"""
+        if not HOST_SAMPLING_ENABLED or not proc_available():
+            return None
+        with self._lock:
+            self._trackers += 1
+            if self._thread is None:
+                self._stop = threading.Event()
+                self._thread = threading.Thread(target=self._loop, args=(self._stop,), name='host-metrics-sampler', daemon=True)
+                self._thread.start()
+            return {'start': self.offset + len(self.series['ts']), 'started_at': time.time()}
+
+    def stop_tracking(self, token):
+        """추적 종료 후 추적 구간의 샘플 계열 반환 (마지막 추적이면 샘플러 중지)"""
+        if token is None:
+            return None
+        with self._lock:
+            start = max(0, token['start'] - self.offset)
+            window = {key: list(values[start:]) for key, values in self.series.items()}
+            self._trackers -= 1
+            stop, thread = None, None
+            if self._trackers <= 0:
+                self._trackers = 0
+                stop, thread = self._stop, self._thread
+                self._thread = None
+                self.offset += len(self.series['ts'])
+                self.series = {key: [] for key in HOST_SERIES}
+                self._previous = None
+        if stop is not None:
+            stop.set()
+            thread.join(timeout=self.interval * 2)
+        window['interval'] = self.interval
+        window['cores'] = len(window['cpu_cores'][0]) if window['cpu_cores'] else None
+        window['overhead_percent'] = self.overhead_percent()
+        try:
+            window['mem_total_kb'] = read_meminfo().get('MemTotal')
+        except OSError:
+            window['mem_total_kb'] = None
+        return window
+
+    def overhead_percent(self):
+        """샘플러 스레드 CPU 시간 / 동작 시간 (코어 1개 기준 %)"""
+        return round(self.cpu_seconds * 100.0 / self.active_seconds, 4) if self.active_seconds else 0.0
+
+    def _loop(self, stop):
+        started = time.time()
+        cpu_started = time.thread_time()
+        self._sample(record=False)
+        while not stop.wait(self.interval):
+            try:
+                self._sample()
+            except (OSError, ValueError):
+                continue
+            self.cpu_seconds += time.thread_time() - cpu_started
+            self.active_seconds += time.time() - started
+            started, cpu_started = time.time(), time.thread_time()
+
+    def _read_counters(self):
+        tcp = read_tcp_counters()
+        return {
+            'cpu': read_cpu_times(),
+            'net': read_net_dev(),
+            'retrans': tcp.get('RetransSegs', 0),
+            'out': tcp.get('OutSegs', 0),
+            'estab': tcp.get('CurrEstab', 0)
+        }
+
+    def _sample(self, record=True):
+        now = time.time()
+        counters = self._read_counters()
+        previous, self._previous = self._previous, counters
+        if not record or previous is None:
+            return
+        cpu = {}
+        for name, (busy, iowait, steal, total) in counters['cpu'].items():
+            before = previous['cpu'].get(name)
+            if before is None:
+                continue
+            delta_total = total - before[3]
+            cpu[name] = (
+                _percent(busy - before[0], delta_total),
+                _percent(iowait - before[1], delta_total),
+                _percent(steal - before[2], delta_total)
+            )
+        memory = read_meminfo()
+        sockets = read_sockstat()
+        load1 = float(_read('loadavg').split()[0])
+        overall = cpu.get('cpu', (0.0, 0.0, 0.0))
+        sample = {
+            'ts': round(now, 3),
+            'cpu': overall[0],
+            'iowait': overall[1],
+            'steal': overall[2],
+            'cpu_cores': [cpu[name][0] for name in sorted((n for n in cpu if n != 'cpu'), key=lambda n: int(n[3:]))],
+            'load1': load1,
+            'mem_available_kb': memory.get('MemAvailable', memory.get('MemFree', 0)),
+            'swap_used_kb': max(0, memory.get('SwapTotal', 0) - memory.get('SwapFree', 0)),
+            'net_rx': max(0, counters['net'][0] - previous['net'][0]),
+            'net_tx': max(0, counters['net'][1] - previous['net'][1]),
+            'tcp_retrans': max(0, counters['retrans'] - previous['retrans']),
+            'tcp_out': max(0, counters['out'] - previous['out']),
+            'tcp_estab': counters['estab'],
+            'tcp_tw': sockets.get('tw', 0),
+            'tcp_orphan': sockets.get('orphan', 0)
+        }
+        with self._lock:
+            if threading.current_thread() is not self._thread:
+                # 중지된 이전 샘플러 스레드의 마지막 샘플은 버림
+                return
+            for key, value in sample.items():
+                self.series[key].append(value)
+            overflow = len(self.series['ts']) - self.max_samples
+            if overflow > 0:
+                for key in HOST_SERIES:
+                    del self.series[key][:overflow]
+                self.offset += overflow
+
+def summarize_host_samples(samples):
+    """호스트 지표 요약 (최대 CPU/코어 사용률, 최대 부하, 최소 가용 메모리, 재전송 합계)"""
+    if not samples or not samples.get('ts'):
+        return None
+    cores = samples.get('cores') or 1
+    retrans = sum(samples['tcp_retrans'])
+    out = sum(samples['tcp_out'])
+    return {
+        'samples': len(samples['ts']),
+        'interval': samples.get('interval'),
+        'cores': cores,
+        'started_at': samples['ts'][0],
+        'ended_at': samples['ts'][-1],
+        'peak_cpu_percent': max(samples['cpu']),
+        'avg_cpu_percent': round(sum(samples['cpu']) / len(samples['cpu']), 1),
+        'peak_core_percent': max((max(c) for c in samples['cpu_cores'] if c), default=None),
+        'peak_load1': max(samples['load1']),
+        'peak_load_per_core': round(max(samples['load1']) / cores, 2),
+        'mem_total_kb': samples.get('mem_total_kb'),
+        'min_mem_available_kb': min(samples['mem_available_kb']),
+        'peak_swap_used_kb': max(samples['swap_used_kb']),
+        'net_rx_bytes': sum(samples['net_rx']),
+        'net_tx_bytes': sum(samples['net_tx']),
+        'tcp_retransmits': retrans,
+        'tcp_retransmit_rate': round(retrans / out, 5) if out else 0.0,
+        'peak_tcp_time_wait': max(samples['tcp_tw']),
+        'overhead_percent': samples.get('overhead_percent')
+    }
+
+# 호스트 지표 샘플러 인스턴스 생성
+host_sampler = HostMetricsSampler()
@@ -0,0 +1,621 @@
+import asyncio
+import json
+import os
+import re
+import ssl
+import time
+from collections import deque
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+from engines.histogram import LatencyHistogram
+from engines.k6_parser import K6ResultParser, MetricAggregate
+from engines.k6_engine import build_k6_result, resolve_script_path
+from engines.process_runner import is_cancelled, CANCELLED_MESSAGE
+from engines.workspace import RunWorkspace
+from engines.durations import parse_duration
+
+# uvloop이 있으면 이벤트 루프로 사용 (없으면 기본 asyncio 루프)
+try:
+    import uvloop
+    LOOP_FACTORY = uvloop.new_event_loop
+except ImportError:
+    LOOP_FACTORY = None
+
+# HTTP 부하 시나리오 파일 확장자 (JSON: base_url, headers, requests, scenario, thresholds)
+HTTP_SPEC_EXTENSION = '.http.json'
+# 요청 시간 초과 기본값 (k6 기본값과 동일)
+HTTP_REQUEST_TIMEOUT = os.environ.get('HTTP_LOAD_REQUEST_TIMEOUT', '60s')
+# 도착률(개방형) 실행기의 스케줄 간격 (초)
+SCHEDULER_TICK = float(os.environ.get('HTTP_LOAD_SCHEDULER_TICK', '0.002'))
+# VU 수 조정, 취소 확인, 시간 초과 요청 정리 간격 (초)
+CONTROL_TICK = 0.1
+TIMELINE_FILE_NAME = 'timeline.json'
+
+# 폐쇄형(고정 VU) / 개방형(도착률) 실행기 (k6 시나리오 실행기 이름과 설정을 그대로 사용)
+CLOSED_EXECUTORS = ('constant-vus', 'ramping-vus')
+OPEN_EXECUTORS = ('constant-arrival-rate', 'ramping-arrival-rate')
+DEFAULT_SCENARIO = {'executor': 'constant-vus', 'vus': 1, 'duration': '10s'}
+
+ENV_PATTERN = re.compile(r'\$\{(\w+)\}')
+
+def substitute_env(value, env_vars):
+    """문자열 안의 ${NAME}을 환경 변수로 치환 (dict/list는 재귀 처리)"""
+    if isinstance(value, str):
+        return ENV_PATTERN.sub(lambda m: str(env_vars.get(m.group(1), os.environ.get(m.group(1), ''))), value)
+    if isinstance(value, dict):
+        return {k: substitute_env(v, env_vars) for k, v in value.items()}
+    if isinstance(value, list):
+        return [substitute_env(v, env_vars) for v in value]
+    return value
+
+def load_http_spec(script_path, env_vars=None):
+    """HTTP 부하 시나리오 파일 읽기 (형식 오류는 ValueError)"""
+    with open(script_path, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    if not isinstance(spec, dict) or not spec.get('requests'):
+        raise ValueError('requests 목록이 필요합니다')
+    return substitute_env(spec, env_vars or {})
+
+def interpolate_stages(stages, start, elapsed):
+    """k6 stages(duration/target)를 선형 보간한 elapsed 시점의 목표값"""
+    offset, previous = 0.0, start
+    for stage in stages:
+        duration = parse_duration(stage['duration'])
+        target = stage['target']
+        if elapsed < offset + duration:
+            return previous + (target - previous) * ((elapsed - offset) / duration if duration else 1.0)
+        offset, previous = offset + duration, target
+    return previous
+
+# 시나리오의 수치 설정 (환경 변수 치환 결과는 문자열이므로 숫자로 변환)
+NUMERIC_SCENARIO_KEYS = ('vus', 'startVUs', 'rate', 'startRate', 'preAllocatedVUs', 'maxVUs')
+
+def normalize_scenario(scenario, env_vars=None):
+    """시나리오 수치 변환, K6_VUS/K6_DURATION 환경 변수가 있으면 k6와 같이 고정 VU 실행으로 덮어씀"""
+    env_vars = env_vars or {}
+    if env_vars.get('K6_VUS') and env_vars.get('K6_DURATION'):
+        scenario = {'executor': 'constant-vus', 'vus': env_vars['K6_VUS'], 'duration': env_vars['K6_DURATION'],
+                    'gracefulStop': scenario.get('gracefulStop', '30s')}
+    scenario = dict(scenario)
+    for key in NUMERIC_SCENARIO_KEYS:
+        if key in scenario:
+            scenario[key] = float(scenario[key])
+    if scenario.get('stages'):
+        scenario['stages'] = [{**stage, 'target': float(stage['target'])} for stage in scenario['stages']]
+    return scenario
+
+def scenario_duration(scenario):
+    if scenario.get('stages'):
+        return sum(parse_duration(stage['duration']) for stage in scenario['stages'])
+    return parse_duration(scenario.get('duration', DEFAULT_SCENARIO['duration']))
+
+# 요청 템플릿: 요청 바이트(요청 줄 + 헤더 + 본문)를 미리 인코딩하여 실행 중에는 그대로 전송
+class RequestTemplate:
+    def __init__(self, entry, base_url, default_headers):
+        method = (entry.get('method') or 'GET').upper()
+        url = entry.get('url') or base_url.rstrip('/') + '/' + (entry.get('path') or '').lstrip('/')
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f'요청 URL이 올바르지 않습니다: {url}')
+        default_port = 443 if parts.scheme == 'https' else 80
+        port = parts.port or default_port
+        self.name = entry.get('name') or f'{method} {parts.path or "/"}'
+        self.origin = (parts.scheme, parts.hostname, port)
+        self.head_request = method == 'HEAD'
+        self.expect_status = set(entry.get('expect_status') or [])
+
+        headers = {'Host': parts.hostname if port == default_port else f'{parts.hostname}:{port}',
+                   'User-Agent': 'integrated-test-platform-http-load', 'Accept': '*/*'}
+        headers.update(default_headers or {})
+        headers.update(entry.get('headers') or {})
+        if 'json' in entry:
+            body = json.dumps(entry['json']).encode('utf-8')
+            headers.setdefault('Content-Type', 'application/json')
+        else:
+            body = (entry.get('body') or '').encode('utf-8')
+        if body or method in ('POST', 'PUT', 'PATCH'):
+            headers['Content-Length'] = str(len(body))
+        target = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+        head = f'{method} {target} HTTP/1.1\r\n' + ''.join(f'{k}: {v}\r\n' for k, v in headers.items()) + '\r\n'
+        self.payload = head.encode('latin-1') + body
+
+    def is_success(self, status):
+        if self.expect_status:
+            return status in self.expect_status
+        return 200 <= status < 400
+
+class Connection:
+    __slots__ = ('reader', 'writer', 'deadline', 'timed_out')
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.deadline = None
+        self.timed_out = False
+
+    def close(self):
+        self.writer.transport.abort()
+
+# 원본(스킴/호스트/포트)별 keep-alive 커넥션 풀
+# 유휴 커넥션을 재사용하고, 상한에 도달하면 반납(또는 닫힌 자리)을 기다림
+class ConnectionPool:
+    def __init__(self, origin, limit, ssl_context=None, connect_timeout=10.0):
+        self.scheme, self.host, self.port = origin
+        self.limit = max(1, limit)
+        self.ssl_context = ssl_context if self.scheme == 'https' else None
+        self.connect_timeout = connect_timeout
+        self.idle = []
+        self.busy = set()
+        self.size = 0
+        self.opened = 0
+        self.waiters = deque()
+
+    async def acquire(self):
+        while True:
+            if self.idle:
+                conn = self.idle.pop()
+                self.busy.add(conn)
+                return conn
+            if self.size < self.limit:
+                self.size += 1
+                try:
+                    reader, writer = await asyncio.wait_for(
+                        asyncio.open_connection(self.host, self.port, ssl=self.ssl_context),
+                        self.connect_timeout
+                    )
+                except BaseException:
+                    self._discard_slot()
+                    raise
+                self.opened += 1
+                conn = Connection(reader, writer)
+                self.busy.add(conn)
+                return conn
+            waiter = asyncio.get_running_loop().create_future()
+            self.waiters.append(waiter)
+            try:
+                conn = await waiter
+            except asyncio.CancelledError:
+                # 커넥션(또는 빈 자리)을 넘겨받은 직후 취소되면 다음 대기자에게 넘김
+                if waiter.done() and not waiter.cancelled():
+                    if waiter.result() is not None:
+                        self.release(waiter.result(), True)
+                    else:
+                        self._wake(None)
+                raise
+            if conn is not None:
+                self.busy.add(conn)
+                return conn
+
+    def release(self, conn, reusable):
+        self.busy.discard(conn)
+        conn.deadline = None
+        if not reusable:
+            conn.close()
+            self._discard_slot()
+            return
+        if not self._wake(conn):
+            self.idle.append(conn)
+
+    def _wake(self, value):
+        """가장 오래 기다린 대기자에게 커넥션(None이면 새로 열 자리) 전달"""
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(value)
+                return True
+        return False
+
+    def _discard_slot(self):
+        """커넥션 하나가 닫힘 → 대기 중인 요청이 새 커넥션을 열 수 있도록 깨움"""
+        self.size -= 1
+        self._wake(None)
+
+    def expire(self, now):
+        """요청 시간 초과 커넥션 강제 종료 (요청마다 타이머를 만들지 않고 주기적으로 정리)"""
+        for conn in [c for c in self.busy if c.deadline is not None and c.deadline < now]:
+            conn.timed_out = True
+            conn.close()
+
+    def close(self):
+        for conn in self.idle + list(self.busy):
+            conn.close()
+        self.idle.clear()
+
+async def read_response(reader, head_request=False):
+    """HTTP/1.1 응답 읽기, (상태 코드, 수신 바이트, 재사용 가능 여부) 반환"""
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head[9:12])
+    lower = head.lower()
+    keep_alive = b'\r\nconnection: close' not in lower and not head.startswith(b'HTTP/1.0')
+    received = len(head)
+    if head_request or status in (204, 304) or 100 <= status < 200:
+        return status, received, keep_alive
+    index = lower.find(b'\r\ncontent-length:')
+    if index >= 0:
+        length = int(lower[index + 17:lower.index(b'\r\n', index + 2)])
+        if length:
+            await reader.readexactly(length)
+        return status, received + length, keep_alive
+    if b'\r\ntransfer-encoding: chunked' in lower:
+        while True:
+            size_line = await reader.readuntil(b'\r\n')
+            size = int(size_line.split(b';', 1)[0], 16)
+            received += len(size_line)
+            if size == 0:
+                trailer = await reader.readuntil(b'\r\n')
+                while trailer != b'\r\n':
+                    received += len(trailer)
+                    trailer = await reader.readuntil(b'\r\n')
+                return status, received + 2, keep_alive
+            await reader.readexactly(size + 2)
+            received += size + 2
+    # 길이 정보가 없으면 연결 종료까지 읽음
+    body = await reader.read()
+    return status, received + len(body), False
+
+def _trend(name, histogram):
+    metric = MetricAggregate(name, 'trend')
+    metric.histogram = histogram
+    metric.count, metric.total, metric.min, metric.max = histogram.count, histogram.total, histogram.min, histogram.max
+    return metric
+
+def _counter(name, total, count):
+    metric = MetricAggregate(name, 'counter')
+    metric.count, metric.total, metric.non_zero = count, total, count
+    return metric
+
+def _rate(name, hits, count):
+    metric = MetricAggregate(name, 'rate')
+    metric.count, metric.total, metric.non_zero = count, hits, hits
+    metric.min, metric.max = (0.0 if hits < count else 1.0), (1.0 if hits else 0.0)
+    return metric
+
+def _gauge(name, value):
+    metric = MetricAggregate(name, 'gauge')
+    metric.add(value)
+    return metric
+
+# HTTP 부하 실행 1회
+# 반복(iteration) 1회 = 시나리오의 requests를 순서대로 한 번씩 요청
+# 지연 시간은 전체/요청별/초 단위 구간별 로그 버킷 히스토그램(LatencyHistogram)에 기록하여 메모리가 요청 수와 무관
+class HttpLoadRun:
+    def __init__(self, spec, scenario, execution_id=None):
+        self.spec = spec
+        self.scenario = scenario
+        self.execution_id = execution_id
+        self.executor = scenario.get('executor', DEFAULT_SCENARIO['executor'])
+        if self.executor not in CLOSED_EXECUTORS + OPEN_EXECUTORS:
+            raise ValueError(f'지원하지 않는 실행기입니다: {self.executor} (지원: {", ".join(CLOSED_EXECUTORS + OPEN_EXECUTORS)})')
+        self.duration = scenario_duration(scenario)
+        self.graceful_stop = parse_duration(scenario.get('gracefulStop', '30s'))
+        self.request_timeout = parse_duration(spec.get('timeout', HTTP_REQUEST_TIMEOUT))
+        self.think_time = parse_duration(spec.get('think_time', 0))
+        base_url = spec.get('base_url') or ''
+        self.templates = [RequestTemplate(entry, base_url, spec.get('headers')) for entry in spec['requests']]
+        if self.executor in CLOSED_EXECUTORS:
+            stage_peak = max((stage['target'] for stage in scenario.get('stages') or []), default=0)
+            self.max_vus = int(max(scenario.get('vus', 0), scenario.get('startVUs', 0), stage_peak) or 1)
+        else:
+            self.max_vus = int(scenario.get('maxVUs') or scenario.get('preAllocatedVUs') or 100)
+        self.max_connections = int(spec.get('max_connections') or self.max_vus)
+
+        self.durations = LatencyHistogram()
+        self.iteration_durations = LatencyHistogram()
+        self.endpoints = {t.name: {'histogram': LatencyHistogram(), 'failed': 0, 'statuses': {}} for t in self.templates}
+        self.buckets = {}
+        self.requests = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.errors = {}
+        self.iterations = 0
+        self.dropped = 0
+        self.interrupted = 0
+        self.data_sent = 0
+        self.data_received = 0
+        self.active = 0
+        self.target_vus = 0
+        self.peak_vus = 0
+        self.cancelled = False
+        self.started_at = None
+        self.ended_at = None
+        self._stopping = False
+        self._done = False
+        self._stopped = None
+        self._tasks = set()
+        self._pools = {}
+
+    def _record(self, template, started, finished, status, sent, received):
+        elapsed_ms = (finished - started) * 1000.0
+        ok = template.is_success(status)
+        self.durations.record(elapsed_ms)
+        endpoint = self.endpoints[template.name]
+        endpoint['histogram'].record(elapsed_ms)
+        endpoint['statuses'][status] = endpoint['statuses'].get(status, 0) + 1
+        self.requests += 1
+        self.data_sent += sent
+        self.data_received += received
+        key = int(self._epoch + finished)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = [0, 0, LatencyHistogram(), 0]
+        bucket[0] += 1
+        bucket[2].record(elapsed_ms)
+        if self.active > bucket[3]:
+            bucket[3] = self.active
+        if not ok:
+            self.failed += 1
+            endpoint['failed'] += 1
+            bucket[1] += 1
+
+    async def _request(self, template):
+        pool = self._pools[template.origin]
+        started = time.perf_counter()
+        status, received, conn = 0, 0, None
+        try:
+            conn = await pool.acquire()
+            conn.deadline = time.perf_counter() + self.request_timeout
+            conn.writer.write(template.payload)
+            status, received, keep_alive = await read_response(conn.reader, template.head_request)
+            pool.release(conn, keep_alive)
+        except asyncio.CancelledError:
+            if conn is not None:
+                pool.release(conn, False)
+            raise
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ValueError) as e:
+            if conn is not None:
+                if conn.timed_out:
+                    self.timeouts += 1
+                pool.release(conn, False)
+            reason = 'timeout' if conn is not None and conn.timed_out else type(e).__name__
+            self.errors[reason] = self.errors.get(reason, 0) + 1
+        self._record(template, started, time.perf_counter(), status, len(template.payload), received)
+
+    async def _iteration(self):
+        started = time.perf_counter()
+        for template in self.templates:
+            await self._request(template)
+            if self.think_time:
+                await asyncio.sleep(self.think_time)
+        self.iteration_durations.record((time.perf_counter() - started) * 1000.0)
+        self.iterations += 1
+
+    async def _closed_vu(self, index):
+        """폐쇄형: VU마다 응답을 받은 뒤 다음 반복 시작 (index가 목표 VU 수 이상이면 대기)"""
+        while not self._stopping:
+            if index >= self.target_vus:
+                await asyncio.sleep(CONTROL_TICK)
+                continue
+            self.active += 1
+            try:
+                await self._iteration()
+            finally:
+                self.active -= 1
+
+    async def _open_iteration(self):
+        try:
+            await self._iteration()
+        finally:
+            self.active -= 1
+
+    async def _open_scheduler(self):
+        """개방형: 응답 시간과 무관하게 목표 도착률로 반복 시작 (maxVUs 모두 사용 중이면 dropped_iterations)"""
+        time_unit = parse_duration(self.scenario.get('timeUnit', '1s'))
+        stages = self.scenario.get('stages')
+        start_rate = self.scenario.get('startRate', 0) if stages else self.scenario.get('rate', 1)
+        loop_start = last = time.perf_counter()
+        arrivals, launched = 0.0, 0
+        while not self._stopping:
+            now = time.perf_counter()
+            elapsed = now - loop_start
+            if elapsed >= self.duration:
+                break
+            rate = interpolate_stages(stages, start_rate, elapsed) if stages else start_rate
+            arrivals += rate / time_unit * (now - last)
+            last = now
+            due = int(arrivals) - launched
+            launched += due
+            for _ in range(due):
+                if self.active >= self.max_vus:
+                    self.dropped += 1
+                    continue
+                self.active += 1
+                task = asyncio.create_task(self._open_iteration())
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            await asyncio.sleep(SCHEDULER_TICK)
+
+    async def _control(self):
+        """VU 목표 조정, 취소 확인, 시간 초과 커넥션 정리"""
+        start = time.perf_counter()
+        stages = self.scenario.get('stages')
+        while not self._done:
+            elapsed = time.perf_counter() - start
+            if self.executor in CLOSED_EXECUTORS and not self._stopping:
+                if elapsed >= self.duration:
+                    self._stop()
+                elif stages:
+                    self.target_vus = int(round(interpolate_stages(stages, self.scenario.get('startVUs', 0), elapsed)))
+                else:
+                    self.target_vus = int(self.scenario.get('vus', 1))
+            self.peak_vus = max(self.peak_vus, self.active)
+            if not self.cancelled and self.execution_id is not None and is_cancelled(self.execution_id):
+                self.cancelled = True
+                self._stop()
+            now = time.perf_counter()
+            for pool in self._pools.values():
+                pool.expire(now)
+            await asyncio.sleep(CONTROL_TICK)
+
+    def _stop(self):
+        self._stopping = True
+        self._stopped.set()
+
+    async def run(self):
+        ssl_context = ssl.create_default_context()
+        if self.spec.get('insecure'):
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        for template in self.templates:
+            if template.origin not in self._pools:
+                self._pools[template.origin] = ConnectionPool(template.origin, self.max_connections, ssl_context)
+        self._epoch = time.time() - time.perf_counter()
+        self.started_at = time.time()
+        self._stopped = asyncio.Event()
+        control = asyncio.create_task(self._control())
+        if self.executor in CLOSED_EXECUTORS:
+            if not self.scenario.get('stages'):
+                self.target_vus = int(self.scenario.get('vus', 1))
+            for index in range(self.max_vus):
+                task = asyncio.create_task(self._closed_vu(index))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            await self._stopped.wait()
+        else:
+            scheduler = asyncio.create_task(self._open_scheduler())
+            stopped = asyncio.create_task(self._stopped.wait())
+            await asyncio.wait([scheduler, stopped], return_when=asyncio.FIRST_COMPLETED)
+            self._stop()
+            scheduler.cancel()
+            stopped.cancel()
+        # 진행 중인 반복은 gracefulStop 동안 완료를 기다린 뒤 중단 (취소되면 즉시 중단)
+        pending = set(self._tasks)
+        deadline = time.perf_counter() + self.graceful_stop
+        while pending and not self.cancelled and time.perf_counter() < deadline:
+            _, pending = await asyncio.wait(pending, timeout=CONTROL_TICK)
+        self._done = True
+        control.cancel()
+        for task in pending:
+            task.cancel()
+        self.interrupted = len(pending)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        self.ended_at = time.time()
+        for pool in self._pools.values():
+            pool.close()
+
+    def build_parser(self):
+        """집계 결과를 k6 결과 파서 형식으로 구성 (k6 엔진과 같은 결과 요약 사용)"""
+        parser = K6ResultParser()
+        parser.metrics = {
+            'http_req_duration': _trend('http_req_duration', self.durations),
+            'http_req_failed': _rate('http_req_failed', self.failed, self.requests),
+            'http_reqs': _counter('http_reqs', self.requests, self.requests),
+            'iteration_duration': _trend('iteration_duration', self.iteration_durations),
+            'iterations': _counter('iterations', self.iterations, self.iterations),
+            'data_sent': _counter('data_sent', self.data_sent, self.requests),
+            'data_received': _counter('data_received', self.data_received, self.requests),
+            'vus': _gauge('vus', self.peak_vus),
+            'vus_max': _gauge('vus_max', self.max_vus)
+        }
+        if self.dropped:
+            parser.metrics['dropped_iterations'] = _counter('dropped_iterations', self.dropped, self.dropped)
+        parser.first_time = datetime.fromtimestamp(self.started_at, timezone.utc)
+        parser.last_time = datetime.fromtimestamp(self.ended_at, timezone.utc)
+        return parser
+
+    def timeline(self):
+        """초 단위 구간 집계 (engines.k6_parser.parse_k6_timeline과 같은 형식)"""
+        if not self.buckets:
+            return None
+        timeline = {'bucket_seconds': 1.0, 'metric': 'http_req_duration',
+                    'ts': [], 'requests': [], 'failed': [], 'p50': [], 'p95': [], 'max': [], 'vus': []}
+        for key in range(min(self.buckets), max(self.buckets) + 1):
+            count, failed, histogram, vus = self.buckets.get(key) or (0, 0, None, 0)
+            timeline['ts'].append(float(key))
+            timeline['requests'].append(count)
+            timeline['failed'].append(failed)
+            timeline['p50'].append(round(histogram.percentile(50), 3) if histogram else None)
+            timeline['p95'].append(round(histogram.percentile(95), 3) if histogram else None)
+            timeline['max'].append(round(histogram.max, 3) if histogram else None)
+            timeline['vus'].append(vus)
+        return timeline
+
+    def endpoint_summary(self):
+        return {
+            name: {
+                'count': data['histogram'].count,
+                'failed': data['failed'],
+                'mean': data['histogram'].mean,
+                'p95': data['histogram'].percentile(95),
+                'statuses': {str(status): count for status, count in sorted(data['statuses'].items())}
+            }
+            for name, data in self.endpoints.items()
+        }
+
+def check_thresholds(thresholds, result):
+    """임계값 검사 (error_rate: 최대 오류율, avg/p50/p90/p95/p99/max: 최대 응답 시간 ms, throughput: 최소 처리량)"""
+    violations = []
+    for key, limit in (thresholds or {}).items():
+        if key == 'throughput':
+            if result.get('throughput', 0.0) < limit:
+                violations.append(f"throughput {result.get('throughput', 0.0):.2f} < {limit}")
+            continue
+        field = 'error_rate' if key == 'error_rate' else f'response_time_{key}'
+        value = result.get(field)
+        if value is None:
+            violations.append(f'알 수 없는 임계값: {key}')
+        elif value > limit:
+            violations.append(f'{key} {value:.3f} > {limit}')
+    return violations
+
+def format_summary(result, run):
+    lines = [
+        f'executor: {run.executor}, max VUs: {run.max_vus}, connections: {sum(p.opened for p in run._pools.values())}',
+        f"requests: {result.get('request_count', 0)} ({result.get('throughput', 0.0):.1f}/s), "
+        f"failed: {run.failed}, iterations: {run.iterations}, dropped: {run.dropped}, interrupted: {run.interrupted}",
+        f"http_req_duration: avg={result.get('response_time_avg', 0.0):.2f}ms p50={result.get('response_time_p50', 0.0):.2f}ms "
+        f"p95={result.get('response_time_p95', 0.0):.2f}ms p99={result.get('response_time_p99', 0.0):.2f}ms max={result.get('response_time_max', 0.0):.2f}ms"
+    ]
+    if run.errors:
+        lines.append('errors: ' + ', '.join(f'{k}={v}' for k, v in sorted(run.errors.items())))
+    return '\n'.join(lines) + '\n'
+
+# 내장 HTTP 부하 엔진
+# REST API 수준의 성능 테스트를 k6 프로세스/JS 런타임 없이 현재 프로세스의 asyncio 이벤트 루프에서 실행
+# 결과는 k6 엔진과 같은 형식 (request_count, response_time_*, throughput, error_rate, metrics)
+class HttpLoadEngine:
+    def execute_test(self, script_path, env_vars=None, execution_id=None, options=None):
+        """HTTP 부하 시나리오 실행 (options: 부하 프로필의 k6 시나리오 설정, 시나리오 파일의 scenario를 덮어씀)"""
+        try:
+            script_path = resolve_script_path(script_path)
+            if not os.path.exists(script_path):
+                return {'status': 'Error', 'error': f'스크립트 파일을 찾을 수 없습니다: {script_path}'}
+            spec = load_http_spec(script_path, env_vars)
+            scenario = dict(DEFAULT_SCENARIO)
+            scenario.update(spec.get('scenario') or {})
+            if options and options.get('scenario'):
+                scenario = dict(options['scenario'])
+            run = HttpLoadRun(spec, normalize_scenario(scenario, env_vars), execution_id)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            return {'status': 'Error', 'error': f'HTTP 부하 시나리오 오류: {e}'}
+
+        workspace = RunWorkspace.create(execution_id)
+        start_time = time.time()
+        with asyncio.Runner(loop_factory=LOOP_FACTORY) as runner:
+            runner.run(run.run())
+        execution_time = time.time() - start_time
+
+        metrics = run.build_parser().summary()
+        violations = check_thresholds(spec.get('thresholds'), metrics)
+        stdout = format_summary(metrics, run)
+        stderr = ''.join(f'임계값 초과: {v}\n' for v in violations)
+        workspace.write_logs(stdout, stderr)
+        timeline = run.timeline()
+        if timeline:
+            with open(workspace.file_path(TIMELINE_FILE_NAME), 'w', encoding='utf-8') as f:
+                json.dump(timeline, f, separators=(',', ':'))
+
+        # 임계값 초과는 k6와 같은 종료 코드(99)로 취급
+        result = build_k6_result(99 if violations else 0, stdout, stderr, workspace, execution_time, metrics=metrics)
+        result['runtime'] = 'asyncio'
+        result['endpoints'] = run.endpoint_summary()
+        result['dropped_iterations'] = run.dropped
+        result['connections_opened'] = sum(p.opened for p in run._pools.values())
+        if run.cancelled:
+            result['status'] = 'Cancelled'
+            result['error'] = CANCELLED_MESSAGE
+            result['cancelled'] = True
+        return result
+
+# HTTP 부하 엔진 인스턴스 생성
+http_load_engine = HttpLoadEngine()
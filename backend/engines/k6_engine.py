@@ -1,21 +1,112 @@
 import os
+import json
+import shlex
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from engines.k6_parser import parse_k6_json, K6ResultParser
+from engines.workspace import RunWorkspace, PROJECT_ROOT, RUN_WORKSPACE_ROOT
+from engines.container_pool import create_container_pool, CONTAINER_CLI
+from engines.process_runner import run_process, read_last_line, is_cancelled, CANCELLED_MESSAGE
+from engines.k6_entry import write_profile_entry
+from engines.resource_monitor import load_samples, combine_samples, summarize_samples, write_samples
+
+def resolve_script_path(script_path):
+    """프로젝트 루트 기준 상대 경로를 절대 경로로 변환"""
+    if not os.path.isabs(script_path):
+        script_path = os.path.join(PROJECT_ROOT, script_path)
+    return os.path.abspath(script_path)
+
+def build_execution_segments(shards):
+    """샤드 수만큼 균등 분할한 k6 execution segment 목록과 sequence 생성"""
+    bounds = [Fraction(i, shards) for i in range(shards + 1)]
+    sequence = ','.join(str(b) for b in bounds)
+    segments = [f'{bounds[i]}:{bounds[i + 1]}' for i in range(shards)]
+    return sequence, segments
+
+def build_k6_result(returncode, stdout, stderr, workspace, execution_time, metrics=None):
+    """k6 종료 코드와 실행 작업 디렉토리의 JSON 출력으로 실행 결과 구성
+
+    stdout/stderr는 출력 끝부분 (전체 출력은 작업 디렉토리의 로그 파일)
+    """
+    # 임계값 실패(종료 코드 99) 등 실패한 실행도 수집된 메트릭은 파싱
+    if metrics is None:
+        metrics = parse_k6_json(workspace.output_path)
+    if returncode == 0:
+        result = {
+            'status': 'Pass',
+            'output': stdout
+        }
+    else:
+        result = {
+            'status': 'Fail',
+            'error': stderr,
+            'output': stdout
+        }
+    result['execution_time'] = execution_time
+    result['workspace'] = workspace.path
+    if metrics:
+        result.update(metrics)
+    else:
+        result.update({
+            'response_time_avg': 0.0,
+            'throughput': 0.0,
+            'error_rate': 0.0
+        })
+    return result
+
+def finalize_k6_result(process_result, workspace, execution_time=None):
+    """run_process 결과로 k6 실행 결과 구성 (시간 초과 시 수집된 메트릭과 함께 Error)"""
+    result = build_k6_result(
+        process_result.returncode, process_result.stdout, process_result.stderr,
+        workspace, execution_time if execution_time is not None else process_result.duration
+    )
+    if process_result.resources is not None:
+        result['resources'] = process_result.resources
+    if process_result.cancelled:
+        result['status'] = 'Cancelled'
+        result['error'] = CANCELLED_MESSAGE
+        result['cancelled'] = True
+    elif process_result.timed_out:
+        result['status'] = 'Error'
+        result['error'] = 'k6 실행 시간 초과'
+    return result
 
 # k6 엔진 클래스 정의
 class K6Engine:
     def __init__(self):
         self.k6_path = 'k6'  # k6 실행 파일 경로
+        # 분할 실행용 워커 호스트 목록 (쉼표 구분, 비어 있으면 로컬 프로세스로 분할)
+        self.worker_hosts = [h.strip() for h in os.environ.get('K6_WORKER_HOSTS', '').split(',') if h.strip()]
+        # 원격 워커 접속 명령 ({host} 치환)
+        self.remote_shell = os.environ.get('K6_REMOTE_SHELL', 'ssh -o BatchMode=yes {host}')
+        self.version = None
     
-    def execute_test(self, script_path, env_vars=None):
-        """k6 성능 테스트 실행"""
+    def warm_up(self):
+        """k6 실행 파일 확인 (바이너리를 한 번 실행해 두어 첫 테스트의 로딩 지연 제거), 버전 문자열 반환"""
+        completed = subprocess.run([self.k6_path, 'version'], capture_output=True, text=True, timeout=30)
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip() or f'k6 version 종료 코드 {completed.returncode}')
+        self.version = completed.stdout.strip()
+        return self.version
+
+    def inspect(self, script_path, timeout=30):
+        """k6 inspect로 스크립트를 실행하지 않고 해석하여 options 반환 (구문 오류나 잘못된 options면 ValueError)"""
+        completed = subprocess.run(
+            [self.k6_path, 'inspect', script_path], capture_output=True, text=True, timeout=timeout,
+            cwd=os.path.dirname(script_path)
+        )
+        if completed.returncode != 0:
+            raise ValueError((completed.stderr or completed.stdout).strip()[-2000:] or f'k6 inspect 종료 코드 {completed.returncode}')
+        data = json.loads(completed.stdout or '{}')
+        return data.get('options', data)
+
+    def execute_test(self, script_path, env_vars=None, execution_id=None, options=None):
+        """k6 성능 테스트 실행 (options: 스크립트 options에 병합할 부하 프로필 설정)"""
         try:
-            # 절대 경로로 변환
-            if not os.path.isabs(script_path):
-                # 현재 작업 디렉토리를 기준으로 절대 경로 생성
-                base_dir = os.path.dirname(os.path.abspath(__file__))
-                # backend/engines 디렉토리에서 상위로 이동하여 프로젝트 루트에 접근
-                project_root = os.path.join(base_dir, '..', '..')
-                script_path = os.path.join(project_root, script_path)
+            # 절대 경로로 변환 (backend/engines 기준 프로젝트 루트)
+            script_path = resolve_script_path(script_path)
             
             # 스크립트 파일 존재 확인
             if not os.path.exists(script_path):
@@ -24,45 +115,191 @@ class K6Engine:
                     'error': f'스크립트 파일을 찾을 수 없습니다: {script_path}'
                 }
             
+            # 실행별 작업 디렉토리 (출력/로그/스크린샷 격리)
+            workspace = RunWorkspace.create(execution_id)
+            
             # 환경 변수 설정
             env = os.environ.copy()
             if env_vars:
                 env.update(env_vars)
             
+            # 부하 프로필이 있으면 원본 스크립트를 감싼 진입 스크립트로 실행
+            entry_path = write_profile_entry(workspace.path, script_path, options) if options else script_path
+            
             # k6 명령어 구성
-            cmd = [self.k6_path, 'run', script_path, '--out', 'json=result.json']
+            cmd = [
+                self.k6_path, 'run', entry_path,
+                '--out', f'json={workspace.output_path}',
+                '--summary-export', workspace.summary_path
+            ]
             
-            # k6 실행
-            result = subprocess.run(
-                cmd,
+            # k6 실행 (import 경로는 스크립트 기준으로 해석되므로 작업 디렉토리에서 실행)
+            # 출력은 작업 디렉토리 로그 파일로 스트리밍
+            result = run_process(
+                cmd, workspace.stdout_path, workspace.stderr_path,
                 env=env,
-                capture_output=True,
-                text=True,
                 timeout=1800,  # 30분 타임아웃으로 증가
-                cwd=os.path.dirname(script_path)  # 스크립트 디렉토리에서 실행
+                cwd=workspace.path,
+                run_key=execution_id,
+                resource_path=workspace.resources_path
             )
             
-            # 결과 파싱
-            if result.returncode == 0:
-                return {
-                    'status': 'Pass',
-                    'output': result.stdout,
-                    'response_time_avg': 0.0,  # 실제로는 JSON 결과에서 파싱
-                    'throughput': 0.0,
-                    'error_rate': 0.0
-                }
-            else:
-                return {
-                    'status': 'Fail',
-                    'error': result.stderr,
-                    'output': result.stdout
-                }
+            # 결과 파싱 (시간 초과로 중단된 실행도 그때까지 기록된 메트릭은 수집)
+            return finalize_k6_result(result, workspace)
                 
-        except subprocess.TimeoutExpired:
+        except Exception as e:
             return {
                 'status': 'Error',
-                'error': 'k6 실행 시간 초과'
+                'error': str(e)
             }
+
+    def run_shard(self, script_path, env_vars, workspace, segment, sequence, host=None, run_key=None, options=None):
+        """execution segment 하나를 실행하고 메트릭 집계기를 반환
+
+        host가 없으면 로컬 프로세스로, 있으면 원격 워커 호스트에서 engines.k6_shard로 실행
+        """
+        if host and host != 'local':
+            return self._run_remote_shard(script_path, env_vars, workspace, segment, sequence, host, run_key, options)
+        
+        env = os.environ.copy()
+        if env_vars:
+            env.update(env_vars)
+        entry_path = write_profile_entry(workspace.path, script_path, options) if options else script_path
+        cmd = [
+            self.k6_path, 'run', entry_path,
+            '--execution-segment', segment,
+            '--execution-segment-sequence', sequence,
+            '--out', f'json={workspace.output_path}',
+            '--summary-export', workspace.summary_path
+        ]
+        result = run_process(
+            cmd, workspace.stdout_path, workspace.stderr_path,
+            env=env,
+            timeout=1800,
+            cwd=workspace.path,
+            run_key=run_key,
+            resource_path=workspace.resources_path
+        )
+        parser = K6ResultParser()
+        if os.path.exists(workspace.output_path):
+            parser.parse_file(workspace.output_path)
+        stderr = result.stderr + ('\nk6 실행 시간 초과' if result.timed_out else '')
+        return result.returncode, result.stdout, stderr, parser
+
+    def _run_remote_shard(self, script_path, env_vars, workspace, segment, sequence, host, run_key=None, options=None):
+        """원격 워커 호스트에서 샤드 실행 (워커는 동일한 경로에 저장소가 배포되어 있어야 함)
+
+        원격 워커는 원시 NDJSON 대신 직렬화된 히스토그램만 돌려주므로 전송량이 작음
+        """
+        backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        shard_cmd = [
+            'python', '-m', 'engines.k6_shard',
+            '--script', script_path,
+            '--segment', segment,
+            '--sequence', sequence,
+            '--k6-path', self.k6_path
+        ]
+        for key, value in (env_vars or {}).items():
+            shard_cmd.extend(['--env', f'{key}={value}'])
+        if options:
+            shard_cmd.extend(['--options', json.dumps(options)])
+        remote_cmd = f'cd {shlex.quote(backend_dir)} && ' + ' '.join(shlex.quote(part) for part in shard_cmd)
+        cmd = shlex.split(self.remote_shell.format(host=host)) + [remote_cmd]
+        
+        # 마지막 줄(직렬화된 집계 결과)은 길 수 있으므로 링 버퍼가 아닌 로그 파일에서 읽음
+        remote_log = workspace.file_path('remote.log')
+        result = run_process(cmd, remote_log, workspace.stderr_path, timeout=1800, run_key=run_key)
+        try:
+            payload = json.loads(read_last_line(remote_log))
+        except json.JSONDecodeError:
+            return result.returncode or 1, result.stdout, result.stderr, K6ResultParser()
+        workspace.write_logs(payload.get('stdout', ''), payload.get('stderr', '') + result.stderr)
+        parser = K6ResultParser.from_dict(payload['parser'])
+        return payload.get('returncode', result.returncode), payload.get('stdout', ''), payload.get('stderr', ''), parser
+
+    def execute_sharded(self, script_path, env_vars=None, execution_id=None, shards=None, hosts=None, options=None,
+                        slot=None):
+        """여러 k6 프로세스로 분할 실행 후 메트릭 병합
+
+        --execution-segment로 VU/반복을 나누어 병렬 실행하고,
+        백분위수는 평균이 아닌 샤드별 히스토그램을 합산하여 계산
+        slot: 샤드 프로세스마다 확보할 동시 실행 슬롯 (컨텍스트 매니저 팩토리, 슬롯이 모자라면 남은 샤드는 대기)
+        """
+        try:
+            script_path = resolve_script_path(script_path)
+            if not os.path.exists(script_path):
+                return {
+                    'status': 'Error',
+                    'error': f'스크립트 파일을 찾을 수 없습니다: {script_path}'
+                }
+            
+            hosts = hosts if hosts is not None else self.worker_hosts
+            shards = int(shards or len(hosts) or os.cpu_count() or 1)
+            if shards < 1:
+                return {'status': 'Error', 'error': '샤드 수는 1 이상이어야 합니다'}
+            
+            workspace = RunWorkspace.create(execution_id)
+            sequence, segments = build_execution_segments(shards)
+            
+            # 샤드별 하위 작업 디렉토리, 호스트는 라운드로빈 배정 (없으면 로컬)
+            jobs = []
+            for index, segment in enumerate(segments):
+                shard_workspace = RunWorkspace.create(index, root=workspace.path, prefix='shard_')
+                host = hosts[index % len(hosts)] if hosts else None
+                jobs.append((segment, shard_workspace, host))
+            
+            def run(segment, shard_workspace, host):
+                if slot is None:
+                    return self.run_shard(script_path, env_vars, shard_workspace, segment, sequence, host, execution_id, options)
+                with slot():
+                    return self.run_shard(script_path, env_vars, shard_workspace, segment, sequence, host, execution_id, options)
+            
+            start_time = time.time()
+            with ThreadPoolExecutor(max_workers=shards, thread_name_prefix='k6-shard') as executor:
+                futures = [executor.submit(run, segment, shard_workspace, host) for segment, shard_workspace, host in jobs]
+                shard_results = [f.result() for f in futures]
+            execution_time = time.time() - start_time
+            
+            # 샤드 결과 병합
+            merged = K6ResultParser()
+            returncode = 0
+            stdout_parts, stderr_parts, shard_summaries = [], [], []
+            for (segment, shard_workspace, host), (code, stdout, stderr, parser) in zip(jobs, shard_results):
+                merged.merge(parser)
+                if code != 0 and returncode == 0:
+                    returncode = code
+                stdout_parts.append(f'=== shard {segment} ({host or "local"}) ===\n{stdout}')
+                if stderr:
+                    stderr_parts.append(f'=== shard {segment} ({host or "local"}) ===\n{stderr}')
+                shard_summaries.append({
+                    'segment': segment,
+                    'host': host or 'local',
+                    'returncode': code,
+                    'workspace': shard_workspace.path
+                })
+            
+            workspace.write_logs('\n'.join(stdout_parts), '\n'.join(stderr_parts))
+            result = build_k6_result(
+                returncode, '\n'.join(stdout_parts), '\n'.join(stderr_parts),
+                workspace, execution_time, metrics=merged.summary()
+            )
+            # 로컬 샤드의 자원 샘플 합산 (원격 샤드는 워커 호스트에서 실행되므로 제외)
+            shard_samples = [load_samples(shard_workspace.resources_path) for _, shard_workspace, _ in jobs]
+            for summary, samples in zip(shard_summaries, shard_samples):
+                if samples:
+                    summary['resources'] = summarize_samples(samples)
+            combined = combine_samples(shard_samples)
+            if combined:
+                write_samples(workspace.resources_path, combined)
+                result['resources'] = summarize_samples(combined)
+            result['shards'] = shard_summaries
+            result['execution_segment_sequence'] = sequence
+            if execution_id is not None and is_cancelled(execution_id):
+                result['status'] = 'Cancelled'
+                result['error'] = CANCELLED_MESSAGE
+                result['cancelled'] = True
+            return result
+        
         except Exception as e:
             return {
                 'status': 'Error',
@@ -72,17 +309,87 @@ class K6Engine:
 # Docker를 사용하는 k6 엔진 (선택사항)
 class DockerK6Engine:
     def __init__(self):
-        self.docker_image = 'grafana/k6:latest'
+        self.docker_image = os.environ.get('K6_DOCKER_IMAGE', 'grafana/k6:latest')
+        self.timeout = 300  # 5분 타임아웃
+        # 유휴 컨테이너 풀 (크기 0이면 실행마다 docker run --rm)
+        pool_size = int(os.environ.get('K6_CONTAINER_POOL_SIZE', '2'))
+        self.pool = create_container_pool(
+            self.docker_image, PROJECT_ROOT, RUN_WORKSPACE_ROOT,
+            size=pool_size,
+            max_runs=int(os.environ.get('K6_CONTAINER_MAX_RUNS', '20')),
+            health_check_seconds=int(os.environ.get('K6_CONTAINER_HEALTH_SECONDS', '30'))
+        ) if pool_size > 0 else None
+        self.acquire_timeout = int(os.environ.get('K6_CONTAINER_ACQUIRE_SECONDS', '600'))
+    
+    def _run_pooled(self, script_path, env_vars, workspace, run_key=None, options=None):
+        """유휴 풀 컨테이너에 docker exec로 실행 (풀을 쓸 수 없으면 None)"""
+        container_script = self.pool.container_path(script_path)
+        container_workspace = self.pool.container_path(workspace.path)
+        if not container_script or not container_workspace:
+            return None
+        if options:
+            # 진입 스크립트는 작업 디렉토리에 두고 원본은 컨테이너 경로로 import
+            entry_path = write_profile_entry(workspace.path, container_script, options)
+            container_script = self.pool.container_path(entry_path)
+        try:
+            container = self.pool.acquire(timeout=self.acquire_timeout)
+        except (RuntimeError, TimeoutError) as e:
+            print(f"⚠️ k6 풀 컨테이너 사용 불가, 단독 컨테이너로 실행: {e}")
+            return None
+        
+        broken = True
+        try:
+            cmd = self.pool.exec_command(
+                container,
+                ['k6', 'run', container_script,
+                 '--out', f'json={container_workspace}/result.json',
+                 '--summary-export', f'{container_workspace}/summary.json'],
+                workdir=container_workspace,
+                env_vars=env_vars
+            )
+            result = run_process(cmd, workspace.stdout_path, workspace.stderr_path, timeout=self.timeout, run_key=run_key)
+            # 시간 초과/취소 시 컨테이너 안의 k6가 계속 실행 중일 수 있으므로 컨테이너째 교체
+            broken = result.timed_out or result.cancelled
+            return result
+        finally:
+            self.pool.release(container, broken=broken)
+    
+    def _run_cold(self, script_path, env_vars, workspace, run_key=None, options=None):
+        """실행마다 새 컨테이너 생성 (docker run --rm)"""
+        # Docker 볼륨 마운트를 위한 경로 설정
+        script_dir = os.path.dirname(script_path)
+        script_name = os.path.basename(script_path)
+        entry = f'/scripts/{script_name}'
+        if options:
+            entry = '/workspace/' + os.path.basename(write_profile_entry(workspace.path, entry, options))
+        
+        # Docker 명령어 구성 (스크립트는 읽기 전용, 결과는 작업 디렉토리에 기록)
+        cmd = [
+            CONTAINER_CLI, 'run', '--rm',
+            '-v', f'{script_dir}:/scripts:ro',
+            '-v', f'{workspace.path}:/workspace',
+            '-w', '/workspace',
+            self.docker_image,
+            'run', entry,
+            '--out', 'json=/workspace/result.json',
+            '--summary-export', '/workspace/summary.json'
+        ]
+        
+        # 환경 변수 설정
+        if env_vars:
+            for key, value in env_vars.items():
+                cmd.extend(['-e', f'{key}={value}'])
+        
+        return run_process(
+            cmd, workspace.stdout_path, workspace.stderr_path,
+            env=os.environ.copy(), timeout=self.timeout, run_key=run_key
+        )
     
-    def execute_test(self, script_path, env_vars=None):
-        """Docker를 사용한 k6 성능 테스트 실행"""
+    def execute_test(self, script_path, env_vars=None, execution_id=None, options=None):
+        """Docker를 사용한 k6 성능 테스트 실행 (유휴 풀 컨테이너 우선)"""
         try:
             # 절대 경로로 변환
-            if not os.path.isabs(script_path):
-                base_dir = os.path.dirname(os.path.abspath(__file__))
-                # backend/engines 디렉토리에서 상위로 이동하여 프로젝트 루트에 접근
-                project_root = os.path.join(base_dir, '..', '..')
-                script_path = os.path.join(project_root, script_path)
+            script_path = resolve_script_path(script_path)
             
             # 스크립트 파일 존재 확인
             if not os.path.exists(script_path):
@@ -91,63 +398,49 @@ class DockerK6Engine:
                     'error': f'스크립트 파일을 찾을 수 없습니다: {script_path}'
                 }
             
-            # Docker 볼륨 마운트를 위한 경로 설정
-            script_dir = os.path.dirname(script_path)
-            script_name = os.path.basename(script_path)
-            
-            # Docker 명령어 구성
-            cmd = [
-                'docker', 'run', '--rm',
-                '-v', f'{script_dir}:/scripts',
-                '-w', '/scripts',
-                self.docker_image,
-                'run', script_name, '--out', 'json=result.json'
-            ]
-            
-            # 환경 변수 설정
-            env = os.environ.copy()
-            if env_vars:
-                for key, value in env_vars.items():
-                    cmd.extend(['-e', f'{key}={value}'])
+            # 실행별 작업 디렉토리 (컨테이너 사용자가 쓸 수 있도록 권한 부여)
+            workspace = RunWorkspace.create(execution_id)
+            os.chmod(workspace.path, 0o777)
+            os.chmod(workspace.screenshots_dir, 0o777)
             
-            # Docker 실행
-            result = subprocess.run(
-                cmd,
-                env=env,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5분 타임아웃
-            )
+            start_time = time.time()
+            result = self._run_pooled(script_path, env_vars, workspace, execution_id, options) if self.pool else None
+            runtime = 'pool'
+            if result is None:
+                result = self._run_cold(script_path, env_vars, workspace, execution_id, options)
+                runtime = 'cold'
             
-            # 결과 파싱
-            if result.returncode == 0:
-                return {
-                    'status': 'Pass',
-                    'output': result.stdout,
-                    'response_time_avg': 0.0,  # 실제로는 JSON 결과에서 파싱
-                    'throughput': 0.0,
-                    'error_rate': 0.0
-                }
-            else:
-                return {
-                    'status': 'Fail',
-                    'error': result.stderr,
-                    'output': result.stdout
-                }
+            # 결과 파싱 (컨테이너의 작업 디렉토리는 실행 작업 디렉토리에 마운트됨)
+            k6_result = finalize_k6_result(result, workspace, time.time() - start_time)
+            k6_result['runtime'] = runtime
+            return k6_result
                 
-        except subprocess.TimeoutExpired:
-            return {
-                'status': 'Error',
-                'error': 'k6 실행 시간 초과'
-            }
         except Exception as e:
             return {
                 'status': 'Error',
                 'error': str(e)
             }
+    
+    def stats(self):
+        return self.pool.stats() if self.pool else None
+    
+    def warm_up(self):
+        """유휴 컨테이너 풀을 미리 시작 (첫 실행이 컨테이너 기동을 기다리지 않도록)"""
+        if not self.pool:
+            return None
+        self.pool.warm()
+        return self.pool.stats()['containers']
+    
+    def shutdown(self):
+        if self.pool and self.pool._started:
+            self.pool.shutdown()
 
 # k6 엔진 인스턴스 생성
 k6_engine = K6Engine()
 
 # Docker k6 엔진 인스턴스 생성 (필요시 사용)
-docker_k6_engine = DockerK6Engine() 
\ No newline at end of file
+docker_k6_engine = DockerK6Engine()
+
+def get_k6_engine():
+    """K6_RUNTIME 설정에 따른 단일 실행 엔진 (local: 호스트 k6, docker: 컨테이너 풀)"""
+    return docker_k6_engine if os.environ.get('K6_RUNTIME', 'local') == 'docker' else k6_engine
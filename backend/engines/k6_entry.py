@@ -0,0 +1,54 @@
+import json
+import os
+
+# 부하 프로필 적용 진입 스크립트 파일명 (실행 작업 디렉토리에 생성)
+ENTRY_FILE_NAME = 'profile_entry.js'
+
+# 원본 스크립트를 import하여 default/setup/teardown/handleSummary 등은 그대로 내보내고 options만 덮어씀
+# (스크립트에서 export한 options가 --config보다 우선하므로 실행 시점 병합은 진입 스크립트로 처리)
+# 프로필 시나리오 하나로 스크립트의 시나리오를 대체: 스크립트 시나리오가 하나면 실행 함수(exec)/환경 변수/태그/브라우저 옵션은 유지,
+# 시나리오가 여럿이면 어느 시나리오에 프로필을 적용할지 정할 수 없으므로 초기화 단계에서 오류로 중단
+ENTRY_TEMPLATE = """// 부하 프로필 적용 진입 스크립트 (실행 시 자동 생성)
+import * as target from {url};
+export * from {url};
+export default target.default;
+
+const profile = {profile};
+const KEPT_SCENARIO_KEYS = ['exec', 'env', 'tags', 'options'];
+
+function applyProfile(base) {{
+  const options = Object.assign({{}}, base);
+  ['vus', 'duration', 'stages', 'iterations'].forEach((key) => delete options[key]);
+  const scenarios = base.scenarios || {{}};
+  const names = Object.keys(scenarios);
+  if (names.length > 1) {{
+    throw new Error('load profile cannot be applied to a script with multiple scenarios: ' + names.join(', '));
+  }}
+  const kept = {{}};
+  if (names.length === 1) {{
+    KEPT_SCENARIO_KEYS.forEach((key) => {{
+      if (scenarios[names[0]][key] !== undefined) kept[key] = scenarios[names[0]][key];
+    }});
+  }}
+  options.scenarios = {{}};
+  options.scenarios[names.length === 1 ? names[0] : profile.name] = Object.assign(kept, profile.scenario);
+  return options;
+}}
+
+export const options = applyProfile(target.options || {{}});
+"""
+
+def import_url(script_path):
+    """진입 스크립트에서 원본 스크립트를 가리키는 file:// URL (절대 경로 기준)"""
+    return 'file://' + script_path.replace(os.sep, '/')
+
+def write_profile_entry(directory, script_path, profile_options):
+    """부하 프로필을 적용한 진입 스크립트를 작성하고 경로 반환
+
+    script_path는 k6가 실행되는 위치(호스트 또는 컨테이너) 기준 원본 스크립트의 절대 경로
+    """
+    path = os.path.join(directory, ENTRY_FILE_NAME)
+    url = json.dumps(import_url(script_path))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(ENTRY_TEMPLATE.format(url=url, profile=json.dumps(profile_options, ensure_ascii=False)))
+    return path
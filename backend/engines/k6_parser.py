@@ -0,0 +1,319 @@
+import json
+import os
+from datetime import datetime
+from engines.histogram import LatencyHistogram
+
+# 요약 대상 메트릭 (browser_* 메트릭은 접두어로 포함)
+TRACKED_METRICS = {
+    'http_req_duration', 'http_req_failed', 'http_reqs',
+    'http_req_waiting', 'http_req_connecting', 'http_req_blocked',
+    'iteration_duration', 'iterations', 'checks', 'vus', 'vus_max',
+    'data_sent', 'data_received'
+}
+TRACKED_PREFIXES = ('browser_',)
+
+def parse_k6_time(value):
+    """k6 타임스탬프 파싱 (나노초 단위 소수점은 마이크로초로 절삭)"""
+    if not value:
+        return None
+    if '.' in value:
+        head, rest = value.split('.', 1)
+        digits = ''
+        for ch in rest:
+            if not ch.isdigit():
+                break
+            digits += ch
+        value = f"{head}.{digits[:6].ljust(6, '0')}{rest[len(digits):]}"
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+# 메트릭별 스트리밍 집계기
+class MetricAggregate:
+    def __init__(self, name, metric_type='trend'):
+        self.name = name
+        self.metric_type = metric_type
+        self.histogram = LatencyHistogram() if metric_type == 'trend' else None
+        self.count = 0
+        self.total = 0.0
+        self.non_zero = 0
+        self.min = None
+        self.max = None
+        self.last = None
+
+    def add(self, value):
+        if self.histogram is not None:
+            self.histogram.record(value)
+        self.count += 1
+        self.total += value
+        if value:
+            self.non_zero += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        self.last = value
+
+    def merge(self, other):
+        if other.histogram is not None:
+            if self.histogram is None:
+                self.histogram = LatencyHistogram(other.histogram.precision, other.histogram.min_value)
+            self.histogram.merge(other.histogram)
+        self.count += other.count
+        self.total += other.total
+        self.non_zero += other.non_zero
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+        if other.last is not None:
+            self.last = other.last
+        return self
+
+    def summary(self, duration_seconds=0.0):
+        data = {
+            'type': self.metric_type,
+            'count': self.count,
+            'min': self.min if self.min is not None else 0.0,
+            'max': self.max if self.max is not None else 0.0,
+            'mean': self.total / self.count if self.count else 0.0
+        }
+        if self.metric_type == 'trend':
+            data.update(self.histogram.summary())
+        elif self.metric_type == 'rate':
+            data['rate'] = self.non_zero / self.count if self.count else 0.0
+        elif self.metric_type == 'counter':
+            data['total'] = self.total
+            data['per_second'] = self.total / duration_seconds if duration_seconds > 0 else 0.0
+        elif self.metric_type == 'gauge':
+            data['value'] = self.last if self.last is not None else 0.0
+        return data
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'metric_type': self.metric_type,
+            'histogram': self.histogram.to_dict() if self.histogram is not None else None,
+            'count': self.count,
+            'total': self.total,
+            'non_zero': self.non_zero,
+            'min': self.min,
+            'max': self.max,
+            'last': self.last
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        agg = cls(data['name'], data['metric_type'])
+        if data.get('histogram'):
+            agg.histogram = LatencyHistogram.from_dict(data['histogram'])
+        agg.count = data.get('count', 0)
+        agg.total = data.get('total', 0.0)
+        agg.non_zero = data.get('non_zero', 0)
+        agg.min = data.get('min')
+        agg.max = data.get('max')
+        agg.last = data.get('last')
+        return agg
+
+# k6 --out json (NDJSON) 스트리밍 파서
+# 파일을 한 줄씩 읽으며 메트릭별 집계기만 유지하므로 결과 파일 크기와 무관하게 메모리가 일정
+class K6ResultParser:
+    def __init__(self):
+        self.metrics = {}
+        self.first_time = None
+        self.last_time = None
+        self.lines = 0
+        self.invalid_lines = 0
+
+    def _is_tracked(self, name):
+        return name in TRACKED_METRICS or name.startswith(TRACKED_PREFIXES)
+
+    def _get_metric(self, name, metric_type='trend'):
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = MetricAggregate(name, metric_type)
+            self.metrics[name] = metric
+        return metric
+
+    def feed_line(self, line):
+        line = line.strip()
+        if not line:
+            return
+        self.lines += 1
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            # 실행 중 읽는 경우 마지막 줄이 잘려 있을 수 있음
+            self.invalid_lines += 1
+            return
+        name = entry.get('metric')
+        if not name or not self._is_tracked(name):
+            return
+        data = entry.get('data') or {}
+        if entry.get('type') == 'Metric':
+            self._get_metric(name, data.get('type', 'trend'))
+            return
+        if entry.get('type') != 'Point':
+            return
+        value = data.get('value')
+        if value is None:
+            return
+        self._get_metric(name).add(float(value))
+        timestamp = data.get('time')
+        if timestamp:
+            point_time = parse_k6_time(timestamp)
+            if self.first_time is None or point_time < self.first_time:
+                self.first_time = point_time
+            if self.last_time is None or point_time > self.last_time:
+                self.last_time = point_time
+
+    def parse_file(self, path):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                self.feed_line(line)
+        return self
+
+    def merge(self, other):
+        """다른 파서(샤드) 결과를 병합"""
+        for name, metric in other.metrics.items():
+            if name in self.metrics:
+                self.metrics[name].merge(metric)
+            else:
+                self.metrics[name] = MetricAggregate(name, metric.metric_type).merge(metric)
+        if other.first_time and (self.first_time is None or other.first_time < self.first_time):
+            self.first_time = other.first_time
+        if other.last_time and (self.last_time is None or other.last_time > self.last_time):
+            self.last_time = other.last_time
+        self.lines += other.lines
+        self.invalid_lines += other.invalid_lines
+        return self
+
+    def to_dict(self):
+        """직렬화 (원격 샤드 결과 전송용)"""
+        return {
+            'metrics': [m.to_dict() for m in self.metrics.values()],
+            'first_time': self.first_time.isoformat() if self.first_time else None,
+            'last_time': self.last_time.isoformat() if self.last_time else None,
+            'lines': self.lines,
+            'invalid_lines': self.invalid_lines
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        parser = cls()
+        for metric in data.get('metrics', []):
+            parser.metrics[metric['name']] = MetricAggregate.from_dict(metric)
+        parser.first_time = datetime.fromisoformat(data['first_time']) if data.get('first_time') else None
+        parser.last_time = datetime.fromisoformat(data['last_time']) if data.get('last_time') else None
+        parser.lines = data.get('lines', 0)
+        parser.invalid_lines = data.get('invalid_lines', 0)
+        return parser
+
+    @property
+    def duration_seconds(self):
+        if self.first_time is None or self.last_time is None:
+            return 0.0
+        return (self.last_time - self.first_time).total_seconds()
+
+    def _first_available(self, *names):
+        for name in names:
+            metric = self.metrics.get(name)
+            if metric is not None and metric.count:
+                return metric
+        return None
+
+    def summary(self):
+        duration = self.duration_seconds
+        metrics = {name: m.summary(duration) for name, m in sorted(self.metrics.items()) if m.count}
+
+        # 대표 지표: HTTP 메트릭 우선, 브라우저 테스트는 browser_* 메트릭 사용
+        duration_metric = self._first_available('http_req_duration', 'browser_http_req_duration')
+        failed_metric = self._first_available('http_req_failed', 'browser_http_req_failed')
+        reqs_metric = self._first_available('http_reqs')
+        if reqs_metric is not None:
+            request_count = int(reqs_metric.total)
+        else:
+            request_count = duration_metric.count if duration_metric is not None else 0
+        duration_summary = duration_metric.histogram.summary() if duration_metric is not None else {}
+
+        return {
+            'request_count': request_count,
+            'duration_seconds': duration,
+            'response_time_avg': duration_summary.get('mean', 0.0),
+            'response_time_min': duration_summary.get('min', 0.0),
+            'response_time_max': duration_summary.get('max', 0.0),
+            'response_time_p50': duration_summary.get('p50', 0.0),
+            'response_time_p90': duration_summary.get('p90', 0.0),
+            'response_time_p95': duration_summary.get('p95', 0.0),
+            'response_time_p99': duration_summary.get('p99', 0.0),
+            'throughput': request_count / duration if duration > 0 else 0.0,
+            'error_rate': failed_metric.non_zero / failed_metric.count if failed_metric is not None else 0.0,
+            'metrics': metrics
+        }
+
+def parse_k6_json(path):
+    """k6 JSON 결과 파일 요약 (파일이 없으면 None)"""
+    if not path or not os.path.exists(path):
+        return None
+    return K6ResultParser().parse_file(path).summary()
+
+# 시간 구간별 집계 대상 (지연 시간, 요청 수, 실패, VU)
+TIMELINE_DURATION_METRICS = ('http_req_duration', 'browser_http_req_duration')
+TIMELINE_FAILED_METRICS = ('http_req_failed', 'browser_http_req_failed')
+
+def parse_k6_timeline(paths, bucket_seconds=1.0):
+    """k6 JSON 출력(샤드별 여러 파일 가능)을 시간 구간별로 집계 (호스트 지표와 맞추기 위한 UNIX 시각 기준)
+
+    반환: {'bucket_seconds', 'ts', 'requests', 'failed', 'p50', 'p95', 'max', 'vus'} (구간이 없으면 None)
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    buckets = {}
+    duration_metric = None
+    for path in paths:
+        if not path or not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                if '"Point"' not in line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                name = entry.get('metric')
+                data = entry.get('data') or {}
+                value, timestamp = data.get('value'), data.get('time')
+                if value is None or not timestamp:
+                    continue
+                if name not in TIMELINE_DURATION_METRICS and name not in TIMELINE_FAILED_METRICS and name != 'vus':
+                    continue
+                if name in TIMELINE_DURATION_METRICS:
+                    # HTTP 메트릭이 있으면 브라우저 메트릭보다 우선
+                    if duration_metric is None or (duration_metric != name and name == 'http_req_duration'):
+                        duration_metric = name
+                key = int(parse_k6_time(timestamp).timestamp() // bucket_seconds)
+                bucket = buckets.get(key)
+                if bucket is None:
+                    bucket = buckets[key] = {'histograms': {}, 'failed': 0, 'vus': 0}
+                if name in TIMELINE_DURATION_METRICS:
+                    bucket['histograms'].setdefault(name, LatencyHistogram()).record(float(value))
+                elif name == 'vus':
+                    bucket['vus'] = max(bucket['vus'], int(value))
+                elif value:
+                    bucket['failed'] += 1
+    if not buckets:
+        return None
+    timeline = {'bucket_seconds': bucket_seconds, 'metric': duration_metric,
+                'ts': [], 'requests': [], 'failed': [], 'p50': [], 'p95': [], 'max': [], 'vus': []}
+    for key in range(min(buckets), max(buckets) + 1):
+        bucket = buckets.get(key) or {'histograms': {}, 'failed': 0, 'vus': 0}
+        histogram = bucket['histograms'].get(duration_metric)
+        timeline['ts'].append(round(key * bucket_seconds, 3))
+        timeline['requests'].append(histogram.count if histogram else 0)
+        timeline['failed'].append(bucket['failed'])
+        timeline['p50'].append(round(histogram.percentile(50), 3) if histogram else None)
+        timeline['p95'].append(round(histogram.percentile(95), 3) if histogram else None)
+        timeline['max'].append(round(histogram.max, 3) if histogram else None)
+        timeline['vus'].append(bucket['vus'])
+    return timeline
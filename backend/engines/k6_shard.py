@@ -0,0 +1,48 @@
+"""
+원격 워커 호스트용 k6 샤드 실행 스크립트
+
+사용법 (backend 디렉토리에서):
+    python -m engines.k6_shard --script <path> --segment 0:1/2 --sequence 0,1/2,1 [--env KEY=VALUE ...]
+
+k6를 로컬에서 실행한 뒤 결과 NDJSON을 히스토그램으로 집계하여
+한 줄짜리 JSON으로 stdout에 출력 (코디네이터가 병합에 사용)
+"""
+
+import argparse
+import json
+import sys
+from engines.k6_engine import K6Engine, resolve_script_path
+from engines.workspace import RunWorkspace
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='k6 execution segment 실행')
+    parser.add_argument('--script', required=True)
+    parser.add_argument('--segment', required=True)
+    parser.add_argument('--sequence', required=True)
+    parser.add_argument('--k6-path', default='k6')
+    parser.add_argument('--env', action='append', default=[])
+    parser.add_argument('--options', help='부하 프로필 설정 (JSON)')
+    args = parser.parse_args(argv)
+
+    env_vars = dict(item.split('=', 1) for item in args.env if '=' in item)
+    engine = K6Engine()
+    engine.k6_path = args.k6_path
+    workspace = RunWorkspace.create(prefix='shard_')
+    try:
+        returncode, stdout, stderr, result_parser = engine.run_shard(
+            resolve_script_path(args.script), env_vars, workspace, args.segment, args.sequence,
+            options=json.loads(args.options) if args.options else None
+        )
+    finally:
+        workspace.cleanup()
+
+    print(json.dumps({
+        'returncode': returncode,
+        'stdout': stdout[-20000:],
+        'stderr': stderr[-20000:],
+        'parser': result_parser.to_dict()
+    }))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
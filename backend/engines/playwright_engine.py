@@ -0,0 +1,219 @@
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from engines.workspace import RunWorkspace, PROJECT_ROOT
+from engines.process_runner import run_process, CANCELLED_MESSAGE
+from engines.resource_monitor import load_samples, combine_samples, summarize_samples, write_samples
+
+# Playwright 테스트 상태 → 결과 상태
+PLAYWRIGHT_STATUS = {
+    'expected': 'Pass',
+    'unexpected': 'Fail',
+    'flaky': 'Flaky',
+    'skipped': 'Skip'
+}
+
+def _collect_attachments(results):
+    attachments = []
+    for attempt in results:
+        for attachment in attempt.get('attachments') or []:
+            # 본문(body)이 인라인으로 포함된 첨부는 크기가 커서 경로가 있는 것만 보관
+            if attachment.get('path'):
+                attachments.append({
+                    'name': attachment.get('name'),
+                    'content_type': attachment.get('contentType'),
+                    'path': attachment.get('path')
+                })
+    return attachments
+
+def _walk_suites(suites, titles, shard_index, tests):
+    for suite in suites or []:
+        suite_titles = titles + [suite['title']] if suite.get('title') else titles
+        for spec in suite.get('specs') or []:
+            for test in spec.get('tests') or []:
+                results = test.get('results') or []
+                last = results[-1] if results else {}
+                errors = [e.get('message') or '' for e in last.get('errors') or []]
+                tests.append({
+                    'title': ' › '.join(suite_titles + [spec.get('title', '')]),
+                    'file': spec.get('file') or suite.get('file'),
+                    'line': spec.get('line'),
+                    'project_name': test.get('projectName') or test.get('projectId'),
+                    'status': PLAYWRIGHT_STATUS.get(test.get('status'), 'Error'),
+                    'duration': sum(r.get('duration') or 0 for r in results) / 1000.0,
+                    'retries': max(0, len(results) - 1),
+                    'error': '\n'.join(errors) or None,
+                    'attachments': _collect_attachments(results),
+                    'shard_index': shard_index
+                })
+        _walk_suites(suite.get('suites'), suite_titles, shard_index, tests)
+
+def parse_playwright_report(path, shard_index=None):
+    """Playwright JSON 리포트를 테스트별 결과 목록으로 변환 (파일이 없거나 깨졌으면 None)"""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+    tests = []
+    _walk_suites(report.get('suites'), [], shard_index, tests)
+    return tests
+
+def summarize_tests(tests):
+    """테스트별 결과의 상태별 집계"""
+    counts = {'total': len(tests), 'Pass': 0, 'Fail': 0, 'Flaky': 0, 'Skip': 0, 'Error': 0}
+    for test in tests:
+        counts[test['status']] = counts.get(test['status'], 0) + 1
+    return counts
+
+# Playwright 실행 엔진
+# --shard=i/N 으로 스펙 집합을 나눠 샤드별 작업 디렉토리에서 실행하고 JSON 리포트를 병합
+class PlaywrightEngine:
+    def __init__(self):
+        self.npx_path = os.environ.get('NPX_PATH', 'npx')
+        self.max_shards = int(os.environ.get('PLAYWRIGHT_MAX_SHARDS', '8'))
+        # 워커 준비(warm-up) 시 CLI를 확인할 기본 스펙 디렉토리
+        self.test_dir = os.environ.get('PLAYWRIGHT_TEST_DIR', os.path.join(PROJECT_ROOT, 'test-scripts', 'playwright'))
+        self._cli_cache = {}
+        self._cli_lock = threading.Lock()
+
+    def cli_command(self, cwd):
+        """cwd에서 사용할 Playwright CLI 명령 (상위 디렉토리의 node_modules/.bin/playwright 우선, 없으면 npx)
+
+        npx는 실행마다 패키지를 다시 찾으므로 로컬 CLI를 디렉토리별로 한 번만 찾아 캐시
+        """
+        with self._cli_lock:
+            if cwd in self._cli_cache:
+                return self._cli_cache[cwd]
+        command = [self.npx_path, 'playwright']
+        directory = os.path.abspath(cwd)
+        while True:
+            candidate = os.path.join(directory, 'node_modules', '.bin', 'playwright')
+            if os.access(candidate, os.X_OK):
+                command = [candidate]
+                break
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+        with self._cli_lock:
+            self._cli_cache[cwd] = command
+        return command
+
+    def warm_up(self):
+        """기본 스펙 디렉토리의 CLI를 찾아 한 번 실행 (npx 패키지 해석과 Node 모듈 로딩을 첫 테스트 전에 수행)"""
+        cwd = self.test_dir if os.path.isdir(self.test_dir) else PROJECT_ROOT
+        command = self.cli_command(cwd)
+        completed = subprocess.run(command + ['--version'], cwd=cwd, capture_output=True, text=True, timeout=120)
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip() or f'playwright --version 종료 코드 {completed.returncode}')
+        return command
+
+    def run_shard(self, script_path, env_vars=None, workspace=None, shard_index=1, shards=1, timeout=300, run_key=None):
+        """단일 샤드 실행 (shard_index는 1부터 시작)"""
+        workspace = workspace or RunWorkspace.create()
+        report_path = workspace.file_path('report.json')
+        env = os.environ.copy()
+        env.update(env_vars or {})
+        env['PLAYWRIGHT_JSON_OUTPUT_NAME'] = report_path
+
+        # 설정 파일/노드 모듈 탐색을 위해 스크립트 디렉토리에서 실행
+        cwd = script_path if os.path.isdir(script_path) else os.path.dirname(script_path)
+        cmd = self.cli_command(cwd) + [
+            'test', script_path,
+            '--reporter=json',
+            '--output', os.path.join(workspace.path, 'test-results')
+        ]
+        if shards > 1:
+            cmd.append(f'--shard={shard_index}/{shards}')
+
+        completed = run_process(
+            cmd, workspace.stdout_path, workspace.stderr_path,
+            env=env, cwd=cwd, timeout=timeout, run_key=run_key,
+            resource_path=workspace.resources_path
+        )
+
+        return {
+            'shard_index': shard_index,
+            'exit_code': None if completed.timed_out else completed.returncode,
+            'output': completed.stdout,
+            'stderr': completed.stderr,
+            'error': f'실행 시간 초과 ({timeout}초)' if completed.timed_out else None,
+            'cancelled': completed.cancelled,
+            'execution_time': completed.duration,
+            'workspace': workspace.path,
+            'resources': completed.resources,
+            'tests': parse_playwright_report(report_path, shard_index) or []
+        }
+
+    def merge_shards(self, shard_results, execution_time, workspace):
+        """샤드 결과 병합 (모든 샤드가 종료 코드 0이어야 Pass)"""
+        tests = [t for shard in shard_results for t in shard['tests']]
+        failed = [s for s in shard_results if s['exit_code'] != 0]
+        cancelled = any(s['cancelled'] for s in shard_results)
+        if cancelled:
+            status = 'Cancelled'
+        elif any(s['exit_code'] is None for s in shard_results):
+            status = 'Error'
+        else:
+            status = 'Fail' if failed else 'Pass'
+        if len(shard_results) == 1:
+            resources = shard_results[0]['resources']
+        else:
+            # 동시에 실행된 샤드 프로세스 트리의 자원 샘플 합산
+            combined = combine_samples([load_samples(os.path.join(s['workspace'], 'resources.json')) for s in shard_results])
+            if combined:
+                write_samples(workspace.resources_path, combined)
+            resources = summarize_samples(combined) if combined else None
+        errors = [
+            f"[shard {s['shard_index']}] {s['error'] or s['stderr']}"
+            for s in failed if s['error'] or s['stderr']
+        ]
+        return {
+            'status': status,
+            'engine': 'playwright',
+            'exit_code': next((s['exit_code'] for s in failed), 0),
+            'output': '\n'.join(s['output'] for s in shard_results if s['output']),
+            'error': CANCELLED_MESSAGE if cancelled else ('\n'.join(errors) or None),
+            'cancelled': cancelled,
+            'execution_time': execution_time,
+            'workspace': workspace.path,
+            'resources': resources,
+            'shards': [
+                {k: s[k] for k in ('shard_index', 'exit_code', 'execution_time', 'workspace', 'resources')}
+                for s in shard_results
+            ],
+            'tests': tests,
+            'test_summary': summarize_tests(tests)
+        }
+
+    def execute_test(self, script_path, env_vars=None, execution_id=None, shards=1, timeout=300, slot=None):
+        """스펙 실행 (shards > 1 이면 샤드를 병렬 실행)
+
+        slot: 샤드 프로세스마다 확보할 동시 실행 슬롯 (컨텍스트 매니저 팩토리)
+        """
+        shards = max(1, min(int(shards or 1), self.max_shards))
+        workspace = RunWorkspace.create(execution_id)
+        start_time = time.time()
+
+        def run(index):
+            shard_workspace = workspace if shards == 1 else RunWorkspace.create(index, root=workspace.path, prefix='shard_')
+            if slot is None:
+                return self.run_shard(script_path, env_vars, shard_workspace, index, shards, timeout, execution_id)
+            with slot():
+                return self.run_shard(script_path, env_vars, shard_workspace, index, shards, timeout, execution_id)
+
+        if shards == 1:
+            shard_results = [run(1)]
+        else:
+            with ThreadPoolExecutor(max_workers=shards, thread_name_prefix='playwright-shard') as executor:
+                shard_results = list(executor.map(run, range(1, shards + 1)))
+        return self.merge_shards(shard_results, time.time() - start_time, workspace)
+
+# Playwright 엔진 인스턴스 생성
+playwright_engine = PlaywrightEngine()
@@ -0,0 +1,721 @@
+import asyncio
+import base64
+import json
+import os
+import random
+import re
+import ssl
+import time
+import uuid
+from datetime import datetime, timezone
+from urllib.parse import urlsplit, quote, urlencode
+from engines.http_engine import ConnectionPool, LOOP_FACTORY
+from engines.k6_engine import resolve_script_path
+from engines.playwright_engine import summarize_tests
+from engines.process_runner import is_cancelled, CANCELLED_MESSAGE
+from engines.workspace import RunWorkspace
+from engines.durations import parse_duration
+
+# Postman 컬렉션 파일 이름 (docs/postman_collection.json, *.postman_collection.json)
+POSTMAN_COLLECTION_SUFFIX = 'postman_collection.json'
+# 요청 1건의 시간 초과
+POSTMAN_REQUEST_TIMEOUT = os.environ.get('POSTMAN_REQUEST_TIMEOUT', '30s')
+# 동시에 실행할 최상위 폴더 수
+POSTMAN_FOLDER_CONCURRENCY = int(os.environ.get('POSTMAN_FOLDER_CONCURRENCY', '4'))
+USER_AGENT = 'integrated-test-platform-postman'
+
+VARIABLE_PATTERN = re.compile(r'\{\{([^{}]+)\}\}')
+DYNAMIC_VARIABLES = {
+    '$guid': lambda: str(uuid.uuid4()),
+    '$randomUUID': lambda: str(uuid.uuid4()),
+    '$timestamp': lambda: str(int(time.time())),
+    '$isoTimestamp': lambda: datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z'),
+    '$randomInt': lambda: str(random.randint(0, 1000))
+}
+
+def substitute_variables(value, variables, depth=5):
+    """{{name}} 변수 치환 (값 안의 변수도 depth 단계까지 치환, 정의되지 않은 변수는 그대로 둠)"""
+    if not isinstance(value, str) or '{{' not in value:
+        return value
+    def replace(match):
+        name = match.group(1).strip()
+        if name in DYNAMIC_VARIABLES:
+            return DYNAMIC_VARIABLES[name]()
+        if name in variables:
+            return '' if variables[name] is None else str(variables[name])
+        return match.group(0)
+    for _ in range(depth):
+        replaced = VARIABLE_PATTERN.sub(replace, value)
+        if replaced == value:
+            break
+        value = replaced
+    return value
+
+def load_postman_collection(script_path):
+    with open(script_path, 'r', encoding='utf-8') as f:
+        collection = json.load(f)
+    if not isinstance(collection, dict) or 'item' not in collection:
+        raise ValueError('Postman 컬렉션 형식이 아닙니다 (item 없음)')
+    schema = (collection.get('info') or {}).get('schema') or ''
+    if schema and 'v2.1' not in schema and 'v2.0' not in schema:
+        raise ValueError(f'지원하지 않는 컬렉션 스키마입니다: {schema}')
+    return collection
+
+def load_postman_environment(path):
+    """환경 파일의 활성화된 변수 (이름, 변수 dict)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        environment = json.load(f)
+    values = {
+        entry['key']: entry.get('value', '')
+        for entry in environment.get('values') or []
+        if entry.get('key') and entry.get('enabled', True)
+    }
+    return environment.get('name'), values
+
+def find_environment_path(script_path, env_vars=None):
+    """POSTMAN_ENVIRONMENT 환경 변수의 파일, 없으면 컬렉션 옆의 *environment.json 파일"""
+    configured = (env_vars or {}).get('POSTMAN_ENVIRONMENT')
+    if configured:
+        path = resolve_script_path(configured)
+        if not os.path.exists(path):
+            raise ValueError(f'Postman 환경 파일을 찾을 수 없습니다: {configured}')
+        return path
+    directory, name = os.path.split(script_path)
+    sibling = os.path.join(directory, name.replace('collection', 'environment'))
+    return sibling if sibling != script_path and os.path.exists(sibling) else None
+
+# ---- 테스트 스크립트 ----
+# JS 런타임 없이 자주 쓰는 pm.test/pm.expect 검증 구문만 해석
+# 해석하지 못한 검증 구문은 실패로 처리하지 않고 건너뛴 개수만 기록
+
+TEST_BLOCK = re.compile(r"pm\.test\(\s*(['\"`])(.*?)\1\s*,")
+JSON_ALIAS = re.compile(r"(?:var|let|const)\s+(\w+)\s*=\s*pm\.response\.json\(\)\s*;?")
+STATEMENT = re.compile(r"pm\.expect\(|pm\.response\.to\.")
+SETTER = re.compile(
+    r"pm\.(?:environment|collectionVariables|globals|variables)\.set\(\s*(['\"])(.+?)\1\s*,\s*(.+?)\s*\)\s*;?\s*$", re.M
+)
+JSON_PATH = r"pm\.response\.json\(\)((?:\.\w+|\[\d+\]|\[['\"][^'\"]+['\"]\])*)"
+PATH_SEGMENT = re.compile(r"\.(\w+)|\[(\d+)\]|\[['\"]([^'\"]+)['\"]\]")
+
+# (정규식, 일치 결과 → (검증 종류, 인자))
+ASSERTION_PATTERNS = [
+    (re.compile(r"pm\.response\.to\.have\.status\(\s*(\d{3})\s*\)"),
+     lambda m: ('status', (int(m.group(1)),))),
+    (re.compile(r"pm\.expect\(\s*pm\.response\.(?:code|status)\s*\)\.to\.(?:be\.)?(?:eql|equal|equals)\(\s*(\d{3})\s*\)"),
+     lambda m: ('status', (int(m.group(1)),))),
+    (re.compile(r"pm\.expect\(\s*pm\.response\.code\s*\)\.to\.be\.oneOf\(\s*\[([\d,\s]+)\]\s*\)"),
+     lambda m: ('status_in', tuple(int(v) for v in m.group(1).split(',') if v.strip()))),
+    (re.compile(r"pm\.response\.to\.(be|not\.be)\.(ok|success|error|clientError|serverError)\b"),
+     lambda m: ('status_class', (m.group(2), m.group(1) == 'be'))),
+    (re.compile(r"pm\.response\.to\.(?:be\.json|have\.jsonBody\(\s*\))"),
+     lambda m: ('json', ())),
+    (re.compile(r"pm\.response\.to\.have\.jsonBody\(\s*(['\"])(.+?)\1\s*\)"),
+     lambda m: ('json_property', ('', m.group(2)))),
+    (re.compile(r"pm\.expect\(\s*pm\.response\.responseTime\s*\)\.to\.be\.(below|lessThan|above|greaterThan)\(\s*(\d+(?:\.\d+)?)\s*\)"),
+     lambda m: ('response_time', (m.group(1) in ('below', 'lessThan'), float(m.group(2))))),
+    (re.compile(r"pm\.response\.to\.have\.header\(\s*(['\"])(.+?)\1\s*(?:,\s*(['\"])(.*?)\3\s*)?\)"),
+     lambda m: ('header', (m.group(2), m.group(4)))),
+    (re.compile(r"pm\.expect\(\s*pm\.response\.text\(\)\s*\)\.to\.include\(\s*(['\"])(.*?)\1\s*\)"),
+     lambda m: ('body_includes', (m.group(2),))),
+    (re.compile(r"pm\.expect\(\s*" + JSON_PATH + r"\s*\)\.to\.have\.property\(\s*(['\"])(.+?)\2\s*\)"),
+     lambda m: ('json_property', (m.group(1), m.group(3)))),
+    (re.compile(r"pm\.expect\(\s*" + JSON_PATH + r"\s*\)\.to\.be\.an?\(\s*(['\"])(\w+)\2\s*\)"),
+     lambda m: ('json_type', (m.group(1), m.group(3)))),
+    (re.compile(r"pm\.expect\(\s*" + JSON_PATH + r"\s*\)\.to\.(?:eql|equal|deep\.equal)\((.+?)\)\s*;?\s*$", re.M),
+     lambda m: ('json_equals', (m.group(1), m.group(2).strip()))),
+    (re.compile(r"pm\.expect\(\s*" + JSON_PATH + r"\s*\)\.to\.(?:exist|not\.be\.undefined)"),
+     lambda m: ('json_exists', (m.group(1),)))
+]
+
+JSON_TYPES = {'object': dict, 'array': list, 'string': str, 'number': (int, float), 'boolean': bool}
+MISSING = object()
+
+def parse_literal(text):
+    """검증/변수 설정 구문의 JS 리터럴 값 (해석할 수 없으면 MISSING)"""
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in '\'"`':
+        return text[1:-1]
+    try:
+        return json.loads(text)
+    except ValueError:
+        return MISSING
+
+def _script_source(event):
+    exec_lines = (event.get('script') or {}).get('exec') or []
+    return '\n'.join(exec_lines) if isinstance(exec_lines, list) else str(exec_lines)
+
+def _parse_assertions(code):
+    found = []
+    for pattern, build in ASSERTION_PATTERNS:
+        for match in pattern.finditer(code):
+            found.append((match.start(), build(match)))
+    found.sort(key=lambda item: item[0])
+    # 같은 위치에서 두 구문이 일치하면 먼저 정의한 구문만 사용
+    assertions, positions = [], set()
+    for position, assertion in found:
+        if position not in positions:
+            positions.add(position)
+            assertions.append(assertion)
+    return assertions, max(0, len(STATEMENT.findall(code)) - len(assertions))
+
+# 컴파일된 이벤트 스크립트: pm.test 블록별 검증 목록과 변수 설정 구문
+class PostmanScript:
+    def __init__(self, source):
+        for alias in set(JSON_ALIAS.findall(source)):
+            source = re.sub(rf'\b{alias}\b(?!\s*=\s*pm\.response)', 'pm.response.json()', source)
+        self.setters = [(m.group(2), m.group(3)) for m in SETTER.finditer(source)]
+        self.checks = []
+        self.unsupported = 0
+        blocks = list(TEST_BLOCK.finditer(source))
+        for i, block in enumerate(blocks):
+            end = blocks[i + 1].start() if i + 1 < len(blocks) else len(source)
+            assertions, unsupported = _parse_assertions(source[block.end():end])
+            self.checks.append((block.group(2), assertions))
+            self.unsupported += unsupported
+
+    @classmethod
+    def from_events(cls, events, listen):
+        scripts = [cls(_script_source(e)) for e in events or [] if e.get('listen') == listen and not e.get('disabled')]
+        return [s for s in scripts if s.checks or s.setters]
+
+class PostmanResponse:
+    def __init__(self, status, headers, body, elapsed_ms):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.elapsed_ms = elapsed_ms
+        self._json = MISSING
+
+    def text(self):
+        return self.body.decode('utf-8', errors='replace')
+
+    def json(self):
+        if self._json is MISSING:
+            self._json = json.loads(self.body or b'null')
+        return self._json
+
+    def json_value(self, path):
+        value = self.json()
+        for key, index, quoted in PATH_SEGMENT.findall(path or ''):
+            if index:
+                if not isinstance(value, list) or int(index) >= len(value):
+                    return MISSING
+                value = value[int(index)]
+            else:
+                name = key or quoted
+                if not isinstance(value, dict) or name not in value:
+                    return MISSING
+                value = value[name]
+        return value
+
+STATUS_CLASSES = {
+    'ok': lambda s: s == 200,
+    'success': lambda s: 200 <= s < 300,
+    'error': lambda s: s >= 400,
+    'clientError': lambda s: 400 <= s < 500,
+    'serverError': lambda s: s >= 500
+}
+
+def evaluate_assertion(kind, args, response):
+    """검증 1건 평가, 실패하면 실패 사유 반환"""
+    try:
+        if kind == 'status':
+            return None if response.status == args[0] else f'상태 코드 {args[0]} 기대, 실제 {response.status}'
+        if kind == 'status_in':
+            return None if response.status in args else f'상태 코드 {list(args)} 중 하나 기대, 실제 {response.status}'
+        if kind == 'status_class':
+            name, expected = args
+            if STATUS_CLASSES[name](response.status) == expected:
+                return None
+            return f"응답이 {'' if expected else 'not '}{name} 기대, 실제 상태 코드 {response.status}"
+        if kind == 'json':
+            response.json()
+            return None
+        if kind == 'response_time':
+            below, limit = args
+            ok = response.elapsed_ms < limit if below else response.elapsed_ms > limit
+            return None if ok else f"응답 시간 {response.elapsed_ms:.0f}ms ({'<' if below else '>'} {limit:g}ms 기대)"
+        if kind == 'header':
+            name, value = args
+            actual = response.headers.get(name.lower())
+            if actual is None:
+                return f'응답 헤더 없음: {name}'
+            return None if value is None or actual == value else f'헤더 {name}: {value} 기대, 실제 {actual}'
+        if kind == 'body_includes':
+            return None if args[0] in response.text() else f'응답 본문에 "{args[0]}" 없음'
+        if kind == 'json_property':
+            value = response.json_value(args[0])
+            return None if isinstance(value, dict) and args[1] in value else f'JSON 속성 없음: {args[0] or "$"}.{args[1]}'
+        if kind == 'json_type':
+            value = response.json_value(args[0])
+            expected = JSON_TYPES.get(args[1])
+            if expected is None:
+                return None
+            ok = isinstance(value, expected) and not (args[1] == 'number' and isinstance(value, bool))
+            return None if ok else f'JSON {args[0] or "$"}: {args[1]} 기대'
+        if kind == 'json_equals':
+            expected = parse_literal(args[1])
+            if expected is MISSING:
+                return None
+            value = response.json_value(args[0])
+            return None if value == expected else f'JSON {args[0] or "$"}: {expected!r} 기대, 실제 {None if value is MISSING else value!r}'
+        if kind == 'json_exists':
+            return None if response.json_value(args[0]) is not MISSING else f'JSON 값 없음: {args[0]}'
+    except ValueError:
+        return '응답 본문이 JSON이 아닙니다'
+    return None
+
+def evaluate_setter(expression, response):
+    """변수 설정 구문의 값 (응답 JSON 경로/헤더/상태 코드/리터럴, 해석할 수 없으면 MISSING)"""
+    match = re.fullmatch(JSON_PATH, expression)
+    if match:
+        if response is None:
+            return MISSING
+        try:
+            value = response.json_value(match.group(1))
+        except ValueError:
+            return MISSING
+        return json.dumps(value) if isinstance(value, (dict, list)) else value
+    match = re.fullmatch(r"pm\.response\.headers\.get\(\s*(['\"])(.+?)\1\s*\)", expression)
+    if match:
+        return response.headers.get(match.group(2).lower(), MISSING) if response is not None else MISSING
+    if expression in ('pm.response.code', 'pm.response.status'):
+        return response.status if response is not None else MISSING
+    return parse_literal(expression)
+
+# ---- 요청 구성 ----
+
+class UnsupportedRequest(Exception):
+    pass
+
+class PreparedRequest:
+    __slots__ = ('method', 'url', 'origin', 'payload', 'head_request')
+
+    def __init__(self, method, url, origin, payload, head_request):
+        self.method = method
+        self.url = url
+        self.origin = origin
+        self.payload = payload
+        self.head_request = head_request
+
+def _auth_params(auth):
+    params = auth.get(auth.get('type')) or []
+    if isinstance(params, dict):  # v2.0 형식
+        return params
+    return {p.get('key'): p.get('value') for p in params if p.get('key')}
+
+def _url_source(url):
+    """요청 URL 문자열과 경로 변수(:name) 목록"""
+    if isinstance(url, str):
+        return url, {}
+    raw = url.get('raw')
+    if not raw:
+        host = url.get('host') or ''
+        path = url.get('path') or ''
+        raw = (host if isinstance(host, str) else '.'.join(host)) + '/' + (path if isinstance(path, str) else '/'.join(path))
+        query = [q for q in url.get('query') or [] if not q.get('disabled')]
+        if query:
+            raw += '?' + '&'.join(f"{q.get('key')}={q.get('value') or ''}" for q in query)
+        if url.get('protocol'):
+            raw = f"{url['protocol']}://{raw}"
+    return raw, {v['key']: v.get('value') or '' for v in url.get('variable') or [] if v.get('key')}
+
+def _encode_body(body, variables, headers):
+    if not body or body.get('disabled'):
+        return b''
+    mode = body.get('mode')
+    if mode == 'raw':
+        language = ((body.get('options') or {}).get('raw') or {}).get('language')
+        if language == 'json':
+            headers.setdefault('content-type', ('Content-Type', 'application/json'))
+        return substitute_variables(body.get('raw') or '', variables).encode('utf-8')
+    if mode == 'urlencoded':
+        fields = [(substitute_variables(p.get('key', ''), variables), substitute_variables(p.get('value', ''), variables))
+                  for p in body.get('urlencoded') or [] if not p.get('disabled')]
+        headers.setdefault('content-type', ('Content-Type', 'application/x-www-form-urlencoded'))
+        return urlencode(fields).encode('utf-8')
+    if mode == 'formdata':
+        fields = [p for p in body.get('formdata') or [] if not p.get('disabled')]
+        if any(p.get('type') == 'file' for p in fields):
+            raise UnsupportedRequest('파일 업로드(formdata file) 요청은 지원하지 않습니다')
+        boundary = uuid.uuid4().hex
+        parts = [
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{substitute_variables(p.get("key", ""), variables)}"\r\n\r\n'
+            f'{substitute_variables(p.get("value", ""), variables)}\r\n'
+            for p in fields
+        ]
+        headers['content-type'] = ('Content-Type', f'multipart/form-data; boundary={boundary}')
+        return (''.join(parts) + f'--{boundary}--\r\n').encode('utf-8')
+    if mode == 'graphql':
+        graphql = body.get('graphql') or {}
+        payload = {'query': substitute_variables(graphql.get('query') or '', variables)}
+        if graphql.get('variables'):
+            payload['variables'] = json.loads(substitute_variables(graphql['variables'], variables))
+        headers.setdefault('content-type', ('Content-Type', 'application/json'))
+        return json.dumps(payload).encode('utf-8')
+    raise UnsupportedRequest(f'지원하지 않는 본문 형식입니다: {mode}')
+
+def prepare_request(request, auth, variables):
+    """Postman 요청 정의를 변수 치환 후 HTTP/1.1 요청 바이트로 구성"""
+    if isinstance(request, str):
+        request = {'method': 'GET', 'url': request}
+    method = (request.get('method') or 'GET').upper()
+    raw, path_variables = _url_source(request.get('url') or '')
+    url = substitute_variables(raw, variables).strip()
+    if '://' not in url:
+        url = 'http://' + url
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        raise ValueError(f'요청 URL이 올바르지 않습니다: {url}')
+    if VARIABLE_PATTERN.search(parts.netloc):
+        raise ValueError(f'정의되지 않은 변수가 있습니다: {url}')
+    path = parts.path or '/'
+    for key, value in path_variables.items():
+        path = re.sub(rf'/:{re.escape(key)}(?=/|$)', '/' + quote(str(substitute_variables(value, variables)), safe=''), path)
+    query = parts.query
+    default_port = 443 if parts.scheme == 'https' else 80
+    port = parts.port or default_port
+
+    # 헤더는 소문자 이름 → (원래 이름, 값), 요청 헤더가 기본 헤더/인증 헤더보다 우선
+    headers = {
+        'host': ('Host', parts.hostname if port == default_port else f'{parts.hostname}:{port}'),
+        'user-agent': ('User-Agent', USER_AGENT),
+        'accept': ('Accept', '*/*')
+    }
+    auth = request.get('auth') or auth
+    if auth and auth.get('type') not in (None, 'noauth', 'inherit'):
+        params = {k: substitute_variables(v, variables) for k, v in _auth_params(auth).items()}
+        auth_type = auth['type']
+        if auth_type == 'bearer' or (auth_type == 'oauth2' and params.get('accessToken')):
+            headers['authorization'] = ('Authorization', f"Bearer {params.get('token') or params.get('accessToken') or ''}")
+        elif auth_type == 'basic':
+            credentials = f"{params.get('username') or ''}:{params.get('password') or ''}".encode('utf-8')
+            headers['authorization'] = ('Authorization', 'Basic ' + base64.b64encode(credentials).decode('ascii'))
+        elif auth_type == 'apikey' and params.get('key'):
+            if params.get('in') == 'query':
+                query = (query + '&' if query else '') + urlencode({params['key']: params.get('value') or ''})
+            else:
+                headers[params['key'].lower()] = (params['key'], params.get('value') or '')
+    for header in request.get('header') or []:
+        if header.get('disabled') or not header.get('key'):
+            continue
+        name = substitute_variables(header['key'], variables)
+        headers[name.lower()] = (name, substitute_variables(header.get('value') or '', variables))
+
+    body = _encode_body(request.get('body'), variables, headers)
+    if body or method in ('POST', 'PUT', 'PATCH'):
+        headers['content-length'] = ('Content-Length', str(len(body)))
+    target = quote(path, safe="/%:@!$&'()*+,;=-._~") + (f'?{query}' if query else '')
+    head = f'{method} {target} HTTP/1.1\r\n' + ''.join(f'{k}: {v}\r\n' for k, v in headers.values()) + '\r\n'
+    return PreparedRequest(method, url, (parts.scheme, parts.hostname, port), head.encode('latin-1') + body, method == 'HEAD')
+
+async def read_message(reader, head_request=False):
+    """HTTP/1.1 응답 읽기, (상태 코드, 헤더, 본문, 재사용 가능 여부) 반환 (검증에 필요하므로 본문을 보존)"""
+    head = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1')
+    status_line, *lines = head.split('\r\n')
+    status = int(status_line[9:12])
+    headers = {}
+    for line in lines:
+        if ':' in line:
+            name, value = line.split(':', 1)
+            name = name.strip().lower()
+            headers[name] = f'{headers[name]}, {value.strip()}' if name in headers else value.strip()
+    keep_alive = headers.get('connection', '').lower() != 'close' and not status_line.startswith('HTTP/1.0')
+    if head_request or status in (204, 304) or 100 <= status < 200:
+        return status, headers, b'', keep_alive
+    if 'content-length' in headers:
+        return status, headers, await reader.readexactly(int(headers['content-length'])), keep_alive
+    if 'chunked' in headers.get('transfer-encoding', '').lower():
+        chunks = []
+        while True:
+            size = int((await reader.readuntil(b'\r\n')).split(b';', 1)[0], 16)
+            if size == 0:
+                while await reader.readuntil(b'\r\n') != b'\r\n':
+                    pass
+                return status, headers, b''.join(chunks), keep_alive
+            chunks.append((await reader.readexactly(size + 2))[:-2])
+    # 길이 정보가 없으면 연결 종료까지 읽음
+    return status, headers, await reader.read(), False
+
+# ---- 실행 ----
+
+# 컬렉션의 요청 1건 (상위 폴더의 인증/스크립트를 상속)
+class PostmanItem:
+    def __init__(self, index, titles, item, auth, prerequest, tests):
+        self.index = index
+        self.titles = titles
+        self.name = item.get('name') or f'request {index + 1}'
+        self.request = item.get('request') or {}
+        self.auth = auth
+        self.prerequest = prerequest + PostmanScript.from_events(item.get('event'), 'prerequest')
+        self.tests = tests + PostmanScript.from_events(item.get('event'), 'test')
+
+    @property
+    def title(self):
+        return ' › '.join(self.titles + [self.name])
+
+def _collect_items(entries, titles, auth, prerequest, tests, items):
+    for entry in entries or []:
+        entry_auth = entry.get('auth') if entry.get('auth') and entry['auth'].get('type') != 'inherit' else auth
+        if 'item' in entry:
+            _collect_items(
+                entry['item'], titles + [entry.get('name') or ''], entry_auth,
+                prerequest + PostmanScript.from_events(entry.get('event'), 'prerequest'),
+                tests + PostmanScript.from_events(entry.get('event'), 'test'), items
+            )
+        else:
+            items.append(PostmanItem(len(items), titles, entry, entry_auth, prerequest, tests))
+    return items
+
+def build_groups(collection):
+    """최상위 폴더별 요청 묶음 (폴더 밖의 요청은 한 묶음), 묶음 안에서는 컬렉션 순서대로 실행"""
+    auth = collection.get('auth')
+    prerequest = PostmanScript.from_events(collection.get('event'), 'prerequest')
+    tests = PostmanScript.from_events(collection.get('event'), 'test')
+    groups, loose, count = [], [], 0
+    for entry in collection.get('item') or []:
+        if 'item' in entry:
+            folder = _collect_items([entry], [], auth, prerequest, tests, [])
+        else:
+            loose.extend(_collect_items([entry], [], auth, prerequest, tests, []))
+            continue
+        groups.append((entry.get('name') or '', folder))
+    if loose:
+        groups.insert(0, ((collection.get('info') or {}).get('name') or '', loose))
+    # 요청 순번을 컬렉션 전체 기준으로 다시 매김
+    for _, folder in groups:
+        for item in folder:
+            item.index = count
+            count += 1
+    return groups
+
+# Postman 컬렉션 실행 1회
+# 최상위 폴더를 서로 독립된 묶음으로 보고 동시에 실행 (폴더 안의 요청은 순서대로 실행)
+# 변수는 폴더마다 복사하여 pm.environment.set 등으로 바뀐 값이 다른 폴더에 영향을 주지 않음
+class PostmanRun:
+    def __init__(self, collection, variables, execution_id=None, timeout=None, insecure=False):
+        self.variables = variables
+        self.execution_id = execution_id
+        self.timeout = timeout
+        self.insecure = insecure
+        self.groups = build_groups(collection)
+        self.results = [None] * sum(len(items) for _, items in self.groups)
+        self.concurrency = max(1, POSTMAN_FOLDER_CONCURRENCY)
+        self.request_timeout = parse_duration(POSTMAN_REQUEST_TIMEOUT)
+        self.cancelled = False
+        self.timed_out = False
+        self.unsupported = 0
+        self._pools = {}
+
+    def _pool(self, origin):
+        pool = self._pools.get(origin)
+        if pool is None:
+            ssl_context = ssl.create_default_context()
+            if self.insecure:
+                ssl_context.check_hostname = False
+                ssl_context.verify_mode = ssl.CERT_NONE
+            # 폴더마다 한 번에 요청 1건이므로 동시 폴더 수만큼의 커넥션이면 충분
+            pool = self._pools[origin] = ConnectionPool(origin, self.concurrency, ssl_context)
+        return pool
+
+    async def _exchange(self, prepared):
+        pool = self._pool(prepared.origin)
+        for attempt in range(2):
+            reused = bool(pool.idle)
+            conn = await pool.acquire()
+            try:
+                conn.writer.write(prepared.payload)
+                status, headers, body, keep_alive = await read_message(conn.reader, prepared.head_request)
+            except (asyncio.IncompleteReadError, ConnectionResetError) as e:
+                pool.release(conn, False)
+                # 서버가 먼저 닫은 유휴 keep-alive 커넥션이면 새 커넥션으로 한 번 더 시도
+                if attempt == 0 and reused and not getattr(e, 'partial', b''):
+                    continue
+                raise
+            except BaseException:
+                pool.release(conn, False)
+                raise
+            pool.release(conn, keep_alive)
+            return status, headers, body
+
+    def _apply_setters(self, scripts, variables, response):
+        for script in scripts:
+            for name, expression in script.setters:
+                value = evaluate_setter(expression, response)
+                if value is not MISSING:
+                    variables[name] = value
+
+    async def _run_item(self, item, variables):
+        result = {
+            'title': item.title,
+            'name': item.name,
+            'folder': ' › '.join(item.titles) or None,
+            'status': 'Pass',
+            'duration': 0.0,
+            'error': None,
+            'assertions': []
+        }
+        self._apply_setters(item.prerequest, variables, None)
+        try:
+            prepared = prepare_request(item.request, item.auth, variables)
+        except UnsupportedRequest as e:
+            result.update({'status': 'Skip', 'error': str(e)})
+            return result
+        except (ValueError, TypeError) as e:
+            result.update({'status': 'Error', 'error': f'요청 구성 오류: {e}'})
+            return result
+        result.update({'method': prepared.method, 'url': prepared.url})
+
+        started = time.perf_counter()
+        try:
+            status, headers, body = await asyncio.wait_for(self._exchange(prepared), self.request_timeout)
+        except asyncio.TimeoutError:
+            result.update({'status': 'Error', 'duration': time.perf_counter() - started,
+                           'error': f'요청 시간 초과 ({self.request_timeout:g}초)'})
+            return result
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError) as e:
+            result.update({'status': 'Error', 'duration': time.perf_counter() - started,
+                           'error': f'요청 실패: {type(e).__name__}: {e}'})
+            return result
+        elapsed = time.perf_counter() - started
+        response = PostmanResponse(status, headers, body, elapsed * 1000.0)
+        result.update({'duration': elapsed, 'status_code': status, 'response_size': len(body)})
+
+        failures = []
+        for script in item.tests:
+            self.unsupported += script.unsupported
+            for name, assertions in script.checks:
+                errors = [e for e in (evaluate_assertion(kind, args, response) for kind, args in assertions) if e]
+                result['assertions'].append({'name': name, 'passed': not errors, 'error': errors[0] if errors else None})
+                failures.extend(f'{name}: {e}' for e in errors[:1])
+        # 검증 스크립트가 없으면 오류 응답(4xx/5xx)만 실패로 처리
+        if not result['assertions'] and status >= 400:
+            failures.append(f'상태 코드 {status}')
+        self._apply_setters(item.tests, variables, response)
+        if failures:
+            result.update({'status': 'Fail', 'error': '\n'.join(failures)})
+        return result
+
+    async def _run_group(self, items, semaphore):
+        async with semaphore:
+            variables = dict(self.variables)
+            for item in items:
+                if self.execution_id is not None and is_cancelled(self.execution_id):
+                    self.cancelled = True
+                if self.cancelled:
+                    return
+                self.results[item.index] = await self._run_item(item, variables)
+
+    async def run(self):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [asyncio.create_task(self._run_group(items, semaphore)) for _, items in self.groups]
+        try:
+            if tasks:
+                _, pending = await asyncio.wait(tasks, timeout=self.timeout)
+                if pending:
+                    self.timed_out = True
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            for pool in self._pools.values():
+                pool.close()
+
+    def tests(self, file_name=None):
+        """요청별 결과 (실행되지 않은 요청은 Skip)"""
+        reason = CANCELLED_MESSAGE if self.cancelled else '실행 시간 초과로 실행되지 않음' if self.timed_out else None
+        items = [item for _, group in self.groups for item in group]
+        tests = []
+        for item in items:
+            result = self.results[item.index] or {
+                'title': item.title, 'name': item.name, 'folder': ' › '.join(item.titles) or None,
+                'status': 'Skip', 'duration': 0.0, 'error': reason, 'assertions': []
+            }
+            tests.append({**result, 'file': file_name})
+        return tests
+
+def format_report(tests, summary, unsupported):
+    lines = []
+    folder = MISSING
+    for test in tests:
+        if test['folder'] != folder:
+            folder = test['folder']
+            if folder:
+                lines.append(f'\n❏ {folder}')
+        detail = f" [{test['status_code']}, {test['duration'] * 1000:.0f}ms, {test['response_size']}B]" if 'status_code' in test else ''
+        lines.append(f"→ {test['name']} ({test['status']})")
+        if test.get('method'):
+            lines.append(f"  {test['method']} {test['url']}{detail}")
+        for assertion in test['assertions']:
+            mark = '✓' if assertion['passed'] else '✗'
+            lines.append(f"  {mark} {assertion['name']}" + ('' if assertion['passed'] else f" - {assertion['error']}"))
+        if test['error'] and not test['assertions']:
+            lines.append(f"  ! {test['error']}")
+    lines.append('')
+    lines.append('requests: ' + ', '.join(f'{k.lower()}={v}' for k, v in summary.items()))
+    if unsupported:
+        lines.append(f'건너뛴 검증 구문(해석 불가): {unsupported}')
+    return '\n'.join(lines).lstrip('\n') + '\n'
+
+# Postman 컬렉션 실행 엔진
+# newman(Node.js) 없이 컬렉션 v2.1 + 환경 파일을 읽어 현재 프로세스의 asyncio 이벤트 루프에서 실행
+# 요청별 결과는 Playwright 엔진과 같은 형식(tests/test_summary)으로 반환하여 테스트 케이스별 결과로 적재
+class PostmanEngine:
+    def execute_test(self, script_path, env_vars=None, execution_id=None, timeout=300):
+        env_vars = env_vars or {}
+        try:
+            script_path = resolve_script_path(script_path)
+            collection = load_postman_collection(script_path)
+            # 변수 우선순위: 실행 환경 변수 > 환경 파일 > 컬렉션 변수
+            variables = {v['key']: v.get('value', '') for v in collection.get('variable') or [] if v.get('key') and not v.get('disabled')}
+            environment_path = find_environment_path(script_path, env_vars)
+            environment_name = None
+            if environment_path:
+                environment_name, values = load_postman_environment(environment_path)
+                variables.update(values)
+            variables.update(env_vars)
+            insecure = str(env_vars.get('POSTMAN_INSECURE', '')).lower() in ('1', 'true', 'yes')
+            run = PostmanRun(collection, variables, execution_id, timeout, insecure)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            return {'status': 'Error', 'error': f'Postman 컬렉션 오류: {e}'}
+
+        workspace = RunWorkspace.create(execution_id)
+        start_time = time.time()
+        with asyncio.Runner(loop_factory=LOOP_FACTORY) as runner:
+            runner.run(run.run())
+        execution_time = time.time() - start_time
+
+        tests = run.tests(os.path.basename(script_path))
+        for test in tests:
+            test['project_name'] = environment_name
+        summary = summarize_tests(tests)
+        stdout = format_report(tests, summary, run.unsupported)
+        with open(workspace.output_path, 'w', encoding='utf-8') as f:
+            json.dump({'collection': (collection.get('info') or {}).get('name'), 'environment': environment_name,
+                       'summary': summary, 'tests': tests}, f, ensure_ascii=False)
+
+        failed = summary['Fail'] + summary['Error']
+        result = {
+            'exit_code': 1 if failed else 0,
+            'output': stdout,
+            'execution_time': execution_time,
+            'workspace': workspace.path,
+            'tests': tests,
+            'test_summary': summary,
+            'environment': environment_name,
+            'connections_opened': sum(p.opened for p in run._pools.values())
+        }
+        if run.cancelled:
+            result.update({'status': 'Cancelled', 'error': CANCELLED_MESSAGE, 'cancelled': True})
+        elif run.timed_out:
+            result.update({'status': 'Error', 'exit_code': None, 'error': f'실행 시간 초과 ({timeout}초)'})
+        else:
+            result.update({
+                'status': 'Fail' if failed else 'Pass',
+                'error': '\n'.join(f"{t['title']}: {t['error']}" for t in tests if t['status'] in ('Fail', 'Error')) or None
+            })
+        workspace.write_logs(stdout, result['error'] or '')
+        return result
+
+# Postman 엔진 인스턴스 생성
+postman_engine = PostmanEngine()
@@ -0,0 +1,264 @@
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from engines.resource_monitor import start_sampler, summarize_samples, write_samples
+
+# 메모리에 유지할 출력 끝부분 (줄 수, 줄당 최대 문자 수)
+TAIL_LINES = int(os.environ.get('PROCESS_TAIL_LINES', '200'))
+TAIL_LINE_CHARS = 2000
+# DB(result_summary, TestResult.notes)에 저장할 출력 최대 길이
+OUTPUT_EXCERPT_LIMIT = 4000
+# 파이프에서 한 번에 읽을 최대 바이트 (줄바꿈 없는 긴 출력도 메모리를 제한)
+READ_CHUNK_BYTES = 65536
+# 로그 파일 flush 주기 (초): tail API가 실행 중인 로그를 읽을 수 있도록 주기적으로 flush
+LOG_FLUSH_SECONDS = 0.25
+# 취소/시간 초과 시 SIGTERM 후 SIGKILL까지 기다리는 시간 (초)
+CANCEL_GRACE_SECONDS = float(os.environ.get('RUN_CANCEL_GRACE_SECONDS', '5'))
+
+CANCELLED_MESSAGE = '실행이 취소되었습니다'
+
+# 실행 키(실행 ID)별 실행 중인 프로세스, 이 프로세스에서 실행 중인 키(중첩 수), 취소 요청된 키
+# 취소 표시는 이 프로세스에서 실행 중인 키에만 남기므로, 다른 호스트에서 실행되는 실행을 취소해도 쌓이지 않음
+_processes = {}
+_active_runs = {}
+_cancelled = set()
+_registry_lock = threading.Lock()
+
+def terminate_process_group(process, grace_seconds=None):
+    """프로세스 그룹 전체 종료 (SIGTERM으로 정상 종료를 기다린 뒤 남아 있으면 SIGKILL)
+
+    npx → node → 브라우저처럼 자식 프로세스를 띄우는 러너도 함께 종료되도록
+    프로세스는 새 세션(그룹)으로 시작함
+    """
+    grace_seconds = CANCEL_GRACE_SECONDS if grace_seconds is None else grace_seconds
+    if process.poll() is not None:
+        return
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        return
+    try:
+        process.wait(timeout=grace_seconds)
+    except subprocess.TimeoutExpired:
+        pass
+    # 리더가 종료되어도 그룹에 남은 자식이 있을 수 있으므로 그룹에 SIGKILL
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+@contextmanager
+def cancellable_run(run_key):
+    """이 프로세스에서 실행 키를 실행하는 범위 (범위 안에서만 cancel_run이 적용되고, 끝나면 취소 표시 정리)"""
+    with _registry_lock:
+        _active_runs[run_key] = _active_runs.get(run_key, 0) + 1
+    try:
+        yield
+    finally:
+        with _registry_lock:
+            _active_runs[run_key] -= 1
+            if not _active_runs[run_key]:
+                del _active_runs[run_key]
+                if run_key not in _processes:
+                    _cancelled.discard(run_key)
+
+def cancel_run(run_key):
+    """실행 키의 프로세스를 모두 종료 (이후 시작되는 프로세스도 즉시 종료, 종료 대상 수 반환)
+
+    이 프로세스에서 실행 중이 아닌 키는 무시 (다른 호스트의 실행은 대기열 취소 플래그로 전달)
+    """
+    with _registry_lock:
+        if run_key not in _active_runs and run_key not in _processes:
+            return 0
+        if run_key in _cancelled:
+            return len(_processes.get(run_key, ()))
+        _cancelled.add(run_key)
+        processes = list(_processes.get(run_key, ()))
+    for process in processes:
+        threading.Thread(target=terminate_process_group, args=(process,), daemon=True).start()
+    return len(processes)
+
+def is_cancelled(run_key):
+    with _registry_lock:
+        return run_key in _cancelled
+
+def _register(run_key, process):
+    with _registry_lock:
+        _processes.setdefault(run_key, set()).add(process)
+        cancelled = run_key in _cancelled
+    if cancelled:
+        threading.Thread(target=terminate_process_group, args=(process,), daemon=True).start()
+
+def _unregister(run_key, process):
+    with _registry_lock:
+        processes = _processes.get(run_key)
+        if processes is not None:
+            processes.discard(process)
+            if not processes:
+                del _processes[run_key]
+                if run_key not in _active_runs:
+                    _cancelled.discard(run_key)
+
+# 출력 링 버퍼: 최근 N줄만 보관하므로 출력량과 무관하게 메모리가 일정
+class OutputTail:
+    def __init__(self, max_lines=None, max_line_chars=TAIL_LINE_CHARS):
+        self.lines = deque(maxlen=max_lines or TAIL_LINES)
+        self.max_line_chars = max_line_chars
+        self.total_lines = 0
+        self.total_bytes = 0
+
+    def append(self, raw):
+        self.total_lines += 1
+        self.total_bytes += len(raw)
+        line = raw.decode('utf-8', errors='replace')
+        if len(line) > self.max_line_chars:
+            line = line[:self.max_line_chars] + '…\n'
+        self.lines.append(line)
+
+    def text(self):
+        dropped = self.total_lines - len(self.lines)
+        prefix = f'... ({dropped}줄 생략, 전체 로그는 실행 작업 디렉토리 참고)\n' if dropped > 0 else ''
+        return prefix + ''.join(self.lines)
+
+def excerpt(text, limit=OUTPUT_EXCERPT_LIMIT):
+    """출력 끝부분 발췌 (잘린 경우 표시)"""
+    if not text or len(text) <= limit:
+        return text
+    return '…' + text[-limit:]
+
+class ProcessResult:
+    def __init__(self, returncode, stdout, stderr, duration, timed_out=False, stdout_bytes=0, stderr_bytes=0, cancelled=False,
+                 resources=None):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.duration = duration
+        self.timed_out = timed_out
+        self.cancelled = cancelled
+        self.stdout_bytes = stdout_bytes
+        self.stderr_bytes = stderr_bytes
+        # 프로세스 트리 자원 사용 요약 (샘플링하지 않았으면 None)
+        self.resources = resources
+
+def _pump(pipe, path, tail):
+    """파이프를 줄 단위로 읽어 로그 파일에 기록하고 끝부분만 링 버퍼에 유지"""
+    last_flush = time.time()
+    with open(path, 'ab') as log_file:
+        for raw in iter(lambda: pipe.readline(READ_CHUNK_BYTES), b''):
+            log_file.write(raw)
+            tail.append(raw)
+            now = time.time()
+            if now - last_flush >= LOG_FLUSH_SECONDS:
+                log_file.flush()
+                last_flush = now
+    pipe.close()
+
+def run_process(cmd, stdout_path, stderr_path, env=None, cwd=None, timeout=None, tail_lines=None, run_key=None,
+                resource_path=None):
+    """서브프로세스 실행 (stdout/stderr는 로그 파일로 스트리밍, 메모리에는 끝부분만 유지)
+
+    시간 초과 시 프로세스 그룹을 종료하고 timed_out=True로 반환 (예외를 던지지 않음)
+    run_key를 지정하면 cancel_run(run_key)로 취소 가능 (cancelled=True로 반환)
+    resource_path를 지정하면 프로세스 트리의 CPU/메모리/fd/네트워크를 샘플링하여 파일로 저장하고 요약을 resources로 반환
+    """
+    for path in (stdout_path, stderr_path):
+        open(path, 'wb').close()
+    stdout_tail = OutputTail(tail_lines)
+    stderr_tail = OutputTail(tail_lines)
+
+    start_time = time.time()
+    process = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env, cwd=cwd, start_new_session=True
+    )
+    if run_key is not None:
+        _register(run_key, process)
+    sampler = start_sampler(process.pid) if resource_path else None
+    pumps = [
+        threading.Thread(target=_pump, args=(process.stdout, stdout_path, stdout_tail), daemon=True),
+        threading.Thread(target=_pump, args=(process.stderr, stderr_path, stderr_tail), daemon=True)
+    ]
+    for pump in pumps:
+        pump.start()
+
+    timed_out = False
+    cancelled = False
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        terminate_process_group(process)
+        process.wait()
+    finally:
+        if run_key is not None:
+            # cancellable_run 범위 밖의 실행은 등록 해제 시 취소 표시가 정리되므로 먼저 확인
+            cancelled = is_cancelled(run_key)
+            _unregister(run_key, process)
+    resources = None
+    if sampler is not None:
+        samples = sampler.stop()
+        write_samples(resource_path, samples)
+        resources = summarize_samples(samples)
+    for pump in pumps:
+        pump.join()
+
+    return ProcessResult(
+        process.returncode,
+        stdout_tail.text(),
+        stderr_tail.text(),
+        time.time() - start_time,
+        timed_out=timed_out,
+        stdout_bytes=stdout_tail.total_bytes,
+        stderr_bytes=stderr_tail.total_bytes,
+        cancelled=cancelled,
+        resources=resources
+    )
+
+def read_last_line(path):
+    """파일의 마지막 비어 있지 않은 줄 (길이 제한 없이 끝에서부터 읽음)"""
+    if not os.path.exists(path):
+        return ''
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        chunk_size = 65536
+        data = b''
+        position = end
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+            stripped = data.rstrip(b'\r\n')
+            if b'\n' in stripped:
+                return stripped.rsplit(b'\n', 1)[1].decode('utf-8', errors='replace')
+        return data.strip().decode('utf-8', errors='replace')
+
+def read_log_chunk(path, offset=0, limit=65536):
+    """로그 파일의 offset 위치부터 최대 limit 바이트 읽기 (증분 tail 조회용)
+
+    UTF-8 문자가 잘리지 않도록 마지막 불완전 바이트는 다음 조회로 넘김
+    """
+    if not os.path.exists(path):
+        return {'data': '', 'offset': offset, 'size': 0}
+    size = os.path.getsize(path)
+    offset = max(0, min(offset, size))
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        data = f.read(limit)
+    # 끝에 걸친 멀티바이트 문자는 제외
+    cut = len(data)
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte & 0xC0 == 0xC0:
+            needed = 2 if byte & 0xE0 == 0xC0 else 3 if byte & 0xF0 == 0xE0 else 4
+            if back < needed:
+                cut = len(data) - back
+            break
+        if byte & 0x80 == 0:
+            break
+    data = data[:cut]
+    return {'data': data.decode('utf-8', errors='replace'), 'offset': offset + len(data), 'size': size}
@@ -0,0 +1,316 @@
+import atexit
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from engines.k6_engine import k6_engine, docker_k6_engine, get_k6_engine, resolve_script_path
+from engines.playwright_engine import playwright_engine
+from engines.selenium_engine import selenium_engine
+from engines.http_engine import http_load_engine, HTTP_SPEC_EXTENSION
+from engines.postman_engine import postman_engine, POSTMAN_COLLECTION_SUFFIX
+
+# 실행 1건의 최대 샤드 수 (샤드마다 러너 프로세스를 띄우므로 기본값은 CPU 코어 수)
+MAX_SHARDS = int(os.environ.get('RUN_MAX_SHARDS') or os.cpu_count() or 1)
+
+def parse_shards(value):
+    """요청의 샤드 수 검증 (없으면 1, 1 이상 MAX_SHARDS 이하 정수가 아니면 ValueError)"""
+    if value is None or value == '':
+        return 1
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError(f'shards는 정수여야 합니다: {value!r}')
+    try:
+        shards = int(value)
+    except ValueError:
+        raise ValueError(f'shards는 정수여야 합니다: {value!r}')
+    if not 1 <= shards <= MAX_SHARDS:
+        raise ValueError(f'shards는 1 이상 {MAX_SHARDS} 이하여야 합니다: {shards}')
+    return shards
+
+# 엔진 기능
+# sharding: shards > 1 분할 실행, directory: 디렉토리 전체를 대상으로 실행, load_profile: 부하 프로필(options) 병합,
+# browser: 브라우저 실행, test_report: 테스트별 결과 목록(tests/test_summary) 제공
+CAPABILITIES = ('sharding', 'directory', 'load_profile', 'browser', 'test_report')
+
+# 실행 엔진 정의
+# run(script_path, env_vars, execution_id, shards, options, timeout, slot) → 결과 dict
+# parser(result) → 공통 결과 형식으로 보정한 결과 (없으면 엔진 결과를 그대로 사용)
+# warm_up() → 상태 정보 dict (워커당 1회), teardown() → 프로세스 종료 시 정리
+class EngineSpec:
+    def __init__(self, name, run, extensions=(), aliases=(), capabilities=(), concurrency=1,
+                 parser=None, warm_up=None, teardown=None, default_env=None):
+        unknown = set(capabilities) - set(CAPABILITIES)
+        if unknown:
+            raise ValueError(f'알 수 없는 엔진 기능: {sorted(unknown)}')
+        self.name = name
+        self.run = run
+        self.extensions = tuple(extensions)
+        self.aliases = tuple(aliases)
+        self.capabilities = frozenset(capabilities)
+        self.concurrency = concurrency
+        self.parser = parser
+        self.warm_up = warm_up
+        self.teardown = teardown
+        self.default_env = dict(default_env or {})
+
+    def supports(self, capability):
+        return capability in self.capabilities
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'extensions': list(self.extensions),
+            'aliases': list(self.aliases),
+            'capabilities': sorted(self.capabilities),
+            'concurrency': self.concurrency
+        }
+
+# 실행 엔진 레지스트리
+# 엔진별 동시 실행 슬롯과 전체 슬롯을 세마포어로 제한하여 브라우저를 띄우는 Playwright/Selenium과 k6가
+# 서로의 자원을 잠식하지 않도록 하고, 비용이 큰 런타임 준비(warm-up)는 워커 프로세스당 한 번만 수행
+class EngineRegistry:
+    def __init__(self):
+        self.max_concurrency = int(os.environ.get('AUTOMATION_MAX_CONCURRENCY', '4'))
+        self.timeout = int(os.environ.get('AUTOMATION_TIMEOUT_SECONDS', '300'))
+        self.specs = {}
+        self._global_slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._engine_slots = {}
+        self._active = {}
+        self._warm = {}
+        self._warm_locks = {}
+        self._lock = threading.Lock()
+
+    def register(self, spec):
+        with self._lock:
+            self.specs[spec.name] = spec
+            self._engine_slots[spec.name] = threading.BoundedSemaphore(spec.concurrency)
+            self._active[spec.name] = 0
+            self._warm[spec.name] = {'state': 'cold'}
+            self._warm_locks[spec.name] = threading.Lock()
+        return spec
+
+    def get(self, name):
+        return self.specs.get(name)
+
+    @property
+    def engine_limits(self):
+        return {name: spec.concurrency for name, spec in self.specs.items()}
+
+    def detect(self, test_type, script_path):
+        """test_type(엔진 이름/별칭) 또는 스크립트 확장자로 실행 엔진 결정 (긴 확장자 우선)"""
+        test_type = (test_type or '').lower()
+        for spec in self.specs.values():
+            if test_type == spec.name or test_type in spec.aliases:
+                return spec.name
+        path = (script_path or '').lower()
+        candidates = sorted(
+            ((ext, spec.name) for spec in self.specs.values() for ext in spec.extensions),
+            key=lambda item: -len(item[0])
+        )
+        return next((name for ext, name in candidates if path.endswith(ext)), None)
+
+    def resolve_target(self, spec, script_path):
+        """스크립트 경로를 절대 경로로 변환 (디렉토리 실행을 지원하지 않는 엔진은 확장자가 맞는 첫 스크립트 선택)"""
+        script_path = resolve_script_path(script_path)
+        if os.path.isdir(script_path) and not spec.supports('directory'):
+            candidates = sorted(f for f in os.listdir(script_path) if f.endswith(spec.extensions))
+            if not candidates:
+                return None
+            script_path = os.path.join(script_path, candidates[0])
+        return script_path if os.path.exists(script_path) else None
+
+    @contextmanager
+    def slot(self, name):
+        """엔진 실행 슬롯 확보 (슬롯이 빌 때까지 대기)"""
+        # 엔진 슬롯을 먼저 확보해야 대기 중인 작업이 다른 엔진이 쓸 전체 슬롯을 점유하지 않음
+        with self._engine_slots[name], self._global_slots:
+            with self._lock:
+                self._active[name] += 1
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self._active[name] -= 1
+
+    def warm_up(self, name):
+        """엔진 런타임 준비 (프로세스당 1회, 실패하면 다음 실행에서 다시 시도)"""
+        spec = self.specs[name]
+        if spec.warm_up is None or self._warm[name]['state'] == 'ready':
+            return self._warm[name]
+        with self._warm_locks[name]:
+            if self._warm[name]['state'] == 'ready':
+                return self._warm[name]
+            self._warm[name] = {'state': 'warming'}
+            started = time.time()
+            try:
+                detail = spec.warm_up() or {}
+                state = {'state': 'ready', **detail}
+            except Exception as e:
+                print(f"⚠️ {name} 엔진 준비 실패: {e}")
+                state = {'state': 'failed', 'error': str(e)}
+            state['warm_up_seconds'] = round(time.time() - started, 3)
+            state['warmed_at'] = time.time()
+            self._warm[name] = state
+            return state
+
+    def warm_up_async(self, names=None):
+        """지정한 엔진(ENGINE_WARM_UP, 쉼표 구분 또는 all)을 백그라운드에서 미리 준비"""
+        if names is None:
+            configured = os.environ.get('ENGINE_WARM_UP', '').strip()
+            names = list(self.specs) if configured == 'all' else [n.strip() for n in configured.split(',') if n.strip()]
+        names = [n for n in names if n in self.specs]
+        if not names:
+            return None
+        def run():
+            for name in names:
+                self.warm_up(name)
+        thread = threading.Thread(target=run, name='engine-warm-up', daemon=True)
+        thread.start()
+        return thread
+
+    def teardown(self):
+        for name, spec in self.specs.items():
+            if spec.teardown is None or self._warm[name]['state'] == 'cold':
+                continue
+            try:
+                spec.teardown()
+            except Exception as e:
+                print(f"⚠️ {name} 엔진 정리 실패: {e}")
+
+    def run(self, name, script_path, env_vars=None, execution_id=None, shards=None, options=None, pooled=True):
+        """엔진 슬롯을 확보한 뒤 스크립트 실행
+
+        pooled=False면 엔진 슬롯 없이 실행 (성능 테스트처럼 대기열 워커/매트릭스 동시 실행 수로 이미 제한되는 경우)
+        분할 실행을 지원하는 엔진은 샤드마다 슬롯을 따로 확보하여 병렬 실행
+        """
+        spec = self.specs.get(name)
+        if spec is None:
+            return {'status': 'Error', 'error': f'지원하지 않는 엔진입니다: {name}'}
+        if options and not spec.supports('load_profile'):
+            return {'status': 'Error', 'engine': name, 'error': f'{name} 엔진은 부하 프로필을 지원하지 않습니다'}
+        target = self.resolve_target(spec, script_path)
+        if not target:
+            return {'status': 'Error', 'engine': name, 'error': f'스크립트 파일을 찾을 수 없습니다: {script_path}'}
+        try:
+            shards = parse_shards(shards) if spec.supports('sharding') else 1
+        except ValueError as e:
+            return {'status': 'Error', 'engine': name, 'error': str(e)}
+        self.warm_up(name)
+
+        env = dict(spec.default_env)
+        env.update(env_vars or {})
+        slot = (lambda: self.slot(name)) if pooled else nullcontext
+        result = spec.run(
+            target, env, execution_id=execution_id, shards=shards, options=options,
+            timeout=self.timeout, slot=slot
+        )
+        if spec.parser:
+            result = spec.parser(result)
+        result.setdefault('engine', name)
+        return result
+
+    def stats(self):
+        with self._lock:
+            active = dict(self._active)
+            warm = {name: dict(state) for name, state in self._warm.items()}
+        return {
+            'max_concurrency': self.max_concurrency,
+            'engine_limits': self.engine_limits,
+            'active': active,
+            'warm': warm
+        }
+
+    def describe(self):
+        """엔진 목록과 기능/동시 실행 수/준비 상태"""
+        stats = self.stats()
+        return [
+            {**spec.to_dict(), 'active': stats['active'][name], 'warm': stats['warm'][name]}
+            for name, spec in self.specs.items()
+        ]
+
+def _run_k6(script_path, env_vars, execution_id=None, shards=1, options=None, timeout=None, slot=nullcontext):
+    """k6 실행 (shards > 1 이면 execution segment 분할로 샤드마다 슬롯 확보, 아니면 K6_RUNTIME에 따른 로컬/컨테이너 실행)"""
+    if shards > 1:
+        return k6_engine.execute_sharded(
+            script_path, env_vars, execution_id=execution_id, shards=shards, options=options, slot=slot
+        )
+    with slot():
+        return get_k6_engine().execute_test(script_path, env_vars, execution_id=execution_id, options=options)
+
+def _parse_k6(result):
+    # k6 결과에는 프로세스 종료 코드가 없으므로 상태로 대신함
+    result.setdefault('exit_code', 0 if result.get('status') == 'Pass' else 1)
+    return result
+
+def _warm_up_k6():
+    detail = {'version': k6_engine.warm_up()}
+    if os.environ.get('K6_RUNTIME', 'local') == 'docker':
+        detail['containers'] = docker_k6_engine.warm_up()
+    return detail
+
+def _run_http(script_path, env_vars, execution_id=None, shards=1, options=None, timeout=None, slot=nullcontext):
+    """내장 asyncio HTTP 부하 엔진 실행 (현재 프로세스에서 실행하므로 분할 실행 없음)"""
+    with slot():
+        return http_load_engine.execute_test(script_path, env_vars, execution_id=execution_id, options=options)
+
+def _run_postman(script_path, env_vars, execution_id=None, shards=1, options=None, timeout=None, slot=nullcontext):
+    """Postman 컬렉션 실행 (폴더 단위 동시 실행은 엔진 내부의 이벤트 루프에서 처리)"""
+    with slot():
+        return postman_engine.execute_test(script_path, env_vars, execution_id=execution_id, timeout=timeout)
+
+def _run_playwright(script_path, env_vars, execution_id=None, shards=1, options=None, timeout=None, slot=None):
+    return playwright_engine.execute_test(
+        script_path, env_vars, execution_id=execution_id, shards=shards, timeout=timeout, slot=slot
+    )
+
+def _run_selenium(script_path, env_vars, execution_id=None, shards=1, options=None, timeout=None, slot=nullcontext):
+    with slot():
+        return selenium_engine.execute_test(script_path, env_vars, execution_id=execution_id, timeout=timeout)
+
+# 실행 엔진 레지스트리 인스턴스 생성 및 기본 엔진 등록
+engine_registry = EngineRegistry()
+
+engine_registry.register(EngineSpec(
+    'playwright', _run_playwright,
+    extensions=('.spec.js', '.spec.ts'),
+    capabilities=('sharding', 'directory', 'browser', 'test_report'),
+    concurrency=int(os.environ.get('AUTOMATION_PLAYWRIGHT_CONCURRENCY', '2')),
+    warm_up=lambda: {'cli': ' '.join(playwright_engine.warm_up())}
+))
+engine_registry.register(EngineSpec(
+    'http', _run_http,
+    extensions=(HTTP_SPEC_EXTENSION,),
+    capabilities=('load_profile',),
+    concurrency=int(os.environ.get('AUTOMATION_HTTP_CONCURRENCY', '1')),
+    parser=_parse_k6
+))
+engine_registry.register(EngineSpec(
+    'postman', _run_postman,
+    extensions=(POSTMAN_COLLECTION_SUFFIX,),
+    aliases=('newman',),
+    capabilities=('test_report',),
+    concurrency=int(os.environ.get('AUTOMATION_POSTMAN_CONCURRENCY', '2'))
+))
+engine_registry.register(EngineSpec(
+    'selenium', _run_selenium,
+    extensions=('.py',),
+    aliases=('python',),
+    capabilities=('browser',),
+    concurrency=int(os.environ.get('AUTOMATION_SELENIUM_CONCURRENCY', '2'))
+))
+engine_registry.register(EngineSpec(
+    'k6', _run_k6,
+    extensions=('.js',),
+    aliases=('performance',),
+    capabilities=('sharding', 'load_profile', 'browser'),
+    concurrency=int(os.environ.get('AUTOMATION_K6_CONCURRENCY', '1')),
+    parser=_parse_k6,
+    warm_up=_warm_up_k6,
+    teardown=docker_k6_engine.shutdown,
+    default_env={'K6_BROWSER_ENABLED': 'true', 'K6_BROWSER_HEADLESS': 'true'}
+))
+
+def detect_engine(test_type, script_path):
+    """test_type 또는 스크립트 확장자로 실행 엔진 결정"""
+    return engine_registry.detect(test_type, script_path)
+
+atexit.register(engine_registry.teardown)
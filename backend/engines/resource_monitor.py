@@ -0,0 +1,260 @@
+import json
+import os
+import threading
+import time
+
+# 샘플링 간격 (초)
+RESOURCE_SAMPLE_INTERVAL = float(os.environ.get('RESOURCE_SAMPLE_INTERVAL', '1.0'))
+# 사용 가능한 코어 대비 CPU 사용률이 이 비율 이상인 샘플이 연속 RESOURCE_SATURATION_SAMPLES개 이상이면 포화로 판단
+RESOURCE_SATURATION_CPU = float(os.environ.get('RESOURCE_SATURATION_CPU', '0.9'))
+RESOURCE_SATURATION_SAMPLES = int(os.environ.get('RESOURCE_SATURATION_SAMPLES', '3'))
+# 한 실행에 보관할 최대 샘플 수 (넘으면 인접 샘플을 합쳐 간격을 두 배로 늘림)
+RESOURCE_MAX_SAMPLES = int(os.environ.get('RESOURCE_MAX_SAMPLES', '3600'))
+RESOURCE_SAMPLING_ENABLED = os.environ.get('RESOURCE_SAMPLING', 'true').lower() == 'true'
+
+PROC_ROOT = '/proc'
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+# 샘플 계열 (열 단위로 저장하여 키 반복 없이 압축)
+# cpu: 프로세스 트리 CPU 사용률 (100 = 코어 1개), rss_kb: 상주 메모리 합계, fds: 열린 파일 디스크립터 수,
+# procs: 프로세스 수, net_rx/net_tx: 간격 동안 송수신 바이트 (loopback 제외, 네트워크 네임스페이스 단위)
+SERIES = ('t', 'cpu', 'rss_kb', 'fds', 'procs', 'net_rx', 'net_tx')
+SUMMED_SERIES = ('cpu', 'rss_kb', 'fds', 'procs', 'net_rx', 'net_tx')
+
+def proc_available():
+    return os.path.isdir(os.path.join(PROC_ROOT, 'self'))
+
+def usable_cores():
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+def read_stat(pid):
+    """/proc/<pid>/stat에서 (ppid, session, utime+stime 틱, rss 페이지) 조회 (프로세스가 없으면 None)"""
+    try:
+        with open(os.path.join(PROC_ROOT, str(pid), 'stat'), 'rb') as f:
+            data = f.read().decode('utf-8', errors='replace')
+    except OSError:
+        return None
+    # 프로세스 이름(comm)에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후를 필드로 사용
+    fields = data[data.rfind(')') + 2:].split()
+    try:
+        return int(fields[1]), int(fields[3]), int(fields[11]) + int(fields[12]), int(fields[21])
+    except (IndexError, ValueError):
+        return None
+
+def process_tree(root_pid):
+    """root_pid와 그 하위 프로세스의 stat 정보 {pid: stat}
+
+    러너는 새 세션으로 시작하므로 같은 세션의 프로세스와 부모 관계로 이어진 프로세스를 모두 포함
+    (브라우저처럼 새 세션을 만드는 자식도 부모 관계로 추적)
+    """
+    stats = {}
+    children = {}
+    for name in os.listdir(PROC_ROOT):
+        if not name.isdigit():
+            continue
+        stat = read_stat(int(name))
+        if stat is None:
+            continue
+        stats[int(name)] = stat
+        children.setdefault(stat[0], []).append(int(name))
+    tree = {pid: stat for pid, stat in stats.items() if pid == root_pid or stat[1] == root_pid}
+    pending = list(tree)
+    while pending:
+        for child in children.get(pending.pop(), ()):
+            if child not in tree:
+                tree[child] = stats[child]
+                pending.append(child)
+    return tree
+
+def count_fds(pid):
+    try:
+        return len(os.listdir(os.path.join(PROC_ROOT, str(pid), 'fd')))
+    except OSError:
+        return 0
+
+def read_net_bytes(pid):
+    """프로세스가 속한 네트워크 네임스페이스의 (수신, 송신) 누적 바이트 (loopback 제외)"""
+    rx = tx = 0
+    try:
+        with open(os.path.join(PROC_ROOT, str(pid), 'net', 'dev')) as f:
+            lines = f.readlines()[2:]
+    except OSError:
+        return None
+    for line in lines:
+        interface, _, data = line.partition(':')
+        if interface.strip() == 'lo':
+            continue
+        values = data.split()
+        if len(values) >= 9:
+            rx += int(values[0])
+            tx += int(values[8])
+    return rx, tx
+
+def detect_saturation(cpu, cores, threshold=None, min_samples=None):
+    """CPU 사용률 계열에서 포화 구간 판정 (포화 여부, 포화 샘플 수)"""
+    threshold = RESOURCE_SATURATION_CPU if threshold is None else threshold
+    min_samples = RESOURCE_SATURATION_SAMPLES if min_samples is None else min_samples
+    limit = threshold * cores * 100.0
+    saturated_samples, streak, saturated = 0, 0, False
+    for value in cpu:
+        if value >= limit:
+            streak += 1
+            saturated_samples += 1
+            saturated = saturated or streak >= min_samples
+        else:
+            streak = 0
+    return saturated, saturated_samples
+
+def summarize_samples(samples):
+    """샘플 계열 요약 (최대/평균 CPU, 최대 메모리/fd, 총 송수신 바이트, 포화 여부)"""
+    cpu = samples.get('cpu') or []
+    cores = samples.get('cores') or usable_cores()
+    interval = samples.get('interval') or RESOURCE_SAMPLE_INTERVAL
+    saturated, saturated_samples = detect_saturation(cpu, cores)
+    return {
+        'samples': len(cpu),
+        'interval': interval,
+        'cores': cores,
+        'peak_cpu_percent': round(max(cpu), 1) if cpu else None,
+        'avg_cpu_percent': round(sum(cpu) / len(cpu), 1) if cpu else None,
+        'peak_rss_kb': max(samples.get('rss_kb') or [0]) if cpu else None,
+        'peak_fds': max(samples.get('fds') or [0]) if cpu else None,
+        'peak_procs': max(samples.get('procs') or [0]) if cpu else None,
+        'net_rx_bytes': sum(samples.get('net_rx') or []),
+        'net_tx_bytes': sum(samples.get('net_tx') or []),
+        'saturation_threshold_percent': round(RESOURCE_SATURATION_CPU * cores * 100.0, 1),
+        'saturated_seconds': round(saturated_samples * interval, 1),
+        'saturated': saturated
+    }
+
+def combine_samples(sample_sets):
+    """동시에 실행된 여러 프로세스 트리(샤드)의 샘플을 같은 순번끼리 합산"""
+    sample_sets = [s for s in sample_sets if s and s.get('t')]
+    if not sample_sets:
+        return None
+    longest = max(sample_sets, key=lambda s: len(s['t']))
+    combined = {
+        'interval': max(s.get('interval') or RESOURCE_SAMPLE_INTERVAL for s in sample_sets),
+        'cores': longest.get('cores') or usable_cores(),
+        't': list(longest['t'])
+    }
+    for key in SUMMED_SERIES:
+        combined[key] = [
+            round(sum(s[key][i] for s in sample_sets if i < len(s.get(key) or [])), 1)
+            for i in range(len(longest['t']))
+        ]
+    return combined
+
+def load_samples(path):
+    """작업 디렉토리에 저장된 샘플 파일 읽기 (없으면 None)"""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+def write_samples(path, samples):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(samples, f, separators=(',', ':'))
+
+# 프로세스 트리 자원 샘플러: 러너 프로세스와 하위 프로세스(브라우저, 워커 등)의 CPU/메모리/fd/네트워크를 주기적으로 기록
+# 부하 생성기 자체가 포화되었는지 판단하여 결과(지연 시간/처리량)의 신뢰도를 표시하는 데 사용
+class ProcessTreeSampler:
+    def __init__(self, pid, interval=None, max_samples=None):
+        self.pid = pid
+        self.interval = interval or RESOURCE_SAMPLE_INTERVAL
+        self.max_samples = max_samples or RESOURCE_MAX_SAMPLES
+        self.cores = usable_cores()
+        self.series = {key: [] for key in SERIES}
+        self._ticks = {}
+        self._net = None
+        self._started = time.time()
+        self._last = self._started
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._sample(record=False)
+        self._thread = threading.Thread(target=self._loop, name=f'resource-sampler-{self.pid}', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """샘플링 종료 후 샘플 계열 반환"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        return self.samples()
+
+    def samples(self):
+        return {'interval': self.interval, 'cores': self.cores, **self.series}
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self._sample()
+            except OSError:
+                # 프로세스 목록을 읽는 중 종료된 프로세스 등은 다음 샘플에서 다시 시도
+                continue
+
+    def _sample(self, record=True):
+        now = time.time()
+        tree = process_tree(self.pid)
+        # 프로세스별 누적 틱 차이를 합산 (새로 시작한 프로세스는 시작 이후 전체 틱)
+        delta_ticks = sum(max(0, stat[2] - self._ticks.get(pid, 0)) for pid, stat in tree.items())
+        self._ticks = {pid: stat[2] for pid, stat in tree.items()}
+        net = read_net_bytes(self.pid) if tree else None
+        net_delta = (max(0, net[0] - self._net[0]), max(0, net[1] - self._net[1])) if net and self._net else (0, 0)
+        self._net = net or self._net
+        elapsed = max(now - self._last, 1e-6)
+        self._last = now
+        if not record:
+            return
+        self._append({
+            't': round(now - self._started, 2),
+            'cpu': round(delta_ticks / CLOCK_TICKS / elapsed * 100.0, 1),
+            'rss_kb': sum(stat[3] for stat in tree.values()) * PAGE_SIZE // 1024,
+            'fds': sum(count_fds(pid) for pid in tree),
+            'procs': len(tree),
+            'net_rx': net_delta[0],
+            'net_tx': net_delta[1]
+        })
+
+    def _append(self, sample):
+        for key, value in sample.items():
+            self.series[key].append(value)
+        if len(self.series['t']) > self.max_samples:
+            self._downsample()
+
+    def _downsample(self):
+        """인접한 두 샘플을 합쳐 샘플 수를 절반으로 줄임 (CPU는 평균, 메모리/fd는 최대, 네트워크는 합계)"""
+        pairs = len(self.series['t']) // 2
+        merged = {key: [] for key in SERIES}
+        for i in range(pairs):
+            a, b = 2 * i, 2 * i + 1
+            merged['t'].append(self.series['t'][b])
+            merged['cpu'].append(round((self.series['cpu'][a] + self.series['cpu'][b]) / 2, 1))
+            for key in ('rss_kb', 'fds', 'procs'):
+                merged[key].append(max(self.series[key][a], self.series[key][b]))
+            for key in ('net_rx', 'net_tx'):
+                merged[key].append(self.series[key][a] + self.series[key][b])
+        if len(self.series['t']) % 2:
+            for key in SERIES:
+                merged[key].append(self.series[key][-1])
+        self.series = merged
+        self.interval *= 2
+
+def start_sampler(pid):
+    """프로세스 트리 샘플러 시작 (/proc이 없거나 비활성화되어 있으면 None)"""
+    if not RESOURCE_SAMPLING_ENABLED or not proc_available():
+        return None
+    try:
+        return ProcessTreeSampler(pid).start()
+    except OSError:
+        return None
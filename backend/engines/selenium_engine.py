@@ -0,0 +1,44 @@
+import os
+import sys
+from engines.process_runner import run_process, CANCELLED_MESSAGE
+from engines.workspace import RunWorkspace
+
+def parse_python_result(completed, workspace, timeout):
+    """Python 스크립트 실행 결과(run_process)를 공통 결과 형식으로 변환 (종료 코드 0이면 Pass)"""
+    result = {
+        'exit_code': completed.returncode,
+        'output': completed.stdout,
+        'execution_time': completed.duration,
+        'workspace': workspace.path,
+        'resources': completed.resources
+    }
+    if completed.cancelled:
+        result.update({'status': 'Cancelled', 'error': CANCELLED_MESSAGE, 'cancelled': True})
+    elif completed.timed_out:
+        result.update({'status': 'Error', 'exit_code': None, 'error': f'실행 시간 초과 ({timeout}초)'})
+    else:
+        result.update({
+            'status': 'Pass' if completed.returncode == 0 else 'Fail',
+            'error': completed.stderr if completed.returncode != 0 else None
+        })
+    return result
+
+# Selenium(Python) 실행 엔진
+# 스크립트는 실행별 작업 디렉토리에서 실행하여 스크린샷 등 산출물을 격리
+class SeleniumEngine:
+    def __init__(self):
+        self.python_path = os.environ.get('SELENIUM_PYTHON_PATH', sys.executable)
+
+    def execute_test(self, script_path, env_vars=None, execution_id=None, timeout=300):
+        workspace = RunWorkspace.create(execution_id)
+        env = os.environ.copy()
+        env.update(env_vars or {})
+        completed = run_process(
+            [self.python_path, script_path], workspace.stdout_path, workspace.stderr_path,
+            env=env, cwd=workspace.path, timeout=timeout, run_key=execution_id,
+            resource_path=workspace.resources_path
+        )
+        return parse_python_result(completed, workspace, timeout)
+
+# Selenium 엔진 인스턴스 생성
+selenium_engine = SeleniumEngine()
@@ -0,0 +1,165 @@
+import json
+import os
+import shutil
+import socket
+import time
+import uuid
+
+# 프로젝트 루트 (backend/engines 기준 두 단계 상위)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+# 실행별 작업 디렉토리 루트
+RUN_WORKSPACE_ROOT = os.environ.get('RUN_WORKSPACE_ROOT') or os.path.join(PROJECT_ROOT, 'runs')
+
+# 작업 디렉토리 보존 정책 (0이면 해당 제한 없음)
+RUN_WORKSPACE_MAX_AGE_HOURS = float(os.environ.get('RUN_WORKSPACE_MAX_AGE_HOURS', '168'))
+RUN_WORKSPACE_MAX_COUNT = int(os.environ.get('RUN_WORKSPACE_MAX_COUNT', '1000'))
+
+# 작업 디렉토리 소유 정보 파일 (실행 ID 또는 하위 샤드 번호, 만든 호스트/프로세스): 보존 정책이 실행 중인 디렉토리를 건너뛰는 데 사용
+WORKSPACE_MARKER = '.workspace.json'
+
+# 실행별 격리 작업 디렉토리
+# 출력(result.json), 요약(summary.json), stdout/stderr 로그, 스크린샷을 실행마다 분리하여
+# 같은 폴더의 스크립트를 동시에 실행해도 서로의 결과 파일을 덮어쓰지 않도록 함
+class RunWorkspace:
+    def __init__(self, run_id, root=None, prefix='execution_'):
+        self.run_id = str(run_id)
+        self.root = root or RUN_WORKSPACE_ROOT
+        self.path = os.path.join(self.root, f'{prefix}{self.run_id}')
+
+    @classmethod
+    def create(cls, run_id=None, root=None, prefix='execution_'):
+        """작업 디렉토리 생성 (run_id가 없으면 임시 ID 부여)"""
+        workspace = cls(run_id if run_id is not None else f'adhoc_{uuid.uuid4().hex[:12]}', root, prefix)
+        os.makedirs(workspace.screenshots_dir, exist_ok=True)
+        with open(workspace.file_path(WORKSPACE_MARKER), 'w', encoding='utf-8') as f:
+            json.dump({
+                'run_id': str(run_id) if run_id is not None else None,
+                'host': socket.gethostname(),
+                'pid': os.getpid(),
+                'created_at': time.time()
+            }, f)
+        # 이전 실행의 결과/로그 파일이 남아 있으면 제거 (같은 실행 ID 재사용 시)
+        for path in (workspace.output_path, workspace.summary_path, workspace.stdout_path, workspace.stderr_path,
+                     workspace.resources_path):
+            if os.path.exists(path):
+                os.remove(path)
+        return workspace
+
+    @classmethod
+    def get(cls, run_id, root=None):
+        """기존 작업 디렉토리 조회 (없으면 None)"""
+        workspace = cls(run_id, root)
+        return workspace if os.path.isdir(workspace.path) else None
+
+    @property
+    def output_path(self):
+        return os.path.join(self.path, 'result.json')
+
+    @property
+    def summary_path(self):
+        return os.path.join(self.path, 'summary.json')
+
+    @property
+    def stdout_path(self):
+        return os.path.join(self.path, 'stdout.log')
+
+    @property
+    def stderr_path(self):
+        return os.path.join(self.path, 'stderr.log')
+
+    @property
+    def resources_path(self):
+        # 러너 프로세스 트리 자원 샘플 (engines.resource_monitor)
+        return os.path.join(self.path, 'resources.json')
+
+    @property
+    def screenshots_dir(self):
+        return os.path.join(self.path, 'screenshots')
+
+    def file_path(self, name):
+        return os.path.join(self.path, name)
+
+    def write_logs(self, stdout, stderr):
+        with open(self.stdout_path, 'w', encoding='utf-8') as f:
+            f.write(stdout or '')
+        with open(self.stderr_path, 'w', encoding='utf-8') as f:
+            f.write(stderr or '')
+
+    def list_files(self):
+        """작업 디렉토리 내 파일 목록 (상대 경로)"""
+        files = []
+        for root, dirs, names in os.walk(self.path):
+            for name in names:
+                if name == WORKSPACE_MARKER:
+                    continue
+                full_path = os.path.join(root, name)
+                files.append({
+                    'path': os.path.relpath(full_path, self.path),
+                    'size': os.path.getsize(full_path)
+                })
+        files.sort(key=lambda f: f['path'])
+        return files
+
+    def cleanup(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+def workspace_owner(path):
+    """작업 디렉토리 소유 정보 (소유 정보 파일이 없는 이전 디렉토리는 execution_<id> 이름에서 실행 ID 추출)"""
+    try:
+        with open(os.path.join(path, WORKSPACE_MARKER), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        name = os.path.basename(path)
+        run_id = name[len('execution_'):] if name.startswith('execution_') else None
+        return {'run_id': run_id if run_id and not run_id.startswith('adhoc_') else None}
+
+def _process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+def workspace_in_use(owner, keep):
+    """대기/실행 중인 실행(keep)의 디렉토리이거나, 이 호스트에서 아직 살아 있는 프로세스가 만든 임시 디렉토리인지"""
+    if owner.get('run_id') is not None:
+        return str(owner['run_id']) in keep
+    pid = owner.get('pid')
+    return bool(pid) and owner.get('host') == socket.gethostname() and _process_alive(pid)
+
+def prune_workspaces(root=None, max_age_hours=None, max_count=None, keep=(), now=None):
+    """보존 기간이 지났거나 개수 상한을 넘은 오래된 작업 디렉토리 삭제 (삭제한 디렉토리 이름 목록 반환)
+
+    keep: 삭제하지 않을 실행 ID (대기/실행 중인 실행), 개수 상한은 최근 수정 순으로 적용
+    실행 ID가 없는 임시 디렉토리(adhoc)는 만든 프로세스가 살아 있는 동안 유지
+    """
+    root = root or RUN_WORKSPACE_ROOT
+    max_age_hours = RUN_WORKSPACE_MAX_AGE_HOURS if max_age_hours is None else max_age_hours
+    max_count = RUN_WORKSPACE_MAX_COUNT if max_count is None else max_count
+    if not os.path.isdir(root) or (not max_age_hours and not max_count):
+        return []
+    keep = {str(run_id) for run_id in keep}
+    now = now or time.time()
+
+    entries = []
+    for entry in os.scandir(root):
+        if not entry.is_dir(follow_symlinks=False):
+            continue
+        if workspace_in_use(workspace_owner(entry.path), keep):
+            continue
+        try:
+            entries.append((entry.stat(follow_symlinks=False).st_mtime, entry.path, entry.name))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+
+    removed = []
+    for index, (mtime, path, name) in enumerate(entries):
+        expired = max_age_hours and now - mtime > max_age_hours * 3600
+        if expired or (max_count and index >= max_count):
+            shutil.rmtree(path, ignore_errors=True)
+            removed.append(name)
+    return removed
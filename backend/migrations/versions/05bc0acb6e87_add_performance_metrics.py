@@ -0,0 +1,76 @@
+"""Add k6 metric summary columns and PerformanceMetrics table
+
+Revision ID: 05bc0acb6e87
+Revises: 9a1ef1ebd434
+Create Date: 2026-10-18 09:01:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '05bc0acb6e87'
+down_revision = '9a1ef1ebd434'
+branch_labels = None
+depends_on = None
+
+
+# db.create_all()로 이미 만들어진 테이블/컬럼은 건너뜀 (기존 배포 DB와 신규 DB 모두 적용 가능)
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    existing = _columns('TestExecutions')
+    with op.batch_alter_table('TestExecutions', schema=None) as batch_op:
+        for name, type_ in (
+            ('request_count', sa.Integer()),
+            ('response_time_avg', sa.Float()),
+            ('response_time_p95', sa.Float()),
+            ('throughput', sa.Float()),
+            ('error_rate', sa.Float())
+        ):
+            if name not in existing:
+                batch_op.add_column(sa.Column(name, type_, nullable=True))
+
+    if 'test_execution_id' not in _columns('TestResults'):
+        with op.batch_alter_table('TestResults', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('test_execution_id', sa.Integer(), nullable=True))
+            batch_op.create_foreign_key('fk_TestResults_test_execution_id', 'TestExecutions', ['test_execution_id'], ['id'])
+
+    if 'PerformanceMetrics' not in _tables():
+        op.create_table('PerformanceMetrics',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('test_execution_id', sa.Integer(), nullable=False),
+            sa.Column('metric_name', sa.String(length=100), nullable=False),
+            sa.Column('metric_type', sa.String(length=20), nullable=True),
+            sa.Column('count', sa.Integer(), nullable=True),
+            sa.Column('mean', sa.Float(), nullable=True),
+            sa.Column('min_value', sa.Float(), nullable=True),
+            sa.Column('max_value', sa.Float(), nullable=True),
+            sa.Column('p50', sa.Float(), nullable=True),
+            sa.Column('p90', sa.Float(), nullable=True),
+            sa.Column('p95', sa.Float(), nullable=True),
+            sa.Column('p99', sa.Float(), nullable=True),
+            sa.Column('rate', sa.Float(), nullable=True),
+            sa.Column('per_second', sa.Float(), nullable=True),
+            sa.ForeignKeyConstraint(['test_execution_id'], ['TestExecutions.id']),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_PerformanceMetrics_test_execution_id', 'PerformanceMetrics', ['test_execution_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_PerformanceMetrics_test_execution_id', table_name='PerformanceMetrics')
+    op.drop_table('PerformanceMetrics')
+    with op.batch_alter_table('TestResults', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_TestResults_test_execution_id', type_='foreignkey')
+        batch_op.drop_column('test_execution_id')
+    with op.batch_alter_table('TestExecutions', schema=None) as batch_op:
+        for name in ('error_rate', 'throughput', 'response_time_p95', 'response_time_avg', 'request_count'):
+            batch_op.drop_column(name)
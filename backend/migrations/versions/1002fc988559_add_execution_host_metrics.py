@@ -0,0 +1,46 @@
+"""Add ExecutionHostMetrics table
+
+Revision ID: 1002fc988559
+Revises: 51f773d37d12
+Create Date: 2026-10-18 09:11:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1002fc988559'
+down_revision = '51f773d37d12'
+branch_labels = None
+depends_on = None
+
+
+# db.create_all()로 이미 만들어진 테이블/컬럼은 건너뜀 (기존 배포 DB와 신규 DB 모두 적용 가능)
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if 'ExecutionHostMetrics' in _tables():
+        return
+    op.create_table('ExecutionHostMetrics',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('test_execution_id', sa.Integer(), nullable=False),
+        sa.Column('sample_count', sa.Integer(), nullable=True),
+        sa.Column('interval', sa.Float(), nullable=True),
+        sa.Column('summary', sa.Text(), nullable=True),
+        sa.Column('samples', sa.LargeBinary(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['test_execution_id'], ['TestExecutions.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('test_execution_id')
+    )
+
+
+def downgrade():
+    op.drop_table('ExecutionHostMetrics')
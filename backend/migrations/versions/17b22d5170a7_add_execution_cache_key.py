@@ -0,0 +1,38 @@
+"""Add TestExecutions.cache_key for result reuse
+
+Revision ID: 17b22d5170a7
+Revises: da5515ad3606
+Create Date: 2026-10-18 09:07:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '17b22d5170a7'
+down_revision = 'da5515ad3606'
+branch_labels = None
+depends_on = None
+
+
+# db.create_all()로 이미 만들어진 테이블/컬럼은 건너뜀 (기존 배포 DB와 신규 DB 모두 적용 가능)
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if 'cache_key' not in _columns('TestExecutions'):
+        with op.batch_alter_table('TestExecutions', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('cache_key', sa.String(length=64), nullable=True))
+            batch_op.create_index('ix_TestExecutions_cache_key', ['cache_key'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('TestExecutions', schema=None) as batch_op:
+        batch_op.drop_index('ix_TestExecutions_cache_key')
+        batch_op.drop_column('cache_key')
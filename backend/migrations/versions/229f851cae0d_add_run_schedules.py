@@ -0,0 +1,72 @@
+"""Add RunSchedules table and TestExecutions.schedule_id
+
+Revision ID: 229f851cae0d
+Revises: 1002fc988559
+Create Date: 2026-10-18 09:12:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '229f851cae0d'
+down_revision = '1002fc988559'
+branch_labels = None
+depends_on = None
+
+
+# db.create_all()로 이미 만들어진 테이블/컬럼은 건너뜀 (기존 배포 DB와 신규 DB 모두 적용 가능)
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if 'RunSchedules' not in _tables():
+        op.create_table('RunSchedules',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=100), nullable=False),
+            sa.Column('cron', sa.String(length=100), nullable=False),
+            sa.Column('timezone', sa.String(length=50), nullable=True),
+            sa.Column('target_type', sa.String(length=20), nullable=False),
+            sa.Column('target_id', sa.Integer(), nullable=False),
+            sa.Column('environment', sa.String(length=50), nullable=True),
+            sa.Column('parameters', sa.Text(), nullable=True),
+            sa.Column('overlap_policy', sa.String(length=20), nullable=True),
+            sa.Column('jitter_seconds', sa.Integer(), nullable=True),
+            sa.Column('enabled', sa.Boolean(), nullable=True),
+            sa.Column('next_run_at', sa.DateTime(), nullable=True),
+            sa.Column('next_fire_at', sa.DateTime(), nullable=True),
+            sa.Column('pending_since', sa.DateTime(), nullable=True),
+            sa.Column('last_run_at', sa.DateTime(), nullable=True),
+            sa.Column('last_execution_id', sa.Integer(), nullable=True),
+            sa.Column('last_status', sa.String(length=20), nullable=True),
+            sa.Column('last_error', sa.Text(), nullable=True),
+            sa.Column('run_count', sa.Integer(), nullable=True),
+            sa.Column('skip_count', sa.Integer(), nullable=True),
+            sa.Column('created_by', sa.String(length=100), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_RunSchedules_enabled', 'RunSchedules', ['enabled'], unique=False)
+        op.create_index('ix_RunSchedules_next_fire_at', 'RunSchedules', ['next_fire_at'], unique=False)
+    if 'schedule_id' not in _columns('TestExecutions'):
+        with op.batch_alter_table('TestExecutions', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('schedule_id', sa.Integer(), nullable=True))
+            batch_op.create_foreign_key('fk_TestExecutions_schedule_id', 'RunSchedules', ['schedule_id'], ['id'])
+            batch_op.create_index('ix_TestExecutions_schedule_id', ['schedule_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('TestExecutions', schema=None) as batch_op:
+        batch_op.drop_index('ix_TestExecutions_schedule_id')
+        batch_op.drop_constraint('fk_TestExecutions_schedule_id', type_='foreignkey')
+        batch_op.drop_column('schedule_id')
+    op.drop_index('ix_RunSchedules_next_fire_at', table_name='RunSchedules')
+    op.drop_index('ix_RunSchedules_enabled', table_name='RunSchedules')
+    op.drop_table('RunSchedules')
@@ -0,0 +1,58 @@
+"""Add generator_saturated and ExecutionResourceUsage table
+
+Revision ID: 51f773d37d12
+Revises: 949084687141
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '51f773d37d12'
+down_revision = '949084687141'
+branch_labels = None
+depends_on = None
+
+
+# db.create_all()로 이미 만들어진 테이블/컬럼은 건너뜀 (기존 배포 DB와 신규 DB 모두 적용 가능)
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if 'generator_saturated' not in _columns('TestExecutions'):
+        with op.batch_alter_table('TestExecutions', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('generator_saturated', sa.Boolean(), nullable=True))
+    if 'ExecutionResourceUsage' not in _tables():
+        op.create_table('ExecutionResourceUsage',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('test_execution_id', sa.Integer(), nullable=False),
+            sa.Column('sample_count', sa.Integer(), nullable=True),
+            sa.Column('interval', sa.Float(), nullable=True),
+            sa.Column('cores', sa.Integer(), nullable=True),
+            sa.Column('peak_cpu_percent', sa.Float(), nullable=True),
+            sa.Column('avg_cpu_percent', sa.Float(), nullable=True),
+            sa.Column('peak_rss_kb', sa.Integer(), nullable=True),
+            sa.Column('peak_fds', sa.Integer(), nullable=True),
+            sa.Column('net_rx_bytes', sa.BigInteger(), nullable=True),
+            sa.Column('net_tx_bytes', sa.BigInteger(), nullable=True),
+            sa.Column('saturated', sa.Boolean(), nullable=True),
+            sa.Column('saturated_seconds', sa.Float(), nullable=True),
+            sa.Column('samples', sa.LargeBinary(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['test_execution_id'], ['TestExecutions.id']),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('test_execution_id')
+        )
+
+
+def downgrade():
+    op.drop_table('ExecutionResourceUsage')
+    with op.batch_alter_table('TestExecutions', schema=None) as batch_op:
+        batch_op.drop_column('generator_saturated')
@@ -0,0 +1,55 @@
+"""Add project queue weights/quotas and RunQueue fair-share columns
+
+Revision ID: 58857508a5cf
+Revises: 229f851cae0d
+Create Date: 2026-10-18 09:13:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '58857508a5cf'
+down_revision = '229f851cae0d'
+branch_labels = None
+depends_on = None
+
+
+# db.create_all()로 이미 만들어진 테이블/컬럼은 건너뜀 (기존 배포 DB와 신규 DB 모두 적용 가능)
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    existing = _columns('projects')
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        if 'queue_weight' not in existing:
+            batch_op.add_column(sa.Column('queue_weight', sa.Float(), nullable=True))
+        if 'max_concurrent_runs' not in existing:
+            batch_op.add_column(sa.Column('max_concurrent_runs', sa.Integer(), nullable=True))
+
+    existing = _columns('RunQueue')
+    with op.batch_alter_table('RunQueue', schema=None) as batch_op:
+        if 'project_id' not in existing:
+            batch_op.add_column(sa.Column('project_id', sa.Integer(), nullable=True))
+            batch_op.create_index('ix_RunQueue_project_id', ['project_id'], unique=False)
+        if 'owner_id' not in existing:
+            batch_op.add_column(sa.Column('owner_id', sa.Integer(), nullable=True))
+        if 'paused_at' not in existing:
+            batch_op.add_column(sa.Column('paused_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('RunQueue', schema=None) as batch_op:
+        batch_op.drop_column('paused_at')
+        batch_op.drop_column('owner_id')
+        batch_op.drop_index('ix_RunQueue_project_id')
+        batch_op.drop_column('project_id')
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_column('max_concurrent_runs')
+        batch_op.drop_column('queue_weight')
@@ -0,0 +1,36 @@
+"""Add TestResults.exit_code for subprocess automation runs
+
+Revision ID: 6112b3ca98ca
+Revises: f997f869747c
+Create Date: 2026-10-18 09:03:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6112b3ca98ca'
+down_revision = 'f997f869747c'
+branch_labels = None
+depends_on = None
+
+
+# db.create_all()로 이미 만들어진 테이블/컬럼은 건너뜀 (기존 배포 DB와 신규 DB 모두 적용 가능)
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if 'exit_code' not in _columns('TestResults'):
+        with op.batch_alter_table('TestResults', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('exit_code', sa.Integer(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('TestResults', schema=None) as batch_op:
+        batch_op.drop_column('exit_code')
@@ -0,0 +1,51 @@
+"""Add parent/child suite execution columns to TestExecutions
+
+Revision ID: 6775b42706ce
+Revises: 6112b3ca98ca
+Create Date: 2026-10-18 09:04:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6775b42706ce'
+down_revision = '6112b3ca98ca'
+branch_labels = None
+depends_on = None
+
+
+# db.create_all()로 이미 만들어진 테이블/컬럼은 건너뜀 (기존 배포 DB와 신규 DB 모두 적용 가능)
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    existing = _columns('TestExecutions')
+    with op.batch_alter_table('TestExecutions', schema=None) as batch_op:
+        if 'parent_execution_id' not in existing:
+            batch_op.add_column(sa.Column('parent_execution_id', sa.Integer(), nullable=True))
+            batch_op.create_foreign_key('fk_TestExecutions_parent_execution_id', 'TestExecutions', ['parent_execution_id'], ['id'])
+            batch_op.create_index('ix_TestExecutions_parent_execution_id', ['parent_execution_id'], unique=False)
+        if 'folder_id' not in existing:
+            batch_op.add_column(sa.Column('folder_id', sa.Integer(), nullable=True))
+            batch_op.create_foreign_key('fk_TestExecutions_folder_id', 'Folders', ['folder_id'], ['id'])
+        for name in ('total_count', 'completed_count', 'passed_count', 'failed_count'):
+            if name not in existing:
+                batch_op.add_column(sa.Column(name, sa.Integer(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('TestExecutions', schema=None) as batch_op:
+        for name in ('failed_count', 'passed_count', 'completed_count', 'total_count'):
+            batch_op.drop_column(name)
+        batch_op.drop_constraint('fk_TestExecutions_folder_id', type_='foreignkey')
+        batch_op.drop_column('folder_id')
+        batch_op.drop_index('ix_TestExecutions_parent_execution_id')
+        batch_op.drop_constraint('fk_TestExecutions_parent_execution_id', type_='foreignkey')
+        batch_op.drop_column('parent_execution_id')
@@ -0,0 +1,48 @@
+"""Add TestDurationEstimates table for execution time prediction
+
+Revision ID: 8e79e5093372
+Revises: 17b22d5170a7
+Create Date: 2026-10-18 09:08:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e79e5093372'
+down_revision = '17b22d5170a7'
+branch_labels = None
+depends_on = None
+
+
+# db.create_all()로 이미 만들어진 테이블/컬럼은 건너뜀 (기존 배포 DB와 신규 DB 모두 적용 가능)
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if 'TestDurationEstimates' in _tables():
+        return
+    op.create_table('TestDurationEstimates',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('test_type', sa.String(length=50), nullable=False),
+        sa.Column('test_id', sa.Integer(), nullable=False),
+        sa.Column('environment', sa.String(length=50), nullable=False),
+        sa.Column('samples', sa.Integer(), nullable=True),
+        sa.Column('median', sa.Float(), nullable=True),
+        sa.Column('mean', sa.Float(), nullable=True),
+        sa.Column('deviation', sa.Float(), nullable=True),
+        sa.Column('last_duration', sa.Float(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('test_type', 'test_id', 'environment', name='uq_duration_estimate_test')
+    )
+
+
+def downgrade():
+    op.drop_table('TestDurationEstimates')
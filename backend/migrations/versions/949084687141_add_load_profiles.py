@@ -0,0 +1,51 @@
+"""Add LoadProfiles table and PerformanceTests.load_profile_id
+
+Revision ID: 949084687141
+Revises: 8e79e5093372
+Create Date: 2026-10-18 09:09:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '949084687141'
+down_revision = '8e79e5093372'
+branch_labels = None
+depends_on = None
+
+
+# db.create_all()로 이미 만들어진 테이블/컬럼은 건너뜀 (기존 배포 DB와 신규 DB 모두 적용 가능)
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if 'LoadProfiles' not in _tables():
+        op.create_table('LoadProfiles',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=100), nullable=False),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('profile_type', sa.String(length=50), nullable=False),
+            sa.Column('settings', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('name')
+        )
+    if 'load_profile_id' not in _columns('PerformanceTests'):
+        with op.batch_alter_table('PerformanceTests', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('load_profile_id', sa.Integer(), nullable=True))
+            batch_op.create_foreign_key('fk_PerformanceTests_load_profile_id', 'LoadProfiles', ['load_profile_id'], ['id'])
+
+
+def downgrade():
+    with op.batch_alter_table('PerformanceTests', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_PerformanceTests_load_profile_id', type_='foreignkey')
+        batch_op.drop_column('load_profile_id')
+    op.drop_table('LoadProfiles')
@@ -0,0 +1,36 @@
+"""Add TestExecutions.queued_at for async execution
+
+Revision ID: 9a1ef1ebd434
+Revises: 354e4022d50d
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a1ef1ebd434'
+down_revision = '354e4022d50d'
+branch_labels = None
+depends_on = None
+
+
+# db.create_all()로 이미 만들어진 테이블/컬럼은 건너뜀 (기존 배포 DB와 신규 DB 모두 적용 가능)
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if 'queued_at' not in _columns('TestExecutions'):
+        with op.batch_alter_table('TestExecutions', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('queued_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('TestExecutions', schema=None) as batch_op:
+        batch_op.drop_column('queued_at')
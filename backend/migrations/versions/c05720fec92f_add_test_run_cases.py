@@ -0,0 +1,54 @@
+"""Add TestRunCases table for per-test report results
+
+Revision ID: c05720fec92f
+Revises: 6775b42706ce
+Create Date: 2026-10-18 09:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c05720fec92f'
+down_revision = '6775b42706ce'
+branch_labels = None
+depends_on = None
+
+
+# db.create_all()로 이미 만들어진 테이블/컬럼은 건너뜀 (기존 배포 DB와 신규 DB 모두 적용 가능)
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if 'TestRunCases' in _tables():
+        return
+    op.create_table('TestRunCases',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('test_execution_id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=500), nullable=False),
+        sa.Column('file', sa.String(length=500), nullable=True),
+        sa.Column('line', sa.Integer(), nullable=True),
+        sa.Column('project_name', sa.String(length=100), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=True),
+        sa.Column('duration', sa.Float(), nullable=True),
+        sa.Column('retries', sa.Integer(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('attachments', sa.Text(), nullable=True),
+        sa.Column('shard_index', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['test_execution_id'], ['TestExecutions.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_TestRunCases_test_execution_id', 'TestRunCases', ['test_execution_id'], unique=False)
+    op.create_index('ix_TestRunCases_status', 'TestRunCases', ['status'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_TestRunCases_status', table_name='TestRunCases')
+    op.drop_index('ix_TestRunCases_test_execution_id', table_name='TestRunCases')
+    op.drop_table('TestRunCases')
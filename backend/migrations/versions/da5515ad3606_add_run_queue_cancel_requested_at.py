@@ -0,0 +1,36 @@
+"""Add RunQueue.cancel_requested_at for cross-host cancellation
+
+Revision ID: da5515ad3606
+Revises: c05720fec92f
+Create Date: 2026-10-18 09:06:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'da5515ad3606'
+down_revision = 'c05720fec92f'
+branch_labels = None
+depends_on = None
+
+
+# db.create_all()로 이미 만들어진 테이블/컬럼은 건너뜀 (기존 배포 DB와 신규 DB 모두 적용 가능)
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if 'cancel_requested_at' not in _columns('RunQueue'):
+        with op.batch_alter_table('RunQueue', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('cancel_requested_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('RunQueue', schema=None) as batch_op:
+        batch_op.drop_column('cancel_requested_at')
@@ -0,0 +1,58 @@
+"""Add RunQueue table for the durable run queue
+
+Revision ID: f997f869747c
+Revises: 05bc0acb6e87
+Create Date: 2026-10-18 09:02:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f997f869747c'
+down_revision = '05bc0acb6e87'
+branch_labels = None
+depends_on = None
+
+
+# db.create_all()로 이미 만들어진 테이블/컬럼은 건너뜀 (기존 배포 DB와 신규 DB 모두 적용 가능)
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _columns(table):
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if 'RunQueue' in _tables():
+        return
+    op.create_table('RunQueue',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('test_execution_id', sa.Integer(), nullable=False),
+        sa.Column('job_type', sa.String(length=50), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=True),
+        sa.Column('priority', sa.Integer(), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=True),
+        sa.Column('max_attempts', sa.Integer(), nullable=True),
+        sa.Column('worker_id', sa.String(length=100), nullable=True),
+        sa.Column('available_at', sa.DateTime(), nullable=True),
+        sa.Column('claimed_at', sa.DateTime(), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['test_execution_id'], ['TestExecutions.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('test_execution_id')
+    )
+    op.create_index('ix_RunQueue_status', 'RunQueue', ['status'], unique=False)
+    op.create_index('ix_run_queue_claim', 'RunQueue', ['status', 'priority', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_run_queue_claim', table_name='RunQueue')
+    op.drop_index('ix_RunQueue_status', table_name='RunQueue')
+    op.drop_table('RunQueue')
@@ -1,4 +1,5 @@
 from datetime import datetime
+import json
 from flask_sqlalchemy import SQLAlchemy
 from werkzeug.security import generate_password_hash, check_password_hash
 import secrets
@@ -66,6 +67,8 @@ class Project(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text)
+    queue_weight = db.Column(db.Float, default=1.0)  # 실행 대기열 공정 배분 가중치 (클수록 더 많은 실행 슬롯)
+    max_concurrent_runs = db.Column(db.Integer, nullable=True)  # 프로젝트 동시 실행 상한 (없으면 RUN_QUEUE_PROJECT_MAX_CONCURRENCY)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -123,6 +126,7 @@ class PerformanceTest(db.Model):
     script_path = db.Column(db.String(255))
     environment = db.Column(db.String(50))
     parameters = db.Column(db.Text)  # JSON 형태로 저장
+    load_profile_id = db.Column(db.Integer, db.ForeignKey('LoadProfiles.id'), nullable=True)  # 기본 부하 프로필
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     creator_id = db.Column(db.Integer, db.ForeignKey('Users.id'), nullable=True)
@@ -130,6 +134,32 @@ class PerformanceTest(db.Model):
     
     # 관계 설정
     project = db.relationship('Project', backref='performance_tests')
+    load_profile = db.relationship('LoadProfile', backref='performance_tests')
+
+# 부하 프로필 모델 (ramp, spike, soak, stress, constant_arrival_rate)
+class LoadProfile(db.Model):
+    __tablename__ = 'LoadProfiles'
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False, unique=True)
+    description = db.Column(db.Text)
+    profile_type = db.Column(db.String(50), nullable=False)
+    settings = db.Column(db.Text)  # 검증/기본값이 채워진 설정 (JSON)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def to_profile(self):
+        return {'type': self.profile_type, 'settings': json.loads(self.settings) if self.settings else {}}
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'type': self.profile_type,
+            'settings': json.loads(self.settings) if self.settings else {},
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
 
 # 자동화 테스트 모델
 class AutomationTest(db.Model):
@@ -156,12 +186,14 @@ class TestResult(db.Model):
     test_case_id = db.Column(db.Integer, db.ForeignKey('TestCases.id'), nullable=True)  # nullable=True로 변경
     automation_test_id = db.Column(db.Integer, db.ForeignKey('AutomationTests.id'), nullable=True)  # 자동화 테스트 ID 추가
     performance_test_id = db.Column(db.Integer, db.ForeignKey('PerformanceTests.id'), nullable=True)  # 성능 테스트 ID 추가
-    result = db.Column(db.String(20))  # Pass, Fail, Skip, Error
+    result = db.Column(db.String(20))  # Pass, Fail, Skip, Error, Cancelled
     execution_time = db.Column(db.Float)  # 초 단위
     environment = db.Column(db.String(50))
     executed_by = db.Column(db.String(100))
     executed_at = db.Column(db.DateTime, default=datetime.utcnow)
     notes = db.Column(db.Text)
+    exit_code = db.Column(db.Integer)  # 스크립트 프로세스 종료 코드
+    test_execution_id = db.Column(db.Integer, db.ForeignKey('TestExecutions.id'), nullable=True)  # 실행 기록 ID
     
     # test_case_id, automation_test_id, performance_test_id 중 하나는 반드시 있어야 함
     __table_args__ = (
@@ -184,16 +216,318 @@ class DashboardSummary(db.Model):
 class TestExecution(db.Model):
     __tablename__ = 'TestExecutions'
     id = db.Column(db.Integer, primary_key=True)
-    test_type = db.Column(db.String(50))  # performance, automation, manual
+    test_type = db.Column(db.String(50))  # performance, automation, testcase, suite, manual
     test_case_id = db.Column(db.Integer, db.ForeignKey('TestCases.id'), nullable=True)
     automation_test_id = db.Column(db.Integer, db.ForeignKey('AutomationTests.id'), nullable=True)
     performance_test_id = db.Column(db.Integer, db.ForeignKey('PerformanceTests.id'), nullable=True)
     environment = db.Column(db.String(50))
     executed_by = db.Column(db.String(100))
-    status = db.Column(db.String(20))  # running, completed, failed
+    status = db.Column(db.String(20))  # queued, running, completed, failed, cancelled
     result_summary = db.Column(db.Text)  # JSON 형태로 저장
+    queued_at = db.Column(db.DateTime, default=datetime.utcnow)  # 비동기 실행 등록 시각
     started_at = db.Column(db.DateTime, default=datetime.utcnow)
     completed_at = db.Column(db.DateTime)
+    
+    # 성능 테스트 대표 지표 (k6 JSON 결과에서 파싱)
+    request_count = db.Column(db.Integer)
+    response_time_avg = db.Column(db.Float)  # ms
+    response_time_p95 = db.Column(db.Float)  # ms
+    throughput = db.Column(db.Float)  # 초당 요청 수
+    error_rate = db.Column(db.Float)  # 0~1
+    
+    # 스위트 실행 (폴더 하위 테스트 케이스 일괄 실행): 부모 실행과 진행 카운터
+    parent_execution_id = db.Column(db.Integer, db.ForeignKey('TestExecutions.id'), nullable=True, index=True)
+    folder_id = db.Column(db.Integer, db.ForeignKey('Folders.id'), nullable=True)
+    total_count = db.Column(db.Integer)
+    completed_count = db.Column(db.Integer, default=0)
+    passed_count = db.Column(db.Integer, default=0)
+    failed_count = db.Column(db.Integer, default=0)
+    
+    # 결과 재사용 키 (스크립트/import 모듈 내용 해시 + 환경 변수 + 환경)
+    cache_key = db.Column(db.String(64), index=True)
+    
+    # 부하 생성기(러너 프로세스 트리) CPU 포화 여부 (포화 시 지연 시간/처리량을 신뢰하기 어려움)
+    generator_saturated = db.Column(db.Boolean, default=False)
+    
+    # 예약 실행으로 생성된 실행이면 예약 ID (이전 회차 실행 중 여부 판단에 사용)
+    schedule_id = db.Column(db.Integer, db.ForeignKey('RunSchedules.id'), nullable=True, index=True)
+    
+    # 관계 설정
+    metrics = db.relationship('PerformanceMetric', backref='execution', lazy='dynamic', cascade='all, delete-orphan')
+    resource_usage = db.relationship('ExecutionResourceUsage', backref='execution', uselist=False, cascade='all, delete-orphan')
+    host_metrics = db.relationship('ExecutionHostMetrics', backref='execution', uselist=False, cascade='all, delete-orphan')
+    children = db.relationship('TestExecution', backref=db.backref('parent', remote_side=[id]), lazy='dynamic')
+    
+    def progress(self):
+        """스위트 진행 상황 (자식 실행이 없으면 None)"""
+        if self.total_count is None:
+            return None
+        total = self.total_count or 0
+        completed = self.completed_count or 0
+        return {
+            'total': total,
+            'completed': completed,
+            'passed': self.passed_count or 0,
+            'failed': self.failed_count or 0,
+            'remaining': max(0, total - completed),
+            'percent': round(completed * 100.0 / total, 1) if total else 100.0
+        }
+
+# 실행 대기열 모델 (여러 워커 프로세스/호스트가 공유하는 영속 큐)
+class RunQueueItem(db.Model):
+    __tablename__ = 'RunQueue'
+    id = db.Column(db.Integer, primary_key=True)
+    test_execution_id = db.Column(db.Integer, db.ForeignKey('TestExecutions.id'), nullable=False, unique=True)
+    job_type = db.Column(db.String(50), nullable=False)  # performance, automation 등 (작업 핸들러 키)
+    payload = db.Column(db.Text)  # JSON 형태로 저장 (핸들러 인자)
+    status = db.Column(db.String(20), default='queued', index=True)  # queued, paused, running, done, failed, cancelled
+    priority = db.Column(db.Integer, default=0)  # 높을수록 먼저 실행
+    project_id = db.Column(db.Integer, nullable=True, index=True)  # 공정 배분 단위 (대상 테스트의 프로젝트)
+    owner_id = db.Column(db.Integer, nullable=True)  # 대상 테스트의 생성자 (프로젝트 안에서 공정 배분)
+    paused_at = db.Column(db.DateTime)  # 관리자가 일시 정지한 시각
+    attempts = db.Column(db.Integer, default=0)
+    max_attempts = db.Column(db.Integer, default=3)
+    worker_id = db.Column(db.String(100))  # 실행 중인 워커 ID (호스트명:PID)
+    available_at = db.Column(db.DateTime, default=datetime.utcnow)  # 이 시각 이후 실행 가능
+    claimed_at = db.Column(db.DateTime)
+    heartbeat_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    last_error = db.Column(db.Text)
+    cancel_requested_at = db.Column(db.DateTime)  # 실행 중 취소 요청 시각 (워커가 확인하여 프로세스 종료)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    execution = db.relationship('TestExecution', backref=db.backref('queue_item', uselist=False))
+    
+    __table_args__ = (
+        db.Index('ix_run_queue_claim', 'status', 'priority', 'id'),
+    )
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'test_execution_id': self.test_execution_id,
+            'job_type': self.job_type,
+            'status': self.status,
+            'priority': self.priority,
+            'project_id': self.project_id,
+            'owner_id': self.owner_id,
+            'paused_at': self.paused_at.isoformat() if self.paused_at else None,
+            'attempts': self.attempts,
+            'max_attempts': self.max_attempts,
+            'worker_id': self.worker_id,
+            'available_at': self.available_at.isoformat() if self.available_at else None,
+            'claimed_at': self.claimed_at.isoformat() if self.claimed_at else None,
+            'heartbeat_at': self.heartbeat_at.isoformat() if self.heartbeat_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'last_error': self.last_error,
+            'cancel_requested_at': self.cancel_requested_at.isoformat() if self.cancel_requested_at else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+# 예약 실행 모델 (cron 표현식에 따라 성능/자동화 테스트 또는 폴더 스위트를 대기열에 등록)
+class RunSchedule(db.Model):
+    __tablename__ = 'RunSchedules'
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    cron = db.Column(db.String(100), nullable=False)
+    timezone = db.Column(db.String(50), default='UTC')  # cron 표현식을 해석할 시간대
+    target_type = db.Column(db.String(20), nullable=False)  # performance, automation, folder
+    target_id = db.Column(db.Integer, nullable=False)
+    environment = db.Column(db.String(50))  # 실행 환경 (없으면 대상의 환경)
+    parameters = db.Column(db.Text)  # 실행 API 요청 본문과 같은 형식의 덮어쓸 값 (JSON: environment_vars, shards, load_profile 등)
+    overlap_policy = db.Column(db.String(20), default='skip')  # 이전 회차가 실행 중일 때: skip, coalesce, allow
+    jitter_seconds = db.Column(db.Integer, default=0)  # 실행 시각에 더할 임의 지연 상한 (초)
+    enabled = db.Column(db.Boolean, default=True, index=True)
+    next_run_at = db.Column(db.DateTime)  # 다음 cron 시각 (UTC)
+    next_fire_at = db.Column(db.DateTime, index=True)  # 분산/지터를 더한 실제 등록 시각 (UTC)
+    pending_since = db.Column(db.DateTime)  # coalesce: 이전 회차가 끝나면 한 번 실행할 밀린 회차의 첫 시각
+    last_run_at = db.Column(db.DateTime)
+    last_execution_id = db.Column(db.Integer)
+    last_status = db.Column(db.String(20))  # queued, skipped, coalesced, deferred, error
+    last_error = db.Column(db.Text)
+    run_count = db.Column(db.Integer, default=0)
+    skip_count = db.Column(db.Integer, default=0)
+    created_by = db.Column(db.String(100))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'cron': self.cron,
+            'timezone': self.timezone,
+            'target_type': self.target_type,
+            'target_id': self.target_id,
+            'environment': self.environment,
+            'parameters': json.loads(self.parameters) if self.parameters else {},
+            'overlap_policy': self.overlap_policy,
+            'jitter_seconds': self.jitter_seconds,
+            'enabled': self.enabled,
+            'next_run_at': self.next_run_at.isoformat() if self.next_run_at else None,
+            'next_fire_at': self.next_fire_at.isoformat() if self.next_fire_at else None,
+            'pending_since': self.pending_since.isoformat() if self.pending_since else None,
+            'last_run_at': self.last_run_at.isoformat() if self.last_run_at else None,
+            'last_execution_id': self.last_execution_id,
+            'last_status': self.last_status,
+            'last_error': self.last_error,
+            'run_count': self.run_count,
+            'skip_count': self.skip_count,
+            'created_by': self.created_by,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+# 성능 테스트 메트릭 모델 (실행별 k6 메트릭 요약)
+class PerformanceMetric(db.Model):
+    __tablename__ = 'PerformanceMetrics'
+    id = db.Column(db.Integer, primary_key=True)
+    test_execution_id = db.Column(db.Integer, db.ForeignKey('TestExecutions.id'), nullable=False, index=True)
+    metric_name = db.Column(db.String(100), nullable=False)  # http_req_duration, browser_web_vital_lcp 등
+    metric_type = db.Column(db.String(20))  # trend, rate, counter, gauge
+    count = db.Column(db.Integer, default=0)
+    mean = db.Column(db.Float)
+    min_value = db.Column(db.Float)
+    max_value = db.Column(db.Float)
+    p50 = db.Column(db.Float)
+    p90 = db.Column(db.Float)
+    p95 = db.Column(db.Float)
+    p99 = db.Column(db.Float)
+    rate = db.Column(db.Float)  # rate 메트릭 비율 (예: http_req_failed)
+    per_second = db.Column(db.Float)  # counter 메트릭 초당 값
+    
+    def to_dict(self):
+        return {
+            'metric_name': self.metric_name,
+            'metric_type': self.metric_type,
+            'count': self.count,
+            'mean': self.mean,
+            'min': self.min_value,
+            'max': self.max_value,
+            'p50': self.p50,
+            'p90': self.p90,
+            'p95': self.p95,
+            'p99': self.p99,
+            'rate': self.rate,
+            'per_second': self.per_second
+        }
+
+# 실행별 러너 프로세스 트리 자원 사용량 (샘플은 열 단위 JSON을 zlib 압축하여 저장)
+class ExecutionResourceUsage(db.Model):
+    __tablename__ = 'ExecutionResourceUsage'
+    id = db.Column(db.Integer, primary_key=True)
+    test_execution_id = db.Column(db.Integer, db.ForeignKey('TestExecutions.id'), nullable=False, unique=True)
+    sample_count = db.Column(db.Integer, default=0)
+    interval = db.Column(db.Float)  # 샘플 간격 (초)
+    cores = db.Column(db.Integer)  # 사용 가능한 코어 수
+    peak_cpu_percent = db.Column(db.Float)  # 100 = 코어 1개
+    avg_cpu_percent = db.Column(db.Float)
+    peak_rss_kb = db.Column(db.Integer)
+    peak_fds = db.Column(db.Integer)
+    net_rx_bytes = db.Column(db.BigInteger)
+    net_tx_bytes = db.Column(db.BigInteger)
+    saturated = db.Column(db.Boolean, default=False)
+    saturated_seconds = db.Column(db.Float)
+    samples = db.Column(db.LargeBinary)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def to_dict(self):
+        return {
+            'test_execution_id': self.test_execution_id,
+            'samples': self.sample_count,
+            'interval': self.interval,
+            'cores': self.cores,
+            'peak_cpu_percent': self.peak_cpu_percent,
+            'avg_cpu_percent': self.avg_cpu_percent,
+            'peak_rss_kb': self.peak_rss_kb,
+            'peak_fds': self.peak_fds,
+            'net_rx_bytes': self.net_rx_bytes,
+            'net_tx_bytes': self.net_tx_bytes,
+            'saturated': self.saturated,
+            'saturated_seconds': self.saturated_seconds
+        }
+
+# 성능 실행 중 호스트 전체 지표 (k6 메트릭과 같은 UNIX 시각 기준, 샘플은 열 단위 JSON을 zlib 압축하여 저장)
+class ExecutionHostMetrics(db.Model):
+    __tablename__ = 'ExecutionHostMetrics'
+    id = db.Column(db.Integer, primary_key=True)
+    test_execution_id = db.Column(db.Integer, db.ForeignKey('TestExecutions.id'), nullable=False, unique=True)
+    sample_count = db.Column(db.Integer, default=0)
+    interval = db.Column(db.Float)  # 샘플 간격 (초)
+    summary = db.Column(db.Text)  # JSON 형태로 저장 (최대 CPU/부하, 최소 가용 메모리, 재전송 등)
+    samples = db.Column(db.LargeBinary)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def to_dict(self):
+        return {
+            'test_execution_id': self.test_execution_id,
+            'samples': self.sample_count,
+            'interval': self.interval,
+            'summary': json.loads(self.summary) if self.summary else None
+        }
+
+# 테스트별 실행 시간 예측 모델 (결과가 저장될 때마다 증분 갱신)
+class TestDurationEstimate(db.Model):
+    __tablename__ = 'TestDurationEstimates'
+    id = db.Column(db.Integer, primary_key=True)
+    test_type = db.Column(db.String(50), nullable=False)  # performance, automation, testcase
+    test_id = db.Column(db.Integer, nullable=False)
+    environment = db.Column(db.String(50), nullable=False, default='')
+    samples = db.Column(db.Integer, default=0)
+    median = db.Column(db.Float)  # 지수 가중 중앙값 (초)
+    mean = db.Column(db.Float)  # 지수 가중 평균 (초)
+    deviation = db.Column(db.Float)  # 중앙값 기준 지수 가중 평균 절대 편차 (초)
+    last_duration = db.Column(db.Float)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('test_type', 'test_id', 'environment', name='uq_duration_estimate_test'),
+    )
+
+    def to_dict(self):
+        return {
+            'test_type': self.test_type,
+            'test_id': self.test_id,
+            'environment': self.environment,
+            'samples': self.samples,
+            'median': self.median,
+            'mean': self.mean,
+            'deviation': self.deviation,
+            'last_duration': self.last_duration,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+# 테스트별 실행 결과 모델 (Playwright JSON 리포트 등에서 일괄 적재)
+class TestRunCase(db.Model):
+    __tablename__ = 'TestRunCases'
+    id = db.Column(db.Integer, primary_key=True)
+    test_execution_id = db.Column(db.Integer, db.ForeignKey('TestExecutions.id'), nullable=False, index=True)
+    title = db.Column(db.String(500), nullable=False)  # 상위 describe 제목을 ' › '로 연결한 전체 제목
+    file = db.Column(db.String(500))
+    line = db.Column(db.Integer)
+    project_name = db.Column(db.String(100))  # Playwright 프로젝트 (브라우저)
+    status = db.Column(db.String(20), index=True)  # Pass, Fail, Flaky, Skip, Error
+    duration = db.Column(db.Float)  # 초 단위 (재시도 포함)
+    retries = db.Column(db.Integer, default=0)
+    error = db.Column(db.Text)
+    attachments = db.Column(db.Text)  # JSON 형태로 저장 (스크린샷, 트레이스 등 경로)
+    shard_index = db.Column(db.Integer)
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'test_execution_id': self.test_execution_id,
+            'title': self.title,
+            'file': self.file,
+            'line': self.line,
+            'project_name': self.project_name,
+            'status': self.status,
+            'duration': self.duration,
+            'retries': self.retries,
+            'error': self.error,
+            'attachments': json.loads(self.attachments) if self.attachments else [],
+            'shard_index': self.shard_index
+        }
 
 # 스크린샷 모델
 class Screenshot(db.Model):
@@ -1,9 +1,18 @@
-from flask import Blueprint, request, jsonify, send_from_directory
-from models import db, AutomationTest, TestResult
+from flask import Blueprint, request, jsonify, send_from_directory, current_app
+from models import db, AutomationTest, TestResult, TestExecution
 from utils.cors import add_cors_headers
 from utils.auth_decorators import guest_allowed
+from utils.run_queue import register_job_handler, submit_run, execution_status_for, async_requested
+from utils.test_reports import save_test_run_cases
+from utils.resource_usage import save_resource_usage
+from utils.duration_model import record_execution_duration
+from utils.result_cache import build_cache_key, cache_options, find_cached_result, cache_hit_response
+from utils.script_catalog import script_rejection, resolve_entry
+from utils.scheduler import register_schedule_target
+from engines.process_runner import cancellable_run
+from engines.automation_runner import output_excerpt, summarize_run
+from engines.registry import engine_registry, detect_engine, parse_shards
 from datetime import datetime
-import time
 import os
 import glob
 from pathlib import Path
@@ -133,51 +142,218 @@ def delete_automation_test(id):
         response = jsonify({'error': str(e)})
         return add_cors_headers(response), 500
 
+def parse_automation_env_vars(test):
+    """parameters(JSON 문자열)를 실행 환경 변수로 변환"""
+    if not test.parameters:
+        return {}
+    try:
+        params = json.loads(test.parameters)
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    if not isinstance(params, dict):
+        return {}
+    return {str(k): str(v) for k, v in params.items()}
+
+def merge_automation_env_vars(test, env_vars=None):
+    """테스트 parameters와 요청 환경 변수 병합 (요청 값 우선)"""
+    env = parse_automation_env_vars(test)
+    env.update(env_vars or {})
+    return env
+
+def save_automation_result(test, execution, result):
+    """자동화 실행 결과를 TestResult와 실행 기록에 저장"""
+    test_result = TestResult(
+        automation_test_id=test.id,
+        test_execution_id=execution.id,
+        result=result.get('status', 'Error'),
+        execution_time=result.get('execution_time', 0.0),
+        environment=test.environment,
+        executed_by=execution.executed_by or 'system',
+        executed_at=datetime.utcnow(),
+        exit_code=result.get('exit_code'),
+        notes=output_excerpt(result)
+    )
+    db.session.add(test_result)
+    save_test_run_cases(execution.id, result.get('tests'))
+    save_resource_usage(execution, result)
+    
+    execution.status = execution_status_for(result)
+    execution.completed_at = datetime.utcnow()
+    execution.result_summary = json.dumps(summarize_run(result))
+    return test_result
+
+def automation_engine(test):
+    """자동화 테스트의 실행 엔진 (스크립트 검증/진입 파일 해석과 실행에 같은 값 사용, 결정할 수 없으면 None)"""
+    return detect_engine(test.test_type, test.script_path)
+
+@register_job_handler('automation')
+def run_automation_execution(execution_id, env_vars=None, shards=None):
+    """자동화 테스트 실행 작업 (동기 실행과 대기열 워커가 공통으로 사용)"""
+    execution = TestExecution.query.get(execution_id)
+    if not execution:
+        return None
+    test = AutomationTest.query.get(execution.automation_test_id)
+    
+    env = merge_automation_env_vars(test, env_vars)
+    execution.status = 'running'
+    execution.started_at = datetime.utcnow()
+    execution.cache_key = build_cache_key(
+        'automation', test.id, test.script_path, env, execution.environment or test.environment
+    )
+    db.session.commit()
+    
+    engine = automation_engine(test)
+    if engine is None:
+        result = {'status': 'Error', 'error': f'실행 엔진을 결정할 수 없습니다 (test_type={test.test_type})'}
+    elif not test.script_path:
+        result = {'status': 'Error', 'error': '스크립트 경로가 설정되지 않았습니다'}
+    else:
+        result = engine_registry.run(
+            engine, resolve_entry(test.script_path, engine), env, execution_id=execution.id, shards=shards
+        )
+    
+    test_result = save_automation_result(test, execution, result)
+    db.session.commit()
+    record_execution_duration(execution, result)
+    result['result_id'] = test_result.id
+    return result
+
+def create_automation_execution(test, environment=None, executed_by='system', schedule_id=None):
+    execution = TestExecution(
+        automation_test_id=test.id,
+        test_type='automation',
+        environment=environment or test.environment,
+        executed_by=executed_by,
+        status='queued',
+        started_at=None,
+        schedule_id=schedule_id
+    )
+    db.session.add(execution)
+    return execution
+
+@register_schedule_target('automation')
+def launch_scheduled_automation(app, schedule, parameters):
+    """예약 실행: 스크립트 검증 후 대기열에 등록"""
+    test = AutomationTest.query.get(schedule.target_id)
+    if not test:
+        raise ValueError(f'자동화 테스트를 찾을 수 없습니다: {schedule.target_id}')
+    rejection = script_rejection(test.script_path, automation_engine(test))
+    if rejection:
+        raise ValueError(rejection['error'])
+    shards = parse_shards(parameters.get('shards'))
+    env_vars = dict(parameters.get('environment_vars') or {})
+    if schedule.environment:
+        env_vars.setdefault('ENVIRONMENT', schedule.environment)
+    execution = create_automation_execution(
+        test, schedule.environment, executed_by=f'schedule:{schedule.name}', schedule_id=schedule.id
+    )
+    submit_run(app, execution, 'automation', {'env_vars': env_vars, 'shards': shards})
+    return execution
+
 @automation_bp.route('/automation-tests/<int:id>/execute', methods=['POST'])
 def execute_automation_test(id):
     """자동화 테스트 실행"""
     try:
         test = AutomationTest.query.get_or_404(id)
+        data = request.get_json(silent=True) or {}
+        env_vars = data.get('environment_vars', {})
+        try:
+            shards = parse_shards(data.get('shards'))
+        except ValueError as e:
+            response = jsonify({'error': str(e)})
+            return add_cors_headers(response), 400
         
-        # 실행 시작 시간
-        execution_start = datetime.utcnow()
-        
-        # 실제로는 여기서 자동화 테스트를 실행
-        # 현재는 시뮬레이션
-        time.sleep(2)  # 실행 시간 시뮬레이션
-        
-        # 실행 종료 시간
-        execution_end = datetime.utcnow()
-        execution_duration = (execution_end - execution_start).total_seconds()
-        
-        # 시뮬레이션된 결과 (실제로는 테스트 실행 결과)
-        status = 'Pass'  # 또는 'Fail', 'Skip', 'Error'
-        output = f"테스트 '{test.name}' 실행 완료"
-        error_message = None
-        
-        # TestResult 모델을 사용하여 결과 저장
-        result = TestResult(
-            automation_test_id=test.id,
-            result=status,
-            execution_time=execution_duration,
-            environment=test.environment,
-            executed_by='system',  # 또는 실제 사용자 ID
-            executed_at=execution_end,
-            notes=output
-        )
+        # 스크립트가 없거나 깨졌으면 실행을 만들지 않고 즉시 거부
+        rejection = script_rejection(test.script_path, automation_engine(test))
+        if rejection:
+            response = jsonify({'test_name': test.name, **rejection})
+            return add_cors_headers(response), 400
+        
+        # 결과 재사용: TTL 안에 같은 스크립트/환경 변수/환경으로 성공한 결과가 있으면 다시 실행하지 않음
+        use_cache, cache_ttl = cache_options(data, request.args)
+        if use_cache:
+            cache_key = build_cache_key(
+                'automation', test.id, test.script_path, merge_automation_env_vars(test, env_vars), test.environment
+            )
+            cached_execution, cached_result = find_cached_result(cache_key, cache_ttl)
+            if cached_execution:
+                response = jsonify({'test_name': test.name, **cache_hit_response(cached_execution, cached_result, cache_ttl)})
+                return add_cors_headers(response), 200
+        
+        execution = create_automation_execution(test)
+        
+        # 비동기 모드: 대기열에 등록하고 실행 ID만 즉시 반환
+        if async_requested(data, request.args):
+            submit_run(current_app._get_current_object(), execution, 'automation', {'env_vars': env_vars, 'shards': shards})
+            response = jsonify({
+                'message': '자동화 테스트 실행이 등록되었습니다.',
+                'test_name': test.name,
+                'cache_hit': False,
+                'execution_id': execution.id,
+                'status': execution.status,
+                'status_url': f'/executions/{execution.id}'
+            })
+            return add_cors_headers(response), 202
         
-        db.session.add(result)
         db.session.commit()
+        with cancellable_run(execution.id):
+            result = run_automation_execution(execution.id, env_vars, shards)
         
         response = jsonify({
             'message': '자동화 테스트 실행이 완료되었습니다.',
             'test_name': test.name,
-            'status': status,
-            'execution_duration': execution_duration,
-            'result_id': result.id
+            'cache_hit': False,
+            'status': result.get('status'),
+            'engine': result.get('engine'),
+            'exit_code': result.get('exit_code'),
+            'execution_duration': result.get('execution_time', 0.0),
+            'test_summary': result.get('test_summary'),
+            'execution_id': execution.id,
+            'result_id': result.get('result_id')
         })
         return add_cors_headers(response), 200
     except Exception as e:
+        db.session.rollback()
+        response = jsonify({'error': str(e)})
+        return add_cors_headers(response), 500
+
+@automation_bp.route('/automation-tests/execute-batch', methods=['POST'])
+def execute_automation_tests_batch():
+    """여러 자동화 테스트를 대기열에 일괄 등록 (엔진별 동시 실행 제한 내에서 병렬 실행)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        ids = data.get('ids') or []
+        if not ids:
+            response = jsonify({'error': '실행할 자동화 테스트 ids가 필요합니다'})
+            return add_cors_headers(response), 400
+        try:
+            shards = parse_shards(data.get('shards'))
+        except ValueError as e:
+            response = jsonify({'error': str(e)})
+            return add_cors_headers(response), 400
+        tests = AutomationTest.query.filter(AutomationTest.id.in_(ids)).all()
+        payload = {'env_vars': data.get('environment_vars', {}), 'shards': shards}
+        
+        app = current_app._get_current_object()
+        executions = []
+        rejected = []
+        for test in tests:
+            rejection = script_rejection(test.script_path, automation_engine(test))
+            if rejection:
+                rejected.append({'automation_test_id': test.id, 'details': rejection['details']})
+                continue
+            execution = create_automation_execution(test)
+            submit_run(app, execution, 'automation', payload)
+            executions.append({'automation_test_id': test.id, 'execution_id': execution.id})
+        
+        response = jsonify({
+            'message': f'{len(executions)}개의 자동화 테스트 실행이 등록되었습니다.',
+            'executions': executions,
+            'rejected': rejected
+        })
+        return add_cors_headers(response), 202
+    except Exception as e:
+        db.session.rollback()
         response = jsonify({'error': str(e)})
         return add_cors_headers(response), 500
 
@@ -200,6 +376,8 @@ def get_automation_test_results(id):
                 'environment': result.environment,
                 'executed_by': result.executed_by,
                 'executed_at': result.executed_at.isoformat() if result.executed_at else None,
+                'exit_code': result.exit_code,
+                'test_execution_id': result.test_execution_id,
                 'notes': result.notes
             }
             result_list.append(result_data)
@@ -228,6 +406,8 @@ def get_automation_test_result_detail(id, result_id):
             'environment': result.environment,
             'executed_by': result.executed_by,
             'executed_at': result.executed_at.isoformat() if result.executed_at else None,
+            'exit_code': result.exit_code,
+            'test_execution_id': result.test_execution_id,
             'notes': result.notes
         }
         
@@ -0,0 +1,393 @@
+from flask import Blueprint, request, jsonify, current_app
+from models import db, TestExecution, PerformanceMetric, RunQueueItem, TestRunCase, TestDurationEstimate, Project
+from utils.cors import add_cors_headers
+from utils.auth_decorators import guest_allowed, admin_required
+from utils.execution_pool import execution_pool
+from utils.run_queue import request_cancel, set_run_priority, pause_run, resume_run, FINISHED_EXECUTION_STATUSES
+from utils.fair_share import queue_wait_stats
+from utils.duration_model import execution_eta
+from utils.suite import suite_summary
+from utils.env_matrix import build_comparison
+from utils.resource_usage import load_usage_samples
+from utils.host_metrics import load_host_samples, build_host_overlay
+from utils.script_catalog import script_catalog
+from engines.workspace import RunWorkspace
+from engines.process_runner import read_log_chunk
+from engines.registry import engine_registry
+from engines.k6_engine import docker_k6_engine
+import json
+from datetime import datetime, timedelta
+
+# Blueprint 생성
+executions_bp = Blueprint('executions', __name__)
+
+def serialize_execution(e, include_eta=False):
+    """TestExecution 응답 데이터 구성 (include_eta: 대기/실행 중이면 예상 완료 시각 포함)"""
+    data = {
+        'id': e.id,
+        'test_type': e.test_type,
+        'test_case_id': e.test_case_id,
+        'automation_test_id': e.automation_test_id,
+        'performance_test_id': e.performance_test_id,
+        'environment': e.environment,
+        'executed_by': e.executed_by,
+        'status': e.status,
+        'queued_at': e.queued_at.strftime('%Y-%m-%d %H:%M:%S') if e.queued_at else None,
+        'started_at': e.started_at.strftime('%Y-%m-%d %H:%M:%S') if e.started_at else None,
+        'completed_at': e.completed_at.strftime('%Y-%m-%d %H:%M:%S') if e.completed_at else None,
+        'result_summary': json.loads(e.result_summary) if e.result_summary else None,
+        'request_count': e.request_count,
+        'response_time_avg': e.response_time_avg,
+        'response_time_p95': e.response_time_p95,
+        'throughput': e.throughput,
+        'error_rate': e.error_rate,
+        'generator_saturated': e.generator_saturated,
+        'parent_execution_id': e.parent_execution_id,
+        'folder_id': e.folder_id,
+        'progress': e.progress(),
+        'queue': e.queue_item.to_dict() if e.queue_item else None
+    }
+    if include_eta:
+        data['eta'] = execution_eta(e)
+    return data
+
+# 실행 상태 폴링 API
+@executions_bp.route('/executions/<int:id>', methods=['GET'])
+@guest_allowed
+def get_execution(id):
+    """비동기 실행 상태 조회"""
+    execution = TestExecution.query.get_or_404(id)
+    response = jsonify(serialize_execution(execution, include_eta=True))
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/executions/<int:id>/children', methods=['GET'])
+@guest_allowed
+def get_execution_children(id):
+    """스위트 실행의 자식 실행 목록 조회 (?status= 로 필터)"""
+    execution = TestExecution.query.get_or_404(id)
+    query = execution.children
+    status = request.args.get('status')
+    if status:
+        query = query.filter(TestExecution.status == status)
+    response = jsonify({
+        'execution_id': execution.id,
+        'progress': execution.progress(),
+        'children': [serialize_execution(child) for child in query.order_by(TestExecution.id)]
+    })
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/executions/<int:id>/tests', methods=['GET'])
+@guest_allowed
+def get_execution_tests(id):
+    """실행의 테스트별 결과 조회 (?status=Fail&page=1&per_page=100)"""
+    TestExecution.query.get_or_404(id)
+    query = TestRunCase.query.filter_by(test_execution_id=id)
+    status = request.args.get('status')
+    if status:
+        query = query.filter(TestRunCase.status == status)
+    page = request.args.get('page', 1, type=int)
+    per_page = min(request.args.get('per_page', 100, type=int), 1000)
+    pagination = query.order_by(TestRunCase.id).paginate(page=page, per_page=per_page, error_out=False)
+    counts = dict(
+        db.session.query(TestRunCase.status, db.func.count(TestRunCase.id))
+        .filter(TestRunCase.test_execution_id == id)
+        .group_by(TestRunCase.status)
+        .all()
+    )
+    response = jsonify({
+        'execution_id': id,
+        'counts': counts,
+        'total': pagination.total,
+        'page': page,
+        'per_page': per_page,
+        'tests': [t.to_dict() for t in pagination.items]
+    })
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/executions/<int:id>/metrics', methods=['GET'])
+@guest_allowed
+def get_execution_metrics(id):
+    """실행별 k6 메트릭 요약 조회"""
+    execution = TestExecution.query.get_or_404(id)
+    response = jsonify([m.to_dict() for m in execution.metrics.order_by(PerformanceMetric.metric_name)])
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/executions/<int:id>/resources', methods=['GET'])
+@guest_allowed
+def get_execution_resources(id):
+    """러너 프로세스 트리 자원 사용량 조회 (?samples=false면 요약만)"""
+    execution = TestExecution.query.get_or_404(id)
+    usage = execution.resource_usage
+    if usage is None:
+        response = jsonify({'error': '자원 사용량 기록이 없습니다'})
+        return add_cors_headers(response), 404
+    data = usage.to_dict()
+    if request.args.get('samples', 'true').lower() == 'true':
+        data['series'] = load_usage_samples(usage)
+    response = jsonify(data)
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/executions/<int:id>/host-metrics', methods=['GET'])
+@guest_allowed
+def get_execution_host_metrics(id):
+    """성능 실행 중 호스트 지표 조회 (?samples=false면 요약만)"""
+    execution = TestExecution.query.get_or_404(id)
+    if execution.host_metrics is None:
+        response = jsonify({'error': '호스트 지표 기록이 없습니다'})
+        return add_cors_headers(response), 404
+    data = execution.host_metrics.to_dict()
+    if request.args.get('samples', 'true').lower() == 'true':
+        data['series'] = load_host_samples(execution.host_metrics)
+    response = jsonify(data)
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/executions/<int:id>/analysis', methods=['GET'])
+@guest_allowed
+def get_execution_analysis(id):
+    """k6 구간별 지연 시간과 호스트 자원 압박을 같은 시각으로 맞춘 분석 (?bucket=초)"""
+    execution = TestExecution.query.get_or_404(id)
+    analysis = build_host_overlay(execution, request.args.get('bucket', type=float))
+    if analysis is None:
+        response = jsonify({'error': '호스트 지표 기록이 없습니다'})
+        return add_cors_headers(response), 404
+    response = jsonify(analysis)
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/executions/<int:id>/artifacts', methods=['GET'])
+@guest_allowed
+def get_execution_artifacts(id):
+    """실행 작업 디렉토리의 결과 파일 목록 조회"""
+    TestExecution.query.get_or_404(id)
+    workspace = RunWorkspace.get(id)
+    response = jsonify({
+        'execution_id': id,
+        'workspace': workspace.path if workspace else None,
+        'files': workspace.list_files() if workspace else []
+    })
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/executions/<int:id>/log', methods=['GET'])
+@guest_allowed
+def get_execution_log(id):
+    """실행 로그 증분 조회 (?stream=stdout|stderr&offset=0&limit=65536)
+
+    응답의 offset을 다음 요청에 넘기면 실행 중에도 이어서 읽을 수 있음
+    """
+    execution = TestExecution.query.get_or_404(id)
+    stream = request.args.get('stream', 'stdout')
+    if stream not in ('stdout', 'stderr'):
+        response = jsonify({'error': 'stream은 stdout 또는 stderr이어야 합니다'})
+        return add_cors_headers(response), 400
+    offset = max(0, request.args.get('offset', 0, type=int))
+    # 음수 limit은 파일 전체를 읽게 되므로 제한, UTF-8 문자 하나(최대 4바이트)는 항상 읽을 수 있게 함
+    limit = max(4, min(request.args.get('limit', 65536, type=int), 1024 * 1024))
+    
+    workspace = RunWorkspace.get(execution.id)
+    path = (workspace.stdout_path if stream == 'stdout' else workspace.stderr_path) if workspace else None
+    chunk = read_log_chunk(path, offset, limit) if path else {'data': '', 'offset': offset, 'size': 0}
+    response = jsonify({
+        'execution_id': execution.id,
+        'stream': stream,
+        'status': execution.status,
+        'complete': execution.status not in ('queued', 'running') and chunk['offset'] >= chunk['size'],
+        **chunk
+    })
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/executions/<int:id>/comparison', methods=['GET'])
+@guest_allowed
+def get_execution_comparison(id):
+    """매트릭스 실행의 조합별 지표 비교표 (진행 중이면 완료된 조합까지)"""
+    execution = TestExecution.query.get_or_404(id)
+    comparison = build_comparison(execution)
+    if comparison is None:
+        response = jsonify({'error': '매트릭스 실행이 아닙니다'})
+        return add_cors_headers(response), 404
+    response = jsonify({
+        'execution_id': execution.id,
+        'status': execution.status,
+        'progress': execution.progress(),
+        **comparison
+    })
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/executions/<int:id>/cancel', methods=['POST'])
+def cancel_execution(id):
+    """실행 취소 (대기 중이면 즉시, 실행 중이면 프로세스 그룹 종료 후 cancelled 처리)
+
+    스위트 실행은 종료되지 않은 자식 실행을 모두 취소
+    """
+    try:
+        execution = TestExecution.query.get_or_404(id)
+        if execution.status in FINISHED_EXECUTION_STATUSES:
+            response = jsonify({'error': f'이미 종료된 실행입니다 ({execution.status})'})
+            return add_cors_headers(response), 409
+        
+        children = execution.children.filter(
+            ~TestExecution.status.in_(FINISHED_EXECUTION_STATUSES)
+        ).all()
+        child_states = {child.id: request_cancel(child) for child in children}
+        if execution.total_count is not None:
+            # 스위트 부모는 프로세스가 없으므로 바로 취소 처리 (이후 완료되는 자식은 카운터만 갱신)
+            summary = suite_summary(execution)
+            if execution.queue_item is not None and execution.queue_item.status in ('queued', 'running'):
+                # 매트릭스 실행처럼 부모가 대기열 작업이면 다른 호스트의 워커에도 취소를 전달
+                request_cancel(execution)
+            execution.status = 'cancelled'
+            execution.completed_at = datetime.utcnow()
+            execution.result_summary = json.dumps(summary)
+            db.session.commit()
+            state = 'cancelled'
+        else:
+            state = request_cancel(execution)
+        
+        response = jsonify({
+            'message': '실행이 취소되었습니다.' if state == 'cancelled' else '실행 취소를 요청했습니다.',
+            'execution_id': execution.id,
+            'state': state,
+            'children': child_states,
+            'status_url': f'/executions/{execution.id}'
+        })
+        return add_cors_headers(response), 200 if state == 'cancelled' else 202
+    except Exception as e:
+        db.session.rollback()
+        response = jsonify({'error': str(e)})
+        return add_cors_headers(response), 500
+
+@executions_bp.route('/executions/pool', methods=['GET'])
+@guest_allowed
+def get_execution_pool_stats():
+    """프로세스 내 실행 워커 풀, 자동화 실행기, k6 컨테이너 풀 상태 조회"""
+    stats = execution_pool.stats()
+    stats['automation'] = engine_registry.stats()
+    stats['k6_containers'] = docker_k6_engine.stats()
+    response = jsonify(stats)
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/engines', methods=['GET'])
+@guest_allowed
+def get_engines():
+    """실행 엔진 목록 (기능, 동시 실행 수, 실행 중 수, 준비 상태)"""
+    response = jsonify({'engines': engine_registry.describe(), 'max_concurrency': engine_registry.max_concurrency})
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/scripts', methods=['GET'])
+@guest_allowed
+def get_scripts():
+    """스크립트 카탈로그 (?validate=true면 전체 스크립트 검증, ?path=&test_type=이면 스크립트 1건 해석 결과)"""
+    path = request.args.get('path')
+    if path:
+        info = script_catalog.lookup(path, request.args.get('test_type'))
+        response = jsonify(info.to_dict())
+        return add_cors_headers(response), 200
+    validate = request.args.get('validate', 'false').lower() == 'true'
+    response = jsonify({'scripts': script_catalog.entries(validate), 'catalog': script_catalog.stats()})
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/duration-estimates', methods=['GET'])
+@guest_allowed
+def get_duration_estimates():
+    """테스트별 실행 시간 예측치 조회 (?test_type=&test_id=&environment= 로 필터)"""
+    query = TestDurationEstimate.query
+    for field in ('test_type', 'environment'):
+        if request.args.get(field):
+            query = query.filter(getattr(TestDurationEstimate, field) == request.args[field])
+    if request.args.get('test_id', type=int):
+        query = query.filter(TestDurationEstimate.test_id == request.args.get('test_id', type=int))
+    estimates = query.order_by(TestDurationEstimate.updated_at.desc()).limit(500).all()
+    response = jsonify({'estimates': [e.to_dict() for e in estimates]})
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/run-queue', methods=['GET'])
+@guest_allowed
+def get_run_queue():
+    """실행 대기열 상태 조회 (상태별 건수와 대기/실행 중 항목)"""
+    status = request.args.get('status')
+    query = RunQueueItem.query
+    if status:
+        query = query.filter(RunQueueItem.status == status)
+    else:
+        query = query.filter(RunQueueItem.status.in_(['queued', 'paused', 'running']))
+    items = query.order_by(RunQueueItem.priority.desc(), RunQueueItem.id).limit(200).all()
+    counts = dict(db.session.query(RunQueueItem.status, db.func.count(RunQueueItem.id)).group_by(RunQueueItem.status).all())
+    response = jsonify({
+        'counts': counts,
+        'items': [item.to_dict() for item in items]
+    })
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/run-queue/stats', methods=['GET'])
+@guest_allowed
+def get_run_queue_stats():
+    """프로젝트별 대기 시간 백분위수, 가중치/동시 실행 상한, 최근 사용량 (?hours=24)"""
+    hours = request.args.get('hours', 24, type=float)
+    stats = queue_wait_stats(since=datetime.utcnow() - timedelta(hours=hours))
+    response = jsonify(stats)
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/run-queue/<int:item_id>/priority', methods=['POST'])
+@admin_required
+def update_run_priority(item_id):
+    """대기 중 실행의 우선순위 변경 ({"priority": 10} 또는 {"bump": 5})"""
+    item = RunQueueItem.query.get_or_404(item_id)
+    data = request.get_json(silent=True) or {}
+    try:
+        priority = int(data['priority']) if 'priority' in data else (item.priority or 0) + int(data.get('bump', 1))
+    except (TypeError, ValueError):
+        response = jsonify({'error': 'priority/bump는 정수여야 합니다'})
+        return add_cors_headers(response), 400
+    if not set_run_priority(item, priority):
+        response = jsonify({'error': f'대기 중인 실행만 우선순위를 바꿀 수 있습니다 ({item.status})'})
+        return add_cors_headers(response), 409
+    response = jsonify({'message': '우선순위가 변경되었습니다', 'item': item.to_dict()})
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/run-queue/<int:item_id>/pause', methods=['POST'])
+@admin_required
+def pause_queued_run(item_id):
+    """대기 중 실행 일시 정지 (재개 전까지 워커가 선점하지 않음)"""
+    item = RunQueueItem.query.get_or_404(item_id)
+    if not pause_run(item):
+        response = jsonify({'error': f'대기 중인 실행만 일시 정지할 수 있습니다 ({item.status})'})
+        return add_cors_headers(response), 409
+    response = jsonify({'message': '실행이 일시 정지되었습니다', 'item': item.to_dict()})
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/run-queue/<int:item_id>/resume', methods=['POST'])
+@admin_required
+def resume_queued_run(item_id):
+    item = RunQueueItem.query.get_or_404(item_id)
+    if not resume_run(current_app._get_current_object(), item):
+        response = jsonify({'error': f'일시 정지된 실행이 아닙니다 ({item.status})'})
+        return add_cors_headers(response), 409
+    response = jsonify({'message': '실행이 다시 대기열에 등록되었습니다', 'item': item.to_dict()})
+    return add_cors_headers(response), 200
+
+@executions_bp.route('/run-queue/projects/<int:project_id>', methods=['PUT'])
+@admin_required
+def update_project_queue_settings(project_id):
+    """프로젝트 공정 배분 가중치와 동시 실행 상한 변경 ({"weight": 2, "max_concurrent_runs": 4}, 상한 null이면 기본값)"""
+    project = Project.query.get_or_404(project_id)
+    data = request.get_json(silent=True) or {}
+    try:
+        if 'weight' in data:
+            weight = float(data['weight'])
+            if weight <= 0:
+                raise ValueError('weight는 0보다 커야 합니다')
+            project.queue_weight = weight
+        if 'max_concurrent_runs' in data:
+            quota = data['max_concurrent_runs']
+            if quota is not None and int(quota) < 0:
+                raise ValueError('max_concurrent_runs는 0 이상이어야 합니다')
+            project.max_concurrent_runs = None if quota is None else int(quota)
+    except (TypeError, ValueError) as e:
+        response = jsonify({'error': str(e)})
+        return add_cors_headers(response), 400
+    db.session.commit()
+    response = jsonify({
+        'message': '프로젝트 대기열 설정이 변경되었습니다',
+        'project_id': project.id,
+        'weight': project.queue_weight,
+        'max_concurrent_runs': project.max_concurrent_runs
+    })
+    return add_cors_headers(response), 200
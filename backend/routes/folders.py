@@ -1,7 +1,14 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from models import db, Folder, TestCase
 from utils.cors import add_cors_headers
 from utils.auth_decorators import guest_allowed
+from utils.run_queue import submit_run
+from utils.suite import collect_runnable_test_cases, create_suite_execution, testcase_engine
+from utils.script_catalog import script_rejection
+from utils.scheduler import register_schedule_target
+from utils.suite_schedule import plan_suite_order, ORDER_POLICIES
+from utils.execution_pool import execution_pool
+from engines.registry import engine_registry, parse_shards
 from datetime import datetime
 
 # Blueprint 생성
@@ -242,4 +249,85 @@ def get_folder_tree():
     except Exception as e:
         print(f"❌ 폴더 트리 조회 오류: {str(e)}")
         response = jsonify({'error': '폴더 트리 조회 오류', 'message': str(e)})
-        return add_cors_headers(response), 500 
\ No newline at end of file
+        return add_cors_headers(response), 500 
+def queue_folder_suite(app, folder, data, policy=None, executed_by='system', schedule_id=None, environment=None):
+    """폴더 하위 트리의 실행 가능한 테스트 케이스로 스위트 실행을 만들어 대기열에 등록
+
+    반환: (부모 실행, 자식 실행 목록, 실행 계획, 거부된 테스트 케이스) — 실행 순서 정책이나 샤드 수가 잘못되면 ValueError
+    """
+    shards = parse_shards(data.get('shards'))
+    test_cases = collect_runnable_test_cases(folder.id)
+    
+    # 스크립트가 없거나 깨진 테스트 케이스는 실행을 만들지 않고 거부 사유로 보고
+    rejected = []
+    for test_case in list(test_cases):
+        rejection = script_rejection(test_case.automation_code_path, testcase_engine(test_case))
+        if rejection:
+            test_cases.remove(test_case)
+            rejected.append({'test_case_id': test_case.id, 'details': rejection['details']})
+    
+    # 실행 순서 정책 (최근 실패/불안정 우선, 예상 시간이 긴 순 등)과 예상 소요 시간 계산
+    workers = data.get('workers') or min(execution_pool.max_workers, engine_registry.max_concurrency)
+    test_cases, schedule = plan_suite_order(test_cases, policy, int(workers), environment or folder.environment)
+    
+    parent, children = create_suite_execution(folder, test_cases, executed_by, schedule)
+    parent.schedule_id = schedule_id
+    if environment:
+        for execution in [parent] + children:
+            execution.environment = environment
+    db.session.commit()
+    
+    payload = {'env_vars': data.get('environment_vars', {}), 'shards': shards}
+    for child in children:
+        submit_run(app, child, 'testcase', payload)
+    return parent, children, schedule, rejected
+
+@register_schedule_target('folder')
+def launch_scheduled_folder_suite(app, schedule, parameters):
+    """예약 실행: 폴더 스위트를 대기열에 등록 (실행할 테스트 케이스가 없어도 완료된 부모 실행을 남김)"""
+    folder = Folder.query.get(schedule.target_id)
+    if not folder:
+        raise ValueError(f'폴더를 찾을 수 없습니다: {schedule.target_id}')
+    data = dict(parameters)
+    if schedule.environment:
+        data['environment_vars'] = {'ENVIRONMENT': schedule.environment, **(data.get('environment_vars') or {})}
+    parent, _, _, _ = queue_folder_suite(
+        app, folder, data, policy=data.get('order'),
+        executed_by=f'schedule:{schedule.name}', schedule_id=schedule.id, environment=schedule.environment
+    )
+    return parent
+
+# 스위트 실행 API (폴더 하위의 자동화 테스트 케이스 일괄 실행)
+@folders_bp.route('/folders/<int:id>/execute', methods=['POST'])
+def execute_folder_suite(id):
+    """폴더 하위 트리의 자동화 코드가 있는 테스트 케이스를 대기열에 등록하여 병렬 실행"""
+    try:
+        folder = Folder.query.get_or_404(id)
+        data = request.get_json(silent=True) or {}
+        try:
+            parent, children, schedule, rejected = queue_folder_suite(
+                current_app._get_current_object(), folder, data,
+                policy=data.get('order') or request.args.get('order'),
+                executed_by=data.get('executed_by', 'system')
+            )
+        except (TypeError, ValueError) as e:
+            response = jsonify({'error': str(e), 'policies': list(ORDER_POLICIES)})
+            return add_cors_headers(response), 400
+        
+        response = jsonify({
+            'message': f'{len(children)}개의 테스트 케이스 실행이 등록되었습니다.',
+            'folder_id': folder.id,
+            'execution_id': parent.id,
+            'status': parent.status,
+            'progress': parent.progress(),
+            'order_policy': schedule['policy'],
+            'predicted_makespan': schedule['predicted_makespan'],
+            'rejected': rejected,
+            'status_url': f'/executions/{parent.id}'
+        })
+        return add_cors_headers(response), 202
+    except Exception as e:
+        print(f"❌ 스위트 실행 오류: {str(e)}")
+        db.session.rollback()
+        response = jsonify({'error': '스위트 실행 오류', 'message': str(e)})
+        return add_cors_headers(response), 500
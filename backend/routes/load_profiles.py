@@ -0,0 +1,123 @@
+from flask import Blueprint, request, jsonify
+from models import db, LoadProfile, PerformanceTest
+from utils.cors import add_cors_headers
+from utils.auth_decorators import guest_allowed
+from utils.load_profiles import (
+    PROFILE_TYPES, PROFILE_SETTINGS, COMMON_SETTINGS,
+    normalize_profile, resolve_profile, build_k6_options, estimate_profile, check_limits, profile_limits
+)
+import json
+
+# Blueprint 생성
+load_profiles_bp = Blueprint('load_profiles', __name__)
+
+@load_profiles_bp.route('/load-profiles', methods=['GET'])
+@guest_allowed
+def get_load_profiles():
+    profiles = LoadProfile.query.order_by(LoadProfile.name).all()
+    response = jsonify({
+        'profiles': [p.to_dict() for p in profiles],
+        # 유형별 설정 항목과 기본값 (None이면 필수)
+        'types': {t: {**PROFILE_SETTINGS[t], **COMMON_SETTINGS} for t in PROFILE_TYPES}
+    })
+    return add_cors_headers(response), 200
+
+@load_profiles_bp.route('/load-profiles', methods=['POST'])
+def create_load_profile():
+    data = request.get_json(silent=True) or {}
+    if not data.get('name'):
+        response = jsonify({'error': 'name이 필요합니다'})
+        return add_cors_headers(response), 400
+    try:
+        profile = normalize_profile(data)
+    except ValueError as e:
+        response = jsonify({'error': str(e)})
+        return add_cors_headers(response), 400
+    if LoadProfile.query.filter_by(name=data['name']).first():
+        response = jsonify({'error': f"같은 이름의 부하 프로필이 이미 있습니다: {data['name']}"})
+        return add_cors_headers(response), 409
+
+    stored = LoadProfile(
+        name=data['name'],
+        description=data.get('description'),
+        profile_type=profile['type'],
+        settings=json.dumps(profile['settings'])
+    )
+    try:
+        db.session.add(stored)
+        db.session.commit()
+        response = jsonify({'message': '부하 프로필 생성 완료', 'id': stored.id, 'profile': stored.to_dict()})
+        return add_cors_headers(response), 201
+    except Exception as e:
+        db.session.rollback()
+        response = jsonify({'error': f'데이터베이스 오류: {str(e)}'})
+        return add_cors_headers(response), 500
+
+@load_profiles_bp.route('/load-profiles/<int:id>', methods=['GET'])
+@guest_allowed
+def get_load_profile(id):
+    stored = LoadProfile.query.get_or_404(id)
+    profile = normalize_profile(stored.to_profile())
+    data = stored.to_dict()
+    data['k6_options'] = build_k6_options(profile)
+    data['estimate'] = estimate_profile(profile)
+    response = jsonify(data)
+    return add_cors_headers(response), 200
+
+@load_profiles_bp.route('/load-profiles/<int:id>', methods=['PUT'])
+def update_load_profile(id):
+    stored = LoadProfile.query.get_or_404(id)
+    data = request.get_json(silent=True) or {}
+    # 유형을 바꾸지 않으면 기존 설정에 변경분만 덮어씀
+    profile_type = data.get('type', stored.profile_type)
+    settings = stored.to_profile()['settings'] if profile_type == stored.profile_type else {}
+    settings.update(data.get('settings') or {})
+    try:
+        profile = normalize_profile({'type': profile_type, 'settings': settings})
+    except ValueError as e:
+        response = jsonify({'error': str(e)})
+        return add_cors_headers(response), 400
+
+    stored.name = data.get('name', stored.name)
+    stored.description = data.get('description', stored.description)
+    stored.profile_type = profile['type']
+    stored.settings = json.dumps(profile['settings'])
+    db.session.commit()
+    response = jsonify({'message': '부하 프로필 업데이트 완료', 'profile': stored.to_dict()})
+    return add_cors_headers(response), 200
+
+@load_profiles_bp.route('/load-profiles/<int:id>', methods=['DELETE'])
+def delete_load_profile(id):
+    stored = LoadProfile.query.get_or_404(id)
+    # 기본 프로필로 지정한 성능 테스트는 프로필 없이 실행되도록 해제
+    PerformanceTest.query.filter_by(load_profile_id=stored.id).update({'load_profile_id': None})
+    db.session.delete(stored)
+    db.session.commit()
+    response = jsonify({'message': '부하 프로필 삭제 완료'})
+    return add_cors_headers(response), 200
+
+@load_profiles_bp.route('/load-profiles/estimate', methods=['POST'])
+@guest_allowed
+def estimate_load_profile():
+    """실행 전 비용 추정 (load_profile: 저장된 프로필 ID/이름 또는 인라인 설정, performance_test_id: 반복 시간 이력과 환경 상한 기준)"""
+    data = request.get_json(silent=True) or {}
+    pt = PerformanceTest.query.get_or_404(data['performance_test_id']) if data.get('performance_test_id') else None
+    try:
+        profile = resolve_profile(data.get('load_profile'), pt)
+    except ValueError as e:
+        response = jsonify({'error': str(e)})
+        return add_cors_headers(response), 400
+    if profile is None:
+        response = jsonify({'error': 'load_profile이 필요합니다'})
+        return add_cors_headers(response), 400
+
+    environment = data.get('environment') or (pt.environment if pt else None)
+    estimate = estimate_profile(profile, pt.id if pt else None)
+    response = jsonify({
+        'profile': profile,
+        'k6_options': build_k6_options(profile),
+        'estimate': estimate,
+        'limits': profile_limits(environment),
+        'violations': check_limits(estimate, environment)
+    })
+    return add_cors_headers(response), 200
@@ -1,10 +1,28 @@
-from flask import Blueprint, request, jsonify
-from models import db, PerformanceTest, TestResult, TestExecution
+from flask import Blueprint, request, jsonify, current_app
+from models import db, PerformanceTest, TestResult, TestExecution, PerformanceMetric
 from utils.cors import add_cors_headers
 from utils.auth_decorators import guest_allowed
-from engines.k6_engine import k6_engine
+from utils.run_queue import register_job_handler, submit_run, execution_status_for, async_requested, FINISHED_EXECUTION_STATUSES
+from utils.duration_model import record_execution_duration
+from utils.result_cache import build_cache_key, cache_options, find_cached_result, cache_hit_response
+from engines.registry import engine_registry, detect_engine, parse_shards
+from engines.process_runner import excerpt, cancellable_run, cancel_run, is_cancelled
+from utils.env_matrix import (
+    expand_matrix, create_matrix_execution, load_matrix, build_comparison,
+    MATRIX_DEFAULT_CONCURRENCY, MATRIX_MAX_CONCURRENCY
+)
+from utils.suite import record_suite_child_result
+from utils.capacity_search import CapacitySearch, DEFAULT_STEP_DURATION
+from utils.load_profiles import resolve_profile, build_k6_options, estimate_profile, check_limits
+from utils.resource_usage import save_resource_usage
+from utils.host_metrics import run_with_host_metrics, save_host_metrics
+from utils.script_catalog import script_rejection, resolve_entry
+from utils.scheduler import register_schedule_target
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import json
 from datetime import datetime
+import re
+import threading
 import time
 import os
 
@@ -23,6 +41,7 @@ def get_performance_tests():
         'script_path': pt.script_path,
         'environment': pt.environment,
         'parameters': pt.parameters,
+        'load_profile_id': pt.load_profile_id,
         'created_at': pt.created_at,
         'updated_at': pt.updated_at
     } for pt in tests]
@@ -38,7 +57,8 @@ def create_performance_test():
         description=data.get('description'),
         script_path=data.get('script_path'),
         environment=data.get('environment', 'prod'),
-        parameters=json.dumps(data.get('parameters', {}))
+        parameters=json.dumps(data.get('parameters', {})),
+        load_profile_id=data.get('load_profile_id')
     )
     
     try:
@@ -62,6 +82,7 @@ def get_performance_test(id):
         'script_path': pt.script_path,
         'environment': pt.environment,
         'parameters': json.loads(pt.parameters) if pt.parameters else {},
+        'load_profile_id': pt.load_profile_id,
         'created_at': pt.created_at,
         'updated_at': pt.updated_at
     }
@@ -78,6 +99,7 @@ def update_performance_test(id):
     pt.script_path = data.get('script_path', pt.script_path)
     pt.environment = data.get('environment', pt.environment)
     pt.parameters = json.dumps(data.get('parameters', {}))
+    pt.load_profile_id = data.get('load_profile_id', pt.load_profile_id)
     
     db.session.commit()
     response = jsonify({'message': '성능 테스트 업데이트 완료'})
@@ -91,13 +113,9 @@ def delete_performance_test(id):
     response = jsonify({'message': '성능 테스트 삭제 완료'})
     return add_cors_headers(response), 200
 
-@performance_bp.route('/performance-tests/<int:id>/execute', methods=['POST'])
-def execute_performance_test(id):
-    pt = PerformanceTest.query.get_or_404(id)
-    data = request.get_json()
-    
-    # 환경 변수 설정
-    env_vars = data.get('environment_vars', {})
+def build_performance_env_vars(pt, environment_vars=None):
+    """요청 환경 변수와 성능 테스트 parameters를 병합"""
+    env_vars = dict(environment_vars or {})
     if pt.parameters:
         try:
             base_params = json.loads(pt.parameters)
@@ -126,54 +144,593 @@ def execute_performance_test(id):
             'BASE_URL': 'http://localhost:3000',
             'ENVIRONMENT': pt.environment or 'dev'
         })
-    
-    # k6 테스트 실행
-    result = k6_engine.execute_test(pt.script_path, env_vars)
-    
-    # 실행 결과 저장
-    execution = TestExecution(
-        performance_test_id=pt.id,
-        test_type='performance',
-        status=result.get('status', 'Error'),
-        result_summary=json.dumps(result)
+    return env_vars
+
+def format_performance_notes(result):
+    """성능 테스트 결과 요약 문자열"""
+    return (
+        f"요청 {result.get('request_count', 0)}건 / "
+        f"평균 {result.get('response_time_avg', 0.0):.1f}ms / "
+        f"p95 {result.get('response_time_p95', 0.0):.1f}ms / "
+        f"처리량 {result.get('throughput', 0.0):.2f} req/s / "
+        f"오류율 {result.get('error_rate', 0.0) * 100:.2f}%"
     )
+
+def summarize_result(result):
+    """result_summary 저장용 결과 (메트릭 상세는 PerformanceMetrics 테이블, 전체 출력은 작업 디렉토리 로그)"""
+    summary = {k: v for k, v in result.items() if k != 'metrics'}
+    for key in ('output', 'error'):
+        if summary.get(key):
+            summary[key] = excerpt(summary[key])
+    return json.dumps(summary)
+
+def save_performance_metrics(execution, result):
+    """성능 테스트 지표를 실행 기록의 컬럼과 PerformanceMetric에 저장 (커밋은 호출자가 수행)"""
+    execution.request_count = result.get('request_count')
+    execution.response_time_avg = result.get('response_time_avg')
+    execution.response_time_p95 = result.get('response_time_p95')
+    execution.throughput = result.get('throughput')
+    execution.error_rate = result.get('error_rate')
+    save_resource_usage(execution, result)
+    save_host_metrics(execution, result)
     
+    for name, summary in (result.get('metrics') or {}).items():
+        execution.metrics.append(PerformanceMetric(
+            metric_name=name,
+            metric_type=summary.get('type'),
+            count=summary.get('count', 0),
+            mean=summary.get('mean'),
+            min_value=summary.get('min'),
+            max_value=summary.get('max'),
+            p50=summary.get('p50'),
+            p90=summary.get('p90'),
+            p95=summary.get('p95'),
+            p99=summary.get('p99'),
+            rate=summary.get('rate'),
+            per_second=summary.get('per_second')
+        ))
+
+def save_performance_result(pt, execution, result):
+    """성능 테스트 지표와 (통과 시) TestResult 저장 (커밋은 호출자가 수행)"""
+    save_performance_metrics(execution, result)
     if result.get('status') == 'Pass':
         # 성능 테스트 결과 저장 - TestResult 모델의 실제 필드 사용
         perf_result = TestResult(
             performance_test_id=pt.id,
+            test_execution_id=execution.id,
             result=result.get('status'),
             execution_time=result.get('execution_time', 0.0),
             environment=pt.environment,
             executed_by='system',
             executed_at=datetime.utcnow(),
-            notes=json.dumps(result)  # 성능 테스트 결과를 notes에 JSON으로 저장
+            notes=format_performance_notes(result)
         )
         db.session.add(perf_result)
+        return perf_result
+    return None
+
+def load_test_engine(pt):
+    """HTTP 부하 시나리오 파일(.http.json)은 내장 asyncio HTTP 엔진, 그 외에는 k6"""
+    return 'http' if detect_engine(None, pt.script_path) == 'http' else 'k6'
+
+def run_load_test(pt, env_vars, execution_id, shards=None, load_profile=None):
+    """성능 테스트 실행 (shards가 2 이상이면 execution segment 분할 실행, load_profile은 스크립트 options에 병합)
+
+    HTTP 부하 시나리오 파일(.http.json)은 내장 asyncio HTTP 엔진, 그 외에는 k6로 실행
+
+    실행 동안 호스트 지표를 함께 샘플링하여 k6 메트릭과 시각을 맞춰 분석할 수 있도록 저장
+    """
+    options = build_k6_options(load_profile) if load_profile else None
+    # 동시 실행 수는 대기열 워커/매트릭스 동시 실행 수로 제한되므로 자동화 실행용 엔진 슬롯은 사용하지 않음
+    engine = load_test_engine(pt)
+    return run_with_host_metrics(lambda: engine_registry.run(
+        engine, resolve_entry(pt.script_path, engine), env_vars, execution_id=execution_id, shards=shards, options=options, pooled=False
+    ))
+
+def apply_load_profile_summary(result, load_profile, estimate):
+    """실행 결과에 적용한 부하 프로필과 사전 추정치 기록 (추정 대비 실제 비교용)"""
+    if load_profile:
+        result['load_profile'] = {
+            'id': load_profile.get('id'),
+            'name': load_profile.get('name'),
+            'type': load_profile['type'],
+            'settings': load_profile['settings'],
+            'estimate': estimate
+        }
+    return result
+
+def evaluate_load_profile(pt, data):
+    """요청/테스트 기본 부하 프로필 검증과 비용 추정
+
+    반환: (프로필, 추정치, 오류 본문, 상태 코드) — 상한을 넘으면 confirm=true 없이는 409
+    """
+    try:
+        load_profile = resolve_profile(data.get('load_profile'), pt)
+    except ValueError as e:
+        return None, None, {'error': str(e)}, 400
+    if load_profile is None:
+        return None, None, None, None
+    estimate = estimate_profile(load_profile, pt.id)
+    violations = check_limits(estimate, pt.environment)
+    if violations and not data.get('confirm'):
+        return load_profile, estimate, {
+            'error': '부하 프로필 추정치가 실행 상한을 초과합니다 (확인 후 confirm: true로 다시 요청)',
+            'violations': violations,
+            'estimate': estimate
+        }, 409
+    return load_profile, estimate, None, None
+
+def check_load_profile(pt, data):
+    """evaluate_load_profile 결과를 (프로필, 추정치, 오류 응답)으로 반환"""
+    load_profile, estimate, error, code = evaluate_load_profile(pt, data)
+    return load_profile, estimate, (jsonify(error), code) if error else None
+
+@register_job_handler('performance')
+def run_performance_execution(execution_id, env_vars, shards=None, load_profile=None, estimate=None):
+    """워커 풀에서 실행되는 비동기 성능 테스트 작업"""
+    execution = TestExecution.query.get(execution_id)
+    if not execution:
+        return None
+    pt = PerformanceTest.query.get(execution.performance_test_id)
+    
+    execution.status = 'running'
+    execution.started_at = datetime.utcnow()
+    # 대기 중 스크립트가 바뀌었을 수 있으므로 실제 실행 시점의 내용으로 재사용 키 갱신 (예약 실행은 예약의 실행 환경 기준)
+    execution.cache_key = build_cache_key(
+        'performance', pt.id, pt.script_path, env_vars, execution.environment or pt.environment, load_profile
+    )
+    db.session.commit()
+    
+    try:
+        start_time = time.time()
+        result = run_load_test(pt, env_vars, execution.id, shards, load_profile)
+        result.setdefault('execution_time', time.time() - start_time)
+    except Exception as e:
+        result = {'status': 'Error', 'error': str(e)}
+    apply_load_profile_summary(result, load_profile, estimate)
+    
+    try:
+        save_performance_result(pt, execution, result)
+        execution.status = execution_status_for(result)
+        execution.result_summary = summarize_result(result)
+        execution.completed_at = datetime.utcnow()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    record_execution_duration(execution, result)
+    return result
+
+def queue_performance_execution(pt, env_vars, cache_key, shards=None, load_profile=None, estimate=None,
+                                environment=None, executed_by='system', schedule_id=None):
+    """성능 테스트 실행을 만들어 영속 대기열에 등록 (내장 워커 또는 독립 워커 프로세스가 실행)"""
+    execution = TestExecution(
+        performance_test_id=pt.id,
+        test_type='performance',
+        environment=environment or pt.environment,
+        executed_by=executed_by,
+        status='queued',
+        started_at=None,
+        cache_key=cache_key,
+        schedule_id=schedule_id
+    )
+    db.session.add(execution)
+    submit_run(
+        current_app._get_current_object(),
+        execution,
+        'performance',
+        {'env_vars': env_vars, 'shards': shards, 'load_profile': load_profile, 'estimate': estimate}
+    )
+    return execution
+
+@register_schedule_target('performance')
+def launch_scheduled_performance(app, schedule, parameters):
+    """예약 실행: 실행 API의 비동기 모드와 같은 검증을 거쳐 대기열에 등록"""
+    pt = PerformanceTest.query.get(schedule.target_id)
+    if not pt:
+        raise ValueError(f'성능 테스트를 찾을 수 없습니다: {schedule.target_id}')
+    rejection = script_rejection(pt.script_path, load_test_engine(pt))
+    if rejection:
+        raise ValueError(rejection['error'])
+    shards = parse_shards(parameters.get('shards'))
+    env_vars = build_performance_env_vars(pt, parameters.get('environment_vars', {}))
+    if schedule.environment:
+        env_vars['ENVIRONMENT'] = schedule.environment
+    load_profile, estimate, error, _ = evaluate_load_profile(pt, parameters)
+    if error:
+        raise ValueError(error['error'])
+    environment = schedule.environment or pt.environment
+    cache_key = build_cache_key('performance', pt.id, pt.script_path, env_vars, environment, load_profile)
+    return queue_performance_execution(
+        pt, env_vars, cache_key, shards, load_profile, estimate,
+        environment=environment, executed_by=f'schedule:{schedule.name}', schedule_id=schedule.id
+    )
+
+@performance_bp.route('/performance-tests/<int:id>/execute', methods=['POST'])
+def execute_performance_test(id):
+    pt = PerformanceTest.query.get_or_404(id)
+    data = request.get_json(silent=True) or {}
+    
+    # 스크립트가 없거나 깨졌으면(k6 inspect 실패 등) 실행을 만들지 않고 즉시 거부
+    rejection = script_rejection(pt.script_path, load_test_engine(pt))
+    if rejection:
+        response = jsonify(rejection)
+        return add_cors_headers(response), 400
+    
+    # 환경 변수 설정
+    env_vars = build_performance_env_vars(pt, data.get('environment_vars', {}))
+    # 분할 실행 샤드 수 (1이면 단일 k6 프로세스)
+    try:
+        shards = parse_shards(data.get('shards'))
+    except ValueError as e:
+        response = jsonify({'error': str(e)})
+        return add_cors_headers(response), 400
     
+    # 부하 프로필 검증과 실행 전 비용 추정 (상한 초과 시 확인 요구)
+    load_profile, estimate, error = check_load_profile(pt, data)
+    if error:
+        response, code = error
+        return add_cors_headers(response), code
+    
+    # 결과 재사용: TTL 안에 같은 스크립트/환경 변수/환경으로 성공한 결과가 있으면 k6를 다시 띄우지 않음
+    cache_key = build_cache_key('performance', pt.id, pt.script_path, env_vars, pt.environment, load_profile)
+    use_cache, cache_ttl = cache_options(data, request.args)
+    if use_cache:
+        cached_execution, cached_result = find_cached_result(cache_key, cache_ttl)
+        if cached_execution:
+            response = jsonify(cache_hit_response(cached_execution, cached_result, cache_ttl))
+            return add_cors_headers(response), 200
+    
+    # 비동기 모드: 큐에 등록하고 실행 ID만 즉시 반환
+    run_async = async_requested(data, request.args)
+    if run_async:
+        execution = queue_performance_execution(pt, env_vars, cache_key, shards, load_profile, estimate)
+        
+        response = jsonify({
+            'message': '성능 테스트 실행이 등록되었습니다',
+            'cache_hit': False,
+            'estimate': estimate,
+            'execution_id': execution.id,
+            'status': execution.status,
+            'status_url': f'/executions/{execution.id}'
+        })
+        return add_cors_headers(response), 202
+    
+    # 실행 기록을 먼저 생성하여 실행 ID별 작업 디렉토리 사용
+    execution = TestExecution(
+        performance_test_id=pt.id,
+        test_type='performance',
+        environment=pt.environment,
+        executed_by='system',
+        status='running',
+        cache_key=cache_key
+    )
     db.session.add(execution)
     db.session.commit()
     
+    # k6 테스트 실행
+    with cancellable_run(execution.id):
+        try:
+            result = run_load_test(pt, env_vars, execution.id, shards, load_profile)
+        except Exception as e:
+            result = {'status': 'Error', 'error': str(e)}
+    apply_load_profile_summary(result, load_profile, estimate)
+    
+    # 실행 결과 저장 (비동기 실행과 같은 상태 값: completed, failed, cancelled)
+    try:
+        save_performance_result(pt, execution, result)
+        execution.status = execution_status_for(result)
+        execution.result_summary = summarize_result(result)
+        execution.completed_at = datetime.utcnow()
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        # 저장에 실패해도 실행 기록이 running으로 남지 않도록 실패로 마감
+        execution.status = 'failed'
+        execution.completed_at = datetime.utcnow()
+        db.session.commit()
+        response = jsonify({'error': f'데이터베이스 오류: {str(e)}', 'execution_id': execution.id})
+        return add_cors_headers(response), 500
+    record_execution_duration(execution, result)
+    
     response = jsonify({
         'message': '성능 테스트 실행 완료',
+        'cache_hit': False,
         'execution_id': execution.id,
         'result': result
     })
     return add_cors_headers(response), 200
 
+@register_job_handler('matrix')
+def run_matrix_execution(execution_id, env_vars=None, concurrency=None):
+    """환경 변수 조합별 자식 성능 실행을 동시 실행 수 제한 안에서 병렬 실행
+
+    자식 실행은 단건 성능 실행과 같은 핸들러로 실행/저장하고 부모 카운터에 반영하며,
+    부모가 취소되면 시작 전 조합은 건너뛰고 실행 중 조합의 k6 프로세스를 종료
+    """
+    parent = TestExecution.query.get(execution_id)
+    if not parent:
+        return None
+    matrix = load_matrix(parent)
+    if not matrix:
+        return None
+    if parent.status != 'cancelled':
+        parent.status = 'running'
+        parent.started_at = parent.started_at or datetime.utcnow()
+        db.session.commit()
+    
+    app = current_app._get_current_object()
+    base_env = dict(env_vars or {})
+    concurrency = max(1, min(int(concurrency or matrix.get('concurrency') or MATRIX_DEFAULT_CONCURRENCY), MATRIX_MAX_CONCURRENCY))
+    
+    def parent_cancelled():
+        if is_cancelled(execution_id):
+            return True
+        status = db.session.query(TestExecution.status).filter(TestExecution.id == execution_id).scalar()
+        return status == 'cancelled'
+    
+    def run_combination(child_id, combination_env):
+        # 부모 취소 확인 전에 실행 범위를 열어, 확인 직후 전달된 취소도 놓치지 않음
+        with app.app_context(), cancellable_run(child_id):
+            child = TestExecution.query.get(child_id)
+            if child.status in FINISHED_EXECUTION_STATUSES:
+                return  # 워커 재시도 시 이미 끝난 조합은 다시 실행/집계하지 않음
+            if parent_cancelled():
+                child.status = 'cancelled'
+                child.completed_at = datetime.utcnow()
+                child.result_summary = json.dumps({'status': 'Cancelled', 'error': '실행 전에 취소되었습니다'})
+                db.session.commit()
+                record_suite_child_result(child, False)
+                return
+            run_performance_execution(child_id, {**base_env, **combination_env})
+            child = TestExecution.query.get(child_id)
+            record_suite_child_result(child, child.status == 'completed')
+    
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f'matrix-{execution_id}') as executor:
+        futures = {
+            executor.submit(run_combination, c['execution_id'], c['env']): c['execution_id']
+            for c in matrix['combinations']
+        }
+        pending = set(futures)
+        cancelled = False
+        while pending:
+            done, pending = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
+            if not cancelled and parent_cancelled():
+                # 다른 프로세스의 취소 요청(대기열 취소 플래그)도 실행 중 조합에 전달
+                cancelled = True
+                for future in pending:
+                    cancel_run(futures[future])
+        for future in futures:
+            future.result()
+    
+    db.session.expire_all()
+    parent = TestExecution.query.get(execution_id)
+    return build_comparison(parent)
+
+def start_matrix_run(pt, data, run_async):
+    """매트릭스 실행 생성 후 대기열 등록(비동기) 또는 즉시 실행(동기), (응답 본문, 상태 코드) 반환"""
+    combinations = expand_matrix(data.get('matrix'), data.get('mode', 'cartesian'))
+    concurrency = max(1, min(int(data.get('concurrency') or MATRIX_DEFAULT_CONCURRENCY), MATRIX_MAX_CONCURRENCY))
+    env_vars = build_performance_env_vars(pt, data.get('environment_vars', {}))
+    parent, children = create_matrix_execution(pt, combinations, data.get('mode', 'cartesian'), concurrency)
+    payload = {'env_vars': env_vars, 'concurrency': concurrency}
+    
+    if run_async:
+        submit_run(current_app._get_current_object(), parent, 'matrix', payload)
+        return {
+            'message': f'{len(children)}개 조합의 매트릭스 실행이 등록되었습니다',
+            'execution_id': parent.id,
+            'combinations': len(children),
+            'concurrency': concurrency,
+            'status': parent.status,
+            'status_url': f'/executions/{parent.id}',
+            'comparison_url': f'/executions/{parent.id}/comparison'
+        }, 202
+    
+    db.session.commit()
+    with cancellable_run(parent.id):
+        comparison = run_matrix_execution(parent.id, **payload)
+    parent = TestExecution.query.get(parent.id)
+    return {
+        'message': '매트릭스 실행 완료',
+        'execution_id': parent.id,
+        'status': parent.status,
+        'progress': parent.progress(),
+        'comparison': comparison
+    }, 200
+
+@performance_bp.route('/performance-tests/<int:id>/matrix', methods=['POST'])
+def execute_performance_matrix(id):
+    """스크립트 하나를 환경 변수 값 목록의 조합(cartesian/pairwise)별로 실행하고 지표 비교표 반환"""
+    pt = PerformanceTest.query.get_or_404(id)
+    data = request.get_json(silent=True) or {}
+    rejection = script_rejection(pt.script_path, load_test_engine(pt))
+    if rejection:
+        response = jsonify(rejection)
+        return add_cors_headers(response), 400
+    run_async = async_requested(data, request.args)
+    try:
+        body, status_code = start_matrix_run(pt, data, run_async)
+    except (TypeError, ValueError) as e:
+        db.session.rollback()
+        response = jsonify({'error': str(e)})
+        return add_cors_headers(response), 400
+    response = jsonify(body)
+    return add_cors_headers(response), status_code
+
+# 용량 탐색 요청 파라미터 → 변환 함수
+CAPACITY_SETTINGS = {
+    'start_vus': int,
+    'max_vus': int,
+    'growth': float,
+    'p95_ms': float,
+    'max_error_rate': float,
+    'resolution': float,
+    'saturation_gain': float,
+    'max_steps': int
+}
+K6_DURATION_PATTERN = re.compile(r'^\d+(ms|s|m|h)$')
+
+def parse_capacity_settings(data):
+    """요청 본문에서 용량 탐색 설정 추출 (형식 오류는 ValueError)"""
+    settings = {}
+    for key, convert in CAPACITY_SETTINGS.items():
+        if data.get(key) is not None:
+            settings[key] = convert(data[key])
+    step_duration = str(data.get('step_duration') or DEFAULT_STEP_DURATION)
+    if not K6_DURATION_PATTERN.match(step_duration):
+        raise ValueError(f'step_duration 형식이 올바르지 않습니다: {step_duration} (예: 20s, 1m)')
+    return settings, step_duration
+
+def _watch_parent_cancel(parent_id, child_id, done):
+    """부모 실행 취소(다른 프로세스의 취소 요청 포함)를 실행 중인 단계의 k6 프로세스에 전달"""
+    while not done.wait(0.5):
+        if is_cancelled(parent_id):
+            cancel_run(child_id)
+            return
+
+@register_job_handler('capacity')
+def run_capacity_search(execution_id, env_vars=None, settings=None, step_duration=None, shards=None):
+    """짧은 단계 부하(K6_VUS/K6_DURATION)를 반복 실행하며 임계값을 넘기 직전의 최대 VU 수 탐색
+
+    단계마다 자식 성능 실행을 만들어 지표를 저장하고, 결과(한계점과 단계 곡선)는 부모 result_summary에 기록
+    """
+    parent = TestExecution.query.get(execution_id)
+    if not parent or parent.status == 'cancelled':
+        return None
+    pt = PerformanceTest.query.get(parent.performance_test_id)
+    parent.status = 'running'
+    parent.started_at = datetime.utcnow()
+    db.session.commit()
+    step_duration = step_duration or DEFAULT_STEP_DURATION
+    
+    def run_step(vus, phase):
+        step = TestExecution(
+            test_type='performance',
+            performance_test_id=pt.id,
+            parent_execution_id=execution_id,
+            environment=pt.environment,
+            executed_by=parent.executed_by,
+            status='running',
+            started_at=datetime.utcnow()
+        )
+        db.session.add(step)
+        db.session.commit()
+        # k6 옵션 환경 변수는 스크립트 options보다 우선하므로 스크립트 수정 없이 단계 부하 지정
+        step_env = {**(env_vars or {}), 'K6_VUS': str(vus), 'K6_DURATION': step_duration}
+        done = threading.Event()
+        with cancellable_run(step.id):
+            threading.Thread(target=_watch_parent_cancel, args=(execution_id, step.id, done), daemon=True).start()
+            try:
+                result = run_load_test(pt, step_env, step.id, shards)
+            except Exception as e:
+                result = {'status': 'Error', 'error': str(e)}
+            finally:
+                done.set()
+        save_performance_metrics(step, result)
+        step.status = execution_status_for(result)
+        step.result_summary = summarize_result({**result, 'capacity_step': {'vus': vus, 'phase': phase}})
+        step.completed_at = datetime.utcnow()
+        db.session.commit()
+        return {**result, 'execution_id': step.id}
+    
+    search = CapacitySearch(run_step, should_stop=lambda: is_cancelled(execution_id), **(settings or {}))
+    report = search.run()
+    
+    parent = TestExecution.query.get(execution_id)
+    if report['stop_reason'] == 'cancelled':
+        parent.status = 'cancelled'
+    else:
+        parent.status = 'failed' if report['stop_reason'] == 'error' else 'completed'
+    parent.throughput = report['knee_throughput']
+    parent.response_time_p95 = report['knee_p95']
+    parent.result_summary = json.dumps({
+        'capacity': report,
+        'step_duration': step_duration,
+        'steps': len(search.steps)
+    })
+    parent.completed_at = datetime.utcnow()
+    db.session.commit()
+    return report
+
+@performance_bp.route('/performance-tests/<int:id>/capacity-search', methods=['POST'])
+def execute_capacity_search(id):
+    """용량 탐색 실행 (부하를 늘려 구간을 잡은 뒤 이분 탐색으로 임계값 한계 VU 수와 처리량 보고)"""
+    pt = PerformanceTest.query.get_or_404(id)
+    data = request.get_json(silent=True) or {}
+    rejection = script_rejection(pt.script_path, load_test_engine(pt))
+    if rejection:
+        response = jsonify(rejection)
+        return add_cors_headers(response), 400
+    try:
+        settings, step_duration = parse_capacity_settings(data)
+        shards = parse_shards(data.get('shards'))
+    except (TypeError, ValueError) as e:
+        response = jsonify({'error': str(e)})
+        return add_cors_headers(response), 400
+    
+    payload = {
+        'env_vars': build_performance_env_vars(pt, data.get('environment_vars', {})),
+        'settings': settings,
+        'step_duration': step_duration,
+        'shards': shards
+    }
+    parent = TestExecution(
+        test_type='capacity',
+        performance_test_id=pt.id,
+        environment=pt.environment,
+        executed_by='system',
+        status='queued',
+        started_at=None
+    )
+    db.session.add(parent)
+    
+    if async_requested(data, request.args):
+        submit_run(current_app._get_current_object(), parent, 'capacity', payload)
+        response = jsonify({
+            'message': '용량 탐색이 등록되었습니다',
+            'execution_id': parent.id,
+            'status': parent.status,
+            'status_url': f'/executions/{parent.id}'
+        })
+        return add_cors_headers(response), 202
+    
+    db.session.commit()
+    with cancellable_run(parent.id):
+        report = run_capacity_search(parent.id, **payload)
+    parent = TestExecution.query.get(parent.id)
+    response = jsonify({
+        'message': '용량 탐색 완료',
+        'execution_id': parent.id,
+        'status': parent.status,
+        'capacity': report
+    })
+    return add_cors_headers(response), 200
+
 @performance_bp.route('/performance-tests/<int:id>/results', methods=['GET'])
 def get_performance_test_results(id):
     results = TestResult.query.filter_by(performance_test_id=id).all()
-    data = [{
-        'id': r.id,
-        'performance_test_id': r.performance_test_id,
-        'result': r.result,
-        'execution_time': r.execution_time,
-        'environment': r.environment,
-        'executed_by': r.executed_by,
-        'executed_at': r.executed_at.strftime('%Y-%m-%d %H:%M:%S') if r.executed_at else None,
-        'notes': r.notes
-    } for r in results]
+    execution_ids = [r.test_execution_id for r in results if r.test_execution_id]
+    executions = {e.id: e for e in TestExecution.query.filter(TestExecution.id.in_(execution_ids)).all()} if execution_ids else {}
+    data = []
+    for r in results:
+        e = executions.get(r.test_execution_id)
+        data.append({
+            'id': r.id,
+            'performance_test_id': r.performance_test_id,
+            'test_execution_id': r.test_execution_id,
+            'result': r.result,
+            'execution_time': r.execution_time,
+            'environment': r.environment,
+            'executed_by': r.executed_by,
+            'executed_at': r.executed_at.strftime('%Y-%m-%d %H:%M:%S') if r.executed_at else None,
+            'notes': r.notes,
+            'request_count': e.request_count if e else None,
+            'response_time_avg': e.response_time_avg if e else None,
+            'response_time_p95': e.response_time_p95 if e else None,
+            'throughput': e.throughput if e else None,
+            'error_rate': e.error_rate if e else None
+        })
     response = jsonify(data)
     return add_cors_headers(response), 200
 
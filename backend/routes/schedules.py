@@ -0,0 +1,175 @@
+from flask import Blueprint, request, jsonify, current_app
+from models import db, RunSchedule, TestExecution, PerformanceTest, AutomationTest, Folder
+from utils.cors import add_cors_headers
+from utils.auth_decorators import guest_allowed
+from utils.cron import upcoming_runs
+from utils.scheduler import validate_schedule, reschedule, launch_schedule, wake_scheduler, active_execution
+from datetime import datetime
+import json
+
+# Blueprint 생성
+schedules_bp = Blueprint('schedules', __name__)
+
+# 예약 대상 유형별 모델 (대상 존재 여부 확인용)
+TARGET_MODELS = {
+    'performance': PerformanceTest,
+    'automation': AutomationTest,
+    'folder': Folder
+}
+
+# 수정 가능한 예약 필드
+SCHEDULE_FIELDS = ('name', 'cron', 'timezone', 'target_type', 'target_id', 'environment',
+                   'parameters', 'overlap_policy', 'jitter_seconds', 'enabled')
+
+def schedule_detail(schedule, recent=10):
+    """예약 정보 + 다음 실행 예정 시각과 최근 실행"""
+    data = schedule.to_dict()
+    try:
+        data['upcoming'] = [t.isoformat() for t in upcoming_runs(schedule.cron, datetime.utcnow(), schedule.timezone)]
+    except ValueError as e:
+        data['upcoming'] = []
+        data['cron_error'] = str(e)
+    executions = TestExecution.query.filter_by(schedule_id=schedule.id).order_by(
+        TestExecution.id.desc()
+    ).limit(recent).all()
+    data['recent_executions'] = [{
+        'id': e.id,
+        'status': e.status,
+        'started_at': e.started_at.isoformat() if e.started_at else None,
+        'completed_at': e.completed_at.isoformat() if e.completed_at else None
+    } for e in executions]
+    return data
+
+def check_schedule(data):
+    """예약 본문과 대상 존재 여부 검증 (오류 응답 또는 None)"""
+    errors = validate_schedule(data)
+    model = TARGET_MODELS.get(data.get('target_type'))
+    if model is not None and not model.query.get(data.get('target_id') or 0):
+        errors.append(f"예약 대상을 찾을 수 없습니다: {data.get('target_type')} {data.get('target_id')}")
+    if errors:
+        response = jsonify({'error': '예약 설정이 올바르지 않습니다', 'details': errors})
+        return add_cors_headers(response), 400
+    return None
+
+def apply_schedule_fields(schedule, data):
+    for field in SCHEDULE_FIELDS:
+        if field not in data:
+            continue
+        value = data[field]
+        if field == 'parameters':
+            value = json.dumps(value or {})
+        elif field == 'jitter_seconds':
+            value = int(value or 0)
+        elif field == 'enabled':
+            value = bool(value)
+        setattr(schedule, field, value)
+
+@schedules_bp.route('/schedules', methods=['GET'])
+@guest_allowed
+def get_schedules():
+    query = RunSchedule.query
+    if request.args.get('target_type'):
+        query = query.filter_by(target_type=request.args['target_type'])
+    schedules = query.order_by(RunSchedule.next_fire_at.is_(None), RunSchedule.next_fire_at, RunSchedule.id).all()
+    response = jsonify([s.to_dict() for s in schedules])
+    return add_cors_headers(response), 200
+
+@schedules_bp.route('/schedules', methods=['POST'])
+def create_schedule():
+    data = request.get_json(silent=True) or {}
+    if not data.get('name'):
+        response = jsonify({'error': 'name이 필요합니다'})
+        return add_cors_headers(response), 400
+    data.setdefault('timezone', 'UTC')
+    error = check_schedule(data)
+    if error:
+        return error
+
+    schedule = RunSchedule(created_by=data.get('created_by', 'system'), overlap_policy='skip', jitter_seconds=0, enabled=True)
+    apply_schedule_fields(schedule, data)
+    try:
+        db.session.add(schedule)
+        db.session.flush()
+        reschedule(schedule)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        response = jsonify({'error': f'데이터베이스 오류: {str(e)}'})
+        return add_cors_headers(response), 500
+    wake_scheduler()
+    response = jsonify({'message': '예약 생성 완료', 'id': schedule.id, 'schedule': schedule_detail(schedule)})
+    return add_cors_headers(response), 201
+
+@schedules_bp.route('/schedules/<int:id>', methods=['GET'])
+@guest_allowed
+def get_schedule(id):
+    schedule = RunSchedule.query.get_or_404(id)
+    response = jsonify(schedule_detail(schedule))
+    return add_cors_headers(response), 200
+
+@schedules_bp.route('/schedules/<int:id>', methods=['PUT'])
+def update_schedule(id):
+    schedule = RunSchedule.query.get_or_404(id)
+    data = request.get_json(silent=True) or {}
+    merged = schedule.to_dict()
+    merged.update({k: v for k, v in data.items() if k in SCHEDULE_FIELDS})
+    error = check_schedule(merged)
+    if error:
+        return error
+
+    apply_schedule_fields(schedule, data)
+    try:
+        # 실행 시각에 영향을 주는 값이 바뀌었거나 다시 활성화되면 다음 실행 시각을 다시 계산
+        if {'cron', 'timezone', 'enabled', 'jitter_seconds'} & set(data) or (schedule.enabled and not schedule.next_fire_at):
+            reschedule(schedule)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        response = jsonify({'error': f'데이터베이스 오류: {str(e)}'})
+        return add_cors_headers(response), 500
+    wake_scheduler()
+    response = jsonify({'message': '예약 수정 완료', 'schedule': schedule_detail(schedule)})
+    return add_cors_headers(response), 200
+
+@schedules_bp.route('/schedules/<int:id>', methods=['DELETE'])
+def delete_schedule(id):
+    schedule = RunSchedule.query.get_or_404(id)
+    try:
+        # 이미 만들어진 실행 기록은 남기고 예약 연결만 해제
+        TestExecution.query.filter_by(schedule_id=schedule.id).update({'schedule_id': None})
+        db.session.delete(schedule)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        response = jsonify({'error': f'데이터베이스 오류: {str(e)}'})
+        return add_cors_headers(response), 500
+    response = jsonify({'message': '예약 삭제 완료'})
+    return add_cors_headers(response), 200
+
+@schedules_bp.route('/schedules/<int:id>/run', methods=['POST'])
+def run_schedule_now(id):
+    """예약을 지금 한 번 실행 (다음 예약 시각은 그대로, 중복 실행 정책은 force=true가 아니면 적용)"""
+    schedule = RunSchedule.query.get_or_404(id)
+    data = request.get_json(silent=True) or {}
+    if schedule.overlap_policy != 'allow' and not data.get('force'):
+        running = active_execution(schedule)
+        if running:
+            response = jsonify({
+                'error': '이전 예약 실행이 아직 끝나지 않았습니다 (겹쳐 실행하려면 force: true)',
+                'execution_id': running.id,
+                'status': running.status
+            })
+            return add_cors_headers(response), 409
+
+    execution = launch_schedule(current_app._get_current_object(), schedule)
+    schedule = RunSchedule.query.get(id)
+    if execution is None:
+        response = jsonify({'error': '예약 실행 등록 실패', 'message': schedule.last_error})
+        return add_cors_headers(response), 400
+    response = jsonify({
+        'message': '예약 실행이 등록되었습니다',
+        'schedule_id': schedule.id,
+        'execution_id': execution.id,
+        'status_url': f'/executions/{execution.id}'
+    })
+    return add_cors_headers(response), 202
@@ -1,13 +1,21 @@
 from flask import Blueprint, request, jsonify, send_file
-from models import db, TestCase, TestResult, Screenshot, Project, Folder
+from models import db, TestCase, TestResult, Screenshot, Project, Folder, TestExecution
 from utils.cors import add_cors_headers
 from utils.auth_decorators import admin_required, user_required, guest_allowed
+from utils.run_queue import register_job_handler, execution_status_for
+from utils.suite import record_suite_child_result, testcase_engine
+from utils.test_reports import save_test_run_cases
+from utils.resource_usage import save_resource_usage
+from utils.duration_model import record_execution_duration
+from utils.result_cache import build_cache_key, cache_options, find_cached_result, cache_hit_response
+from utils.script_catalog import script_rejection, resolve_entry
+from engines.process_runner import cancellable_run
+from engines.automation_runner import output_excerpt, summarize_run
+from engines.registry import engine_registry, parse_shards
 from datetime import datetime
 import pandas as pd
 from io import BytesIO
 import os
-import subprocess
-import time
 import json
 
 # Blueprint 생성
@@ -548,6 +556,60 @@ def download_testcases_excel():
         response = jsonify({'error': f'파일 다운로드 중 오류가 발생했습니다: {str(e)}'})
         return add_cors_headers(response), 500
 
+def save_testcase_result(test_case, execution, result):
+    """테스트 케이스 자동화 코드 실행 결과를 TestResult, 실행 기록, 케이스 상태에 저장"""
+    passed = result.get('status') == 'Pass'
+    test_result = TestResult(
+        test_case_id=test_case.id,
+        test_execution_id=execution.id,
+        result=result.get('status', 'Error'),
+        execution_time=result.get('execution_time', 0.0),
+        environment=execution.environment,
+        executed_by=execution.executed_by or 'system',
+        executed_at=datetime.utcnow(),
+        exit_code=result.get('exit_code'),
+        notes=output_excerpt(result)
+    )
+    db.session.add(test_result)
+    save_test_run_cases(execution.id, result.get('tests'))
+    save_resource_usage(execution, result)
+    
+    if not result.get('cancelled'):
+        test_case.result_status = 'passed' if passed else 'failed'
+    execution.status = execution_status_for(result)
+    execution.completed_at = datetime.utcnow()
+    execution.result_summary = json.dumps(summarize_run(result))
+    return test_result
+
+@register_job_handler('testcase')
+def run_testcase_execution(execution_id, env_vars=None, shards=None):
+    """테스트 케이스 자동화 코드 실행 작업 (단건 실행과 스위트 자식 실행이 공통으로 사용)"""
+    execution = TestExecution.query.get(execution_id)
+    if not execution:
+        return None
+    test_case = TestCase.query.get(execution.test_case_id)
+    
+    script_path = test_case.automation_code_path
+    execution.status = 'running'
+    execution.started_at = datetime.utcnow()
+    execution.cache_key = build_cache_key('testcase', test_case.id, script_path, env_vars, execution.environment)
+    db.session.commit()
+    
+    engine = testcase_engine(test_case)
+    if not script_path:
+        result = {'status': 'Error', 'engine': engine, 'error': '자동화 코드 경로가 설정되지 않았습니다'}
+    else:
+        result = engine_registry.run(
+            engine, resolve_entry(script_path, engine), env_vars, execution_id=execution.id, shards=shards
+        )
+    
+    test_result = save_testcase_result(test_case, execution, result)
+    db.session.commit()
+    record_execution_duration(execution, result)
+    record_suite_child_result(execution, result.get('status') == 'Pass')
+    result['result_id'] = test_result.id
+    return result
+
 # 자동화 코드 실행 API
 @testcases_bp.route('/testcases/<int:id>/execute', methods=['POST'])
 def execute_automation_code(id):
@@ -559,222 +621,59 @@ def execute_automation_code(id):
             response = jsonify({'error': '자동화 코드 경로가 설정되지 않았습니다'})
             return add_cors_headers(response), 400
         
-        # 자동화 코드 실행
-        script_path = test_case.automation_code_path
-        script_type = test_case.automation_code_type or 'playwright'
-        
-        # 디버깅을 위한 로그 추가
-        print(f"🔍 테스트 케이스 ID: {id}")
-        print(f"🔍 자동화 코드 경로: {script_path}")
-        print(f"🔍 자동화 코드 타입: {script_type}")
-        
-        # 스크립트 경로가 디렉토리인지 파일인지 확인
-        if not script_path:
-            response = jsonify({'error': '자동화 코드 경로가 설정되지 않았습니다'})
+        rejection = script_rejection(test_case.automation_code_path, testcase_engine(test_case))
+        if rejection:
+            response = jsonify(rejection)
             return add_cors_headers(response), 400
         
-        import time
-        start_time = time.time()
+        data = request.get_json(silent=True) or {}
+        env_vars = data.get('environment_vars', {})
+        try:
+            shards = parse_shards(data.get('shards'))
+        except ValueError as e:
+            response = jsonify({'error': str(e)})
+            return add_cors_headers(response), 400
         
-        if script_type == 'k6':
-            # k6 성능 테스트 실행
-            from engines.k6_engine import k6_engine
-            result = k6_engine.execute_test(script_path, {})
-            execution_duration = time.time() - start_time
-            
-            # 실행 결과 저장
-            test_result = TestResult(
-                test_case_id=id,
-                result=result['status'],
-                environment=test_case.environment,
-                execution_duration=execution_duration,
-                error_message=result.get('error')
+        # 결과 재사용: TTL 안에 같은 스크립트/환경 변수/환경으로 성공한 결과가 있으면 다시 실행하지 않음
+        use_cache, cache_ttl = cache_options(data, request.args)
+        if use_cache:
+            cache_key = build_cache_key(
+                'testcase', test_case.id, test_case.automation_code_path, env_vars, test_case.environment
             )
-            db.session.add(test_result)
-            db.session.commit()
-            
-            response = jsonify({
-                'message': '자동화 코드 실행 완료',
-                'result': result['status'],
-                'output': result.get('output', ''),
-                'error': result.get('error', ''),
-                'execution_duration': execution_duration
-            })
-            return add_cors_headers(response), 200
-            
-        elif script_type in ['selenium', 'playwright', 'k6']:
-            # UI 테스트 실행
-            if script_type == 'k6':
-                # k6 실행
-                import os
-                # 스크립트 경로를 절대 경로로 변환
-                if not os.path.isabs(script_path):
-                    # 백엔드 디렉토리에서 상위 디렉토리로 이동
-                    backend_dir = os.path.dirname(os.path.abspath(__file__))
-                    project_root = os.path.dirname(backend_dir)
-                    script_path = os.path.join(project_root, script_path)
-                
-                print(f"🔍 k6 실행 경로: {script_path}")
-                print(f"📁 파일 존재 여부: {os.path.exists(script_path)}")
-                print(f"📁 프로젝트 루트: {project_root}")
-                print(f"📁 현재 작업 디렉토리: {os.getcwd()}")
-                
-                # 경로가 디렉토리인지 파일인지 확인
-                if os.path.isdir(script_path):
-                    # 디렉토리인 경우 해당 디렉토리에서 .js 파일 찾기
-                    js_files = [f for f in os.listdir(script_path) if f.endswith('.js')]
-                    if js_files:
-                        script_path = os.path.join(script_path, js_files[0])
-                        print(f"🔍 디렉토리에서 찾은 스크립트: {script_path}")
-                    else:
-                        response = jsonify({'error': f'디렉토리 {script_path}에서 .js 파일을 찾을 수 없습니다'})
-                        return add_cors_headers(response), 400
-                
-                # 절대 경로 사용
-                absolute_script_path = os.path.abspath(script_path)
-                print(f"🔍 절대 경로: {absolute_script_path}")
-                print(f"📁 절대 경로 파일 존재 여부: {os.path.exists(absolute_script_path)}")
-                
-                if not os.path.exists(absolute_script_path):
-                    response = jsonify({'error': f'스크립트 파일을 찾을 수 없습니다: {absolute_script_path}'})
-                    return add_cors_headers(response), 400
-                
-                # 환경 변수 설정
-                env = os.environ.copy()
-                env['K6_BROWSER_ENABLED'] = 'true'
-                env['K6_BROWSER_HEADLESS'] = 'true'
-                
-                result = subprocess.run(
-                    ['k6', 'run', absolute_script_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=300,  # 5분 타임아웃
-                    cwd=project_root,  # 프로젝트 루트에서 실행
-                    env=env
-                )
-            elif script_type == 'playwright':
-                # Playwright 실행
-                import os
-                # 스크립트 경로를 절대 경로로 변환
-                if not os.path.isabs(script_path):
-                    backend_dir = os.path.dirname(os.path.abspath(__file__))
-                    project_root = os.path.dirname(backend_dir)
-                    script_path = os.path.join(project_root, script_path)
-                
-                # 경로가 디렉토리인지 파일인지 확인
-                if os.path.isdir(script_path):
-                    # 디렉토리인 경우 해당 디렉토리에서 .spec.js 파일 찾기
-                    spec_files = [f for f in os.listdir(script_path) if f.endswith('.spec.js')]
-                    if spec_files:
-                        script_path = os.path.join(script_path, spec_files[0])
-                        print(f"🔍 디렉토리에서 찾은 Playwright 스크립트: {script_path}")
-                    else:
-                        response = jsonify({'error': f'디렉토리 {script_path}에서 .spec.js 파일을 찾을 수 없습니다'})
-                        return add_cors_headers(response), 400
-                
-                absolute_script_path = os.path.abspath(script_path)
-                if not os.path.exists(absolute_script_path):
-                    response = jsonify({'error': f'Playwright 스크립트 파일을 찾을 수 없습니다: {absolute_script_path}'})
-                    return add_cors_headers(response), 400
-                
-                result = subprocess.run(
-                    ['npx', 'playwright', 'test', absolute_script_path, '--reporter=json'],
-                    capture_output=True,
-                    text=True,
-                    timeout=300,  # 5분 타임아웃
-                    cwd=os.path.dirname(absolute_script_path) if os.path.dirname(absolute_script_path) else None
-                )
-            else:
-                # Selenium 실행
-                import os
-                # 스크립트 경로를 절대 경로로 변환
-                if not os.path.isabs(script_path):
-                    backend_dir = os.path.dirname(os.path.abspath(__file__))
-                    project_root = os.path.dirname(backend_dir)
-                    script_path = os.path.join(project_root, script_path)
-                
-                # 경로가 디렉토리인지 파일인지 확인
-                if os.path.isdir(script_path):
-                    # 디렉토리인 경우 해당 디렉토리에서 .py 파일 찾기
-                    py_files = [f for f in os.listdir(script_path) if f.endswith('.py')]
-                    if py_files:
-                        script_path = os.path.join(script_path, py_files[0])
-                        print(f"🔍 디렉토리에서 찾은 Selenium 스크립트: {script_path}")
-                    else:
-                        response = jsonify({'error': f'디렉토리 {script_path}에서 .py 파일을 찾을 수 없습니다'})
-                        return add_cors_headers(response), 400
-                
-                absolute_script_path = os.path.abspath(script_path)
-                if not os.path.exists(absolute_script_path):
-                    response = jsonify({'error': f'Selenium 스크립트 파일을 찾을 수 없습니다: {absolute_script_path}'})
-                    return add_cors_headers(response), 400
-                
-                result = subprocess.run(
-                    ['python', absolute_script_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=300,  # 5분 타임아웃
-                    cwd=os.path.dirname(absolute_script_path) if os.path.dirname(absolute_script_path) else None
-                )
-            
-            execution_duration = time.time() - start_time
-            
-            # 스크린샷 경로 생성 (Playwright의 경우)
-            screenshot_path = None
-            if script_type == 'playwright' and result.returncode == 0:
-                # Playwright 테스트 결과에서 스크린샷 경로 추출
-                try:
-                    import json
-                    import os
-                    from datetime import datetime
-                    
-                    # 테스트 결과 디렉토리 생성
-                    screenshot_dir = os.path.join('screenshots', f'testcase_{id}')
-                    os.makedirs(screenshot_dir, exist_ok=True)
-                    
-                    # 스크린샷 파일명 생성
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    screenshot_path = os.path.join(screenshot_dir, f'screenshot_{timestamp}.png')
-                    
-                    # Playwright 실행 결과에서 스크린샷 복사 (실제 구현에서는 더 복잡)
-                    if os.path.exists('test-results'):
-                        import shutil
-                        for root, dirs, files in os.walk('test-results'):
-                            for file in files:
-                                if file.endswith('.png'):
-                                    shutil.copy2(os.path.join(root, file), screenshot_path)
-                                    break
-                except Exception as e:
-                    print(f"스크린샷 처리 중 오류: {e}")
-            
-            # 실행 결과 저장
-            test_result = TestResult(
-                test_case_id=id,
-                result='Pass' if result.returncode == 0 else 'Fail',
-                environment=test_case.environment,
-                execution_duration=execution_duration,
-                error_message=result.stderr if result.returncode != 0 else None,
-                screenshot=screenshot_path
-            )
-            db.session.add(test_result)
-            db.session.commit()
-            
-            response = jsonify({
-                'message': '자동화 코드 실행 완료',
-                'result': 'Pass' if result.returncode == 0 else 'Fail',
-                'output': result.stdout,
-                'error': result.stderr,
-                'execution_duration': execution_duration,
-                'screenshot_path': screenshot_path
-            })
-            return add_cors_headers(response), 200
-        else:
-            response = jsonify({'error': '지원하지 않는 자동화 코드 타입입니다'})
-            return add_cors_headers(response), 400
+            cached_execution, cached_result = find_cached_result(cache_key, cache_ttl)
+            if cached_execution:
+                response = jsonify(cache_hit_response(cached_execution, cached_result, cache_ttl))
+                return add_cors_headers(response), 200
+        
+        execution = TestExecution(
+            test_type='testcase',
+            test_case_id=test_case.id,
+            environment=test_case.environment,
+            executed_by='system',
+            status='queued',
+            started_at=None
+        )
+        db.session.add(execution)
+        db.session.commit()
         
-    except subprocess.TimeoutExpired:
-        response = jsonify({'error': '자동화 코드 실행 시간이 초과되었습니다'})
-        return add_cors_headers(response), 408
+        with cancellable_run(execution.id):
+            result = run_testcase_execution(execution.id, env_vars, shards)
+        
+        response = jsonify({
+            'message': '자동화 코드 실행 완료',
+            'cache_hit': False,
+            'result': result.get('status'),
+            'engine': result.get('engine'),
+            'exit_code': result.get('exit_code'),
+            'output': result.get('output', ''),
+            'error': result.get('error', ''),
+            'execution_duration': result.get('execution_time', 0.0),
+            'test_summary': result.get('test_summary'),
+            'execution_id': execution.id,
+            'result_id': result.get('result_id')
+        })
+        return add_cors_headers(response), 200
     except Exception as e:
+        db.session.rollback()
         response = jsonify({'error': str(e)})
-        return add_cors_headers(response), 500 
\ No newline at end of file
+        return add_cors_headers(response), 500
@@ -0,0 +1,83 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+
+# backend/를 import 경로에 추가 (backend/에서 python -m pytest tests로 실행)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# 실행 작업 디렉토리와 스크립트 감시는 모듈 import 시점에 설정되므로 테스트 전용 값으로 먼저 지정
+os.environ.setdefault('RUN_WORKSPACE_ROOT', tempfile.mkdtemp(prefix='test-runs-'))
+os.environ.setdefault('SCRIPT_CATALOG_WATCH', 'false')
+
+@pytest.fixture
+def db_app():
+    """모델만 등록한 SQLite 메모리 DB 앱 (app.py의 MySQL 설정/블루프린트 없이)"""
+    from flask import Flask
+    from models import db
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _reply(self, status, body, content_type='text/plain'):
+        payload = body if isinstance(body, bytes) else body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _handle(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else ''
+        self.server.requests.append((self.command, self.path, dict(self.headers), body))
+        path = self.path.split('?')[0]
+        if path == '/err':
+            self._reply(500, 'bad')
+        elif path == '/slow':
+            time.sleep(0.2)
+            self._reply(200, 'ok')
+        elif path == '/json':
+            self._reply(200, json.dumps({'token': 'abc', 'items': [1, 2]}), 'application/json')
+        elif path == '/echo':
+            echo = {'method': self.command, 'path': self.path, 'body': body,
+                    'authorization': self.headers.get('Authorization')}
+            self._reply(200, json.dumps(echo), 'application/json')
+        else:
+            self._reply(200, 'ok')
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def http_server():
+    """로컬 HTTP 서버 (/: 200, /err: 500, /slow: 200ms 지연, /json: JSON 본문, /echo: 요청 내용 반환)
+
+    server.url로 기준 URL, server.requests로 받은 요청 (method, path, headers, body) 확인
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    server.requests = []
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,73 @@
+from utils.capacity_search import CapacitySearch
+
+def fake_system(limit_vus, saturate_at=None):
+    """limit_vus까지는 p95 100ms, 넘으면 900ms. saturate_at 이후 처리량이 늘지 않음"""
+    calls = []
+
+    def run_step(vus, phase):
+        calls.append((vus, phase))
+        throughput = min(vus, saturate_at or vus) * 10.0
+        return {'status': 'Completed', 'execution_id': len(calls), 'throughput': throughput,
+                'response_time_p95': 100.0 if vus <= limit_vus else 900.0, 'error_rate': 0.0}
+    return run_step, calls
+
+def test_brackets_then_bisects_to_knee():
+    run_step, calls = fake_system(137)
+    result = CapacitySearch(run_step, start_vus=10, max_vus=1000).run()
+    assert [vus for vus, phase in calls if phase == 'bracket'] == [10, 20, 40, 80, 160]
+    assert result['stop_reason'] == 'converged'
+    assert result['first_failing_vus'] - result['knee_vus'] <= max(1, int(result['knee_vus'] * 0.1))
+    assert result['knee_vus'] <= 137 < result['first_failing_vus']
+    assert result['knee_throughput'] == result['knee_vus'] * 10.0
+    assert [step['vus'] for step in result['curve']] == sorted(vus for vus, _ in calls)
+
+def test_exact_resolution_finds_limit():
+    run_step, _ = fake_system(137)
+    result = CapacitySearch(run_step, start_vus=10, max_vus=1000, resolution=0, max_steps=20).run()
+    assert (result['knee_vus'], result['first_failing_vus']) == (137, 138)
+
+def test_stops_when_throughput_saturates():
+    run_step, calls = fake_system(10000, saturate_at=50)
+    result = CapacitySearch(run_step, start_vus=10, max_vus=1000).run()
+    assert result['stop_reason'] == 'saturated'
+    # 80 VU까지는 처리량이 늘고(400 → 500), 160 VU에서 더 늘지 않음
+    assert result['knee_vus'] == 80
+    assert calls[-1] == (160, 'bracket')
+
+def test_max_vus_reached():
+    run_step, calls = fake_system(10000)
+    result = CapacitySearch(run_step, start_vus=10, max_vus=50).run()
+    assert result['stop_reason'] == 'max_vus_reached'
+    assert result['knee_vus'] == 50
+    assert [vus for vus, _ in calls] == [10, 20, 40, 50]
+
+def test_failure_at_start_vus():
+    run_step, _ = fake_system(5)
+    result = CapacitySearch(run_step, start_vus=10).run()
+    assert result['stop_reason'] == 'below_start_vus'
+    assert result['knee_vus'] is None
+    assert result['first_failing_vus'] == 10
+
+def test_error_rate_violation_fails_step():
+    search = CapacitySearch(lambda vus, phase: None)
+    assert search.evaluate({'status': 'Completed', 'response_time_p95': 100.0, 'error_rate': 0.5})
+    assert search.evaluate({'status': 'Completed', 'response_time_p95': 100.0, 'error_rate': 0.0}) == []
+    assert search.evaluate({'status': 'Completed'}) is None
+
+def test_step_error_stops_search():
+    def run_step(vus, phase):
+        if vus > 20:
+            return {'status': 'Error', 'error': 'k6 실행 실패'}
+        return {'status': 'Completed', 'throughput': vus * 10.0, 'response_time_p95': 100.0, 'error_rate': 0.0}
+    result = CapacitySearch(run_step, start_vus=10).run()
+    assert result['stop_reason'] == 'error'
+    assert result['knee_vus'] == 20
+    assert result['curve'][-1]['violations'] == ['k6 실행 실패']
+
+def test_cancel_and_max_steps():
+    run_step, calls = fake_system(10000)
+    result = CapacitySearch(run_step, should_stop=lambda: True).run()
+    assert result['stop_reason'] == 'cancelled' and calls == []
+    result = CapacitySearch(run_step, start_vus=1, max_vus=10000, max_steps=3).run()
+    assert result['stop_reason'] == 'max_steps_reached'
+    assert result['knee_vus'] == 4
@@ -0,0 +1,165 @@
+import os
+import sys
+import textwrap
+import time
+import pytest
+from engines.container_pool import ContainerPool, CONTAINER_PROJECT_DIR, CONTAINER_RUNS_DIR
+from engines.k6_engine import DockerK6Engine
+from engines.workspace import PROJECT_ROOT, RUN_WORKSPACE_ROOT
+
+# docker 호환 CLI 대역: 컨테이너 상태를 FAKE_CLI_STATE 디렉토리의 파일로 관리
+# exec는 k6 run처럼 --out json= 경로(컨테이너 경로 → 호스트 경로)에 NDJSON 결과를 기록
+FAKE_CLI = textwrap.dedent('''\
+    import json, os, sys
+    state = os.environ['FAKE_CLI_STATE']
+    args = sys.argv[1:]
+    with open(os.path.join(state, 'calls.log'), 'a') as f:
+        f.write(' '.join(args) + '\\n')
+    command = args[0]
+    if command == 'run':
+        if os.path.exists(os.path.join(state, 'fail_run')):
+            sys.stderr.write('image not found')
+            sys.exit(125)
+        name = args[args.index('--name') + 1]
+        with open(os.path.join(state, name), 'w') as f:
+            f.write('true')
+        print('id-' + name)
+    elif command == 'inspect':
+        path = os.path.join(state, args[-1])
+        if not os.path.exists(path):
+            sys.exit(1)
+        print(open(path).read())
+    elif command == 'rm':
+        path = os.path.join(state, args[-1])
+        if os.path.exists(path):
+            os.remove(path)
+    elif command == 'exec':
+        out = next(a[len('json='):] for a in args if a.startswith('json='))
+        host = out.replace('/runs', os.environ['FAKE_RUNS_ROOT'], 1)
+        with open(host, 'w') as f:
+            for i in range(4):
+                f.write(json.dumps({'type': 'Point', 'metric': 'http_req_duration',
+                                    'data': {'time': '2025-01-01T00:00:0%d.000000000Z' % i, 'value': 100.0 + i}}) + '\\n')
+                f.write(json.dumps({'type': 'Point', 'metric': 'http_reqs',
+                                    'data': {'time': '2025-01-01T00:00:0%d.000000000Z' % i, 'value': 1}}) + '\\n')
+        print('fake k6 ' + ' '.join(args))
+''')
+
+@pytest.fixture
+def fake_cli(tmp_path, monkeypatch):
+    state = tmp_path / 'state'
+    state.mkdir()
+    script = tmp_path / 'fake_cli.py'
+    script.write_text(FAKE_CLI)
+    cli = tmp_path / 'docker'
+    cli.write_text(f'#!/bin/sh\nexec {sys.executable} {script} "$@"\n')
+    cli.chmod(0o755)
+    monkeypatch.setenv('FAKE_CLI_STATE', str(state))
+    monkeypatch.setenv('FAKE_RUNS_ROOT', RUN_WORKSPACE_ROOT)
+    return str(cli), state
+
+def live_containers(state):
+    return sorted(p.name for p in state.iterdir() if p.name.startswith('k6-pool-'))
+
+def wait_for(predicate, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+def make_pool(cli, tmp_path, **kwargs):
+    kwargs.setdefault('size', 2)
+    return ContainerPool('grafana/k6:test', PROJECT_ROOT, str(tmp_path / 'runs'), cli=cli, **kwargs)
+
+def test_warm_starts_pool_size_containers(fake_cli, tmp_path):
+    cli, state = fake_cli
+    pool = make_pool(cli, tmp_path)
+    pool.warm()
+    pool.warm()  # 두 번째 호출은 다시 시작하지 않음
+    assert len(live_containers(state)) == 2
+    assert pool.stats()['started'] == 2
+    assert pool.stats()['idle'] == 2
+    pool.shutdown()
+    assert live_containers(state) == []
+
+def test_released_container_is_reused(fake_cli, tmp_path):
+    cli, state = fake_cli
+    pool = make_pool(cli, tmp_path, size=1)
+    first = pool.acquire(timeout=5)
+    pool.release(first)
+    second = pool.acquire(timeout=5)
+    assert second is first
+    assert second.runs == 1
+    assert pool.stats()['started'] == 1
+    pool.release(second)
+    pool.shutdown()
+
+def test_container_is_recycled_after_max_runs(fake_cli, tmp_path):
+    cli, state = fake_cli
+    pool = make_pool(cli, tmp_path, size=1, max_runs=1)
+    container = pool.acquire(timeout=5)
+    pool.release(container)
+    assert wait_for(lambda: container.name not in live_containers(state) and pool.stats()['idle'] == 1)
+    replacement = pool.acquire(timeout=5)
+    assert replacement.name != container.name
+    assert pool.stats()['recycled'] == 1
+    pool.release(replacement)
+    pool.shutdown()
+
+def test_broken_container_is_replaced(fake_cli, tmp_path):
+    cli, state = fake_cli
+    pool = make_pool(cli, tmp_path, size=1)
+    container = pool.acquire(timeout=5)
+    pool.release(container, broken=True)
+    assert wait_for(lambda: container.name not in live_containers(state))
+    assert pool.acquire(timeout=5).name != container.name
+    pool.shutdown()
+
+def test_unhealthy_container_is_skipped(fake_cli, tmp_path):
+    cli, state = fake_cli
+    pool = make_pool(cli, tmp_path, size=2, health_check_seconds=0)
+    pool.warm()
+    stopped = live_containers(state)[0]
+    (state / stopped).write_text('false')
+    seen = {pool.acquire(timeout=5).name, pool.acquire(timeout=5).name}
+    assert stopped not in seen
+    assert pool.stats()['unhealthy'] == 1
+    pool.shutdown()
+
+def test_acquire_fails_when_no_container_can_start(fake_cli, tmp_path):
+    cli, state = fake_cli
+    (state / 'fail_run').write_text('')
+    pool = make_pool(cli, tmp_path)
+    with pytest.raises(RuntimeError):
+        pool.acquire(timeout=1)
+
+def test_container_path_and_exec_command(fake_cli, tmp_path):
+    cli, _ = fake_cli
+    pool = make_pool(cli, tmp_path)
+    runs = str(tmp_path / 'runs')
+    assert pool.container_path(os.path.join(runs, 'execution_1', 'result.json')) == f'{CONTAINER_RUNS_DIR}/execution_1/result.json'
+    assert pool.container_path(os.path.join(PROJECT_ROOT, 'test-scripts', 'a.js')) == f'{CONTAINER_PROJECT_DIR}/test-scripts/a.js'
+    assert pool.container_path('/somewhere/else.js') is None
+
+    container = type('Container', (), {'name': 'k6-pool-x'})()
+    cmd = pool.exec_command(container, ['k6', 'run', 'a.js'], workdir='/runs/execution_1', env_vars={'K6_VUS': '3'})
+    assert cmd == [cli, 'exec', '-w', '/runs/execution_1', '-e', 'K6_VUS=3', 'k6-pool-x', 'k6', 'run', 'a.js']
+
+def test_docker_engine_runs_in_pooled_container(fake_cli, tmp_path):
+    cli, state = fake_cli
+    script = tmp_path / 'script.js'
+    script.write_text('export default function () {}')
+    engine = DockerK6Engine()
+    engine.pool = ContainerPool('grafana/k6:test', str(tmp_path), RUN_WORKSPACE_ROOT, size=1, cli=cli)
+
+    result = engine.execute_test(str(script), {'K6_VUS': '2'}, execution_id='pool-test')
+    assert result['status'] == 'Pass', result
+    assert result['runtime'] == 'pool'
+    assert result['request_count'] == 4
+    assert result['response_time_max'] == pytest.approx(103.0, rel=0.01)
+    exec_calls = [line for line in (state / 'calls.log').read_text().splitlines() if line.startswith('exec')]
+    assert len(exec_calls) == 1 and '-e K6_VUS=2' in exec_calls[0]
+    assert engine.stats()['started'] == 1 and engine.stats()['runs'] == 1
+    engine.shutdown()
@@ -0,0 +1,56 @@
+from datetime import datetime
+import pytest
+from utils.cron import CronExpression, next_run_utc, upcoming_runs
+
+def test_every_fifteen_minutes():
+    cron = CronExpression('*/15 * * * *')
+    assert cron.next_after(datetime(2025, 1, 1, 10, 7, 30)) == datetime(2025, 1, 1, 10, 15)
+    assert cron.next_after(datetime(2025, 1, 1, 10, 45)) == datetime(2025, 1, 1, 11, 0)
+
+def test_ranges_lists_and_names():
+    cron = CronExpression('0 9-17/4 * JAN,mar MON-FRI')
+    assert cron.hours == {9, 13, 17}
+    assert cron.months == {1, 3}
+    assert cron.weekdays == {1, 2, 3, 4, 5}
+    # 2025-01-04는 토요일 → 다음 평일(월요일) 09:00
+    assert cron.next_after(datetime(2025, 1, 4, 12, 0)) == datetime(2025, 1, 6, 9, 0)
+
+def test_aliases_and_sunday_as_seven():
+    assert CronExpression('@daily').next_after(datetime(2025, 1, 1, 0, 0)) == datetime(2025, 1, 2, 0, 0)
+    assert CronExpression('0 0 * * 7').weekdays == {0}
+
+def test_day_and_weekday_match_either():
+    # 일과 요일을 모두 지정하면 둘 중 하나만 맞아도 실행 (Vixie cron)
+    cron = CronExpression('0 0 13 * FRI')
+    runs = []
+    after = datetime(2025, 6, 1)
+    for _ in range(3):
+        after = cron.next_after(after)
+        runs.append(after)
+    assert runs == [datetime(2025, 6, 6), datetime(2025, 6, 13), datetime(2025, 6, 20)]
+
+@pytest.mark.parametrize('expression', ['* * * *', '60 * * * *', '*/0 * * * *', '5-1 * * * *', '0 0 * FOO *'])
+def test_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronExpression(expression)
+
+def test_impossible_date_is_rejected():
+    with pytest.raises(ValueError):
+        CronExpression('0 0 30 2 *').next_after(datetime(2025, 1, 1))
+
+def test_next_run_converts_timezone():
+    # 서울 09:00 = UTC 00:00
+    assert next_run_utc('0 9 * * *', datetime(2025, 1, 1, 1, 0), 'Asia/Seoul') == datetime(2025, 1, 2, 0, 0)
+
+def test_daylight_saving_gap_and_overlap():
+    # 2025-03-09 02:30은 뉴욕에 존재하지 않는 시각 → 한 번만 실행되고 다음 날로 넘어감
+    runs = upcoming_runs('30 2 * * *', datetime(2025, 3, 8, 12, 0), 'America/New_York', count=2)
+    assert runs[0] < runs[1]
+    assert len(set(runs)) == 2
+    # 2025-11-02 01:30은 두 번 나타나지만 한 번만 실행
+    runs = upcoming_runs('30 1 * * *', datetime(2025, 11, 1, 12, 0), 'America/New_York', count=2)
+    assert (runs[1] - runs[0]).total_seconds() >= 23 * 3600
+
+def test_unknown_timezone():
+    with pytest.raises(ValueError):
+        next_run_utc('* * * * *', datetime(2025, 1, 1), 'Mars/Olympus')
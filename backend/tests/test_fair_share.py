@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta
+import pytest
+from models import db, Project, RunQueueItem
+from utils.fair_share import _group_heads, fair_share_candidates, fair_share_order
+
+@pytest.fixture
+def enqueue(db_app):
+    """대기열 항목 추가 (실행 ID는 항목마다 새로 부여, SQLite는 외래 키를 검사하지 않음)"""
+    counter = iter(range(1, 10000))
+
+    def add(project_id=None, owner_id=None, priority=0, status='queued', claimed_at=None):
+        item = RunQueueItem(test_execution_id=next(counter), job_type='performance', project_id=project_id,
+                            owner_id=owner_id, priority=priority, status=status, claimed_at=claimed_at,
+                            available_at=datetime.utcnow() - timedelta(seconds=1))
+        db.session.add(item)
+        db.session.commit()
+        return item.id
+    return add
+
+def project(project_id, weight=1.0, max_concurrent_runs=None):
+    db.session.add(Project(id=project_id, name=f'project-{project_id}', queue_weight=weight,
+                           max_concurrent_runs=max_concurrent_runs))
+    db.session.commit()
+
+def queued():
+    return RunQueueItem.query.filter(RunQueueItem.status == 'queued')
+
+def test_higher_priority_goes_first(enqueue):
+    project(1)
+    project(2)
+    first = enqueue(1, 10)
+    urgent = enqueue(2, 20, priority=5)
+    assert fair_share_candidates(queued()) == [urgent, first]
+
+def test_project_usage_is_divided_by_weight(enqueue):
+    project(1, weight=1)
+    project(2, weight=4)
+    for _ in range(2):
+        enqueue(1, 10, status='running', claimed_at=datetime.utcnow())
+    for _ in range(4):
+        enqueue(2, 20, status='running', claimed_at=datetime.utcnow())
+    light = enqueue(1, 10)
+    heavy = enqueue(2, 20)
+    # 사용량/가중치: 프로젝트 1 = 2/1, 프로젝트 2 = 4/4
+    assert fair_share_candidates(queued()) == [heavy, light]
+
+def test_owner_with_less_usage_goes_first_within_project(enqueue):
+    project(1)
+    enqueue(1, 10, status='done', claimed_at=datetime.utcnow())
+    busy = enqueue(1, 10)
+    idle = enqueue(1, 11)
+    assert fair_share_candidates(queued()) == [idle, busy]
+
+def test_project_at_quota_is_skipped(enqueue):
+    project(1, max_concurrent_runs=1)
+    project(2)
+    enqueue(1, 10, status='running', claimed_at=datetime.utcnow())
+    blocked = enqueue(1, 10)
+    other = enqueue(2, 20)
+    assert fair_share_candidates(queued()) == [other]
+    # ETA 계산은 모든 항목을 순서에 포함
+    assert fair_share_order(queued()) == [other, blocked]
+
+def test_group_head_is_highest_priority_then_oldest(enqueue):
+    enqueue(1, 10)
+    enqueue(1, 10)
+    head = enqueue(1, 10, priority=3)
+    enqueue(1, 10, priority=3)
+    other = enqueue(2, 20)
+    heads = _group_heads(queued())
+    assert heads[(1, 10)][0] == (head, 3)
+    assert heads[(2, 20)][0] == (other, 0)
+
+def test_order_alternates_between_projects(enqueue):
+    project(1)
+    project(2)
+    a = [enqueue(1, 10) for _ in range(3)]
+    b = [enqueue(2, 20) for _ in range(3)]
+    assert fair_share_order(queued()) == [a[0], b[0], a[1], b[1], a[2], b[2]]
+    assert fair_share_order(queued(), until=b[1]) == [a[0], b[0], a[1], b[1]]
+    assert fair_share_order(queued(), limit=2) == [a[0], b[0]]
+
+def test_claim_next_run_follows_fair_share(enqueue):
+    from utils.run_queue import claim_next_run
+    project(1)
+    project(2)
+    a = [enqueue(1, 10) for _ in range(2)]
+    b = enqueue(2, 20)
+    first = claim_next_run('worker-1')
+    second = claim_next_run('worker-2')
+    assert (first.id, second.id) == (a[0], b)
+    assert first.status == 'running' and first.worker_id == 'worker-1' and first.attempts == 1
+    assert claim_next_run('worker-3').id == a[1]
+    assert claim_next_run('worker-4') is None
@@ -0,0 +1,94 @@
+import json
+import pytest
+from engines.http_engine import (
+    HttpLoadEngine, check_thresholds, interpolate_stages, normalize_scenario, scenario_duration, substitute_env
+)
+
+@pytest.fixture
+def write_spec(tmp_path):
+    def write(spec, name='api.http.json'):
+        path = tmp_path / name
+        path.write_text(json.dumps(spec))
+        return str(path)
+    return write
+
+def test_substitute_env_replaces_nested_values():
+    spec = {'base_url': '${BASE_URL}', 'requests': [{'path': '/users/${USER_ID}'}]}
+    assert substitute_env(spec, {'BASE_URL': 'http://h', 'USER_ID': 7}) == {
+        'base_url': 'http://h', 'requests': [{'path': '/users/7'}]
+    }
+
+def test_scenario_helpers():
+    assert interpolate_stages([{'duration': '10s', 'target': 10}], 0, 5) == pytest.approx(5)
+    assert interpolate_stages([{'duration': '10s', 'target': 10}], 0, 20) == 10
+    assert scenario_duration({'stages': [{'duration': '1m', 'target': 5}, {'duration': '30s', 'target': 0}]}) == 90
+    # K6_VUS/K6_DURATION은 k6와 같이 고정 VU 실행으로 덮어씀
+    scenario = normalize_scenario({'executor': 'constant-arrival-rate', 'rate': '5'}, {'K6_VUS': '3', 'K6_DURATION': '2s'})
+    assert scenario['executor'] == 'constant-vus' and scenario['vus'] == 3.0
+
+def test_check_thresholds():
+    result = {'error_rate': 0.2, 'response_time_p95': 120.0, 'throughput': 5.0}
+    assert check_thresholds({'error_rate': 0.5, 'p95': 200}, result) == []
+    violations = check_thresholds({'error_rate': 0.1, 'p95': 100, 'throughput': 10, 'p42': 1}, result)
+    assert len(violations) == 4
+
+def test_constant_vus_run_against_local_server(http_server, write_spec):
+    script = write_spec({
+        'base_url': '${BASE_URL}',
+        'requests': [{'path': '/', 'name': 'root'}, {'path': '/echo', 'method': 'POST', 'json': {'a': 1}}],
+        'scenario': {'executor': 'constant-vus', 'vus': 2, 'duration': '1s'}
+    })
+    result = HttpLoadEngine().execute_test(script, {'BASE_URL': http_server.url}, execution_id='http-vus')
+
+    assert result['status'] == 'Pass', result.get('error')
+    assert result['runtime'] == 'asyncio'
+    assert result['request_count'] > 0
+    assert result['error_rate'] == 0.0
+    assert set(result['endpoints']) == {'root', 'POST /echo'}
+    assert result['endpoints']['root']['statuses'] == {'200': result['endpoints']['root']['count']}
+    # 연결은 VU마다 재사용 (요청마다 새로 열지 않음)
+    assert result['connections_opened'] <= 2 * 2
+    posted = [body for method, path, _, body in http_server.requests if method == 'POST']
+    assert posted and json.loads(posted[0]) == {'a': 1}
+
+def test_failed_requests_break_error_rate_threshold(http_server, write_spec):
+    script = write_spec({
+        'base_url': http_server.url,
+        'requests': [{'path': '/'}, {'path': '/err'}],
+        'scenario': {'executor': 'constant-vus', 'vus': 1, 'duration': '1s'},
+        'thresholds': {'error_rate': 0.1}
+    })
+    result = HttpLoadEngine().execute_test(script, execution_id='http-err')
+
+    assert result['status'] == 'Fail'
+    assert result['error_rate'] == pytest.approx(0.5, abs=0.1)
+    assert 'error_rate' in result['error']
+
+def test_constant_arrival_rate_paces_requests(http_server, write_spec):
+    script = write_spec({
+        'base_url': http_server.url,
+        'requests': [{'path': '/'}],
+        'scenario': {'executor': 'constant-arrival-rate', 'rate': 20, 'timeUnit': '1s', 'duration': '1s', 'maxVUs': 5}
+    })
+    result = HttpLoadEngine().execute_test(script, execution_id='http-rate')
+
+    assert result['status'] == 'Pass'
+    assert 15 <= result['request_count'] <= 25
+    assert result['dropped_iterations'] == 0
+
+def test_load_profile_scenario_overrides_spec(http_server, write_spec):
+    script = write_spec({
+        'base_url': http_server.url,
+        'requests': [{'path': '/'}],
+        'scenario': {'executor': 'constant-vus', 'vus': 50, 'duration': '1m'}
+    })
+    options = {'name': 'ramp', 'scenario': {'executor': 'constant-vus', 'vus': 1, 'duration': '500ms'}}
+    result = HttpLoadEngine().execute_test(script, execution_id='http-profile', options=options)
+
+    assert result['status'] == 'Pass'
+    assert result['execution_time'] < 10
+
+def test_invalid_spec_is_reported_as_error(write_spec):
+    result = HttpLoadEngine().execute_test(write_spec({'base_url': 'http://127.0.0.1:1', 'requests': []}))
+    assert result['status'] == 'Error'
+    assert 'requests' in result['error']
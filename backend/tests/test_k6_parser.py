@@ -0,0 +1,108 @@
+import json
+import random
+import pytest
+from engines.histogram import LatencyHistogram
+from engines.k6_parser import K6ResultParser, parse_k6_json, parse_k6_time, parse_k6_timeline
+
+def point(metric, value, second, tags=None):
+    return json.dumps({'type': 'Point', 'metric': metric,
+                       'data': {'time': f'2025-01-01T00:00:{second:02d}.123456789Z', 'value': value, 'tags': tags or {}}})
+
+def metric(name, metric_type):
+    return json.dumps({'type': 'Metric', 'metric': name, 'data': {'name': name, 'type': metric_type}})
+
+def write_ndjson(path, lines):
+    path.write_text('\n'.join(lines) + '\n')
+    return str(path)
+
+def test_histogram_percentiles_stay_within_precision():
+    rng = random.Random(42)
+    values = sorted(rng.uniform(1, 1000) for _ in range(10000))
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    for percent in (50, 90, 95, 99):
+        exact = values[int(len(values) * percent / 100) - 1]
+        assert histogram.percentile(percent) == pytest.approx(exact, rel=0.02)
+    assert histogram.min == values[0] and histogram.max == values[-1]
+    assert histogram.mean == pytest.approx(sum(values) / len(values))
+
+def test_histogram_merge_equals_single_histogram():
+    rng = random.Random(7)
+    values = [rng.expovariate(1 / 50) for _ in range(5000)]
+    whole, left, right = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for index, value in enumerate(values):
+        whole.record(value)
+        (left if index % 2 else right).record(value)
+    merged = LatencyHistogram.from_dict(left.to_dict()).merge(right)
+    assert merged.count == whole.count
+    assert merged.summary() == pytest.approx(whole.summary())
+
+def test_histogram_rejects_different_precision():
+    other = LatencyHistogram(precision=0.05)
+    other.record(1.0)
+    with pytest.raises(ValueError):
+        LatencyHistogram().merge(other)
+
+def test_empty_histogram_summary():
+    assert LatencyHistogram().summary() == {'count': 0, 'mean': 0.0, 'min': 0.0, 'max': 0.0,
+                                           'p50': 0.0, 'p90': 0.0, 'p95': 0.0, 'p99': 0.0}
+
+def test_parse_k6_time_truncates_nanoseconds():
+    parsed = parse_k6_time('2025-08-06T09:08:49.252246016+09:00')
+    assert parsed.microsecond == 252246
+    assert parsed.utcoffset().total_seconds() == 9 * 3600
+    assert parse_k6_time('2025-01-01T00:00:00Z').utcoffset().total_seconds() == 0
+
+def test_parser_summarizes_http_metrics(tmp_path):
+    lines = [metric('http_req_duration', 'trend'), metric('http_req_failed', 'rate'),
+             metric('http_reqs', 'counter'), metric('vus', 'gauge')]
+    for second in range(10):
+        lines.append(point('http_req_duration', 100.0 + second * 10, second))
+        lines.append(point('http_req_failed', 1 if second == 9 else 0, second))
+        lines.append(point('http_reqs', 1, second))
+        lines.append(point('vus', 5, second))
+    lines.append(point('custom_metric', 1, 0))  # 추적하지 않는 메트릭
+    lines.append('{"type": "Point", "metric": "http_reqs", "da')  # 잘린 마지막 줄
+    summary = parse_k6_json(write_ndjson(tmp_path / 'result.json', lines))
+
+    assert summary['request_count'] == 10
+    assert summary['duration_seconds'] == pytest.approx(9.0)
+    assert summary['throughput'] == pytest.approx(10 / 9.0)
+    assert summary['error_rate'] == pytest.approx(0.1)
+    assert summary['response_time_min'] == 100.0
+    assert summary['response_time_max'] == 190.0
+    assert summary['response_time_p50'] == pytest.approx(140.0, rel=0.02)
+    assert summary['metrics']['vus']['value'] == 5
+    assert 'custom_metric' not in summary['metrics']
+
+def test_browser_metrics_are_used_without_http_metrics(tmp_path):
+    lines = [point('browser_http_req_duration', 200.0, 0), point('browser_http_req_duration', 400.0, 2),
+             point('browser_http_req_failed', 0, 0), point('browser_http_req_failed', 1, 2)]
+    summary = parse_k6_json(write_ndjson(tmp_path / 'result.json', lines))
+    assert summary['request_count'] == 2
+    assert summary['response_time_max'] == 400.0
+    assert summary['error_rate'] == 0.5
+
+def test_shard_merge_matches_single_file(tmp_path):
+    lines = [point('http_req_duration', float(v), v % 60) for v in range(1, 201)]
+    whole = K6ResultParser().parse_file(write_ndjson(tmp_path / 'all.json', lines))
+    first = K6ResultParser().parse_file(write_ndjson(tmp_path / 'a.json', lines[::2]))
+    second = K6ResultParser().parse_file(write_ndjson(tmp_path / 'b.json', lines[1::2]))
+    merged = K6ResultParser.from_dict(json.loads(json.dumps(first.to_dict()))).merge(second)
+    assert merged.summary() == whole.summary()
+
+def test_missing_file_returns_none(tmp_path):
+    assert parse_k6_json(str(tmp_path / 'missing.json')) is None
+
+def test_timeline_buckets_per_second(tmp_path):
+    lines = [point('http_req_duration', 100.0, 0), point('http_req_duration', 300.0, 0),
+             point('http_req_failed', 1, 0), point('vus', 3, 0), point('http_req_duration', 50.0, 2)]
+    timeline = parse_k6_timeline(write_ndjson(tmp_path / 'result.json', lines))
+    assert timeline['metric'] == 'http_req_duration'
+    assert timeline['requests'] == [2, 0, 1]
+    assert timeline['failed'] == [1, 0, 0]
+    assert timeline['vus'] == [3, 0, 0]
+    assert timeline['max'] == [300.0, None, 50.0]
+    assert timeline['ts'][1] - timeline['ts'][0] == 1.0
+    assert parse_k6_timeline([str(tmp_path / 'missing.json')]) is None
@@ -0,0 +1,101 @@
+import json
+import pytest
+from engines.durations import format_duration, parse_duration
+from utils.load_profiles import (build_k6_options, build_stages, check_limits, estimate_profile,
+                                 normalize_profile, profile_limits)
+
+@pytest.mark.parametrize('value, seconds', [('30s', 30), ('1m30s', 90), ('500ms', 0.5), ('2h', 7200), (15, 15)])
+def test_parse_duration(value, seconds):
+    assert parse_duration(value) == seconds
+
+@pytest.mark.parametrize('value', ['30', '1d', '', 'abc', -1])
+def test_parse_duration_rejects_invalid(value):
+    with pytest.raises(ValueError):
+        parse_duration(value)
+
+@pytest.mark.parametrize('seconds, text', [(90, '1m30s'), (3600, '1h'), (0, '0s'), (0.25, '250ms')])
+def test_format_duration(seconds, text):
+    assert format_duration(seconds) == text
+
+def test_normalize_fills_defaults_and_accepts_settings_object():
+    flat = normalize_profile({'type': 'ramp', 'vus': 50, 'hold': '300s'})
+    nested = normalize_profile({'type': 'ramp', 'settings': {'vus': 50, 'hold': '5m'}})
+    assert flat == nested
+    assert flat['settings']['hold'] == '5m'
+    assert flat['settings']['ramp_up'] == '30s'
+    assert flat['settings']['graceful_stop'] == '30s'
+
+@pytest.mark.parametrize('profile', [
+    'ramp',
+    {'type': 'unknown'},
+    {'type': 'ramp'},
+    {'type': 'ramp', 'vus': 10, 'peak_vus': 20},
+    {'type': 'ramp', 'vus': 0},
+    {'type': 'ramp', 'vus': 1.5},
+    {'type': 'ramp', 'vus': 10, 'hold': '5 minutes'},
+    {'type': 'spike', 'baseline_vus': 10, 'peak_vus': 10},
+    {'type': 'stress', 'start_vus': 20, 'max_vus': 10},
+    {'type': 'stress', 'start_vus': 1, 'max_vus': 1000, 'step_vus': 1},
+    {'type': 'constant_arrival_rate', 'rate': 10, 'pre_allocated_vus': 5, 'max_vus': 2},
+    {'type': 'ramp', 'vus': 10, 'iteration_seconds': 0},
+])
+def test_normalize_rejects_invalid(profile):
+    with pytest.raises(ValueError):
+        normalize_profile(profile)
+
+def test_stress_stages_step_up_to_max():
+    start, stages = build_stages(normalize_profile({'type': 'stress', 'start_vus': 10, 'max_vus': 25, 'step_vus': 10}))
+    assert start == 0
+    assert [stage['target'] for stage in stages] == [10, 10, 20, 20, 25, 25, 0]
+
+def test_spike_options():
+    options = build_k6_options(normalize_profile({'type': 'spike', 'baseline_vus': 2, 'peak_vus': 20}))
+    scenario = options['scenario']
+    assert options['name'] == 'spike'
+    assert scenario['executor'] == 'ramping-vus'
+    assert scenario['startVUs'] == 2
+    assert [stage['target'] for stage in scenario['stages']] == [2, 20, 20, 2, 2]
+
+def test_arrival_rate_options_derive_vus_from_iteration_time():
+    profile = normalize_profile({'type': 'constant_arrival_rate', 'rate': 20, 'iteration_seconds': 0.5})
+    scenario = build_k6_options(profile)['scenario']
+    assert scenario['executor'] == 'constant-arrival-rate'
+    assert (scenario['preAllocatedVUs'], scenario['maxVUs']) == (10, 20)
+
+def test_estimate_ramp_profile():
+    profile = normalize_profile({'type': 'ramp', 'vus': 10, 'ramp_up': '10s', 'hold': '20s', 'ramp_down': '10s',
+                                 'iteration_seconds': 2, 'requests_per_iteration': 3})
+    estimate = estimate_profile(profile)
+    # VU·초 면적 = 10×10/2 + 10×20 + 10×10/2 = 300
+    assert estimate['vu_seconds'] == 300
+    assert estimate['peak_vus'] == 10
+    assert estimate['duration_seconds'] == 40
+    assert estimate['max_duration_seconds'] == 70
+    assert estimate['estimated_iterations'] == 150
+    assert estimate['estimated_requests'] == 450
+    assert estimate['basis'] == 'profile'
+
+def test_estimate_arrival_rate_warns_about_dropped_iterations():
+    profile = normalize_profile({'type': 'constant_arrival_rate', 'rate': 100, 'duration': '10s', 'max_vus': 10,
+                                 'iteration_seconds': 1})
+    estimate = estimate_profile(profile)
+    assert estimate['peak_vus'] == 10
+    assert estimate['estimated_iterations'] == 100
+    assert estimate['warnings']
+
+def test_estimate_without_history_uses_defaults():
+    estimate = estimate_profile(normalize_profile({'type': 'soak', 'vus': 5}))
+    assert estimate['basis'] == 'default'
+
+def test_limits_are_overridden_per_environment(monkeypatch):
+    monkeypatch.setenv('LOAD_PROFILE_LIMITS', json.dumps({'alpha': {'max_vus': 5, 'max_duration': '1m'}}))
+    assert profile_limits('alpha')['max_vus'] == 5
+    assert profile_limits('production')['max_vus'] == profile_limits()['max_vus']
+    estimate = estimate_profile(normalize_profile({'type': 'ramp', 'vus': 10, 'hold': '2m'}))
+    violations = check_limits(estimate, 'alpha')
+    assert len(violations) == 2
+    assert check_limits(estimate, 'production') == []
+
+def test_invalid_limits_json_falls_back_to_defaults(monkeypatch):
+    monkeypatch.setenv('LOAD_PROFILE_LIMITS', '{not json')
+    assert profile_limits('alpha') == profile_limits()
@@ -0,0 +1,115 @@
+import json
+import time
+import pytest
+from engines.postman_engine import PostmanEngine, build_groups, load_postman_collection, substitute_variables
+
+def request(name, url, method='GET', tests=None, **extra):
+    item = {'name': name, 'request': {'method': method, 'url': url, **extra}}
+    if tests:
+        item['event'] = [{'listen': 'test', 'script': {'exec': tests}}]
+    return item
+
+def collection(items, variables=None, **extra):
+    return {
+        'info': {'name': 'sample', 'schema': 'https://schema.getpostman.com/json/collection/v2.1.0/collection.json'},
+        'variable': [{'key': k, 'value': v} for k, v in (variables or {}).items()],
+        'item': items,
+        **extra
+    }
+
+@pytest.fixture
+def write_collection(tmp_path):
+    def write(data, environment=None):
+        path = tmp_path / 'sample.postman_collection.json'
+        path.write_text(json.dumps(data))
+        if environment is not None:
+            (tmp_path / 'sample.postman_environment.json').write_text(json.dumps({
+                'name': 'local', 'values': [{'key': k, 'value': v, 'enabled': True} for k, v in environment.items()]
+            }))
+        return str(path)
+    return write
+
+def test_substitute_variables():
+    assert substitute_variables('{{base}}/users/{{id}}', {'base': 'http://h', 'id': 3}) == 'http://h/users/3'
+    assert substitute_variables('{{missing}}', {}) == '{{missing}}'
+
+def test_groups_follow_top_level_folders(write_collection):
+    path = write_collection(collection([
+        request('loose', 'http://h/'),
+        {'name': 'F1', 'item': [request('a', 'http://h/a'), {'name': 'nested', 'item': [request('b', 'http://h/b')]}]},
+        {'name': 'F2', 'item': [request('c', 'http://h/c')]}
+    ]))
+    groups = build_groups(load_postman_collection(path))
+    assert [(name, [item.name for item in items]) for name, items in groups] == [
+        ('sample', ['loose']), ('F1', ['a', 'b']), ('F2', ['c'])
+    ]
+    assert [item.index for _, items in groups for item in items] == [0, 1, 2, 3]
+
+def test_assertions_and_variable_chaining(http_server, write_collection):
+    path = write_collection(collection([
+        {'name': 'auth', 'item': [
+            request('login', '{{base}}/json', tests=[
+                "pm.test('status ok', function () { pm.response.to.have.status(200); });",
+                "pm.test('has token', function () { pm.expect(pm.response.json()).to.have.property('token'); });",
+                "pm.environment.set('token', pm.response.json().token);"
+            ]),
+            request('me', '{{base}}/echo', header=[{'key': 'Authorization', 'value': 'Bearer {{token}}'}], tests=[
+                "pm.test('sent token', function () { pm.expect(pm.response.text()).to.include('Bearer abc'); });"
+            ]),
+            request('broken', '{{base}}/err')
+        ]}
+    ]), environment={'base': http_server.url})
+    result = PostmanEngine().execute_test(path, execution_id='postman-chain')
+
+    assert result['status'] == 'Fail'
+    assert result['environment'] == 'local'
+    statuses = {t['name']: t['status'] for t in result['tests']}
+    assert statuses == {'login': 'Pass', 'me': 'Pass', 'broken': 'Fail'}
+    assert result['test_summary']['Pass'] == 2 and result['test_summary']['Fail'] == 1
+    login = next(t for t in result['tests'] if t['name'] == 'login')
+    assert [a['passed'] for a in login['assertions']] == [True, True]
+    assert 'broken' in result['error'] and '500' in result['error']
+
+def test_failed_assertion_marks_request_failed(http_server, write_collection):
+    path = write_collection(collection([
+        request('root', '{{base}}/', tests=[
+            "pm.test('is 201', function () { pm.response.to.have.status(201); });"
+        ])
+    ], variables={'base': http_server.url}))
+    result = PostmanEngine().execute_test(path)
+
+    assert result['status'] == 'Fail'
+    assert result['exit_code'] == 1
+    assert result['tests'][0]['assertions'][0]['passed'] is False
+
+def test_folders_run_concurrently(http_server, write_collection):
+    folders = [{'name': f'F{i}', 'item': [request('slow', '{{base}}/slow')]} for i in range(4)]
+    path = write_collection(collection(folders, variables={'base': http_server.url}))
+    started = time.time()
+    result = PostmanEngine().execute_test(path)
+    elapsed = time.time() - started
+
+    assert result['status'] == 'Pass'
+    assert len(result['tests']) == 4
+    # 폴더 4개 × 200ms를 순서대로 실행하면 0.8초 이상
+    assert elapsed < 0.7
+
+def test_run_env_vars_override_collection_variables(http_server, write_collection):
+    path = write_collection(collection([request('root', '{{base}}/')], variables={'base': 'http://127.0.0.1:1'}))
+    result = PostmanEngine().execute_test(path, {'base': http_server.url})
+    assert result['status'] == 'Pass'
+
+def test_timeout_skips_remaining_requests(http_server, write_collection):
+    path = write_collection(collection([
+        {'name': 'F', 'item': [request(f'slow{i}', '{{base}}/slow') for i in range(5)]}
+    ], variables={'base': http_server.url}))
+    result = PostmanEngine().execute_test(path, timeout=0.3)
+
+    assert result['status'] == 'Error'
+    assert result['test_summary']['Skip'] >= 3
+
+def test_invalid_collection_is_reported_as_error(tmp_path):
+    path = tmp_path / 'bad.postman_collection.json'
+    path.write_text('{not json')
+    result = PostmanEngine().execute_test(str(path))
+    assert result['status'] == 'Error'
@@ -0,0 +1,75 @@
+import pytest
+from utils.load_profiles import normalize_profile
+from utils.result_cache import build_cache_key, cache_options, collect_script_files
+
+@pytest.fixture
+def script(tmp_path):
+    """_ENV.js와 데이터 파일을 import하는 k6 스크립트"""
+    (tmp_path / 'lib').mkdir()
+    (tmp_path / '_ENV.js').write_text("export const BASE_URL = 'http://alpha';\n")
+    (tmp_path / 'lib' / 'checks.js').write_text("import { BASE_URL } from '../_ENV.js';\nexport const url = BASE_URL;\n")
+    (tmp_path / 'users.json').write_text('[]')
+    path = tmp_path / 'test.js'
+    path.write_text(
+        "import http from 'k6/http';\n"
+        "import { url } from './lib/checks';\n"
+        "import { uuidv4 } from 'https://jslib.k6.io/k6-utils/1.4.0/index.js';\n"
+        "const users = JSON.parse(open('./users.json'));\n"
+        "export default function () { http.get(url); }\n"
+    )
+    return path
+
+def key(script, **kwargs):
+    return build_cache_key('performance', 1, str(script), **kwargs)
+
+def test_collects_local_imports_recursively(script, tmp_path):
+    files = collect_script_files(str(script))
+    assert sorted(files['contents']) == sorted(str(tmp_path / name) for name in
+                                               ('test.js', '_ENV.js', 'lib/checks.js', 'users.json'))
+    assert files['remote'] == {'https://jslib.k6.io/k6-utils/1.4.0/index.js'}
+    assert files['missing'] == {}
+
+def test_missing_relative_import_is_reported(tmp_path):
+    path = tmp_path / 'test.js'
+    path.write_text("import { a } from './nowhere.js';\n")
+    assert collect_script_files(str(path))['missing'] == {str(path): ['./nowhere.js']}
+
+def test_python_relative_imports(tmp_path):
+    (tmp_path / 'k6_options.py').write_text('OPTIONS = {}\n')
+    path = tmp_path / 'test.py'
+    path.write_text('from .k6_options import OPTIONS\nimport json\n')
+    assert sorted(collect_script_files(str(path))['contents']) == sorted(
+        [str(path), str(tmp_path / 'k6_options.py')])
+
+def test_key_is_stable(script):
+    assert key(script, env_vars={'A': 1}) == key(script, env_vars={'A': '1'})
+    assert len(key(script)) == 64
+
+def test_key_changes_with_inputs(script):
+    base = key(script, env_vars={'A': '1'}, environment='alpha')
+    assert key(script, env_vars={'A': '2'}, environment='alpha') != base
+    assert key(script, env_vars={'A': '1'}, environment='production') != base
+    assert build_cache_key('performance', 2, str(script), env_vars={'A': '1'}, environment='alpha') != base
+    profile = normalize_profile({'type': 'ramp', 'vus': 10})
+    with_profile = key(script, env_vars={'A': '1'}, environment='alpha', load_profile=profile)
+    assert with_profile != base
+    assert key(script, env_vars={'A': '1'}, environment='alpha',
+               load_profile=normalize_profile({'type': 'ramp', 'vus': 20})) != with_profile
+
+def test_key_changes_when_imported_module_changes(script, tmp_path):
+    before = key(script)
+    (tmp_path / '_ENV.js').write_text("export const BASE_URL = 'http://beta';\n")
+    assert key(script) != before
+    # import하지 않는 파일은 키에 영향 없음
+    after = key(script)
+    (tmp_path / 'unrelated.js').write_text('export default 1;\n')
+    assert key(script) == after
+
+def test_no_key_without_script(tmp_path):
+    assert build_cache_key('performance', 1, None) is None
+    assert build_cache_key('performance', 1, str(tmp_path / 'missing.js')) is None
+
+def test_cache_options():
+    assert cache_options({'use_cache': True, 'cache_ttl': 30}, {}) == (True, 30)
+    assert cache_options({}, {'use_cache': 'true', 'cache_ttl': 'abc'})[0] is True
+    assert cache_options({'use_cache': True, 'cache_ttl': 0}, {}) == (False, 0)
@@ -0,0 +1,152 @@
+import os
+import textwrap
+import pytest
+from engines.k6_engine import k6_engine
+from utils import script_catalog as catalog_module
+from utils.script_catalog import ScriptCatalog
+
+# k6 inspect 대역: FAKE_K6_MODE 파일 내용에 따라 성공/구문 오류/네트워크 오류/잘못된 출력/시간 초과를 흉내내고 호출을 기록
+FAKE_K6 = textwrap.dedent('''\
+    #!/bin/sh
+    dir=$(dirname "$0")
+    echo "$@" >> "$dir/calls.log"
+    case "$(cat "$dir/mode")" in
+      syntax) echo "SyntaxError: script.js: Unexpected token (3:1)" >&2; exit 107;;
+      network) echo 'GoError: The moduleSpecifier "https://jslib.k6.io/x.js" couldn'"'"'t be retrieved: dial tcp: lookup jslib.k6.io: no such host' >&2; exit 107;;
+      junk) echo "not json";;
+      slow) sleep 3; echo '{"options":{}}';;
+      *) echo '{"options":{"vus":2,"duration":"5s"}}';;
+    esac
+''')
+
+class FakeK6:
+    def __init__(self, directory):
+        self.directory = directory
+        self.path = directory / 'k6'
+        self.path.write_text(FAKE_K6)
+        self.path.chmod(0o755)
+        self.mode('ok')
+
+    def mode(self, mode):
+        (self.directory / 'mode').write_text(mode)
+
+    @property
+    def calls(self):
+        log = self.directory / 'calls.log'
+        return len(log.read_text().splitlines()) if log.exists() else 0
+
+@pytest.fixture
+def fake_k6(tmp_path, monkeypatch):
+    directory = tmp_path / 'bin'
+    directory.mkdir()
+    fake = FakeK6(directory)
+    monkeypatch.setattr(k6_engine, 'k6_path', str(fake.path))
+    # 캐시된 항목을 매 조회마다 mtime으로 다시 확인
+    monkeypatch.setattr(catalog_module, 'SCRIPT_CATALOG_RECHECK_SECONDS', 0)
+    return fake
+
+@pytest.fixture
+def scripts(tmp_path):
+    root = tmp_path / 'scripts'
+    root.mkdir()
+    return root
+
+def test_valid_script_is_inspected_once_per_content(fake_k6, scripts):
+    (scripts / 'a.js').write_text('export default function () {}')
+    (scripts / 'copy').mkdir()
+    (scripts / 'copy' / 'a.js').write_text('export default function () {}')
+    catalog = ScriptCatalog(str(scripts))
+
+    info = catalog.lookup(str(scripts / 'a.js'))
+    assert info.valid and info.engine == 'k6'
+    assert info.metadata['options'] == {'vus': 2, 'duration': '5s'}
+    assert catalog.lookup(str(scripts / 'a.js')) is info
+    # 내용이 같으면 다른 디렉토리에 있어도 다시 검증하지 않음
+    assert catalog.lookup(str(scripts / 'copy' / 'a.js')).valid
+    assert fake_k6.calls == 1
+
+def test_syntax_error_is_rejected_and_cached(fake_k6, scripts):
+    script = scripts / 'broken.js'
+    script.write_text('export default function ( {')
+    fake_k6.mode('syntax')
+    catalog = ScriptCatalog(str(scripts))
+
+    info = catalog.lookup(str(script))
+    assert not info.valid
+    assert 'SyntaxError' in info.errors[0]
+    # 내용이 그대로면 mtime이 바뀌어도 inspect를 다시 실행하지 않음
+    os.utime(script, (1, 1))
+    assert not catalog.lookup(str(script)).valid
+    assert fake_k6.calls == 1
+
+    script.write_text('export default function () {}')
+    fake_k6.mode('ok')
+    assert catalog.lookup(str(script)).valid
+    assert fake_k6.calls == 2
+
+@pytest.mark.parametrize('mode', ['network', 'junk'])
+def test_inconclusive_inspect_is_not_rejected_or_cached(fake_k6, scripts, monkeypatch, mode):
+    script = scripts / 'remote.js'
+    script.write_text("import x from 'https://jslib.k6.io/x.js';\nexport default function () {}")
+    fake_k6.mode(mode)
+    catalog = ScriptCatalog(str(scripts))
+
+    info = catalog.lookup(str(script))
+    assert info.valid
+    assert info.inspected is False
+    assert info.metadata['inspect_error']
+    assert info.remote_imports == ['https://jslib.k6.io/x.js']
+    assert catalog.stats()['validated_contents'] == 0
+
+    # 재검증 간격 안에서는 그대로, 간격이 지나면 파일이 그대로여도 다시 검증
+    assert catalog.lookup(str(script)) is info
+    assert fake_k6.calls == 1
+    monkeypatch.setattr(catalog_module, 'SCRIPT_INSPECT_RETRY_SECONDS', 0)
+    fake_k6.mode('ok')
+    info = catalog.lookup(str(script))
+    assert info.inspected and info.valid
+    assert fake_k6.calls == 2
+    assert catalog.stats()['validated_contents'] == 1
+
+def test_inspect_timeout_is_not_rejected(fake_k6, scripts, monkeypatch):
+    script = scripts / 'slow.js'
+    script.write_text('export default function () {}')
+    fake_k6.mode('slow')
+    monkeypatch.setattr(catalog_module, 'SCRIPT_INSPECT_TIMEOUT', 0.5)
+    info = ScriptCatalog(str(scripts)).lookup(str(script))
+    assert info.valid and info.inspected is False
+
+def test_missing_k6_binary_skips_validation(fake_k6, scripts, monkeypatch):
+    script = scripts / 'a.js'
+    script.write_text('export default function () {}')
+    monkeypatch.setattr(k6_engine, 'k6_path', str(scripts / 'no-such-k6'))
+    info = ScriptCatalog(str(scripts)).lookup(str(script))
+    assert info.valid and info.inspected is False
+
+def test_local_imports_are_tracked(fake_k6, scripts):
+    (scripts / 'lib').mkdir()
+    (scripts / 'lib' / 'env.js').write_text('export const BASE = "http://h";')
+    script = scripts / 'main.js'
+    script.write_text("import { BASE } from './lib/env.js';\nimport { x } from './missing.js';\nexport default function () {}")
+    catalog = ScriptCatalog(str(scripts))
+
+    info = catalog.lookup(str(script))
+    assert info.to_dict()['imports'] == ['lib/env.js']
+    assert not info.valid
+    assert any('missing.js' in error for error in info.errors)
+
+    # import한 모듈이 바뀌면 내용 해시가 달라짐
+    before = info.content_hash
+    (scripts / 'lib' / 'env.js').write_text('export const BASE = "http://other";')
+    assert catalog.lookup(str(script)).content_hash != before
+
+def test_python_syntax_errors_are_reported(scripts):
+    script = scripts / 'test_login.py'
+    script.write_text('def test():\n    return (\n')
+    info = ScriptCatalog(str(scripts)).lookup(str(script))
+    assert info.engine == 'selenium'
+    assert not info.valid and '구문 오류' in info.errors[0]
+
+def test_missing_script_is_rejected(scripts):
+    info = ScriptCatalog(str(scripts)).lookup(str(scripts / 'nope.js'))
+    assert not info.valid
@@ -0,0 +1,132 @@
+import os
+
+# 기본 임계값 (test-scripts/performance/python/k6_options.py의 thresholds와 동일)
+#   http_req_duration p(95)<500, http_req_failed rate<0.1
+DEFAULT_P95_MS = 500.0
+DEFAULT_MAX_ERROR_RATE = 0.1
+# 단계별 부하 유지 시간 (짧은 단계 여러 번으로 한계점을 찾음)
+DEFAULT_STEP_DURATION = os.environ.get('CAPACITY_STEP_DURATION', '20s')
+DEFAULT_MAX_STEPS = int(os.environ.get('CAPACITY_MAX_STEPS', '12'))
+
+# 용량 탐색 (최대 지속 가능 VU 수)
+# 1) 구간 설정: start_vus부터 growth 배씩 늘리며 임계값을 처음 넘는 VU 수를 찾음
+# 2) 이분 탐색: 통과한 최대 VU(lo)와 실패한 최소 VU(hi) 사이를 좁혀 한계점(knee)을 찾음
+# VU를 늘려도 처리량이 거의 늘지 않으면(포화) 임계값을 넘기 전이라도 조기 종료
+class CapacitySearch:
+    def __init__(self, run_step, start_vus=10, max_vus=1000, growth=2.0, p95_ms=None, max_error_rate=None,
+                 resolution=0.1, saturation_gain=0.1, max_steps=None, should_stop=None):
+        """run_step(vus, phase) → {'status', 'response_time_p95', 'error_rate', 'throughput', ...}"""
+        self.run_step = run_step
+        self.start_vus = max(1, int(start_vus))
+        self.max_vus = max(self.start_vus, int(max_vus))
+        self.growth = max(1.1, float(growth))
+        self.p95_ms = float(p95_ms if p95_ms is not None else DEFAULT_P95_MS)
+        self.max_error_rate = float(max_error_rate if max_error_rate is not None else DEFAULT_MAX_ERROR_RATE)
+        # 이분 탐색 종료 폭 (lo 대비 비율, 최소 1 VU)
+        self.resolution = max(0.0, float(resolution))
+        # 구간 설정 단계에서 VU 증가 대비 처리량 증가율이 이 값 미만이면 포화로 판단
+        self.saturation_gain = float(saturation_gain)
+        self.max_steps = int(max_steps or DEFAULT_MAX_STEPS)
+        self.should_stop = should_stop or (lambda: False)
+        self.steps = []
+
+    def evaluate(self, result):
+        """단계 결과의 임계값 판정 (위반 항목 목록, 메트릭이 없으면 None)"""
+        p95 = result.get('response_time_p95')
+        error_rate = result.get('error_rate')
+        if result.get('status') in ('Error', 'Cancelled') or p95 is None:
+            return None
+        violations = []
+        if p95 >= self.p95_ms:
+            violations.append(f'p95 {p95:.1f}ms >= {self.p95_ms:.0f}ms')
+        if (error_rate or 0.0) >= self.max_error_rate:
+            violations.append(f'error_rate {error_rate:.3f} >= {self.max_error_rate}')
+        return violations
+
+    def _step(self, vus, phase):
+        result = self.run_step(vus, phase) or {}
+        violations = self.evaluate(result)
+        step = {
+            'vus': vus,
+            'phase': phase,
+            'execution_id': result.get('execution_id'),
+            'status': result.get('status'),
+            'response_time_p95': result.get('response_time_p95'),
+            'response_time_avg': result.get('response_time_avg'),
+            'error_rate': result.get('error_rate'),
+            'throughput': result.get('throughput'),
+            'request_count': result.get('request_count'),
+            'passed': violations == [],
+            'violations': violations if violations is not None else [result.get('error') or '메트릭 없음']
+        }
+        self.steps.append(step)
+        return step
+
+    def _tolerance(self, lo):
+        return max(1, int(lo * self.resolution))
+
+    def run(self):
+        lo, hi = None, None
+        stop_reason = None
+        vus = self.start_vus
+        previous = None
+
+        # 1) 구간 설정
+        while True:
+            if self.should_stop():
+                stop_reason = 'cancelled'
+                break
+            step = self._step(vus, 'bracket')
+            if step['status'] in ('Error', 'Cancelled'):
+                stop_reason = 'cancelled' if step['status'] == 'Cancelled' else 'error'
+                break
+            if not step['passed']:
+                hi = vus
+                break
+            if previous and previous['throughput'] and step['throughput'] is not None:
+                gain = step['throughput'] / previous['throughput'] - 1
+                if gain < self.saturation_gain:
+                    # 부하를 늘려도 처리량이 늘지 않음: 직전 단계가 한계점
+                    stop_reason = 'saturated'
+                    break
+            lo, previous = vus, step
+            if vus >= self.max_vus:
+                stop_reason = 'max_vus_reached'
+                break
+            if len(self.steps) >= self.max_steps:
+                stop_reason = 'max_steps_reached'
+                break
+            vus = min(self.max_vus, max(vus + 1, int(round(vus * self.growth))))
+
+        # 2) 이분 탐색 (lo 통과, hi 실패)
+        if stop_reason is None and hi is not None and lo is not None:
+            while hi - lo > self._tolerance(lo):
+                if self.should_stop():
+                    stop_reason = 'cancelled'
+                    break
+                if len(self.steps) >= self.max_steps:
+                    stop_reason = 'max_steps_reached'
+                    break
+                mid = (lo + hi) // 2
+                step = self._step(mid, 'bisect')
+                if step['status'] in ('Error', 'Cancelled'):
+                    stop_reason = 'cancelled' if step['status'] == 'Cancelled' else 'error'
+                    break
+                if step['passed']:
+                    lo = mid
+                else:
+                    hi = mid
+        if stop_reason is None:
+            stop_reason = 'converged' if lo is not None else 'below_start_vus'
+
+        knee = next((s for s in self.steps if s['passed'] and s['vus'] == lo), None)
+        return {
+            'knee_vus': lo,
+            'knee_throughput': knee['throughput'] if knee else None,
+            'knee_p95': knee['response_time_p95'] if knee else None,
+            'first_failing_vus': hi,
+            'stop_reason': stop_reason,
+            'thresholds': {'p95_ms': self.p95_ms, 'max_error_rate': self.max_error_rate},
+            # 단계 곡선 (VU 오름차순)
+            'curve': sorted(self.steps, key=lambda s: (s['vus'], self.steps.index(s)))
+        }
@@ -0,0 +1,127 @@
+from datetime import timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# 5필드 cron 표현식 (분 시 일 월 요일)
+# *, 목록(1,15), 범위(1-5), 간격(*/15, 10-40/10), 월/요일 이름(JAN, MON)과 @daily 등의 별칭 지원
+# 일과 요일을 모두 지정하면 둘 중 하나만 맞아도 실행 (Vixie cron과 동일)
+
+CRON_ALIASES = {
+    '@yearly': '0 0 1 1 *',
+    '@annually': '0 0 1 1 *',
+    '@monthly': '0 0 1 * *',
+    '@weekly': '0 0 * * 0',
+    '@daily': '0 0 * * *',
+    '@midnight': '0 0 * * *',
+    '@hourly': '0 * * * *'
+}
+MONTH_NAMES = {name: i + 1 for i, name in enumerate(
+    ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
+)}
+WEEKDAY_NAMES = {name: i for i, name in enumerate(['SUN', 'MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT'])}
+# (이름, 최소값, 최대값, 이름 표)
+CRON_FIELDS = (
+    ('minute', 0, 59, {}),
+    ('hour', 0, 23, {}),
+    ('day', 1, 31, {}),
+    ('month', 1, 12, MONTH_NAMES),
+    ('weekday', 0, 7, WEEKDAY_NAMES)
+)
+# 다음 실행 시각 탐색 상한 (존재하지 않는 날짜(2월 30일 등)만 지정한 표현식 방지)
+MAX_SEARCH_DAYS = 366 * 5
+
+def _parse_value(text, names, field):
+    value = names.get(text.upper()) if names else None
+    if value is None:
+        try:
+            value = int(text)
+        except ValueError:
+            raise ValueError(f'cron {field} 값이 올바르지 않습니다: {text}')
+    return value
+
+def _parse_field(text, field, low, high, names):
+    values = set()
+    for part in text.split(','):
+        step = 1
+        if '/' in part:
+            part, step_text = part.split('/', 1)
+            step = int(step_text) if step_text.isdigit() else 0
+            if step <= 0:
+                raise ValueError(f'cron {field} 간격이 올바르지 않습니다: {step_text}')
+        if part == '*':
+            start, end = low, high
+        elif '-' in part:
+            start_text, end_text = part.split('-', 1)
+            start, end = _parse_value(start_text, names, field), _parse_value(end_text, names, field)
+        else:
+            start = _parse_value(part, names, field)
+            # 10/5 처럼 시작값에 간격만 지정하면 최대값까지
+            end = high if step > 1 else start
+        if not (low <= start <= high and low <= end <= high) or start > end:
+            raise ValueError(f'cron {field} 범위를 벗어났습니다: {part} ({low}-{high})')
+        values.update(range(start, end + 1, step))
+    return values
+
+class CronExpression:
+    def __init__(self, expression):
+        self.expression = (expression or '').strip()
+        fields = CRON_ALIASES.get(self.expression.lower(), self.expression).split()
+        if len(fields) != 5:
+            raise ValueError(f'cron 표현식은 5개 필드(분 시 일 월 요일)여야 합니다: {self.expression}')
+        parsed = [_parse_field(text, *spec) for text, spec in zip(fields, CRON_FIELDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        self.weekdays = {d % 7 for d in weekdays}  # 7도 일요일
+        self.day_restricted = fields[2] != '*'
+        self.weekday_restricted = fields[4] != '*'
+
+    def _day_matches(self, dt):
+        day_ok = dt.day in self.days
+        weekday_ok = (dt.isoweekday() % 7) in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, after):
+        """after(벽시계 시각, 시간대 정보 없음) 이후 첫 실행 시각 (분 단위)"""
+        dt = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt + timedelta(days=MAX_SEARCH_DAYS)
+        while dt < limit:
+            if dt.month not in self.months:
+                dt = (dt.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(dt):
+                dt = dt.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if dt.hour not in self.hours:
+                dt = dt.replace(minute=0) + timedelta(hours=1)
+                continue
+            if dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+                continue
+            return dt
+        raise ValueError(f'cron 표현식과 일치하는 시각이 없습니다: {self.expression}')
+
+def load_timezone(name):
+    try:
+        return ZoneInfo(name or 'UTC')
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f'알 수 없는 시간대입니다: {name}')
+
+def next_run_utc(expression, after_utc, tz_name='UTC'):
+    """after_utc(UTC, 시간대 정보 없음) 이후 tz_name 벽시계 기준 다음 실행 시각을 UTC(시간대 정보 없음)로 반환"""
+    tz = load_timezone(tz_name)
+    local = after_utc.replace(tzinfo=timezone.utc).astimezone(tz).replace(tzinfo=None)
+    cron = expression if isinstance(expression, CronExpression) else CronExpression(expression)
+    while True:
+        candidate = cron.next_after(local)
+        utc = candidate.replace(tzinfo=tz).astimezone(timezone.utc).replace(tzinfo=None)
+        # 일광 절약 시간 전환으로 되돌아간 시각은 건너뜀
+        if utc > after_utc:
+            return utc
+        local = candidate
+
+def upcoming_runs(expression, after_utc, tz_name='UTC', count=5):
+    runs = []
+    for _ in range(count):
+        after_utc = next_run_utc(expression, after_utc, tz_name)
+        runs.append(after_utc)
+    return runs
@@ -0,0 +1,240 @@
+import heapq
+import json
+import os
+from datetime import datetime, timedelta
+from sqlalchemy import or_, and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from models import db, TestDurationEstimate, TestExecution, RunQueueItem
+from utils.fair_share import fair_share_order
+
+# 지수 가중치 (클수록 최근 결과를 크게 반영)
+DURATION_ALPHA = float(os.environ.get('DURATION_MODEL_ALPHA', '0.3'))
+# 이 수보다 표본이 적으면 단순 평균으로 초기값을 잡음
+WARMUP_SAMPLES = 3
+# 이력이 전혀 없는 테스트의 예상 시간 (초)
+DEFAULT_EXPECTED_SECONDS = float(os.environ.get('DURATION_DEFAULT_SECONDS', '60'))
+# 대기 중 실행의 ETA 계산 시 앞선 대기 항목을 최대 몇 건까지 반영할지
+ETA_QUEUE_LOOKAHEAD = int(os.environ.get('ETA_QUEUE_LOOKAHEAD', '500'))
+
+# 실행 유형 → 테스트 ID 컬럼
+TEST_ID_FIELDS = {
+    'performance': 'performance_test_id',
+    'automation': 'automation_test_id',
+    'testcase': 'test_case_id'
+}
+
+# 예측에 반영할 결과 (오류/취소/시간 초과는 실제 소요 시간을 대표하지 않음)
+MODELED_RESULTS = ('Pass', 'Fail')
+
+def duration_key(execution):
+    """실행 기록의 예측 모델 키 (test_type, test_id, environment), 단건 테스트 실행이 아니면 None"""
+    field = TEST_ID_FIELDS.get(execution.test_type)
+    test_id = getattr(execution, field) if field else None
+    if test_id is None:
+        return None
+    return execution.test_type, test_id, execution.environment or ''
+
+def update_estimate(estimate, seconds, alpha=None):
+    """새 소요 시간 한 건으로 추정치 증분 갱신 (이력 재조회 없음)
+
+    중앙값은 편차 폭으로 잘라낸(clamp) 오차만큼만 이동하므로 한 번의 이상치에 크게 흔들리지 않고,
+    지수 가중으로 최근 결과를 더 반영하는 가중 중앙값 근사치가 됨
+    """
+    alpha = alpha or DURATION_ALPHA
+    samples = estimate.samples or 0
+    if samples == 0:
+        estimate.median = estimate.mean = seconds
+        estimate.deviation = 0.0
+    elif samples < WARMUP_SAMPLES:
+        error = seconds - estimate.median
+        estimate.median += error / (samples + 1)
+        estimate.mean += (seconds - estimate.mean) / (samples + 1)
+        estimate.deviation += (abs(error) - estimate.deviation) / (samples + 1)
+    else:
+        error = seconds - estimate.median
+        bound = max(estimate.deviation, 0.1 * abs(estimate.median), 0.01)
+        estimate.median += alpha * max(-bound, min(bound, error))
+        estimate.mean += alpha * (seconds - estimate.mean)
+        estimate.deviation += alpha * (abs(error) - estimate.deviation)
+    estimate.samples = samples + 1
+    estimate.last_duration = seconds
+    estimate.updated_at = datetime.utcnow()
+    return estimate
+
+def record_duration(test_type, test_id, environment, seconds, result=None):
+    """결과 한 건을 예측 모델에 반영하고 커밋 (결과 저장 커밋 이후 호출)
+
+    같은 테스트가 동시에 끝나는 경우를 위해 행 잠금으로 갱신하고, 최초 생성 충돌 시 한 번 재시도
+    """
+    if test_id is None or seconds is None or (result is not None and result not in MODELED_RESULTS):
+        return None
+    environment = environment or ''
+    for attempt in range(2):
+        try:
+            estimate = TestDurationEstimate.query.filter_by(
+                test_type=test_type, test_id=test_id, environment=environment
+            ).with_for_update().first()
+            if estimate is None:
+                estimate = TestDurationEstimate(test_type=test_type, test_id=test_id, environment=environment, samples=0)
+                db.session.add(estimate)
+            update_estimate(estimate, float(seconds))
+            db.session.commit()
+            return estimate
+        except IntegrityError:
+            db.session.rollback()
+            if attempt:
+                raise
+    return None
+
+def record_execution_duration(execution, result):
+    """실행 결과의 소요 시간을 모델에 반영 (실패해도 실행 결과 저장에는 영향 없음)"""
+    key = duration_key(execution)
+    if key is None:
+        return None
+    try:
+        return record_duration(*key, result.get('execution_time'), result=result.get('status'))
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️ 실행 시간 모델 갱신 실패 (execution_id={execution.id}): {e}")
+        return None
+
+def load_estimates(keys):
+    """(test_type, test_id, environment) 키 목록의 추정치 일괄 조회
+
+    같은 환경의 추정치가 없으면 같은 테스트의 다른 환경 추정치(표본이 가장 많은 것)를 사용
+    """
+    keys = {k for k in keys if k}
+    if not keys:
+        return {}
+    conditions = {}
+    for test_type, test_id, _ in keys:
+        conditions.setdefault(test_type, set()).add(test_id)
+    rows = TestDurationEstimate.query.filter(or_(*[
+        and_(TestDurationEstimate.test_type == test_type, TestDurationEstimate.test_id.in_(test_ids))
+        for test_type, test_ids in conditions.items()
+    ])).all()
+    exact = {(r.test_type, r.test_id, r.environment): r for r in rows}
+    any_env = {}
+    for r in rows:
+        best = any_env.get((r.test_type, r.test_id))
+        if best is None or (r.samples or 0) > (best.samples or 0):
+            any_env[(r.test_type, r.test_id)] = r
+    return {k: exact.get(k) or any_env.get(k[:2]) for k in keys}
+
+def expected_seconds(estimate, default=None):
+    if estimate is not None and estimate.median is not None:
+        return max(0.0, estimate.median)
+    return DEFAULT_EXPECTED_SECONDS if default is None else default
+
+def eta_capacity():
+    """ETA 계산에 쓰는 동시 실행 수 (RUN_QUEUE_ETA_WORKERS로 지정, 없으면 내장/독립 워커 설정)"""
+    configured = os.environ.get('RUN_QUEUE_ETA_WORKERS')
+    if configured:
+        return max(1, int(configured))
+    from utils.run_queue import embedded_worker_enabled
+    if embedded_worker_enabled():
+        from utils.execution_pool import execution_pool
+        return execution_pool.max_workers
+    return int(os.environ.get('RUN_QUEUE_WORKER_CONCURRENCY', '2'))
+
+def _remaining(execution, expected, now):
+    if execution.status == 'running' and execution.started_at:
+        return max(0.0, expected - (now - execution.started_at).total_seconds())
+    return expected
+
+def pack_workers(durations, workers):
+    """리스트 스케줄링: 순서대로 가장 먼저 비는 워커에 배정 (워커별 시작 시각, 워커 인덱스 반환)"""
+    heap = [(0.0, i) for i in range(max(1, int(workers)))]
+    heapq.heapify(heap)
+    slots = []
+    for duration in durations:
+        start, worker = heapq.heappop(heap)
+        slots.append((start, worker))
+        heapq.heappush(heap, (start + duration, worker))
+    return slots, max(t for t, _ in heap)
+
+def _eta_payload(expected, estimate, start_in, now):
+    return {
+        'expected_duration': round(expected, 3),
+        'samples': estimate.samples if estimate is not None else 0,
+        'basis': 'model' if estimate is not None else 'default',
+        'estimated_start_at': (now + timedelta(seconds=start_in)).isoformat(),
+        'estimated_completion_at': (now + timedelta(seconds=start_in + expected)).isoformat(),
+        'remaining_seconds': round(start_in + expected, 3)
+    }
+
+def execution_eta(execution, now=None):
+    """대기/실행 중인 실행의 예상 완료 시각 (완료된 실행이면 None)"""
+    now = now or datetime.utcnow()
+    if execution.status not in ('queued', 'running'):
+        return None
+    if execution.test_type == 'suite':
+        return suite_eta(execution, now)
+    key = duration_key(execution)
+    estimate = load_estimates([key]).get(key) if key else None
+    expected = expected_seconds(estimate)
+    if execution.status == 'running':
+        remaining = _remaining(execution, expected, now)
+        payload = _eta_payload(expected, estimate, 0.0, now)
+        payload.update({
+            'estimated_start_at': execution.started_at.isoformat() if execution.started_at else None,
+            'estimated_completion_at': (now + timedelta(seconds=remaining)).isoformat(),
+            'remaining_seconds': round(remaining, 3)
+        })
+        return payload
+
+    item = execution.queue_item
+    if item is None or item.status != 'queued':
+        return _eta_payload(expected, estimate, 0.0, now)
+    # 워커와 같은 공정 배분 순서로 앞서 선점될 대기 항목과 실행 중 항목의 남은 시간으로 시작 시각 추정
+    order = fair_share_order(
+        RunQueueItem.query.filter(RunQueueItem.status == 'queued'), now, until=item.id, limit=ETA_QUEUE_LOOKAHEAD + 1
+    )
+    ahead_ids = order[:-1] if order and order[-1] == item.id else order[:ETA_QUEUE_LOOKAHEAD]
+    ahead_items = {i.id: i for i in RunQueueItem.query.options(joinedload(RunQueueItem.execution)).filter(
+        RunQueueItem.id.in_(ahead_ids)
+    ).all()} if ahead_ids else {}
+    ahead = [ahead_items[i] for i in ahead_ids if i in ahead_items]
+    running = RunQueueItem.query.options(joinedload(RunQueueItem.execution)).filter(
+        RunQueueItem.status == 'running'
+    ).all()
+    estimates = load_estimates([duration_key(i.execution) for i in ahead + running])
+
+    workers = max(eta_capacity(), 1)
+    busy = sorted(
+        _remaining(i.execution, expected_seconds(estimates.get(duration_key(i.execution))), now)
+        for i in running
+    )
+    # 실행 중 항목이 워커 수보다 많으면(다른 호스트 워커) 남은 시간이 짧은 순으로 워커를 채움
+    heap = (busy + [0.0] * workers)[:max(workers, len(busy))]
+    heapq.heapify(heap)
+    for queued in ahead:
+        heapq.heappush(heap, heapq.heappop(heap) + expected_seconds(estimates.get(duration_key(queued.execution))))
+    payload = _eta_payload(expected, estimate, heap[0], now)
+    payload['queue_position'] = len(ahead) + 1
+    return payload
+
+def suite_eta(parent, now=None):
+    """스위트 실행의 예상 완료 시각 (남은 자식 실행을 계획된 워커 수로 리스트 스케줄링)"""
+    now = now or datetime.utcnow()
+    children = parent.children.filter(TestExecution.status.in_(('queued', 'running'))).order_by(TestExecution.id).all()
+    estimates = load_estimates([duration_key(c) for c in children])
+    running = [_remaining(c, expected_seconds(estimates.get(duration_key(c))), now) for c in children if c.status == 'running']
+    queued = [expected_seconds(estimates.get(duration_key(c))) for c in children if c.status == 'queued']
+    try:
+        workers = (json.loads(parent.result_summary or '{}').get('schedule') or {}).get('workers')
+    except (ValueError, AttributeError):
+        workers = None
+    workers = max(int(workers or eta_capacity()), len(running), 1)
+    heap = (sorted(running) + [0.0] * workers)[:workers]
+    heapq.heapify(heap)
+    for duration in queued:
+        heapq.heappush(heap, heapq.heappop(heap) + duration)
+    remaining = max(heap) if children else 0.0
+    return {
+        'remaining_children': len(children),
+        'estimated_completion_at': (now + timedelta(seconds=remaining)).isoformat(),
+        'remaining_seconds': round(remaining, 3),
+        'workers': workers
+    }
@@ -0,0 +1,198 @@
+import itertools
+import json
+import os
+import re
+from datetime import datetime
+from models import db, TestExecution, PerformanceMetric
+
+# 조합별 p50/p99를 가져올 지연 시간 지표 (앞쪽 우선)
+DURATION_METRICS = ('http_req_duration', 'browser_http_req_duration')
+
+# 조합 생성 방식
+# - cartesian: 모든 값 조합
+# - pairwise: 임의의 두 변수 값 쌍이 최소 한 번씩 포함되는 조합만 생성 (조합 수를 크게 줄임)
+MATRIX_MODES = ('cartesian', 'pairwise')
+# 한 번에 생성할 수 있는 최대 조합 수와 기본 동시 실행 수
+MATRIX_MAX_COMBINATIONS = int(os.environ.get('MATRIX_MAX_COMBINATIONS', '64'))
+MATRIX_DEFAULT_CONCURRENCY = int(os.environ.get('MATRIX_DEFAULT_CONCURRENCY', '2'))
+MATRIX_MAX_CONCURRENCY = int(os.environ.get('MATRIX_MAX_CONCURRENCY', '8'))
+
+ENV_NAME_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+def normalize_matrix(matrix):
+    """{변수: [값, ...]} 검증 후 값은 문자열로 변환 (형식이 잘못되면 ValueError)"""
+    if not isinstance(matrix, dict) or not matrix:
+        raise ValueError('matrix는 {변수명: [값, ...]} 형식이어야 합니다')
+    normalized = {}
+    for name, values in matrix.items():
+        if not ENV_NAME_PATTERN.match(str(name)):
+            raise ValueError(f'환경 변수 이름이 올바르지 않습니다: {name}')
+        if not isinstance(values, list):
+            values = [values]
+        values = list(dict.fromkeys(str(v) for v in values))  # 중복 제거 (순서 유지)
+        if not values:
+            raise ValueError(f'{name}의 값 목록이 비어 있습니다')
+        normalized[str(name)] = values
+    return normalized
+
+def cartesian_combinations(matrix):
+    names = list(matrix)
+    return [dict(zip(names, values)) for values in itertools.product(*(matrix[n] for n in names))]
+
+def pairwise_combinations(matrix):
+    """모든 변수 쌍의 값 조합을 덮는 조합 생성 (AETG 방식 탐욕 알고리즘, 결정적)
+
+    값이 많은 변수부터 채우며, 아직 덮지 않은 쌍을 가장 많이 덮는 값을 고름
+    """
+    names = sorted(matrix, key=lambda n: (-len(matrix[n]), list(matrix).index(n)))
+    if len(names) < 2:
+        return cartesian_combinations(matrix)
+    position = {name: i for i, name in enumerate(names)}
+
+    def pair(a, va, b, vb):
+        return ((a, va), (b, vb)) if position[a] < position[b] else ((b, vb), (a, va))
+
+    uncovered = {
+        pair(a, va, b, vb)
+        for i, a in enumerate(names) for b in names[i + 1:]
+        for va in matrix[a] for vb in matrix[b]
+    }
+    ordered_pairs = sorted(uncovered, key=lambda p: (
+        position[p[0][0]], position[p[1][0]], matrix[p[0][0]].index(p[0][1]), matrix[p[1][0]].index(p[1][1])
+    ))
+    rows = []
+    while uncovered:
+        (a, va), (b, vb) = next(p for p in ordered_pairs if p in uncovered)
+        row = {a: va, b: vb}
+        for name in names:
+            if name in row:
+                continue
+            row[name] = max(
+                matrix[name],
+                key=lambda v: (sum(pair(n, nv, name, v) in uncovered for n, nv in row.items()), -matrix[name].index(v))
+            )
+        uncovered -= {pair(x, row[x], y, row[y]) for i, x in enumerate(names) for y in names[i + 1:]}
+        rows.append({n: row[n] for n in matrix})
+    return rows
+
+def expand_matrix(matrix, mode='cartesian'):
+    """변수별 값 목록을 조합 목록으로 확장 (조합 수가 상한을 넘으면 ValueError)"""
+    if mode not in MATRIX_MODES:
+        raise ValueError(f'지원하지 않는 조합 방식입니다: {mode} (사용 가능: {", ".join(MATRIX_MODES)})')
+    matrix = normalize_matrix(matrix)
+    if mode == 'cartesian':
+        total = 1
+        for values in matrix.values():
+            total *= len(values)
+        if total > MATRIX_MAX_COMBINATIONS:
+            raise ValueError(
+                f'조합 수({total})가 최대 {MATRIX_MAX_COMBINATIONS}개를 초과합니다 (mode=pairwise 사용 또는 값 축소)'
+            )
+        return cartesian_combinations(matrix)
+    combinations = pairwise_combinations(matrix)
+    if len(combinations) > MATRIX_MAX_COMBINATIONS:
+        raise ValueError(f'조합 수({len(combinations)})가 최대 {MATRIX_MAX_COMBINATIONS}개를 초과합니다')
+    return combinations
+
+def create_matrix_execution(pt, combinations, mode, concurrency, executed_by='system'):
+    """매트릭스 부모 실행과 조합별 자식 성능 실행 생성 (커밋은 호출자가 수행)
+
+    조합(환경 변수)은 부모 result_summary.matrix에 보관하여 비교표 구성에 사용
+    """
+    parent = TestExecution(
+        test_type='matrix',
+        performance_test_id=pt.id,
+        environment=pt.environment,
+        executed_by=executed_by,
+        status='queued',
+        started_at=None,
+        total_count=len(combinations),
+        completed_count=0,
+        passed_count=0,
+        failed_count=0
+    )
+    db.session.add(parent)
+    children = []
+    for _ in combinations:
+        child = TestExecution(
+            test_type='performance',
+            performance_test_id=pt.id,
+            parent=parent,
+            environment=pt.environment,
+            executed_by=executed_by,
+            status='queued',
+            started_at=None
+        )
+        db.session.add(child)
+        children.append(child)
+    db.session.flush()
+    parent.result_summary = json.dumps({'matrix': {
+        'mode': mode,
+        'concurrency': concurrency,
+        'combinations': [{'execution_id': c.id, 'env': env} for c, env in zip(children, combinations)]
+    }})
+    return parent, children
+
+def load_matrix(parent):
+    try:
+        return (json.loads(parent.result_summary or '{}') or {}).get('matrix')
+    except (json.JSONDecodeError, TypeError, AttributeError):
+        return None
+
+def build_comparison(parent):
+    """조합별 지연 시간/오류율 비교표 (진행 중이면 완료된 조합까지)"""
+    matrix = load_matrix(parent)
+    if not matrix:
+        return None
+    combinations = matrix['combinations']
+    ids = [c['execution_id'] for c in combinations]
+    executions = {e.id: e for e in TestExecution.query.filter(TestExecution.id.in_(ids)).all()}
+    # 실행별 대표 지연 시간 지표: k6 요약과 같이 HTTP 메트릭 우선, 브라우저 테스트는 browser_* 메트릭
+    durations = {}
+    for m in PerformanceMetric.query.filter(
+        PerformanceMetric.test_execution_id.in_(ids),
+        PerformanceMetric.metric_name.in_(DURATION_METRICS)
+    ).all():
+        current = durations.get(m.test_execution_id)
+        if current is None or DURATION_METRICS.index(m.metric_name) < DURATION_METRICS.index(current.metric_name):
+            durations[m.test_execution_id] = m
+
+    rows = []
+    for combination in combinations:
+        execution = executions.get(combination['execution_id'])
+        metric = durations.get(combination['execution_id'])
+        rows.append({
+            'execution_id': combination['execution_id'],
+            'env': combination['env'],
+            'status': execution.status if execution else None,
+            'request_count': execution.request_count if execution else None,
+            'response_time_avg': execution.response_time_avg if execution else None,
+            'response_time_p50': metric.p50 if metric else None,
+            'response_time_p95': execution.response_time_p95 if execution else None,
+            'response_time_p99': metric.p99 if metric else None,
+            'throughput': execution.throughput if execution else None,
+            'error_rate': execution.error_rate if execution else None
+        })
+
+    measured = [r for r in rows if r['response_time_p95'] is not None]
+    best_p95 = min((r['response_time_p95'] for r in measured), default=None)
+    for row in rows:
+        # 가장 빠른 조합 대비 p95 배율
+        row['p95_vs_best'] = (
+            round(row['response_time_p95'] / best_p95, 3)
+            if best_p95 and row['response_time_p95'] is not None else None
+        )
+    summary = {}
+    if measured:
+        summary['fastest_p95'] = min(measured, key=lambda r: r['response_time_p95'])['execution_id']
+        summary['slowest_p95'] = max(measured, key=lambda r: r['response_time_p95'])['execution_id']
+    errored = [r for r in rows if r['error_rate'] is not None]
+    if errored:
+        summary['highest_error_rate'] = max(errored, key=lambda r: r['error_rate'])['execution_id']
+    return {
+        'mode': matrix.get('mode'),
+        'variables': sorted({k for c in combinations for k in c['env']}),
+        'rows': rows,
+        'summary': summary,
+        'generated_at': datetime.utcnow().isoformat()
+    }
@@ -0,0 +1,68 @@
+import os
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로세스 내 실행 워커 풀 (k6 / 자동화 실행을 요청 스레드에서 분리)
+class ExecutionPool:
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or int(os.environ.get('EXECUTION_MAX_WORKERS', '8'))
+        self._executor = None
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        """워커 풀은 첫 실행 요청 시점에 생성"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='execution-worker'
+                )
+            return self._executor
+
+    def submit(self, app, execution_id, fn, *args, **kwargs):
+        """실행 작업을 풀에 등록 (작업은 앱 컨텍스트 안에서 실행됨)"""
+        def run_in_context():
+            with app.app_context():
+                try:
+                    return fn(execution_id, *args, **kwargs)
+                except Exception:
+                    print(f"❌ 실행 작업 오류 (execution_id={execution_id}): {traceback.format_exc()}")
+                    raise
+                finally:
+                    with self._lock:
+                        self._futures.pop(execution_id, None)
+
+        with self._lock:
+            self._futures[execution_id] = None
+        future = self._get_executor().submit(run_in_context)
+        with self._lock:
+            # 이미 끝난 작업은 다시 등록하지 않음
+            if execution_id in self._futures:
+                self._futures[execution_id] = future
+        return future
+
+    def is_tracked(self, execution_id):
+        """해당 실행이 이 프로세스의 풀에서 대기/실행 중인지 확인"""
+        with self._lock:
+            return execution_id in self._futures
+
+    def stats(self):
+        """풀 상태 요약"""
+        with self._lock:
+            in_flight = len(self._futures)
+        return {
+            'max_workers': self.max_workers,
+            'in_flight': in_flight
+        }
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+# 전역 실행 풀 인스턴스
+execution_pool = ExecutionPool()
@@ -0,0 +1,210 @@
+import os
+from collections import deque
+from datetime import datetime, timedelta
+from sqlalchemy import or_
+from models import db, Project, RunQueueItem, PerformanceTest, AutomationTest, TestCase, Folder
+from engines.histogram import LatencyHistogram
+
+# 가중 공정 배분(fair-share)
+# - 우선순위가 높은 항목이 항상 먼저 (관리자가 올린 긴급 실행)
+# - 같은 우선순위에서는 최근 사용량(실행 중 + 최근 구간에 선점한 항목 수)을 가중치로 나눈 값이 작은 프로젝트 먼저,
+#   프로젝트 안에서는 사용량이 적은 생성자 먼저, 그다음 등록 순
+# - 동시 실행 상한에 도달한 프로젝트의 항목은 건너뜀
+DEFAULT_PROJECT_WEIGHT = float(os.environ.get('RUN_QUEUE_DEFAULT_WEIGHT', '1'))
+DEFAULT_PROJECT_MAX_CONCURRENCY = int(os.environ.get('RUN_QUEUE_PROJECT_MAX_CONCURRENCY', '0'))  # 0이면 제한 없음
+FAIR_SHARE_WINDOW_SECONDS = int(os.environ.get('RUN_QUEUE_FAIR_SHARE_WINDOW_SECONDS', '600'))
+# 예상 선점 순서(ETA) 계산 시 훑어볼 대기 항목 수 상한 (선점 자체는 그룹별 선두 항목만 SQL로 집계)
+FAIR_SHARE_SCAN_LIMIT = int(os.environ.get('RUN_QUEUE_FAIR_SHARE_SCAN_LIMIT', '5000'))
+
+WAIT_PERCENTILES = (50, 90, 95, 99)
+
+def execution_owner(execution):
+    """실행의 (프로젝트 ID, 생성자 ID): 대상 테스트 → 폴더 → 부모 실행 순으로 찾음"""
+    for model, target_id in (
+        (PerformanceTest, execution.performance_test_id),
+        (AutomationTest, execution.automation_test_id),
+        (TestCase, execution.test_case_id)
+    ):
+        target = model.query.get(target_id) if target_id else None
+        if target is None:
+            continue
+        project_id = target.project_id
+        if project_id is None and getattr(target, 'folder_id', None):
+            folder = Folder.query.get(target.folder_id)
+            project_id = folder.project_id if folder else None
+        return project_id, target.creator_id
+    folder = Folder.query.get(execution.folder_id) if execution.folder_id else None
+    if folder is not None:
+        return folder.project_id, None
+    if execution.parent is not None:
+        return execution_owner(execution.parent)
+    return None, None
+
+def project_settings(project_ids):
+    """프로젝트별 (가중치, 동시 실행 상한) — 프로젝트가 없는 실행은 기본값"""
+    settings = {None: (DEFAULT_PROJECT_WEIGHT, DEFAULT_PROJECT_MAX_CONCURRENCY)}
+    ids = [pid for pid in project_ids if pid is not None]
+    if ids:
+        for project in Project.query.filter(Project.id.in_(ids)).all():
+            weight = project.queue_weight if project.queue_weight and project.queue_weight > 0 else DEFAULT_PROJECT_WEIGHT
+            quota = project.max_concurrent_runs if project.max_concurrent_runs is not None else DEFAULT_PROJECT_MAX_CONCURRENCY
+            settings[project.id] = (weight, quota)
+    return settings
+
+def usage_snapshot(now=None):
+    """프로젝트/생성자별 최근 사용량과 프로젝트별 실행 중 수"""
+    since = (now or datetime.utcnow()) - timedelta(seconds=FAIR_SHARE_WINDOW_SECONDS)
+    usage = {}
+    for project_id, owner_id, count in db.session.query(
+        RunQueueItem.project_id, RunQueueItem.owner_id, db.func.count(RunQueueItem.id)
+    ).filter(
+        or_(RunQueueItem.status == 'running', RunQueueItem.claimed_at >= since)
+    ).group_by(RunQueueItem.project_id, RunQueueItem.owner_id).all():
+        usage[(project_id, owner_id)] = count
+    running = dict(db.session.query(
+        RunQueueItem.project_id, db.func.count(RunQueueItem.id)
+    ).filter(RunQueueItem.status == 'running').group_by(RunQueueItem.project_id).all())
+    return usage, running
+
+def _pending_groups(query):
+    """대기 항목을 (프로젝트, 생성자) 그룹별 우선순위/등록 순 목록으로 묶음"""
+    groups = {}
+    rows = query.with_entities(
+        RunQueueItem.id, RunQueueItem.project_id, RunQueueItem.owner_id, RunQueueItem.priority
+    ).order_by(RunQueueItem.priority.desc(), RunQueueItem.id).limit(FAIR_SHARE_SCAN_LIMIT).all()
+    for item_id, project_id, owner_id, priority in rows:
+        groups.setdefault((project_id, owner_id), deque()).append((item_id, priority or 0))
+    return groups
+
+def _group_heads(query):
+    """(프로젝트, 생성자) 그룹별 선두 항목 (가장 높은 우선순위 중 가장 먼저 등록된 항목)
+
+    GROUP BY로 그룹/우선순위별 최소 ID만 가져오므로 대기 항목 수와 무관하게 그룹 × 우선순위 단계 수만큼만 읽음
+    """
+    heads = {}
+    rows = query.with_entities(
+        RunQueueItem.project_id, RunQueueItem.owner_id, RunQueueItem.priority, db.func.min(RunQueueItem.id)
+    ).group_by(RunQueueItem.project_id, RunQueueItem.owner_id, RunQueueItem.priority).all()
+    for project_id, owner_id, priority, item_id in rows:
+        head = ((priority or 0), -item_id)
+        if (project_id, owner_id) not in heads or head > heads[(project_id, owner_id)]:
+            heads[(project_id, owner_id)] = head
+    return {group: deque([(-negative_id, priority)]) for group, (priority, negative_id) in heads.items()}
+
+def _project_usage(usage):
+    project_usage = {}
+    for (project_id, _), count in usage.items():
+        project_usage[project_id] = project_usage.get(project_id, 0) + count
+    return project_usage
+
+def _rank_heads(groups, usage, project_usage, running, settings, enforce_quota=True):
+    """그룹 선두 항목을 공정 배분 순서로 정렬한 (그룹, 항목 ID) 목록"""
+    ranked = []
+    for (project_id, owner_id), items in groups.items():
+        item_id, priority = items[0]
+        weight, quota = settings.get(project_id, settings[None])
+        if enforce_quota and quota and running.get(project_id, 0) >= quota:
+            continue
+        share = project_usage.get(project_id, 0) / weight
+        ranked.append((-priority, share, usage.get((project_id, owner_id), 0), item_id, (project_id, owner_id)))
+    ranked.sort()
+    return [(group, item_id) for *_, item_id, group in ranked]
+
+def fair_share_candidates(query, now=None):
+    """대기 항목 조회(query)에서 공정 배분 순서대로 선점 후보 ID 목록 반환
+
+    같은 (프로젝트, 생성자)의 항목은 우선순위/등록 순으로만 실행되므로 그룹별 선두 항목만 비교
+    """
+    groups = _group_heads(query)
+    if not groups:
+        return []
+    usage, running = usage_snapshot(now)
+    settings = project_settings({project_id for project_id, _ in groups})
+    return [item_id for _, item_id in _rank_heads(groups, usage, _project_usage(usage), running, settings)]
+
+def fair_share_order(query, now=None, until=None, limit=None):
+    """대기 항목 조회(query)를 워커가 차례로 선점한다고 가정한 전체 선점 순서 (ID 목록, ETA 추정용)
+
+    선점할 때마다 해당 프로젝트/생성자의 사용량과 실행 중 수를 늘려 다음 후보를 다시 고르며,
+    모든 프로젝트가 동시 실행 상한에 걸리면 앞선 실행이 끝난 뒤 선점되는 것으로 보고 상한 없이 고름
+    until 항목까지 또는 limit개까지만 계산
+    """
+    groups = _pending_groups(query)
+    if not groups:
+        return []
+    usage, running = usage_snapshot(now)
+    settings = project_settings({project_id for project_id, _ in groups})
+    project_usage = _project_usage(usage)
+
+    order = []
+    while groups and (limit is None or len(order) < limit):
+        ranked = _rank_heads(groups, usage, project_usage, running, settings) or \
+            _rank_heads(groups, usage, project_usage, running, settings, enforce_quota=False)
+        group, item_id = ranked[0]
+        order.append(item_id)
+        if item_id == until:
+            break
+        groups[group].popleft()
+        if not groups[group]:
+            del groups[group]
+        project_id = group[0]
+        usage[group] = usage.get(group, 0) + 1
+        project_usage[project_id] = project_usage.get(project_id, 0) + 1
+        running[project_id] = running.get(project_id, 0) + 1
+    return order
+
+def _wait_summary(histogram):
+    summary = histogram.summary(WAIT_PERCENTILES)
+    return {key: round(value, 3) if isinstance(value, float) else value for key, value in summary.items()}
+
+def queue_wait_stats(since=None, now=None):
+    """프로젝트별 대기 시간(등록 → 선점, 초) 백분위수와 현재 대기열 상태 (가중치 조정용)"""
+    now = now or datetime.utcnow()
+    since = since or now - timedelta(hours=24)
+    histograms = {}
+    for project_id, created_at, claimed_at in db.session.query(
+        RunQueueItem.project_id, RunQueueItem.created_at, RunQueueItem.claimed_at
+    ).filter(RunQueueItem.claimed_at.isnot(None), RunQueueItem.created_at >= since).all():
+        histogram = histograms.setdefault(project_id, LatencyHistogram())
+        histogram.record(max(0.0, (claimed_at - created_at).total_seconds()))
+
+    waiting = {}
+    for project_id, status, count, oldest in db.session.query(
+        RunQueueItem.project_id, RunQueueItem.status, db.func.count(RunQueueItem.id), db.func.min(RunQueueItem.created_at)
+    ).filter(RunQueueItem.status.in_(['queued', 'paused'])).group_by(RunQueueItem.project_id, RunQueueItem.status).all():
+        entry = waiting.setdefault(project_id, {'queued': 0, 'paused': 0, 'oldest_wait': 0.0})
+        entry[status] = count
+        if status == 'queued' and oldest:
+            entry['oldest_wait'] = round((now - oldest).total_seconds(), 3)
+
+    usage, running = usage_snapshot(now)
+    project_ids = set(histograms) | set(waiting) | set(running) | {project_id for project_id, _ in usage}
+    settings = project_settings(project_ids)
+    names = dict(db.session.query(Project.id, Project.name).filter(
+        Project.id.in_([pid for pid in project_ids if pid is not None])
+    ).all()) if any(pid is not None for pid in project_ids) else {}
+
+    projects = []
+    for project_id in sorted(project_ids, key=lambda pid: (pid is None, pid or 0)):
+        weight, quota = settings.get(project_id, settings[None])
+        recent = sum(count for (pid, _), count in usage.items() if pid == project_id)
+        projects.append({
+            'project_id': project_id,
+            'name': names.get(project_id),
+            'weight': weight,
+            'max_concurrent_runs': quota or None,
+            'running': running.get(project_id, 0),
+            'recent_usage': recent,
+            'share': round(recent / weight, 3),
+            **waiting.get(project_id, {'queued': 0, 'paused': 0, 'oldest_wait': 0.0}),
+            'wait_seconds': _wait_summary(histograms.get(project_id, LatencyHistogram()))
+        })
+    overall = LatencyHistogram()
+    for histogram in histograms.values():
+        overall.merge(histogram)
+    return {
+        'since': since.isoformat(),
+        'window_seconds': FAIR_SHARE_WINDOW_SECONDS,
+        'wait_seconds': _wait_summary(overall),
+        'projects': projects
+    }
@@ -0,0 +1,177 @@
+import glob
+import json
+import os
+import zlib
+from statistics import median
+from models import ExecutionHostMetrics
+from engines.host_monitor import host_sampler, summarize_host_samples
+from engines.k6_parser import parse_k6_timeline
+from engines.resource_monitor import load_samples, write_samples
+from engines.http_engine import TIMELINE_FILE_NAME
+
+HOST_METRICS_FILE_NAME = 'host_metrics.json'
+
+# 지연 시간 급증 판정: 구간 p95가 전체 구간 p95 중앙값의 SPIKE_FACTOR배 이상이고 SPIKE_MIN_MS 이상 증가
+SPIKE_FACTOR = float(os.environ.get('ANALYSIS_SPIKE_FACTOR', '2.0'))
+SPIKE_MIN_MS = float(os.environ.get('ANALYSIS_SPIKE_MIN_MS', '50'))
+# 호스트 자원 압박 판정 기준
+PRESSURE_CPU_PERCENT = float(os.environ.get('ANALYSIS_CPU_PRESSURE', '90'))
+PRESSURE_CORE_PERCENT = float(os.environ.get('ANALYSIS_CORE_PRESSURE', '95'))
+PRESSURE_LOAD_PER_CORE = float(os.environ.get('ANALYSIS_LOAD_PRESSURE', '1.0'))
+PRESSURE_MEM_AVAILABLE = float(os.environ.get('ANALYSIS_MEM_PRESSURE', '0.1'))  # 가용 메모리 비율
+PRESSURE_IOWAIT_PERCENT = float(os.environ.get('ANALYSIS_IOWAIT_PRESSURE', '20'))
+PRESSURE_STEAL_PERCENT = float(os.environ.get('ANALYSIS_STEAL_PRESSURE', '10'))
+
+def run_with_host_metrics(run):
+    """성능 실행 동안 호스트 지표 추적 (run(): k6 실행 결과 dict)
+
+    추적 구간의 샘플은 실행 작업 디렉토리(host_metrics.json)에 저장하고 요약은 result['host_metrics']에 기록
+    """
+    token = host_sampler.start_tracking()
+    try:
+        result = run()
+    finally:
+        samples = host_sampler.stop_tracking(token)
+    if samples and samples.get('ts') and result.get('workspace'):
+        write_samples(os.path.join(result['workspace'], HOST_METRICS_FILE_NAME), samples)
+        result['host_metrics'] = summarize_host_samples(samples)
+    return result
+
+def save_host_metrics(execution, result):
+    """작업 디렉토리의 호스트 지표를 압축하여 실행 기록에 저장 (커밋은 호출자가 수행)"""
+    workspace = result.get('workspace')
+    samples = load_samples(os.path.join(workspace, HOST_METRICS_FILE_NAME)) if workspace else None
+    if not samples or not samples.get('ts'):
+        return None
+    record = execution.host_metrics or ExecutionHostMetrics(test_execution_id=execution.id)
+    record.sample_count = len(samples['ts'])
+    record.interval = samples.get('interval')
+    record.summary = json.dumps(result.get('host_metrics') or summarize_host_samples(samples))
+    record.samples = zlib.compress(json.dumps(samples, separators=(',', ':')).encode('utf-8'))
+    execution.host_metrics = record
+    return record
+
+def load_host_samples(record):
+    if record is None or not record.samples:
+        return None
+    return json.loads(zlib.decompress(record.samples).decode('utf-8'))
+
+def k6_output_paths(workspace_path):
+    """실행 작업 디렉토리의 k6 JSON 출력 (분할 실행이면 샤드별 출력)"""
+    if not workspace_path:
+        return []
+    shard_outputs = sorted(glob.glob(os.path.join(workspace_path, 'shard_*', 'result.json')))
+    return shard_outputs or [os.path.join(workspace_path, 'result.json')]
+
+def _nearest_sample(host_ts, ts, start):
+    """ts 이후 가장 가까운 호스트 샘플 순번 (정렬된 시각 목록을 앞에서부터 탐색)"""
+    index = start
+    while index + 1 < len(host_ts) and abs(host_ts[index + 1] - ts) <= abs(host_ts[index] - ts):
+        index += 1
+    return index
+
+def _pressure(host, index, cores, mem_total_kb):
+    """호스트 샘플 한 건의 자원 압박 항목"""
+    reasons = []
+    if host['cpu'][index] >= PRESSURE_CPU_PERCENT:
+        reasons.append('cpu')
+    if host['cpu_cores'][index] and max(host['cpu_cores'][index]) >= PRESSURE_CORE_PERCENT:
+        reasons.append('cpu_core')
+    if cores and host['load1'][index] / cores >= PRESSURE_LOAD_PER_CORE:
+        reasons.append('load')
+    if mem_total_kb and host['mem_available_kb'][index] / mem_total_kb <= PRESSURE_MEM_AVAILABLE:
+        reasons.append('memory')
+    if host['iowait'][index] >= PRESSURE_IOWAIT_PERCENT:
+        reasons.append('iowait')
+    if host['steal'][index] >= PRESSURE_STEAL_PERCENT:
+        reasons.append('steal')
+    if host['tcp_retrans'][index] > 0:
+        reasons.append('tcp_retransmits')
+    return reasons
+
+def _correlation(xs, ys):
+    pairs = [(x, y) for x, y in zip(xs, ys) if x is not None and y is not None]
+    if len(pairs) < 3:
+        return None
+    n = len(pairs)
+    mean_x = sum(x for x, _ in pairs) / n
+    mean_y = sum(y for _, y in pairs) / n
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in pairs)
+    var_x = sum((x - mean_x) ** 2 for x, _ in pairs)
+    var_y = sum((y - mean_y) ** 2 for _, y in pairs)
+    if var_x == 0 or var_y == 0:
+        return None
+    return round(cov / (var_x * var_y) ** 0.5, 3)
+
+def build_host_overlay(execution, bucket_seconds=None):
+    """k6 구간별 지연 시간과 같은 시각의 호스트 지표를 맞춘 분석 결과
+
+    지연 시간 급증 구간마다 당시의 호스트 자원 압박(CPU/코어/부하/메모리/iowait/steal/TCP 재전송) 여부를 표시
+    """
+    host = load_host_samples(execution.host_metrics)
+    if not host:
+        return None
+    interval = host.get('interval') or 1.0
+    bucket_seconds = bucket_seconds or interval
+    try:
+        summary = json.loads(execution.result_summary or '{}')
+    except json.JSONDecodeError:
+        summary = {}
+    # 내장 HTTP 엔진은 요청별 출력 대신 초 단위 구간 집계(timeline.json)를 남김
+    workspace = summary.get('workspace')
+    timeline = load_samples(os.path.join(workspace, TIMELINE_FILE_NAME)) if workspace else None
+    if timeline:
+        bucket_seconds = timeline['bucket_seconds']
+    else:
+        timeline = parse_k6_timeline(k6_output_paths(workspace), bucket_seconds)
+    cores = host.get('cores')
+    mem_total_kb = host.get('mem_total_kb')
+
+    rows = []
+    if timeline:
+        p95_values = [v for v in timeline['p95'] if v is not None]
+        baseline = median(p95_values) if p95_values else None
+        cursor = 0
+        for i, ts in enumerate(timeline['ts']):
+            # 구간 중앙 시각에 가장 가까운 호스트 샘플
+            cursor = _nearest_sample(host['ts'], ts + bucket_seconds / 2, cursor)
+            aligned = abs(host['ts'][cursor] - (ts + bucket_seconds / 2)) <= max(interval, bucket_seconds)
+            p95 = timeline['p95'][i]
+            spike = bool(baseline and p95 is not None and p95 >= baseline * SPIKE_FACTOR and p95 - baseline >= SPIKE_MIN_MS)
+            rows.append({
+                'ts': ts,
+                'requests': timeline['requests'][i],
+                'failed': timeline['failed'][i],
+                'p95': p95,
+                'vus': timeline['vus'][i],
+                'host_cpu': host['cpu'][cursor] if aligned else None,
+                'host_max_core': max(host['cpu_cores'][cursor]) if aligned and host['cpu_cores'][cursor] else None,
+                'host_load1': host['load1'][cursor] if aligned else None,
+                'host_mem_available_kb': host['mem_available_kb'][cursor] if aligned else None,
+                'host_tcp_retrans': host['tcp_retrans'][cursor] if aligned else None,
+                'latency_spike': spike,
+                'pressure': _pressure(host, cursor, cores, mem_total_kb) if aligned else []
+            })
+    else:
+        baseline = None
+
+    spikes = [r for r in rows if r['latency_spike']]
+    return {
+        'execution_id': execution.id,
+        'bucket_seconds': bucket_seconds,
+        'latency_metric': timeline['metric'] if timeline else None,
+        'baseline_p95': round(baseline, 3) if baseline else None,
+        'host': summarize_host_samples(host),
+        'generator_saturated': execution.generator_saturated,
+        'summary': {
+            'buckets': len(rows),
+            'latency_spikes': len(spikes),
+            'spikes_with_host_pressure': sum(1 for r in spikes if r['pressure']),
+            'pressure_buckets': sum(1 for r in rows if r['pressure']),
+            # 구간 p95와 호스트 CPU 사용률의 상관계수 (1에 가까울수록 지연이 로컬 자원 압박과 함께 움직임)
+            'p95_cpu_correlation': _correlation([r['p95'] for r in rows], [r['host_cpu'] for r in rows])
+        },
+        'spikes': spikes,
+        'timeline': rows,
+        'k6_timeline_available': timeline is not None
+    }
@@ -0,0 +1,303 @@
+import json
+import math
+import os
+from engines.durations import parse_duration, format_duration
+from models import db, TestExecution, PerformanceMetric, LoadProfile
+
+# 부하 프로필 유형
+# - ramp: 목표 VU까지 증가 → 유지 → 감소
+# - spike: 기준 부하에서 짧은 시간에 최대 부하로 급증 후 기준 부하로 회복
+# - soak: 중간 부하를 장시간 유지 (메모리 누수, 커넥션 고갈 확인)
+# - stress: 일정 간격으로 VU를 계단식으로 늘려 한계까지 증가
+# - constant_arrival_rate: VU 수와 무관하게 초당 반복 수를 고정 (개방형 부하 모델)
+PROFILE_TYPES = ('ramp', 'spike', 'soak', 'stress', 'constant_arrival_rate')
+
+# 유형별 설정 (기본값이 None이면 필수)
+PROFILE_SETTINGS = {
+    'ramp': {'vus': None, 'ramp_up': '30s', 'hold': '1m', 'ramp_down': '10s'},
+    'spike': {'baseline_vus': 1, 'peak_vus': None, 'baseline': '30s', 'spike_ramp': '10s', 'spike_hold': '30s', 'recovery': '30s'},
+    'soak': {'vus': None, 'ramp_up': '2m', 'hold': '1h', 'ramp_down': '2m'},
+    'stress': {'start_vus': 10, 'max_vus': None, 'step_vus': 10, 'step_ramp': '10s', 'step_hold': '1m', 'ramp_down': '30s'},
+    'constant_arrival_rate': {'rate': None, 'time_unit': '1s', 'duration': '1m', 'pre_allocated_vus': None, 'max_vus': None}
+}
+DURATION_SETTINGS = ('ramp_up', 'hold', 'ramp_down', 'baseline', 'spike_ramp', 'spike_hold', 'recovery',
+                     'step_ramp', 'step_hold', 'duration', 'time_unit')
+# 모든 유형에 공통으로 지정할 수 있는 설정
+# iteration_seconds/requests_per_iteration은 비용 추정용 (없으면 최근 실행 지표 사용)
+COMMON_SETTINGS = {'graceful_stop': '30s', 'iteration_seconds': None, 'requests_per_iteration': None}
+# 값이 없어도 되는 설정 (도착률 프로필의 VU 수는 반복 시간으로 계산)
+OPTIONAL_SETTINGS = {('constant_arrival_rate', 'pre_allocated_vus'), ('constant_arrival_rate', 'max_vus')}
+MAX_STRESS_STEPS = 100
+
+# 이력이 없을 때 비용 추정에 쓰는 반복 1회 소요 시간(초)과 반복당 요청 수
+DEFAULT_ITERATION_SECONDS = float(os.environ.get('LOAD_PROFILE_ITERATION_SECONDS', '1'))
+DEFAULT_REQUESTS_PER_ITERATION = float(os.environ.get('LOAD_PROFILE_REQUESTS_PER_ITERATION', '1'))
+
+# 실행 전 상한 (초과하면 confirm 없이는 실행 거부)
+# LOAD_PROFILE_LIMITS='{"alpha": {"max_vus": 50, "max_duration": "10m"}}' 처럼 환경별로 덮어씀
+DEFAULT_LIMITS = {
+    'max_vus': int(os.environ.get('LOAD_PROFILE_MAX_VUS', '500')),
+    'max_duration': os.environ.get('LOAD_PROFILE_MAX_DURATION', '2h'),
+    'max_requests': int(os.environ.get('LOAD_PROFILE_MAX_REQUESTS', '1000000'))
+}
+
+def _positive_int(name, value, minimum=1):
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{name}은(는) 정수여야 합니다: {value}')
+    if number < minimum or number != float(value):
+        raise ValueError(f'{name}은(는) {minimum} 이상의 정수여야 합니다: {value}')
+    return number
+
+def normalize_profile(profile):
+    """부하 프로필 검증 및 기본값 채우기 (형식이 잘못되면 ValueError)
+
+    {'type': 'ramp', 'vus': 50, 'hold': '5m'} 또는 {'type': 'ramp', 'settings': {...}} 형식 모두 허용
+    """
+    if not isinstance(profile, dict):
+        raise ValueError('부하 프로필은 객체여야 합니다')
+    profile_type = profile.get('type') or profile.get('profile_type')
+    if profile_type not in PROFILE_TYPES:
+        raise ValueError(f'지원하지 않는 부하 프로필 유형입니다: {profile_type} (사용 가능: {", ".join(PROFILE_TYPES)})')
+    given = dict(profile.get('settings') or {})
+    given.update({k: v for k, v in profile.items() if k not in ('id', 'name', 'type', 'profile_type', 'settings')})
+    allowed = {**PROFILE_SETTINGS[profile_type], **COMMON_SETTINGS}
+    unknown = sorted(set(given) - set(allowed))
+    if unknown:
+        raise ValueError(f'{profile_type} 프로필에서 지원하지 않는 설정입니다: {", ".join(unknown)}')
+
+    settings = {}
+    for key, default in allowed.items():
+        value = given.get(key, default)
+        if value is None:
+            if key in PROFILE_SETTINGS[profile_type] and (profile_type, key) not in OPTIONAL_SETTINGS:
+                raise ValueError(f'{profile_type} 프로필에는 {key} 설정이 필요합니다')
+            settings[key] = None
+        elif key in DURATION_SETTINGS or key == 'graceful_stop':
+            settings[key] = format_duration(parse_duration(value))
+        elif key in ('iteration_seconds', 'requests_per_iteration'):
+            try:
+                settings[key] = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f'{key}은(는) 숫자여야 합니다: {value}')
+            if settings[key] <= 0:
+                raise ValueError(f'{key}은(는) 0보다 커야 합니다: {value}')
+        else:
+            settings[key] = _positive_int(key, value, minimum=0 if key == 'baseline_vus' else 1)
+
+    if profile_type == 'spike' and settings['peak_vus'] <= settings['baseline_vus']:
+        raise ValueError('peak_vus는 baseline_vus보다 커야 합니다')
+    if profile_type == 'stress' and settings['max_vus'] < settings['start_vus']:
+        raise ValueError('max_vus는 start_vus 이상이어야 합니다')
+    if profile_type == 'stress' and math.ceil((settings['max_vus'] - settings['start_vus']) / settings['step_vus']) > MAX_STRESS_STEPS:
+        raise ValueError(f'계단 수가 최대 {MAX_STRESS_STEPS}개를 초과합니다 (step_vus를 늘려 주세요)')
+    if profile_type == 'constant_arrival_rate':
+        if parse_duration(settings['time_unit']) <= 0 or parse_duration(settings['duration']) <= 0:
+            raise ValueError('time_unit과 duration은 0보다 커야 합니다')
+        if settings['max_vus'] and settings['pre_allocated_vus'] and settings['max_vus'] < settings['pre_allocated_vus']:
+            raise ValueError('max_vus는 pre_allocated_vus 이상이어야 합니다')
+    return {'type': profile_type, 'settings': settings}
+
+def build_stages(profile):
+    """VU 기반 프로필의 ramping-vus 단계 목록 (start_vus, stages)"""
+    profile_type, s = profile['type'], profile['settings']
+    if profile_type in ('ramp', 'soak'):
+        return 0, [
+            {'duration': s['ramp_up'], 'target': s['vus']},
+            {'duration': s['hold'], 'target': s['vus']},
+            {'duration': s['ramp_down'], 'target': 0}
+        ]
+    if profile_type == 'spike':
+        base, peak = s['baseline_vus'], s['peak_vus']
+        return base, [
+            {'duration': s['baseline'], 'target': base},
+            {'duration': s['spike_ramp'], 'target': peak},
+            {'duration': s['spike_hold'], 'target': peak},
+            {'duration': s['spike_ramp'], 'target': base},
+            {'duration': s['recovery'], 'target': base}
+        ]
+    if profile_type == 'stress':
+        stages = []
+        vus = s['start_vus']
+        while True:
+            stages.append({'duration': s['step_ramp'], 'target': vus})
+            stages.append({'duration': s['step_hold'], 'target': vus})
+            if vus >= s['max_vus']:
+                break
+            vus = min(s['max_vus'], vus + s['step_vus'])
+        stages.append({'duration': s['ramp_down'], 'target': 0})
+        return 0, stages
+    return None, None
+
+def build_scenario(profile):
+    """부하 프로필을 k6 시나리오 설정으로 변환"""
+    s = profile['settings']
+    if profile['type'] == 'constant_arrival_rate':
+        pre_allocated, max_vus = _arrival_rate_vus(s, s['iteration_seconds'])
+        return {
+            'executor': 'constant-arrival-rate',
+            'rate': s['rate'],
+            'timeUnit': s['time_unit'],
+            'duration': s['duration'],
+            'preAllocatedVUs': pre_allocated,
+            'maxVUs': max_vus,
+            'gracefulStop': s['graceful_stop']
+        }
+    start_vus, stages = build_stages(profile)
+    return {
+        'executor': 'ramping-vus',
+        'startVUs': start_vus,
+        'stages': stages,
+        'gracefulRampDown': s['graceful_stop'],
+        'gracefulStop': s['graceful_stop']
+    }
+
+def build_k6_options(profile):
+    """실행 시점에 스크립트 options에 병합할 k6 설정 (engines.k6_entry가 스크립트 시나리오에 적용)"""
+    return {'scenario': build_scenario(profile), 'name': profile['type']}
+
+def _arrival_rate_vus(settings, iteration_seconds):
+    """constant-arrival-rate의 사전 할당/최대 VU (지정하지 않으면 반복 시간 기준으로 계산)"""
+    per_second = settings['rate'] / parse_duration(settings['time_unit'])
+    needed = max(1, math.ceil(per_second * (iteration_seconds or DEFAULT_ITERATION_SECONDS)))
+    pre_allocated = settings['pre_allocated_vus'] or needed
+    max_vus = settings['max_vus'] or max(pre_allocated, needed * 2)
+    return pre_allocated, max_vus
+
+def load_iteration_stats(performance_test_id):
+    """최근 완료된 실행의 반복 1회 평균 시간(초)과 반복당 요청 수 (이력이 없으면 None)"""
+    if performance_test_id is None:
+        return None
+    executions = TestExecution.query.filter(
+        TestExecution.performance_test_id == performance_test_id,
+        TestExecution.test_type == 'performance',
+        TestExecution.status == 'completed'
+    ).order_by(TestExecution.id.desc()).limit(5).all()
+    ids = [e.id for e in executions]
+    if not ids:
+        return None
+    metrics = {}
+    for metric in PerformanceMetric.query.filter(
+        PerformanceMetric.test_execution_id.in_(ids),
+        PerformanceMetric.metric_name.in_(('iteration_duration', 'iterations', 'http_reqs'))
+    ).all():
+        metrics.setdefault(metric.test_execution_id, {})[metric.metric_name] = metric
+    for execution_id in ids:
+        found = metrics.get(execution_id, {})
+        duration, iterations = found.get('iteration_duration'), found.get('iterations')
+        if duration is None or duration.mean is None or not iterations or not iterations.count:
+            continue
+        requests = found.get('http_reqs')
+        return {
+            'execution_id': execution_id,
+            'iteration_seconds': duration.mean / 1000.0,
+            'requests_per_iteration': (requests.count / iterations.count) if requests and requests.count else None
+        }
+    return None
+
+def _vu_curve(start_vus, stages):
+    """단계별 선형 보간 VU 곡선의 (총 시간, 최대 VU, VU·초 면적)"""
+    elapsed, area, current, peak = 0.0, 0.0, start_vus, start_vus
+    for stage in stages:
+        seconds = parse_duration(stage['duration'])
+        area += (current + stage['target']) / 2.0 * seconds
+        elapsed += seconds
+        current = stage['target']
+        peak = max(peak, current)
+    return elapsed, peak, area
+
+def estimate_profile(profile, performance_test_id=None):
+    """실행 전 비용 추정 (총 반복 수, 최대 VU, 예상 요청 수, 소요 시간)
+
+    폐쇄형(VU 기반) 부하는 VU·초 면적을 반복 1회 시간으로 나누고, 개방형(도착률)은 도착률 × 기간으로 계산
+    """
+    s = profile['settings']
+    stats = load_iteration_stats(performance_test_id)
+    iteration_seconds = s['iteration_seconds'] or (stats or {}).get('iteration_seconds') or DEFAULT_ITERATION_SECONDS
+    requests_per_iteration = (s['requests_per_iteration'] or (stats or {}).get('requests_per_iteration')
+                              or DEFAULT_REQUESTS_PER_ITERATION)
+    if s['iteration_seconds'] or s['requests_per_iteration']:
+        basis = 'profile'
+    else:
+        basis = 'history' if stats else 'default'
+    graceful = parse_duration(s['graceful_stop'])
+    warnings = []
+
+    if profile['type'] == 'constant_arrival_rate':
+        duration = parse_duration(s['duration'])
+        per_second = s['rate'] / parse_duration(s['time_unit'])
+        iterations = per_second * duration
+        pre_allocated, max_vus = _arrival_rate_vus(s, iteration_seconds)
+        needed = math.ceil(per_second * iteration_seconds)
+        peak_vus = min(max_vus, max(needed, 1))
+        if needed > max_vus:
+            # VU가 부족하면 k6가 반복을 버림 (dropped_iterations)
+            achievable = max_vus / iteration_seconds * duration
+            warnings.append(f'max_vus({max_vus})가 필요한 VU 수({needed})보다 적어 반복 약 {int(iterations - achievable)}회가 누락될 수 있습니다')
+            iterations = achievable
+        vu_seconds = peak_vus * duration
+    else:
+        start_vus, stages = build_stages(profile)
+        duration, peak_vus, vu_seconds = _vu_curve(start_vus, stages)
+        iterations = vu_seconds / iteration_seconds
+
+    return {
+        'type': profile['type'],
+        'peak_vus': int(peak_vus),
+        'duration_seconds': round(duration, 3),
+        # 마지막 반복 종료 대기(gracefulStop)까지 포함한 최대 소요 시간
+        'max_duration_seconds': round(duration + graceful, 3),
+        'vu_seconds': round(vu_seconds, 3),
+        'estimated_iterations': int(round(iterations)),
+        'estimated_requests': int(round(iterations * requests_per_iteration)),
+        'iteration_seconds': round(iteration_seconds, 4),
+        'requests_per_iteration': round(requests_per_iteration, 3),
+        'basis': basis,
+        'warnings': warnings
+    }
+
+def profile_limits(environment=None):
+    """환경별 실행 상한 (LOAD_PROFILE_LIMITS의 환경 설정이 기본값을 덮어씀)"""
+    limits = dict(DEFAULT_LIMITS)
+    try:
+        overrides = json.loads(os.environ.get('LOAD_PROFILE_LIMITS') or '{}')
+    except json.JSONDecodeError:
+        overrides = {}
+    if environment and isinstance(overrides.get(environment), dict):
+        limits.update(overrides[environment])
+    return limits
+
+def check_limits(estimate, environment=None):
+    """추정치가 환경별 상한을 넘는 항목 목록"""
+    limits = profile_limits(environment)
+    violations = []
+    if limits.get('max_vus') is not None and estimate['peak_vus'] > int(limits['max_vus']):
+        violations.append(f"최대 VU {estimate['peak_vus']} > 상한 {limits['max_vus']}")
+    if limits.get('max_duration') is not None and estimate['duration_seconds'] > parse_duration(limits['max_duration']):
+        violations.append(f"소요 시간 {format_duration(estimate['duration_seconds'])} > 상한 {limits['max_duration']}")
+    if limits.get('max_requests') is not None and estimate['estimated_requests'] > int(limits['max_requests']):
+        violations.append(f"예상 요청 수 {estimate['estimated_requests']} > 상한 {limits['max_requests']}")
+    return violations
+
+def resolve_profile(value, pt=None):
+    """요청의 load_profile(저장된 프로필 ID, 이름 또는 인라인 설정)이나 성능 테스트 기본 프로필을 정규화하여 반환
+
+    프로필을 찾을 수 없거나 형식이 잘못되면 ValueError, 지정된 프로필이 없으면 None
+    """
+    if value is None and pt is not None and pt.load_profile_id:
+        value = pt.load_profile_id
+    if value is None or value == '':
+        return None
+    if isinstance(value, dict):
+        return normalize_profile(value)
+    if isinstance(value, int) or str(value).isdigit():
+        stored = db.session.get(LoadProfile, int(value))
+    else:
+        stored = LoadProfile.query.filter_by(name=str(value)).first()
+    if stored is None:
+        raise ValueError(f'부하 프로필을 찾을 수 없습니다: {value}')
+    profile = normalize_profile(stored.to_profile())
+    profile['id'] = stored.id
+    profile['name'] = stored.name
+    return profile
@@ -0,0 +1,40 @@
+import json
+import os
+import zlib
+from models import ExecutionResourceUsage
+from engines.resource_monitor import load_samples, summarize_samples
+
+RESOURCE_FILE_NAME = 'resources.json'
+
+def save_resource_usage(execution, result):
+    """실행 결과의 러너 자원 샘플을 실행 기록에 저장하고 부하 생성기 포화 여부 표시 (커밋은 호출자가 수행)
+
+    샘플은 작업 디렉토리의 resources.json(열 단위 JSON)을 압축하여 보관 (작업 디렉토리 정리 후에도 조회 가능)
+    """
+    workspace = result.get('workspace')
+    samples = load_samples(os.path.join(workspace, RESOURCE_FILE_NAME)) if workspace else None
+    if not samples:
+        return None
+    summary = result.get('resources') or summarize_samples(samples)
+    usage = execution.resource_usage or ExecutionResourceUsage(test_execution_id=execution.id)
+    usage.sample_count = summary['samples']
+    usage.interval = summary['interval']
+    usage.cores = summary['cores']
+    usage.peak_cpu_percent = summary['peak_cpu_percent']
+    usage.avg_cpu_percent = summary['avg_cpu_percent']
+    usage.peak_rss_kb = summary['peak_rss_kb']
+    usage.peak_fds = summary['peak_fds']
+    usage.net_rx_bytes = summary['net_rx_bytes']
+    usage.net_tx_bytes = summary['net_tx_bytes']
+    usage.saturated = summary['saturated']
+    usage.saturated_seconds = summary['saturated_seconds']
+    usage.samples = zlib.compress(json.dumps(samples, separators=(',', ':')).encode('utf-8'))
+    execution.resource_usage = usage
+    execution.generator_saturated = bool(summary['saturated'])
+    return usage
+
+def load_usage_samples(usage):
+    """압축 저장된 샘플 계열 복원"""
+    if usage is None or not usage.samples:
+        return None
+    return json.loads(zlib.decompress(usage.samples).decode('utf-8'))
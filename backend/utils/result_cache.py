@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from models import TestExecution, TestResult
+from engines.k6_engine import resolve_script_path
+
+# 결과 재사용 기본 TTL (초)과 요청에 use_cache가 없을 때의 기본 사용 여부
+RESULT_CACHE_TTL_SECONDS = int(os.environ.get('RESULT_CACHE_TTL_SECONDS', '600'))
+RESULT_CACHE_DEFAULT = os.environ.get('RESULT_CACHE_DEFAULT', 'false').lower() == 'true'
+
+# 해시 대상 파일 확장자 (디렉토리 스크립트는 하위 파일 전체를 해시)
+HASHED_EXTENSIONS = ('.js', '.mjs', '.cjs', '.ts', '.json', '.py')
+SKIPPED_DIRS = {'node_modules', 'test-results', 'playwright-report', '__pycache__', '.git'}
+# import 경로 해석 시 시도할 접미사
+MODULE_SUFFIXES = ('', '.js', '.mjs', '.ts', '.json', '/index.js', '/index.ts')
+
+# JS/TS: import ... from '...', import '...', require('...'), open('...')(k6 데이터 파일)
+JS_IMPORT_PATTERN = re.compile(
+    r'''(?:\bfrom\s*|\bimport\s*\(?\s*|\brequire\s*\(\s*|\bopen\s*\(\s*)['"]([^'"\n]+)['"]'''
+)
+# Python: from .mod import x / from mod import x / import mod
+PY_IMPORT_PATTERN = re.compile(r'^\s*(?:from\s+(\.*[\w.]*)\s+import|import\s+([\w.]+))', re.MULTILINE)
+
+def _resolve_js_import(base_dir, spec):
+    if spec.startswith(('http://', 'https://')):
+        return None
+    if not spec.startswith('.'):
+        return None  # 패키지 import는 빌드(node_modules) 범위로 보고 해시하지 않음
+    target = os.path.normpath(os.path.join(base_dir, spec))
+    for suffix in MODULE_SUFFIXES:
+        if os.path.isfile(target + suffix):
+            return target + suffix
+    return None
+
+def _resolve_py_import(base_dir, module):
+    # 스크립트와 같은 디렉토리(또는 상대 import 기준 디렉토리)의 로컬 모듈만 추적
+    level = len(module) - len(module.lstrip('.'))
+    directory = base_dir
+    for _ in range(max(0, level - 1)):
+        directory = os.path.dirname(directory)
+    parts = [p for p in module.lstrip('.').split('.') if p]
+    if not parts:
+        return None
+    target = os.path.join(directory, *parts)
+    for candidate in (target + '.py', os.path.join(target, '__init__.py')):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+def _imports(path, content):
+    """파일에서 추적할 로컬 import 대상 경로, 원격 import URL, 찾을 수 없는 상대 경로 import"""
+    base_dir = os.path.dirname(path)
+    text = content.decode('utf-8', errors='replace')
+    local, remote, missing = [], [], []
+    if path.endswith('.py'):
+        for from_module, import_module in PY_IMPORT_PATTERN.findall(text):
+            module = from_module or import_module
+            resolved = _resolve_py_import(base_dir, module)
+            if resolved:
+                local.append(resolved)
+            elif module.startswith('.'):
+                missing.append(module)
+    elif path.endswith(('.js', '.mjs', '.cjs', '.ts')):
+        for spec in JS_IMPORT_PATTERN.findall(text):
+            if spec.startswith(('http://', 'https://')):
+                # 원격 모듈은 내려받지 않고 URL(버전 포함) 자체를 키에 반영
+                remote.append(spec)
+                continue
+            resolved = _resolve_js_import(base_dir, spec)
+            if resolved:
+                local.append(resolved)
+            elif spec.startswith('.'):
+                missing.append(spec)
+    return local, remote, missing
+
+def _entry_files(script_path):
+    if not os.path.isdir(script_path):
+        return [script_path]
+    files = []
+    for root, dirs, names in os.walk(script_path):
+        dirs[:] = sorted(d for d in dirs if d not in SKIPPED_DIRS)
+        files.extend(os.path.join(root, n) for n in sorted(names) if n.endswith(HASHED_EXTENSIONS))
+    return files
+
+def collect_script_files(script_path):
+    """스크립트(디렉토리면 하위 스크립트 전체)와 스크립트가 import하는 로컬 모듈을 재귀적으로 수집 (순환 import는 한 번만)
+
+    반환: root(상대 경로 기준), contents(경로 → 내용), remote(원격 import URL), missing(파일 경로 → 찾을 수 없는 import),
+    dirs(디렉토리 스크립트에서 탐색한 디렉토리)
+    """
+    script_path = resolve_script_path(script_path)
+    is_dir = os.path.isdir(script_path)
+    files = {
+        'root': script_path if is_dir else os.path.dirname(script_path),
+        'contents': {},
+        'remote': set(),
+        'missing': {},
+        'dirs': []
+    }
+    if is_dir:
+        for root, dirs, _ in os.walk(script_path):
+            dirs[:] = [d for d in dirs if d not in SKIPPED_DIRS]
+            files['dirs'].append(root)
+    pending = _entry_files(script_path)
+    while pending:
+        path = os.path.abspath(pending.pop())
+        if path in files['contents']:
+            continue
+        try:
+            with open(path, 'rb') as f:
+                content = f.read()
+        except OSError:
+            continue
+        files['contents'][path] = content
+        local, urls, missing = _imports(path, content)
+        pending.extend(local)
+        files['remote'].update(urls)
+        if missing:
+            files['missing'][path] = missing
+    return files
+
+def hash_script_files(files):
+    """collect_script_files 결과의 SHA-256 (파일 경로와 내용, 원격 import URL을 함께 해시)"""
+    digest = hashlib.sha256()
+    for path in sorted(files['contents']):
+        digest.update(os.path.relpath(path, files['root']).encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(hashlib.sha256(files['contents'][path]).digest())
+    for url in sorted(files['remote']):
+        digest.update(url.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def script_content_hash(script_path):
+    """스크립트와 스크립트가 import하는 로컬 모듈(_ENV.js 등) 내용의 SHA-256 (스크립트가 없으면 None)
+
+    파일 경로와 내용을 함께 해시하므로 공통 모듈 하나만 바뀌어도 키가 달라짐
+    """
+    if not os.path.exists(resolve_script_path(script_path)):
+        return None
+    return hash_script_files(collect_script_files(script_path))
+
+def build_cache_key(test_type, test_id, script_path, env_vars=None, environment=None, load_profile=None):
+    """결과 재사용 키 (스크립트 내용 해시 + 병합된 환경 변수 + 실행 환경 + 부하 프로필, 스크립트가 없으면 None)"""
+    if not script_path:
+        return None
+    script_hash = script_content_hash(script_path)
+    if script_hash is None:
+        return None
+    payload = {
+        'test_type': test_type,
+        'test_id': test_id,
+        'script': script_hash,
+        'env_vars': {str(k): str(v) for k, v in (env_vars or {}).items()},
+        'environment': environment
+    }
+    if load_profile:
+        # 프로필이 없는 실행의 키는 기존과 동일하게 유지
+        payload['load_profile'] = {'type': load_profile['type'], 'settings': load_profile['settings']}
+    payload = json.dumps(payload, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def cache_options(data, args):
+    """요청 본문/쿼리의 캐시 옵션 (사용 여부, TTL 초)"""
+    use_cache = data.get('use_cache')
+    if use_cache is None:
+        use_cache = args.get('use_cache', str(RESULT_CACHE_DEFAULT)).lower() == 'true'
+    try:
+        ttl = int(data.get('cache_ttl', args.get('cache_ttl', RESULT_CACHE_TTL_SECONDS)))
+    except (TypeError, ValueError):
+        ttl = RESULT_CACHE_TTL_SECONDS
+    return bool(use_cache) and ttl > 0, ttl
+
+def find_cached_result(cache_key, ttl):
+    """TTL 안에 같은 키로 성공(Pass)한 가장 최근 실행과 TestResult (없으면 (None, None))
+
+    실패/오류/취소 결과는 재실행(재시도) 의도가 있으므로 재사용하지 않음
+    """
+    if not cache_key:
+        return None, None
+    cutoff = datetime.utcnow() - timedelta(seconds=ttl)
+    row = TestResult.query.join(
+        TestExecution, TestResult.test_execution_id == TestExecution.id
+    ).filter(
+        TestExecution.cache_key == cache_key,
+        TestExecution.completed_at >= cutoff,
+        TestResult.result == 'Pass'
+    ).order_by(TestExecution.completed_at.desc()).with_entities(TestExecution, TestResult).first()
+    return (row[0], row[1]) if row else (None, None)
+
+def cache_hit_response(execution, test_result, ttl):
+    """캐시 적중 응답 (재실행하지 않고 이전 결과를 반환했음을 명시)"""
+    try:
+        summary = json.loads(execution.result_summary) if execution.result_summary else None
+    except (json.JSONDecodeError, TypeError):
+        summary = None
+    age = (datetime.utcnow() - execution.completed_at).total_seconds()
+    return {
+        'cache_hit': True,
+        'message': '동일한 스크립트/환경 변수/환경의 이전 결과를 재사용했습니다 (재실행하지 않음)',
+        'execution_id': execution.id,
+        'cached_execution_id': execution.id,
+        'cached_at': execution.completed_at.isoformat(),
+        'cache_age_seconds': round(age, 1),
+        'cache_ttl_seconds': ttl,
+        'result_id': test_result.id,
+        'status': test_result.result,
+        'execution_duration': test_result.execution_time,
+        'notes': test_result.notes,
+        'result': summary
+    }
@@ -0,0 +1,510 @@
+import json
+import os
+import socket
+import threading
+import time
+import traceback
+from datetime import datetime, timedelta
+from sqlalchemy import update
+from models import db, RunQueueItem, TestExecution
+from engines.process_runner import cancel_run, cancellable_run
+from engines.registry import engine_registry
+from engines.workspace import prune_workspaces
+from utils.fair_share import execution_owner, fair_share_candidates
+
+# 워커 임대(lease) 시간: 이 시간 동안 하트비트가 없으면 워커가 죽은 것으로 보고 재할당
+LEASE_SECONDS = int(os.environ.get('RUN_QUEUE_LEASE_SECONDS', '60'))
+HEARTBEAT_SECONDS = max(1, LEASE_SECONDS // 3)
+# 실행 중 항목의 취소 요청 확인 주기 (초)
+CANCEL_POLL_SECONDS = float(os.environ.get('RUN_QUEUE_CANCEL_POLL_SECONDS', '1'))
+
+# 한 번의 선점 시도에서 공정 배분 순서대로 잠가 볼 후보 수
+RUN_QUEUE_CLAIM_CANDIDATES = int(os.environ.get('RUN_QUEUE_CLAIM_CANDIDATES', '10'))
+
+# 오래된 실행 작업 디렉토리 정리 주기 (초, 0이면 정리하지 않음)
+WORKSPACE_PRUNE_INTERVAL_SECONDS = int(os.environ.get('RUN_WORKSPACE_PRUNE_INTERVAL_SECONDS', '3600'))
+
+# 실행 종료 상태 (취소 요청 대상에서 제외)
+FINISHED_EXECUTION_STATUSES = ('completed', 'failed', 'cancelled')
+
+# 작업 유형별 핸들러 (handler(execution_id, **payload))
+JOB_HANDLERS = {}
+
+def register_job_handler(job_type):
+    """큐 작업 핸들러 등록 데코레이터"""
+    def decorator(fn):
+        JOB_HANDLERS[job_type] = fn
+        return fn
+    return decorator
+
+def execution_status_for(result):
+    """실행 결과 상태 → TestExecution 상태"""
+    if result.get('cancelled'):
+        return 'cancelled'
+    return 'completed' if result.get('status') == 'Pass' else 'failed'
+
+def default_worker_id():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+def enqueue_run(execution, job_type, payload=None, priority=0, max_attempts=None):
+    """실행을 대기열에 등록 (커밋은 호출자가 수행)
+
+    대상 테스트의 프로젝트/생성자를 함께 기록하여 선점 시 공정 배분과 프로젝트 동시 실행 상한에 사용
+    """
+    project_id, owner_id = execution_owner(execution)
+    item = RunQueueItem(
+        execution=execution,
+        job_type=job_type,
+        payload=json.dumps(payload or {}),
+        status='queued',
+        priority=priority,
+        project_id=project_id,
+        owner_id=owner_id,
+        max_attempts=max_attempts or int(os.environ.get('RUN_QUEUE_MAX_ATTEMPTS', '3')),
+        available_at=datetime.utcnow()
+    )
+    db.session.add(item)
+    return item
+
+def _supports_skip_locked():
+    return db.engine.dialect.name in ('mysql', 'postgresql')
+
+def _mark_claimed(item_id, worker_id, now):
+    """조건부 UPDATE로 대기 중인 항목 선점 (다른 워커가 먼저 가져가면 0건)"""
+    result = db.session.execute(
+        update(RunQueueItem.__table__)
+        .where(RunQueueItem.__table__.c.id == item_id)
+        .where(RunQueueItem.__table__.c.status == 'queued')
+        .values(
+            status='running',
+            worker_id=worker_id,
+            claimed_at=now,
+            heartbeat_at=now,
+            attempts=RunQueueItem.__table__.c.attempts + 1
+        )
+    )
+    return result.rowcount == 1
+
+def claim_run(item_id, worker_id):
+    """특정 대기열 항목 선점 (성공 시 항목 반환)"""
+    now = datetime.utcnow()
+    try:
+        claimed = _mark_claimed(item_id, worker_id, now)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return RunQueueItem.query.get(item_id) if claimed else None
+
+def claim_next_run(worker_id, job_types=None):
+    """공정 배분 순서(우선순위 → 프로젝트 가중 사용량 → 생성자 사용량 → 등록 순)로 다음 항목 선점
+
+    순서는 애플리케이션에서 정하고 상위 후보만 잠금:
+    MySQL/PostgreSQL은 SELECT ... WHERE id IN (...) FOR UPDATE SKIP LOCKED로 다른 워커가 잠근 행을 건너뛰고,
+    SQLite는 후보를 차례로 조건부 UPDATE로 선점 (쓰기 잠금이 DB 단위라 동시 선점이 불가능)
+    (동시 실행 상한은 선점 직전의 실행 중 수 기준이라 여러 워커가 동시에 선점하면 잠시 넘칠 수 있음)
+    """
+    now = datetime.utcnow()
+    query = RunQueueItem.query.filter(
+        RunQueueItem.status == 'queued',
+        RunQueueItem.available_at <= now
+    )
+    if job_types:
+        query = query.filter(RunQueueItem.job_type.in_(job_types))
+
+    try:
+        candidates = fair_share_candidates(query, now)[:RUN_QUEUE_CLAIM_CANDIDATES]
+        if candidates and _supports_skip_locked():
+            locked = {item.id: item for item in RunQueueItem.query.filter(
+                RunQueueItem.id.in_(candidates),
+                RunQueueItem.status == 'queued'
+            ).with_for_update(skip_locked=True).all()}
+            item = next((locked[candidate_id] for candidate_id in candidates if candidate_id in locked), None)
+            if item is not None:
+                item.status = 'running'
+                item.worker_id = worker_id
+                item.claimed_at = now
+                item.heartbeat_at = now
+                item.attempts = (item.attempts or 0) + 1
+                db.session.commit()
+                return item
+        else:
+            for candidate_id in candidates:
+                if _mark_claimed(candidate_id, worker_id, now):
+                    db.session.commit()
+                    return RunQueueItem.query.get(candidate_id)
+        db.session.rollback()
+        return None
+    except Exception:
+        db.session.rollback()
+        raise
+
+def heartbeat(item_ids, worker_id):
+    """실행 중 항목의 하트비트 갱신 (별도 커넥션 사용)"""
+    if not item_ids:
+        return
+    table = RunQueueItem.__table__
+    with db.engine.begin() as conn:
+        conn.execute(
+            update(table)
+            .where(table.c.id.in_(list(item_ids)))
+            .where(table.c.worker_id == worker_id)
+            .where(table.c.status == 'running')
+            .values(heartbeat_at=datetime.utcnow())
+        )
+
+def finish_run(item, status, error=None):
+    """대기열 항목 종료 처리"""
+    item.status = status
+    item.finished_at = datetime.utcnow()
+    item.last_error = error
+    db.session.commit()
+
+def request_cancel(execution):
+    """실행 취소 요청
+
+    - 대기/일시 정지 중: 워커가 가져가기 전에 조건부 UPDATE로 대기열에서 제외하고 바로 cancelled 처리
+    - 실행 중: 대기열 항목에 취소 요청을 기록 (다른 프로세스/호스트의 워커가 확인하여 프로세스 종료)하고
+      이 프로세스에서 실행 중이면 즉시 프로세스 그룹 종료
+    반환: 'cancelled'(즉시 취소됨) 또는 'cancelling'(실행 중 종료 대기)
+    """
+    now = datetime.utcnow()
+    item = execution.queue_item
+    if item is not None and item.status in ('queued', 'paused'):
+        table = RunQueueItem.__table__
+        result = db.session.execute(
+            update(table)
+            .where(table.c.id == item.id)
+            .where(table.c.status.in_(('queued', 'paused')))
+            .values(status='cancelled', finished_at=now, cancel_requested_at=now, last_error='취소됨')
+        )
+        if result.rowcount == 1:
+            execution.status = 'cancelled'
+            execution.completed_at = now
+            execution.result_summary = json.dumps({'status': 'Cancelled', 'error': '실행 전에 취소되었습니다'})
+            db.session.commit()
+            return 'cancelled'
+        db.session.refresh(item)
+    if item is not None and item.status == 'running' and item.cancel_requested_at is None:
+        item.cancel_requested_at = now
+        db.session.commit()
+    cancel_run(execution.id)
+    return 'cancelling'
+
+def set_run_priority(item, priority):
+    """대기/일시 정지 중 항목의 우선순위 변경 (실행이 시작된 항목은 False)"""
+    table = RunQueueItem.__table__
+    result = db.session.execute(
+        update(table)
+        .where(table.c.id == item.id)
+        .where(table.c.status.in_(('queued', 'paused')))
+        .values(priority=priority)
+    )
+    db.session.commit()
+    db.session.refresh(item)
+    return result.rowcount == 1
+
+def pause_run(item):
+    """대기 중 항목 일시 정지 (워커가 선점하지 않음, 실행 상태는 queued 유지)"""
+    table = RunQueueItem.__table__
+    result = db.session.execute(
+        update(table)
+        .where(table.c.id == item.id)
+        .where(table.c.status == 'queued')
+        .values(status='paused', paused_at=datetime.utcnow())
+    )
+    db.session.commit()
+    db.session.refresh(item)
+    return result.rowcount == 1
+
+def resume_run(app, item):
+    """일시 정지한 항목을 다시 대기 상태로 (내장 워커가 켜져 있으면 바로 실행 시도)"""
+    table = RunQueueItem.__table__
+    result = db.session.execute(
+        update(table)
+        .where(table.c.id == item.id)
+        .where(table.c.status == 'paused')
+        .values(status='queued', paused_at=None)
+    )
+    db.session.commit()
+    db.session.refresh(item)
+    if result.rowcount == 1:
+        dispatch_embedded(app, item)
+    return result.rowcount == 1
+
+def reclaim_stale_runs(lease_seconds=None):
+    """하트비트가 끊긴(워커가 죽은) 항목을 다시 대기 상태로 되돌림
+
+    재시도 횟수를 초과한 항목은 실패 처리
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=lease_seconds or LEASE_SECONDS)
+    stale_items = RunQueueItem.query.filter(
+        RunQueueItem.status == 'running',
+        RunQueueItem.heartbeat_at < cutoff
+    ).all()
+    reclaimed = 0
+    for item in stale_items:
+        execution = item.execution
+        message = f'워커 응답 없음 ({item.worker_id})'
+        if (item.attempts or 0) >= (item.max_attempts or 1):
+            item.status = 'failed'
+            item.finished_at = datetime.utcnow()
+            item.last_error = message
+            if execution:
+                execution.status = 'failed'
+                execution.completed_at = datetime.utcnow()
+                execution.result_summary = json.dumps({'status': 'Error', 'error': message})
+        else:
+            item.status = 'queued'
+            item.worker_id = None
+            item.last_error = message
+            item.available_at = datetime.utcnow()
+            if execution:
+                execution.status = 'queued'
+            reclaimed += 1
+    if stale_items:
+        db.session.commit()
+    return reclaimed
+
+_last_workspace_prune = 0.0
+_workspace_prune_lock = threading.Lock()
+
+def prune_run_workspaces(force=False):
+    """끝난 실행의 오래된 작업 디렉토리 정리 (워커/스케줄러 루프에서 정리 주기마다 한 번, 삭제 수 반환)"""
+    global _last_workspace_prune
+    if not WORKSPACE_PRUNE_INTERVAL_SECONDS and not force:
+        return 0
+    with _workspace_prune_lock:
+        if not force and time.time() - _last_workspace_prune < WORKSPACE_PRUNE_INTERVAL_SECONDS:
+            return 0
+        _last_workspace_prune = time.time()
+    active = [execution_id for execution_id, in db.session.query(TestExecution.id).filter(
+        TestExecution.status.notin_(FINISHED_EXECUTION_STATUSES)
+    ).all()]
+    removed = prune_workspaces(keep=active)
+    if removed:
+        print(f"🧹 오래된 실행 작업 디렉토리 {len(removed)}개 정리")
+    return len(removed)
+
+def run_claimed_item(item, worker_id):
+    """선점한 항목의 핸들러 실행 및 종료 처리 (앱 컨텍스트 안에서 호출)"""
+    handler = JOB_HANDLERS.get(item.job_type)
+    if handler is None:
+        finish_run(item, 'failed', f'등록되지 않은 작업 유형: {item.job_type}')
+        return None
+    item_id = item.id
+    execution_id = item.test_execution_id
+    payload = json.loads(item.payload) if item.payload else {}
+
+    try:
+        with cancellable_run(execution_id):
+            result = handler(execution_id, **payload)
+    except Exception:
+        db.session.rollback()
+        error = traceback.format_exc()
+        print(f"❌ 대기열 작업 오류 (item={item_id}, worker={worker_id}): {error}")
+        execution = TestExecution.query.get(execution_id)
+        if execution and execution.status in ('queued', 'running'):
+            execution.status = 'failed'
+            execution.completed_at = datetime.utcnow()
+        finish_run(RunQueueItem.query.get(item_id), 'failed', error[-4000:])
+        return None
+    execution = TestExecution.query.get(execution_id)
+    if execution and execution.status == 'cancelled':
+        finish_run(RunQueueItem.query.get(item_id), 'cancelled', '취소됨')
+    else:
+        finish_run(RunQueueItem.query.get(item_id), 'done')
+    return result
+
+# 대기열 워커 (독립 실행 프로세스 또는 웹 프로세스 내장용)
+class RunQueueWorker:
+    def __init__(self, app, worker_id=None, concurrency=None, job_types=None, poll_interval=None):
+        self.app = app
+        self.worker_id = worker_id or default_worker_id()
+        self.concurrency = concurrency or int(os.environ.get('RUN_QUEUE_WORKER_CONCURRENCY', '2'))
+        self.job_types = job_types
+        self.poll_interval = poll_interval or float(os.environ.get('RUN_QUEUE_POLL_SECONDS', '2'))
+        self._running = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat_thread = None
+
+    def start_heartbeat(self):
+        """하트비트 스레드 시작 (한 번만)"""
+        with self._lock:
+            if self._heartbeat_thread is None:
+                self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, daemon=True)
+                self._heartbeat_thread.start()
+
+    def _heartbeat_loop(self):
+        # 종료 신호 후에도 실행 중인 항목이 끝날 때까지는 하트비트 유지
+        # 하트비트보다 짧은 주기로 취소 요청을 확인하여 취소된 실행의 슬롯을 빠르게 반환
+        last_beat = time.time()
+        while True:
+            time.sleep(CANCEL_POLL_SECONDS)
+            item_ids = self.active_items()
+            if self._stop.is_set() and not item_ids:
+                break
+            if not item_ids:
+                continue
+            try:
+                with self.app.app_context():
+                    self._check_cancel_requests(item_ids)
+                    if time.time() - last_beat >= HEARTBEAT_SECONDS:
+                        heartbeat(item_ids, self.worker_id)
+                        last_beat = time.time()
+            except Exception as e:
+                print(f"⚠️ 하트비트 갱신 실패: {e}")
+
+    def _check_cancel_requests(self, item_ids):
+        requested = db.session.query(RunQueueItem.test_execution_id).filter(
+            RunQueueItem.id.in_(list(item_ids)),
+            RunQueueItem.cancel_requested_at.isnot(None)
+        ).all()
+        for execution_id, in requested:
+            cancel_run(execution_id)
+
+    def _run_item(self, item_id):
+        try:
+            with self.app.app_context():
+                item = RunQueueItem.query.get(item_id)
+                run_claimed_item(item, self.worker_id)
+        finally:
+            with self._lock:
+                self._running.discard(item_id)
+
+    def run_item(self, item_id):
+        """특정 항목을 선점하여 현재 스레드에서 실행 (다른 워커가 먼저 가져갔으면 None)"""
+        self.start_heartbeat()
+        with self.app.app_context():
+            item = claim_run(item_id, self.worker_id)
+            if item is None:
+                return None
+            with self._lock:
+                self._running.add(item_id)
+            try:
+                return run_claimed_item(item, self.worker_id)
+            finally:
+                with self._lock:
+                    self._running.discard(item_id)
+
+    def run_next(self):
+        """공정 배분 순서로 다음 항목을 선점하여 현재 스레드에서 실행하고, 선점할 항목이 없을 때까지 반복 (실행 수 반환)
+
+        내장 워커는 대기열을 주기적으로 조회하지 않으므로, 동시 실행 상한에 걸려 남은 항목은
+        같은 프로젝트의 실행이 끝난 스레드가 이어서 가져감
+        """
+        self.start_heartbeat()
+        ran = 0
+        while not self._stop.is_set():
+            with self.app.app_context():
+                item = claim_next_run(self.worker_id, self.job_types)
+                if item is None:
+                    break
+                with self._lock:
+                    self._running.add(item.id)
+                try:
+                    run_claimed_item(item, self.worker_id)
+                finally:
+                    with self._lock:
+                        self._running.discard(item.id)
+            ran += 1
+        return ran
+
+    def active_items(self):
+        with self._lock:
+            return set(self._running)
+
+    def run_once(self):
+        """빈 슬롯만큼 항목을 선점하여 실행 스레드 시작 (선점 수 반환)"""
+        started = 0
+        with self.app.app_context():
+            reclaim_stale_runs()
+            prune_run_workspaces()
+            while True:
+                with self._lock:
+                    if len(self._running) >= self.concurrency:
+                        break
+                item = claim_next_run(self.worker_id, self.job_types)
+                if item is None:
+                    break
+                with self._lock:
+                    self._running.add(item.id)
+                threading.Thread(target=self._run_item, args=(item.id,), daemon=True).start()
+                started += 1
+        return started
+
+    def run_forever(self):
+        print(f"🚀 대기열 워커 시작: {self.worker_id} (동시 실행 {self.concurrency})")
+        self.start_heartbeat()
+        # 비용이 큰 엔진 런타임은 테스트마다가 아니라 워커 시작 시 한 번 준비
+        engine_registry.warm_up_async()
+        try:
+            while not self._stop.is_set():
+                try:
+                    started = self.run_once()
+                except Exception as e:
+                    print(f"⚠️ 대기열 조회 실패: {e}")
+                    started = 0
+                if not started:
+                    self._stop.wait(self.poll_interval)
+        finally:
+            self._stop.set()
+
+    def stop(self):
+        self._stop.set()
+
+    def wait_for_running(self, timeout=None):
+        """실행 중인 항목이 모두 끝날 때까지 대기 (종료 시 사용)"""
+        deadline = time.time() + timeout if timeout else None
+        while self.active_items():
+            if deadline and time.time() > deadline:
+                return False
+            time.sleep(0.5)
+        return True
+
+# 웹 프로세스 내장 워커 (Vercel 등 서버리스 환경에서는 비활성화하고 독립 워커 사용)
+_embedded_worker = None
+_embedded_lock = threading.Lock()
+
+def embedded_worker_enabled():
+    is_vercel = 'vercel.app' in os.environ.get('VERCEL_URL', '') or os.environ.get('VERCEL') == '1'
+    return os.environ.get('RUN_QUEUE_EMBEDDED', '0' if is_vercel else '1') == '1'
+
+def get_embedded_worker(app):
+    global _embedded_worker
+    with _embedded_lock:
+        if _embedded_worker is None:
+            _embedded_worker = RunQueueWorker(app, worker_id=f'{default_worker_id()}:web')
+            engine_registry.warm_up_async()
+        return _embedded_worker
+
+def _dispatch_embedded(execution_id, item_id):
+    from flask import current_app
+    # 등록한 항목 대신 공정 배분 순서상 다음 항목을 실행할 수 있음 (등록한 항목은 다른 스레드가 이어서 실행)
+    return get_embedded_worker(current_app._get_current_object()).run_next()
+
+def dispatch_embedded(app, item):
+    """내장 워커가 켜져 있으면 프로세스 내 풀에서 대기열 실행 시도"""
+    from utils.execution_pool import execution_pool
+    if embedded_worker_enabled():
+        execution_pool.submit(app, item.test_execution_id, _dispatch_embedded, item.id)
+
+def submit_run(app, execution, job_type, payload=None, priority=0):
+    """실행을 영속 대기열에 등록하고, 내장 워커가 켜져 있으면 프로세스 내 풀에서 바로 실행
+
+    내장 워커는 공정 배분 순서로 선점하며, 독립 워커가 먼저 선점한 항목은 건너뜀
+    """
+    item = enqueue_run(execution, job_type, payload, priority)
+    db.session.commit()
+    dispatch_embedded(app, item)
+    return item
+
+def async_requested(data, args):
+    """요청 본문/쿼리의 async 옵션 ("false", "0" 같은 문자열은 거짓으로 처리)"""
+    value = data.get('async')
+    if value is None:
+        value = args.get('async', 'false')
+    if isinstance(value, str):
+        return value.strip().lower() in ('true', '1', 'yes', 'on')
+    return bool(value)
@@ -0,0 +1,307 @@
+import json
+import os
+import random
+import threading
+from datetime import datetime, timedelta
+from sqlalchemy import update
+from models import db, RunSchedule, RunQueueItem, TestExecution
+from utils.cron import CronExpression, load_timezone, next_run_utc
+from utils.run_queue import embedded_worker_enabled, prune_run_workspaces
+from engines.registry import parse_shards
+
+# 예약 스케줄러 조회 주기 상한 (초): 가장 이른 실행 시각이 더 가까우면 그때 깨어남
+SCHEDULER_POLL_SECONDS = float(os.environ.get('SCHEDULER_POLL_SECONDS', '30'))
+# 같은 cron 시각에 겹친 예약을 몇 초 간격으로 나누어 등록할지와 그 분산 구간 (초)
+SCHEDULE_STAGGER_SECONDS = int(os.environ.get('SCHEDULE_STAGGER_SECONDS', '15'))
+SCHEDULE_STAGGER_WINDOW = int(os.environ.get('SCHEDULE_STAGGER_WINDOW', '300'))
+# 역압(backpressure): 대기열에 이만큼 쌓여 있으면 예약 등록을 미룸
+SCHEDULE_MAX_QUEUE_DEPTH = int(os.environ.get('SCHEDULE_MAX_QUEUE_DEPTH', '50'))
+SCHEDULE_DEFER_SECONDS = int(os.environ.get('SCHEDULE_DEFER_SECONDS', '60'))
+# 한 번 조회에서 등록할 최대 예약 수 (나머지는 다음 조회에서)
+SCHEDULE_MAX_FIRES_PER_TICK = int(os.environ.get('SCHEDULE_MAX_FIRES_PER_TICK', '20'))
+
+# 이전 회차가 아직 대기/실행 중일 때의 처리
+# skip: 이번 회차를 건너뜀, coalesce: 밀린 회차를 모아 이전 회차가 끝나면 한 번 실행, allow: 겹쳐서 실행
+OVERLAP_POLICIES = ('skip', 'coalesce', 'allow')
+ACTIVE_EXECUTION_STATUSES = ('queued', 'running')
+
+# 예약 대상 유형별 실행 등록 함수 (launcher(app, schedule, parameters) → TestExecution)
+# 대상을 실행할 수 없으면(스크립트 거부, 부하 상한 초과 등) ValueError
+SCHEDULE_TARGETS = {}
+
+def register_schedule_target(target_type):
+    """예약 대상 실행 등록 함수 등록 데코레이터"""
+    def decorator(fn):
+        SCHEDULE_TARGETS[target_type] = fn
+        return fn
+    return decorator
+
+def scheduler_enabled():
+    """예약 스케줄러 실행 여부 (기본값은 내장 워커와 같음: Vercel 등 서버리스 환경에서는 비활성화)"""
+    default = '1' if embedded_worker_enabled() else '0'
+    return os.environ.get('RUN_SCHEDULER', default) == '1'
+
+def validate_schedule(data):
+    """예약 요청 본문 검증 (오류 메시지 목록 반환)"""
+    errors = []
+    try:
+        CronExpression(data.get('cron'))
+    except ValueError as e:
+        errors.append(str(e))
+    try:
+        load_timezone(data.get('timezone'))
+    except ValueError as e:
+        errors.append(str(e))
+    if data.get('target_type') not in SCHEDULE_TARGETS:
+        errors.append(f"지원하지 않는 예약 대상입니다: {data.get('target_type')} ({', '.join(sorted(SCHEDULE_TARGETS))})")
+    if data.get('overlap_policy', 'skip') not in OVERLAP_POLICIES:
+        errors.append(f"지원하지 않는 중복 실행 정책입니다: {data.get('overlap_policy')} ({', '.join(OVERLAP_POLICIES)})")
+    if not isinstance(data.get('parameters') or {}, dict):
+        errors.append('parameters는 객체여야 합니다')
+    try:
+        if int(data.get('jitter_seconds') or 0) < 0:
+            errors.append('jitter_seconds는 0 이상이어야 합니다')
+    except (TypeError, ValueError):
+        errors.append('jitter_seconds는 정수여야 합니다')
+    if isinstance(data.get('parameters'), dict):
+        try:
+            parse_shards(data['parameters'].get('shards'))
+        except ValueError as e:
+            errors.append(str(e))
+    return errors
+
+def schedule_parameters(schedule):
+    try:
+        params = json.loads(schedule.parameters) if schedule.parameters else {}
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return params if isinstance(params, dict) else {}
+
+def plan_next_fire(schedule, after=None):
+    """다음 cron 시각과 실제 등록 시각 계산 (저장은 호출자가 수행)
+
+    같은 시각에 이미 잡힌 예약 수만큼 SCHEDULE_STAGGER_SECONDS씩 밀고(분산 구간 안에서 순환),
+    예약별 jitter_seconds 안에서 임의 지연을 더해 동시에 시작하는 예약이 대기열에 한꺼번에 몰리지 않게 함
+    """
+    slot = next_run_utc(schedule.cron, after or datetime.utcnow(), schedule.timezone)
+    offset = 0
+    if SCHEDULE_STAGGER_SECONDS > 0:
+        same_slot = RunSchedule.query.filter(
+            RunSchedule.enabled.is_(True),
+            RunSchedule.next_run_at == slot,
+            RunSchedule.id != schedule.id
+        ).count()
+        offset = (same_slot * SCHEDULE_STAGGER_SECONDS) % max(SCHEDULE_STAGGER_WINDOW, SCHEDULE_STAGGER_SECONDS)
+    if schedule.jitter_seconds:
+        offset += random.randint(0, schedule.jitter_seconds)  # DB DATETIME 정밀도에 맞춰 초 단위
+    return slot, slot + timedelta(seconds=offset)
+
+def reschedule(schedule, after=None):
+    """예약의 다음 실행 시각 갱신 (비활성 예약은 비움, 커밋은 호출자가 수행)"""
+    if schedule.enabled:
+        schedule.next_run_at, schedule.next_fire_at = plan_next_fire(schedule, after)
+    else:
+        schedule.next_run_at = schedule.next_fire_at = None
+        schedule.pending_since = None
+
+def queue_depth():
+    return RunQueueItem.query.filter_by(status='queued').count()
+
+def active_execution(schedule):
+    """이 예약으로 만든 실행 중 아직 대기/실행 중인 최근 실행"""
+    return TestExecution.query.filter(
+        TestExecution.schedule_id == schedule.id,
+        TestExecution.status.in_(ACTIVE_EXECUTION_STATUSES)
+    ).order_by(TestExecution.id.desc()).first()
+
+def _claim(schedule_id, fire_at, **values):
+    """조건부 UPDATE로 이번 회차 선점 (다른 스케줄러 프로세스가 먼저 처리했으면 False)"""
+    result = db.session.execute(
+        update(RunSchedule)
+        .where(RunSchedule.id == schedule_id, RunSchedule.next_fire_at == fire_at)
+        .values(**values)
+    )
+    db.session.commit()
+    return result.rowcount == 1
+
+def launch_schedule(app, schedule, now=None):
+    """예약 대상을 대기열에 등록하고 결과를 예약에 기록 (실행 또는 None 반환)"""
+    now = now or datetime.utcnow()
+    launcher = SCHEDULE_TARGETS.get(schedule.target_type)
+    schedule_id = schedule.id
+    try:
+        if launcher is None:
+            raise ValueError(f'지원하지 않는 예약 대상입니다: {schedule.target_type}')
+        execution = launcher(app, schedule, schedule_parameters(schedule))
+    except Exception as e:
+        db.session.rollback()
+        schedule = RunSchedule.query.get(schedule_id)
+        schedule.last_run_at = now
+        schedule.last_status = 'error'
+        schedule.last_error = str(e)
+        schedule.pending_since = None
+        db.session.commit()
+        print(f"⚠️ 예약 실행 등록 실패 ({schedule.name}): {e}")
+        return None
+    schedule = RunSchedule.query.get(schedule_id)
+    schedule.last_run_at = now
+    schedule.last_execution_id = execution.id
+    schedule.last_status = 'queued'
+    schedule.last_error = None
+    schedule.pending_since = None
+    schedule.run_count = (schedule.run_count or 0) + 1
+    db.session.commit()
+    return execution
+
+def fire_schedule(app, schedule, now=None):
+    """실행 시각이 된 예약 처리 (결과 상태 반환, 다른 프로세스가 먼저 처리했으면 None)
+
+    여러 회차를 놓쳤어도(스케줄러 중단 등) 현재 시각 이후로 다시 계산하므로 한 번만 실행
+    """
+    now = now or datetime.utcnow()
+    fire_at = schedule.next_fire_at
+    if queue_depth() >= SCHEDULE_MAX_QUEUE_DEPTH:
+        if _claim(schedule.id, fire_at, next_fire_at=now + timedelta(seconds=SCHEDULE_DEFER_SECONDS), last_status='deferred'):
+            return 'deferred'
+        return None
+    slot = schedule.next_run_at or fire_at
+    next_slot, next_fire = plan_next_fire(schedule, max(now, slot))
+    if not _claim(schedule.id, fire_at, next_run_at=next_slot, next_fire_at=next_fire):
+        return None
+    db.session.refresh(schedule)
+
+    if schedule.overlap_policy != 'allow' and active_execution(schedule):
+        schedule.skip_count = (schedule.skip_count or 0) + 1
+        if schedule.overlap_policy == 'coalesce':
+            schedule.pending_since = schedule.pending_since or slot
+            schedule.last_status = 'coalesced'
+        else:
+            schedule.last_status = 'skipped'
+        db.session.commit()
+        return schedule.last_status
+    return 'queued' if launch_schedule(app, schedule, now) else 'error'
+
+def run_pending_coalesced(app, now=None):
+    """coalesce 정책으로 모아 둔 회차 중 이전 회차가 끝난 예약을 한 번 실행"""
+    launched = 0
+    pending = RunSchedule.query.filter(
+        RunSchedule.enabled.is_(True),
+        RunSchedule.pending_since.isnot(None)
+    ).all()
+    for schedule in pending:
+        if queue_depth() >= SCHEDULE_MAX_QUEUE_DEPTH:
+            break
+        if active_execution(schedule):
+            continue
+        pending_since = schedule.pending_since
+        claimed = db.session.execute(
+            update(RunSchedule)
+            .where(RunSchedule.id == schedule.id, RunSchedule.pending_since == pending_since)
+            .values(pending_since=None)
+        ).rowcount == 1
+        db.session.commit()
+        if claimed and launch_schedule(app, schedule, now):
+            launched += 1
+    return launched
+
+def run_due_schedules(app, now=None):
+    """실행 시각이 된 예약을 등록 순서(next_fire_at)대로 처리 (처리 결과 목록 반환)"""
+    now = now or datetime.utcnow()
+    fired = []
+    run_pending_coalesced(app, now)
+    due = RunSchedule.query.filter(
+        RunSchedule.enabled.is_(True),
+        RunSchedule.next_fire_at <= now
+    ).order_by(RunSchedule.next_fire_at, RunSchedule.id).limit(SCHEDULE_MAX_FIRES_PER_TICK).all()
+    for schedule in due:
+        try:
+            status = fire_schedule(app, schedule, now)
+        except Exception as e:
+            db.session.rollback()
+            print(f"⚠️ 예약 처리 실패 ({schedule.id}): {e}")
+            continue
+        if status:
+            fired.append({'schedule_id': schedule.id, 'status': status})
+    return fired
+
+def plan_unscheduled():
+    """다음 실행 시각이 비어 있는 활성 예약의 시각 계산 (스케줄러 시작 시)"""
+    for schedule in RunSchedule.query.filter(RunSchedule.enabled.is_(True), RunSchedule.next_fire_at.is_(None)).all():
+        try:
+            reschedule(schedule)
+        except ValueError as e:
+            schedule.last_status = 'error'
+            schedule.last_error = str(e)
+        db.session.commit()
+
+class RunScheduler:
+    def __init__(self, app, poll_interval=None):
+        self.app = app
+        self.poll_interval = poll_interval or SCHEDULER_POLL_SECONDS
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def run_once(self):
+        with self.app.app_context():
+            # 내장 워커는 대기열을 주기적으로 조회하지 않으므로 작업 디렉토리 정리는 스케줄러 루프에서도 수행
+            prune_run_workspaces()
+            return run_due_schedules(self.app)
+
+    def _sleep_seconds(self):
+        """다음 조회까지 대기 시간 (가장 이른 등록 시각과 조회 주기 중 짧은 쪽)"""
+        with self.app.app_context():
+            earliest = db.session.query(db.func.min(RunSchedule.next_fire_at)).filter(
+                RunSchedule.enabled.is_(True)
+            ).scalar()
+        if earliest is None:
+            return self.poll_interval
+        return min(self.poll_interval, max(0.5, (earliest - datetime.utcnow()).total_seconds()))
+
+    def run_forever(self):
+        print(f"⏰ 예약 스케줄러 시작 (조회 주기 최대 {self.poll_interval:g}초)")
+        try:
+            with self.app.app_context():
+                plan_unscheduled()
+        except Exception as e:
+            print(f"⚠️ 예약 시각 계산 실패: {e}")
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+                timeout = self._sleep_seconds()
+            except Exception as e:
+                print(f"⚠️ 예약 조회 실패: {e}")
+                timeout = self.poll_interval
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def wake(self):
+        """예약이 추가/변경되었을 때 다음 실행 시각을 다시 계산하도록 깨움"""
+        self._wake.set()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def start_scheduler(app, poll_interval=None):
+    """프로세스당 하나의 예약 스케줄러 스레드 시작 (여러 프로세스가 실행해도 회차는 조건부 UPDATE로 한 번만 처리)"""
+    global _scheduler
+    if _scheduler is not None:
+        return _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = RunScheduler(app, poll_interval).start()
+        return _scheduler
+
+def wake_scheduler():
+    if _scheduler is not None:
+        _scheduler.wake()
@@ -0,0 +1,342 @@
+import json
+import os
+import subprocess
+import threading
+import time
+from engines.registry import engine_registry
+from engines.k6_engine import k6_engine, resolve_script_path
+from engines.workspace import PROJECT_ROOT
+from engines.http_engine import load_http_spec, CLOSED_EXECUTORS, OPEN_EXECUTORS, DEFAULT_SCENARIO
+from engines.postman_engine import load_postman_collection, build_groups
+from utils.result_cache import collect_script_files, hash_script_files, SKIPPED_DIRS
+
+# watchdog이 있으면 파일 변경 이벤트(inotify 등)로 캐시를 무효화 (없으면 mtime 비교)
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+# 색인할 스크립트 루트 디렉토리
+SCRIPT_CATALOG_ROOT = os.environ.get('SCRIPT_CATALOG_ROOT', os.path.join(PROJECT_ROOT, 'test-scripts'))
+# 파일 변경 감시를 쓰지 않을 때 캐시된 항목을 mtime으로 다시 확인하는 간격 (초)
+SCRIPT_CATALOG_RECHECK_SECONDS = float(os.environ.get('SCRIPT_CATALOG_RECHECK_SECONDS', '1.0'))
+SCRIPT_CATALOG_WATCH = os.environ.get('SCRIPT_CATALOG_WATCH', 'true').lower() == 'true'
+# 내용 해시별 검증 결과 캐시 크기
+SCRIPT_CATALOG_MAX_ENTRIES = int(os.environ.get('SCRIPT_CATALOG_MAX_ENTRIES', '2048'))
+# 실행 등록 시 검증에 실패한 스크립트를 거부할지 여부
+SCRIPT_CATALOG_ENFORCE = os.environ.get('SCRIPT_CATALOG_ENFORCE', 'true').lower() == 'true'
+SCRIPT_INSPECT_TIMEOUT = int(os.environ.get('SCRIPT_INSPECT_TIMEOUT_SECONDS', '30'))
+# 검증하지 못한 스크립트(k6 없음, 시간 초과, 원격 import 네트워크 오류 등)를 다시 검증하기까지의 간격 (초)
+SCRIPT_INSPECT_RETRY_SECONDS = float(os.environ.get('SCRIPT_INSPECT_RETRY_SECONDS', '60'))
+# 색인에서 제외할 디렉토리 (빌드 산출물/실행 결과)
+CATALOG_SKIPPED_DIRS = SKIPPED_DIRS | {'dist', 'build', 'Result', 'results'}
+
+# ---- 엔진별 검증 (내용 해시가 같으면 다시 수행하지 않음) ----
+# validator(entry, files) → (메타데이터 dict, 오류 목록)
+# 메타데이터의 inspected가 False면 검증하지 못한 것 (거부하지 않고 캐시하지도 않음)
+
+# k6 inspect 실패 중 스크립트가 아닌 환경 문제(원격 모듈 다운로드 실패 등)로 보는 메시지
+K6_TRANSIENT_ERRORS = (
+    'dial tcp', 'no such host', 'connection refused', 'connection reset', 'i/o timeout',
+    'context deadline exceeded', 'tls handshake', "couldn't be retrieved", 'network is unreachable'
+)
+
+def _validate_k6(entry, files):
+    """k6 inspect로 구문과 options 검증 (k6가 없거나 일시적인 오류면 검증 생략)"""
+    try:
+        options = k6_engine.inspect(entry, timeout=SCRIPT_INSPECT_TIMEOUT)
+    except json.JSONDecodeError as e:
+        return {'inspected': False, 'options': None, 'inspect_error': f'k6 inspect 출력을 해석할 수 없습니다: {e}'}, []
+    except ValueError as e:
+        if any(marker in str(e).lower() for marker in K6_TRANSIENT_ERRORS):
+            return {'inspected': False, 'options': None, 'inspect_error': str(e)}, []
+        return {'inspected': True, 'options': None}, [f'k6 inspect 실패: {e}']
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return {'inspected': False, 'options': None, 'inspect_error': str(e)}, []
+    return {'inspected': True, 'options': options}, []
+
+def _validate_python(entry, files):
+    errors = []
+    for path, content in files['contents'].items():
+        if not path.endswith('.py'):
+            continue
+        try:
+            compile(content, path, 'exec')
+        except SyntaxError as e:
+            errors.append(f'{os.path.relpath(path, files["root"])}:{e.lineno}: 구문 오류: {e.msg}')
+    return {}, errors
+
+def _validate_http(entry, files):
+    try:
+        spec = load_http_spec(entry)
+    except (OSError, ValueError) as e:
+        return {}, [f'HTTP 부하 시나리오 오류: {e}']
+    errors = []
+    if not isinstance(spec.get('requests'), list) or not spec['requests']:
+        errors.append('requests가 비어 있습니다')
+    scenario = spec.get('scenario') or {}
+    executor = scenario.get('executor', DEFAULT_SCENARIO['executor'])
+    if executor not in CLOSED_EXECUTORS + OPEN_EXECUTORS:
+        errors.append(f'지원하지 않는 실행기입니다: {executor}')
+    return {'requests': len(spec.get('requests') or []), 'scenario': scenario}, errors
+
+def _validate_postman(entry, files):
+    try:
+        groups = build_groups(load_postman_collection(entry))
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        return {}, [f'Postman 컬렉션 오류: {e}']
+    requests = sum(len(items) for _, items in groups)
+    return {'folders': len(groups), 'requests': requests}, [] if requests else ['실행할 요청이 없습니다']
+
+def _validate_playwright(entry, files):
+    specs = [p for p in files['contents'] if p.endswith(('.spec.js', '.spec.ts'))]
+    return {'specs': len(specs)}, [] if specs else ['Playwright 스펙 파일(.spec.js/.spec.ts)이 없습니다']
+
+VALIDATORS = {
+    'k6': _validate_k6,
+    'selenium': _validate_python,
+    'http': _validate_http,
+    'postman': _validate_postman,
+    'playwright': _validate_playwright
+}
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+# 스크립트 1건의 해석 결과 (실행 엔진, 진입 파일, import 목록, 검증 결과)
+class ScriptInfo:
+    def __init__(self, script_path, resolved_path, engine=None):
+        self.script_path = script_path
+        self.resolved_path = resolved_path
+        self.engine = engine
+        self.entry = None
+        self.content_hash = None
+        self.imports = []
+        self.remote_imports = []
+        self.metadata = {}
+        self.errors = []
+        self.watched = []  # 신선도 확인 대상 (파일/디렉토리 경로)
+        self.fingerprint = None
+        self.checked = 0.0
+        self.built = 0.0
+        self.generation = 0
+
+    @property
+    def valid(self):
+        return not self.errors
+
+    @property
+    def inspected(self):
+        return self.metadata.get('inspected') is not False
+
+    def to_dict(self):
+        root = self.entry if self.entry and os.path.isdir(self.entry) else os.path.dirname(self.entry or self.resolved_path)
+        return {
+            'script_path': os.path.relpath(self.resolved_path, PROJECT_ROOT),
+            'engine': self.engine,
+            'entry': os.path.relpath(self.entry, PROJECT_ROOT) if self.entry else None,
+            'content_hash': self.content_hash,
+            'imports': [os.path.relpath(p, root) for p in self.imports],
+            'remote_imports': self.remote_imports,
+            'valid': self.valid,
+            'errors': self.errors,
+            **self.metadata
+        }
+
+# 스크립트 카탈로그
+# test-scripts/를 한 번 색인하고, 스크립트별 해석 결과를 경로별로 캐시하여 mtime(또는 파일 변경 이벤트)으로 신선도를 유지
+# 검증 결과(k6 inspect 등)는 내용 해시별로 캐시하므로 파일을 건드리기만 하거나 같은 내용을 다른 경로에 두면 다시 검증하지 않음
+class ScriptCatalog:
+    def __init__(self, root=None):
+        self.root = os.path.abspath(root or SCRIPT_CATALOG_ROOT)
+        self._entries = {}
+        self._validated = {}
+        self._listings = {}
+        self._indexed = False
+        self._generation = 0
+        self._observer = None
+        self._lock = threading.Lock()
+
+    # ---- 색인/감시 ----
+
+    def scan(self):
+        """스크립트 루트 색인 (디렉토리별 파일 목록, 이후에는 디렉토리 mtime이 바뀐 곳만 다시 읽음)"""
+        listings = {}
+        for root, dirs, names in os.walk(self.root):
+            dirs[:] = sorted(d for d in dirs if d not in CATALOG_SKIPPED_DIRS and not d.startswith('.'))
+            listings[root] = (_stat(root), sorted(names))
+        with self._lock:
+            self._listings = listings
+            self._indexed = True
+        self._start_watch()
+        return len(listings)
+
+    def _start_watch(self):
+        if Observer is None or not SCRIPT_CATALOG_WATCH or self._observer is not None or not os.path.isdir(self.root):
+            return
+        try:
+            observer = Observer()
+            observer.schedule(self, self.root, recursive=True)
+            observer.daemon = True
+            observer.start()
+        except OSError as e:
+            print(f"⚠️ 스크립트 변경 감시 시작 실패: {e}")
+            return
+        self._observer = observer
+
+    @property
+    def watching(self):
+        return self._observer is not None and self._observer.is_alive()
+
+    def dispatch(self, event):
+        """watchdog 이벤트 처리 → 세대를 올려 캐시된 항목을 mtime으로 다시 확인하게 함 (실행 산출물 디렉토리 이벤트는 무시)"""
+        path = getattr(event, 'src_path', '') or ''
+        if isinstance(path, bytes):
+            path = os.fsdecode(path)
+        if CATALOG_SKIPPED_DIRS.intersection(os.path.relpath(path, self.root).split(os.sep)):
+            return
+        with self._lock:
+            self._generation += 1
+
+    def listing(self, directory):
+        """디렉토리의 파일 목록 (색인된 목록을 디렉토리 mtime이 같으면 그대로 사용)"""
+        if not self._indexed:
+            self.scan()
+        stat = _stat(directory)
+        with self._lock:
+            cached = self._listings.get(directory)
+        if cached and cached[0] == stat:
+            return cached[1]
+        names = sorted(os.listdir(directory))
+        with self._lock:
+            self._listings[directory] = (stat, names)
+        return names
+
+    # ---- 조회 ----
+
+    def lookup(self, script_path, test_type=None):
+        """스크립트 해석 결과 (캐시된 항목은 재확인 간격 안이거나 mtime이 같으면 그대로 반환)
+
+        검증하지 못한 항목은 SCRIPT_INSPECT_RETRY_SECONDS가 지나면 파일이 그대로여도 다시 검증
+        """
+        resolved = resolve_script_path(script_path)
+        key = (resolved, (test_type or '').lower())
+        with self._lock:
+            info = self._entries.get(key)
+            generation = self._generation
+        if info is not None and (info.inspected or time.monotonic() - info.built < SCRIPT_INSPECT_RETRY_SECONDS):
+            fresh = info.generation == generation if self.watching else (
+                time.monotonic() - info.checked < SCRIPT_CATALOG_RECHECK_SECONDS
+            )
+            if fresh:
+                return info
+            if self._fingerprint(info.watched) == info.fingerprint:
+                info.checked = time.monotonic()
+                info.generation = generation
+                return info
+        info = self._build(script_path, resolved, test_type)
+        info.generation = generation
+        with self._lock:
+            self._entries[key] = info
+        return info
+
+    def _fingerprint(self, paths):
+        return tuple(_stat(path) for path in paths)
+
+    def _build(self, script_path, resolved, test_type):
+        info = ScriptInfo(script_path, resolved, engine_registry.detect(test_type, resolved))
+        parent = os.path.dirname(resolved)
+        info.watched = [resolved, parent]
+        if not os.path.exists(resolved):
+            info.errors.append(f'스크립트 파일을 찾을 수 없습니다: {script_path}')
+            return self._finish(info)
+        spec = engine_registry.get(info.engine)
+        if spec is None:
+            info.errors.append(f'실행 엔진을 결정할 수 없습니다 (test_type={test_type})')
+            return self._finish(info)
+
+        entry = resolved
+        if os.path.isdir(resolved) and not spec.supports('directory'):
+            # 디렉토리 실행을 지원하지 않는 엔진은 확장자가 맞는 첫 스크립트 (엔진 레지스트리와 같은 규칙)
+            candidates = [n for n in self.listing(resolved) if n.endswith(spec.extensions)]
+            if not candidates:
+                info.errors.append(f'{info.engine} 스크립트가 없습니다: {script_path}')
+                return self._finish(info)
+            entry = os.path.join(resolved, candidates[0])
+        info.entry = entry
+
+        files = collect_script_files(entry)
+        info.content_hash = hash_script_files(files)
+        info.imports = sorted(p for p in files['contents'] if p != entry)
+        info.remote_imports = sorted(files['remote'])
+        info.watched = [resolved, parent] + ([entry] if entry != resolved else []) + sorted(files['contents']) + files['dirs']
+        for path, specs in files['missing'].items():
+            info.errors.extend(f'{os.path.relpath(path, files["root"])}: import 대상을 찾을 수 없습니다: {s}' for s in specs)
+
+        validated = self._validated.get((info.engine, info.content_hash))
+        if validated is None:
+            validator = VALIDATORS.get(info.engine)
+            validated = validator(entry, files) if validator else ({}, [])
+            # 성공과 결정적인 오류(구문 오류 등)만 캐시, 검증하지 못한 결과는 다음 조회에서 다시 시도
+            if validated[0].get('inspected') is not False:
+                with self._lock:
+                    self._validated[(info.engine, info.content_hash)] = validated
+                    while len(self._validated) > SCRIPT_CATALOG_MAX_ENTRIES:
+                        self._validated.pop(next(iter(self._validated)))
+        info.metadata = dict(validated[0])
+        info.errors.extend(validated[1])
+        return self._finish(info)
+
+    def _finish(self, info):
+        info.fingerprint = self._fingerprint(info.watched)
+        info.checked = info.built = time.monotonic()
+        return info
+
+    def entries(self, validate=False):
+        """스크립트 루트의 스크립트 목록 (validate=True면 캐시되지 않은 스크립트도 해석)"""
+        self.scan()
+        with self._lock:
+            listings = dict(self._listings)
+            cached = {path: info for (path, _), info in self._entries.items()}
+        scripts = []
+        for directory, (_, names) in sorted(listings.items()):
+            for name in names:
+                path = os.path.join(directory, name)
+                engine = engine_registry.detect(None, path)
+                if engine is None:
+                    continue
+                info = self.lookup(path) if validate else cached.get(path)
+                scripts.append(info.to_dict() if info else {
+                    'script_path': os.path.relpath(path, PROJECT_ROOT), 'engine': engine, 'valid': None
+                })
+        return scripts
+
+    def stats(self):
+        with self._lock:
+            return {
+                'root': self.root,
+                'indexed_directories': len(self._listings),
+                'cached_scripts': len(self._entries),
+                'validated_contents': len(self._validated),
+                'watching': self.watching
+            }
+
+# 스크립트 카탈로그 인스턴스 생성
+script_catalog = ScriptCatalog()
+
+def resolve_entry(script_path, test_type=None):
+    """실행할 진입 파일 (카탈로그에 캐시된 해석 결과 사용, 해석할 수 없으면 원래 경로)"""
+    return script_catalog.lookup(script_path, test_type).entry or script_path
+
+def script_rejection(script_path, test_type=None):
+    """실행 등록 전 스크립트 확인, 실행할 수 없으면 응답 본문 반환 (경로가 없거나 SCRIPT_CATALOG_ENFORCE=false면 실행 단계에서 처리)"""
+    if not script_path or not SCRIPT_CATALOG_ENFORCE:
+        return None
+    info = script_catalog.lookup(script_path, test_type)
+    if info.valid:
+        return None
+    return {'error': '스크립트를 실행할 수 없습니다', 'details': info.errors, 'script': info.to_dict()}
@@ -0,0 +1,120 @@
+import json
+from datetime import datetime
+from sqlalchemy import update
+from models import db, Folder, TestCase, TestExecution
+from engines.registry import detect_engine
+
+def collect_folder_ids(folder_id):
+    """폴더와 모든 하위 폴더 ID 수집 (너비 우선, 순환 참조 방지)"""
+    folder_ids = [folder_id]
+    seen = {folder_id}
+    frontier = [folder_id]
+    while frontier:
+        children = Folder.query.with_entities(Folder.id).filter(Folder.parent_folder_id.in_(frontier)).all()
+        frontier = [child_id for child_id, in children if child_id not in seen]
+        seen.update(frontier)
+        folder_ids.extend(frontier)
+    return folder_ids
+
+def collect_runnable_test_cases(folder_id):
+    """폴더 하위 트리에서 자동화 코드 경로가 있는 테스트 케이스 조회"""
+    folder_ids = collect_folder_ids(folder_id)
+    return TestCase.query.filter(
+        TestCase.folder_id.in_(folder_ids),
+        TestCase.automation_code_path.isnot(None),
+        TestCase.automation_code_path != ''
+    ).order_by(TestCase.id).all()
+
+def testcase_engine(test_case):
+    """테스트 케이스 자동화 코드의 실행 엔진 (결정할 수 없으면 Playwright)"""
+    return detect_engine(test_case.automation_code_type, test_case.automation_code_path) or 'playwright'
+
+def create_suite_execution(folder, test_cases, executed_by='system', schedule=None):
+    """부모(스위트) 실행과 테스트 케이스별 자식 실행 생성 (커밋은 호출자가 수행)
+
+    test_cases 순서대로 자식 실행을 만들므로 대기열에서도 이 순서로 실행됨
+    schedule: 실행 계획(정책, 예상 소요 시간)으로 부모 result_summary에 보관
+    """
+    parent = TestExecution(
+        test_type='suite',
+        folder_id=folder.id,
+        environment=folder.environment,
+        executed_by=executed_by,
+        status='running' if test_cases else 'completed',
+        started_at=datetime.utcnow(),
+        completed_at=None if test_cases else datetime.utcnow(),
+        total_count=len(test_cases),
+        completed_count=0,
+        passed_count=0,
+        failed_count=0
+    )
+    db.session.add(parent)
+    children = []
+    for test_case in test_cases:
+        child = TestExecution(
+            test_type='testcase',
+            test_case_id=test_case.id,
+            parent=parent,
+            environment=test_case.environment or folder.environment,
+            executed_by=executed_by,
+            status='queued',
+            started_at=None
+        )
+        db.session.add(child)
+        children.append(child)
+    if schedule:
+        db.session.flush()
+        for entry, child in zip(schedule['order'], children):
+            entry['execution_id'] = child.id
+        parent.result_summary = json.dumps({'schedule': schedule})
+    return parent, children
+
+def record_suite_child_result(execution, passed):
+    """자식 실행 완료를 부모 카운터에 반영
+
+    여러 워커가 동시에 완료하므로 카운터는 SQL 증분 UPDATE로 갱신하고,
+    마지막 자식이 끝났을 때 부모 상태를 조건부 UPDATE로 한 번만 완료 처리
+    """
+    parent_id = execution.parent_execution_id
+    if not parent_id:
+        return
+    table = TestExecution.__table__
+    values = {'completed_count': table.c.completed_count + 1}
+    if passed:
+        values['passed_count'] = table.c.passed_count + 1
+    else:
+        values['failed_count'] = table.c.failed_count + 1
+    db.session.execute(update(table).where(table.c.id == parent_id).values(**values))
+    db.session.commit()
+
+    finished = db.session.execute(
+        update(table)
+        .where(table.c.id == parent_id)
+        .where(table.c.status == 'running')
+        .where(table.c.completed_count >= table.c.total_count)
+        .values(status='completed', completed_at=datetime.utcnow())
+    )
+    db.session.commit()
+    if finished.rowcount == 1:
+        parent = TestExecution.query.get(parent_id)
+        db.session.refresh(parent)
+        if parent.failed_count:
+            parent.status = 'failed'
+        summary = suite_summary(parent)
+        schedule = summary.get('schedule')
+        if schedule and parent.started_at:
+            # 실행 계획의 예상 소요 시간과 실제 소요 시간(부모 시작 ~ 마지막 자식 완료) 비교
+            schedule['actual_makespan'] = round((parent.completed_at - parent.started_at).total_seconds(), 3)
+        parent.result_summary = json.dumps(summary)
+        db.session.commit()
+
+def suite_summary(parent):
+    """부모 실행 요약 (생성 시 기록한 실행 계획(schedule)/매트릭스 조합(matrix)에 진행 상황을 합침)"""
+    return {**_load_summary(parent), **parent.progress()}
+
+def _load_summary(parent):
+    try:
+        summary = json.loads(parent.result_summary) if parent.result_summary else {}
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return summary if isinstance(summary, dict) else {}
@@ -0,0 +1,139 @@
+import os
+from statistics import median
+from sqlalchemy import func
+from models import db, TestResult
+from utils.duration_model import load_estimates, pack_workers, DEFAULT_EXPECTED_SECONDS
+
+# 스위트 실행 순서 정책
+# - id: 테스트 케이스 ID 순 (기존 동작)
+# - failure_first: 최근 실패 → 불안정(flaky) → 나머지, 같은 그룹 안에서는 예상 시간이 긴 순
+# - longest_first: 예상 시간이 긴 순 (LPT, 마지막에 긴 작업 하나를 기다리는 꼬리 지연 감소)
+# - shortest_first: 예상 시간이 짧은 순 (완료 건수 기준 피드백 우선)
+ORDER_POLICIES = ('id', 'failure_first', 'longest_first', 'shortest_first')
+DEFAULT_ORDER_POLICY = os.environ.get('SUITE_ORDER_POLICY', 'failure_first')
+
+# 테스트 케이스별로 참고할 최근 결과 수
+HISTORY_WINDOW = int(os.environ.get('SUITE_HISTORY_WINDOW', '10'))
+# 결과가 바뀐 비율(Pass↔Fail 전환)이 이 값 이상이면 불안정 테스트로 분류
+FLAKY_THRESHOLD = float(os.environ.get('SUITE_FLAKY_THRESHOLD', '0.2'))
+
+FAILED_RESULTS = ('Fail', 'Error')
+
+def load_recent_results(test_case_ids, window=None):
+    """테스트 케이스별 최근 결과 (최신순, 케이스당 window건)
+
+    윈도 함수로 케이스별 상위 N건만 조회하여 이력이 많아도 조회량이 스위트 크기에 비례
+    """
+    window = window or HISTORY_WINDOW
+    history = {test_case_id: [] for test_case_id in test_case_ids}
+    if not test_case_ids:
+        return history
+    ranked = db.session.query(
+        TestResult.test_case_id.label('test_case_id'),
+        TestResult.result.label('result'),
+        TestResult.execution_time.label('execution_time'),
+        func.row_number().over(
+            partition_by=TestResult.test_case_id,
+            order_by=(TestResult.executed_at.desc(), TestResult.id.desc())
+        ).label('rank')
+    ).filter(
+        TestResult.test_case_id.in_(test_case_ids),
+        TestResult.result != 'Cancelled'
+    ).subquery()
+    rows = db.session.query(ranked).filter(ranked.c.rank <= window).order_by(ranked.c.test_case_id, ranked.c.rank).all()
+    for row in rows:
+        history[row.test_case_id].append((row.result, row.execution_time))
+    return history
+
+def profile_test_case(results):
+    """최근 결과로 실패 여부, 불안정 비율, 예상 시간(중앙값) 계산"""
+    outcomes = [r for r, _ in results if r in ('Pass',) + FAILED_RESULTS]
+    durations = [t for r, t in results if t is not None and r in ('Pass',) + FAILED_RESULTS]
+    failed = [o in FAILED_RESULTS for o in outcomes]
+    flips = sum(1 for a, b in zip(failed, failed[1:]) if a != b)
+    return {
+        'recently_failed': bool(failed and failed[0]),
+        'flaky_rate': flips / (len(failed) - 1) if len(failed) > 1 else 0.0,
+        'expected_duration': median(durations) if durations else None,
+        'history_count': len(results)
+    }
+
+def _sort_key(policy, entry):
+    duration = entry['expected_duration']
+    if policy == 'failure_first':
+        if entry['recently_failed']:
+            group = 0
+        elif entry['flaky_rate'] >= FLAKY_THRESHOLD:
+            group = 1
+        else:
+            group = 2
+        return (group, -entry['flaky_rate'] if group == 1 else 0, -duration, entry['test_case_id'])
+    if policy == 'longest_first':
+        return (-duration, entry['test_case_id'])
+    if policy == 'shortest_first':
+        return (duration, entry['test_case_id'])
+    return (entry['test_case_id'],)
+
+def _reason(entry):
+    if entry['recently_failed']:
+        return 'recently_failed'
+    if entry['flaky_rate'] >= FLAKY_THRESHOLD:
+        return 'flaky'
+    if entry['basis'] == 'default':
+        return 'no_history'
+    return 'duration'
+
+def plan_suite_order(test_cases, policy=None, workers=1, environment=None):
+    """정책에 따라 테스트 케이스 순서를 정하고 워커 배정과 예상 소요 시간(makespan)을 계산
+
+    예상 시간은 실행 시간 예측 모델 → 최근 결과 중앙값 → 스위트 내 중앙값 → 기본값 순으로 사용
+    반환: (정렬된 테스트 케이스 목록, 실행 계획 dict)
+    """
+    workers = max(1, int(workers))
+    policy = policy or DEFAULT_ORDER_POLICY
+    if policy not in ORDER_POLICIES:
+        raise ValueError(f'지원하지 않는 실행 순서 정책입니다: {policy} (사용 가능: {", ".join(ORDER_POLICIES)})')
+    history = load_recent_results([tc.id for tc in test_cases])
+    keys = {tc.id: ('testcase', tc.id, tc.environment or environment or '') for tc in test_cases}
+    estimates = load_estimates(keys.values())
+    entries = []
+    for test_case in test_cases:
+        entry = {'test_case_id': test_case.id, **profile_test_case(history[test_case.id])}
+        estimate = estimates.get(keys[test_case.id])
+        if estimate is not None and estimate.median is not None:
+            entry['expected_duration'] = estimate.median
+            entry['basis'] = 'model'
+        else:
+            entry['basis'] = 'history' if entry['expected_duration'] is not None else 'default'
+        entries.append(entry)
+
+    known = [e['expected_duration'] for e in entries if e['expected_duration'] is not None]
+    fallback = median(known) if known else DEFAULT_EXPECTED_SECONDS
+    for entry in entries:
+        if entry['expected_duration'] is None:
+            entry['expected_duration'] = fallback
+
+    by_id = {tc.id: tc for tc in test_cases}
+    ordered = sorted(entries, key=lambda e: _sort_key(policy, e))
+    # 대기열은 먼저 빈 워커가 다음 항목을 가져가므로 순서대로 리스트 스케줄링한 결과가 워커 배정이 됨
+    # (longest_first는 LPT 빈 패킹으로 전체 소요 시간을 최적의 4/3 이내로 제한)
+    slots, makespan = pack_workers([e['expected_duration'] for e in ordered], workers)
+    assignment = [{'worker': i, 'predicted_load': 0.0, 'test_case_ids': []} for i in range(min(workers, len(ordered)))]
+    for entry, (start, worker) in zip(ordered, slots):
+        assignment[worker]['test_case_ids'].append(entry['test_case_id'])
+        assignment[worker]['predicted_load'] = round(start + entry['expected_duration'], 3)
+    plan = {
+        'policy': policy,
+        'workers': workers,
+        'predicted_makespan': round(makespan if ordered else 0.0, 3),
+        'actual_makespan': None,
+        'assignment': assignment,
+        'order': [{
+            'test_case_id': e['test_case_id'],
+            'predicted_duration': round(e['expected_duration'], 3),
+            'predicted_start': round(start, 3),
+            'basis': e['basis'],
+            'reason': _reason(e)
+        } for e, (start, _) in zip(ordered, slots)]
+    }
+    return [by_id[e['test_case_id']] for e in ordered], plan
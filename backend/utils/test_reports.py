@@ -0,0 +1,28 @@
+import json
+import os
+from models import db, TestRunCase
+
+# 테스트별 결과 일괄 적재 단위
+INSERT_BATCH_SIZE = int(os.environ.get('TEST_RESULT_BATCH_SIZE', '500'))
+
+def save_test_run_cases(execution_id, tests, batch_size=None):
+    """테스트별 결과를 배치 단위 INSERT로 적재 (커밋은 호출자가 수행)"""
+    if not tests:
+        return 0
+    batch_size = batch_size or INSERT_BATCH_SIZE
+    rows = [{
+        'test_execution_id': execution_id,
+        'title': (test.get('title') or '')[:500],
+        'file': test.get('file'),
+        'line': test.get('line'),
+        'project_name': test.get('project_name'),
+        'status': test.get('status'),
+        'duration': test.get('duration'),
+        'retries': test.get('retries', 0),
+        'error': test.get('error'),
+        'attachments': json.dumps(test.get('attachments') or []),
+        'shard_index': test.get('shard_index')
+    } for test in tests]
+    for start in range(0, len(rows), batch_size):
+        db.session.execute(TestRunCase.__table__.insert(), rows[start:start + batch_size])
+    return len(rows)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+실행 대기열 워커
+
+웹(API) 프로세스와 분리된 호스트에서 부하 생성 작업을 실행하는 독립 프로세스
+여러 호스트에서 동시에 실행할 수 있으며, 하트비트가 끊긴 워커의 실행은 다른 워커가 재할당받음
+
+사용법:
+    python worker.py --concurrency 2
+    python worker.py --worker-id load-gen-1 --job-type performance
+    python worker.py --no-scheduler   # 예약 실행 스케줄러 없이 대기열만 처리
+"""
+
+import argparse
+import signal
+import sys
+from app import app
+from utils.run_queue import RunQueueWorker
+from utils.scheduler import start_scheduler
+
+def main():
+    parser = argparse.ArgumentParser(description='실행 대기열 워커')
+    parser.add_argument('--worker-id', help='워커 ID (기본값: 호스트명:PID)')
+    parser.add_argument('--concurrency', type=int, help='동시 실행 수 (기본값: RUN_QUEUE_WORKER_CONCURRENCY 또는 2)')
+    parser.add_argument('--job-type', action='append', dest='job_types', help='처리할 작업 유형 (여러 번 지정 가능)')
+    parser.add_argument('--poll-interval', type=float, help='대기열 조회 간격 (초)')
+    parser.add_argument('--no-scheduler', action='store_true', help='예약 실행 스케줄러를 실행하지 않음')
+    parser.add_argument('--drain-timeout', type=float, default=600, help='종료 시 실행 중 작업 대기 시간 (초)')
+    args = parser.parse_args()
+
+    # 스키마는 마이그레이션(flask db upgrade)으로만 생성: 워커가 임의로 테이블을 만들지 않음
+    with app.app_context():
+        from sqlalchemy import inspect
+        from models import db
+        if not inspect(db.engine).has_table('RunQueue'):
+            print("❌ 실행 대기열 테이블이 없습니다. 먼저 'flask db upgrade'로 마이그레이션을 적용하세요")
+            return 1
+
+    # 예약 실행 등록 (여러 워커가 실행해도 같은 회차는 한 번만 등록)
+    scheduler = None if args.no_scheduler else start_scheduler(app)
+
+    worker = RunQueueWorker(
+        app,
+        worker_id=args.worker_id,
+        concurrency=args.concurrency,
+        job_types=args.job_types,
+        poll_interval=args.poll_interval
+    )
+
+    def handle_signal(signum, frame):
+        print(f"🛑 종료 신호 수신 ({signum}), 새 작업 선점 중단")
+        worker.stop()
+        if scheduler:
+            scheduler.stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    worker.run_forever()
+    if not worker.wait_for_running(timeout=args.drain_timeout):
+        print("⚠️ 실행 중인 작업이 남아 있는 상태로 종료합니다 (다른 워커가 재할당)")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())